@@ -292,6 +292,15 @@ def to_tuple_or_list(value):
     return value
 
 
+def large_negative_number(dtype):
+    """Return a large negative number based on dtype, to mask logits."""
+    from keras.src.backend.common.variables import standardize_dtype
+
+    if standardize_dtype(dtype) == "float16":
+        return -3e4
+    return -1e9
+
+
 ### Code for ops.vectorize() used for TF and torch backends.
 
 # See http://docs.scipy.org/doc/numpy/reference/c-api.generalized-ufuncs.html
@@ -1,4 +1,5 @@
 import builtins
+import functools
 import math
 
 import jax
@@ -11,6 +12,7 @@ from keras.src import backend
 from keras.src.backend.common.backend_utils import (
     compute_conv_transpose_padding_args_for_jax,
 )
+from keras.src.backend.common.backend_utils import large_negative_number
 from keras.src.backend.jax.core import cast
 from keras.src.backend.jax.core import convert_to_tensor
 
@@ -512,6 +514,133 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return -jnp.sum(target * log_prob, axis=axis)
 
 
+def _for_each_class_chunk(fn, carry, num_classes, chunk_size):
+    # Loop over the full chunks, then over the (static) remainder.
+    num_chunks, remainder = divmod(num_classes, chunk_size)
+    if num_chunks:
+        carry = lax.fori_loop(
+            0,
+            num_chunks,
+            lambda i, carry: fn(carry, i * chunk_size, chunk_size),
+            carry,
+        )
+    if remainder:
+        carry = fn(carry, num_chunks * chunk_size, remainder)
+    return carry
+
+
+def _chunk_logits(inputs, kernel, bias, start, size, dtype):
+    kernel = lax.dynamic_slice_in_dim(kernel, start, size, axis=1)
+    bias = lax.dynamic_slice_in_dim(bias, start, size)
+    logits = jnp.matmul(inputs, kernel) + bias
+    return logits.astype(dtype), kernel
+
+
+@functools.partial(jax.custom_vjp, nondiff_argnums=(4,))
+def _chunked_crossentropy(target, inputs, kernel, bias, chunk_size):
+    return _chunked_crossentropy_fwd(target, inputs, kernel, bias, chunk_size)[
+        0
+    ]
+
+
+def _chunked_crossentropy_fwd(target, inputs, kernel, bias, chunk_size):
+    dtype = backend.result_type(inputs.dtype, "float32")
+
+    def body(carry, start, size):
+        log_sum_exp, target_logits = carry
+        logits, _ = _chunk_logits(inputs, kernel, bias, start, size, dtype)
+        log_sum_exp = jnp.logaddexp(
+            log_sum_exp, jax.nn.logsumexp(logits, axis=-1)
+        )
+        index = target - start
+        logit = jnp.take_along_axis(
+            logits, jnp.clip(index, 0, size - 1)[:, None], axis=-1
+        )[:, 0]
+        in_chunk = (index >= 0) & (index < size)
+        return log_sum_exp, target_logits + jnp.where(in_chunk, logit, 0.0)
+
+    log_sum_exp, target_logits = _for_each_class_chunk(
+        body,
+        (
+            jnp.full(target.shape, -jnp.inf, dtype=dtype),
+            jnp.zeros(target.shape, dtype=dtype),
+        ),
+        kernel.shape[-1],
+        chunk_size,
+    )
+    residuals = (target, inputs, kernel, bias, log_sum_exp)
+    return log_sum_exp - target_logits, residuals
+
+
+def _chunked_crossentropy_bwd(chunk_size, residuals, upstream):
+    target, inputs, kernel, bias, log_sum_exp = residuals
+    dtype = log_sum_exp.dtype
+
+    def body(carry, start, size):
+        d_inputs, d_kernel, d_bias = carry
+        logits, chunk_kernel = _chunk_logits(
+            inputs, kernel, bias, start, size, dtype
+        )
+        # The gradient of the loss w.r.t. the logits is
+        # `softmax(logits) - one_hot(target)`.
+        d_logits = jnp.exp(logits - log_sum_exp[:, None])
+        d_logits = d_logits - (
+            target[:, None] - start == jnp.arange(size)[None, :]
+        ).astype(dtype)
+        d_logits = d_logits * upstream[:, None]
+        d_inputs = d_inputs + jnp.matmul(d_logits, chunk_kernel.T)
+        d_kernel = lax.dynamic_update_slice_in_dim(
+            d_kernel, jnp.matmul(inputs.T, d_logits), start, axis=1
+        )
+        d_bias = lax.dynamic_update_slice_in_dim(
+            d_bias, jnp.sum(d_logits, axis=0), start, axis=0
+        )
+        return d_inputs, d_kernel, d_bias
+
+    d_inputs, d_kernel, d_bias = _for_each_class_chunk(
+        body,
+        (
+            jnp.zeros(inputs.shape, dtype=dtype),
+            jnp.zeros(kernel.shape, dtype=dtype),
+            jnp.zeros(bias.shape, dtype=dtype),
+        ),
+        kernel.shape[-1],
+        chunk_size,
+    )
+    return (
+        None,
+        d_inputs.astype(inputs.dtype),
+        d_kernel.astype(kernel.dtype),
+        d_bias.astype(bias.dtype),
+    )
+
+
+_chunked_crossentropy.defvjp(
+    _chunked_crossentropy_fwd, _chunked_crossentropy_bwd
+)
+
+
+def chunked_sparse_categorical_crossentropy(
+    target, inputs, kernel, bias=None, chunk_size=4096
+):
+    target = convert_to_tensor(target, "int32")
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    if bias is None:
+        bias = jnp.zeros(kernel.shape[-1:], dtype=kernel.dtype)
+    else:
+        bias = convert_to_tensor(bias)
+    batch_shape = inputs.shape[:-1]
+    loss = _chunked_crossentropy(
+        jnp.reshape(target, (-1,)),
+        jnp.reshape(inputs, (-1, inputs.shape[-1])),
+        kernel,
+        bias,
+        chunk_size,
+    )
+    return jnp.reshape(loss, batch_shape)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     target = jnp.array(target)
     output = jnp.array(output)
@@ -942,3 +1071,166 @@ def psnr(x1, x2, max_val):
     mse = jnp.mean(jnp.square(x1 - x2))
     psnr = 20 * jnp.log10(max_val) - 10 * jnp.log10(mse)
     return psnr
+
+
+# Queries are processed in blocks of this size when the attention logits
+# would be too large to be materialized at once.
+_ATTENTION_BLOCK_SIZE = 512
+
+
+def _attention_mask(mask, is_causal, query_length, key_length):
+    """Merges `mask` and the causal mask into one broadcastable boolean mask.
+
+    Returns `None` if there is no mask.
+    """
+    if is_causal:
+        causal_mask = jnp.tril(
+            jnp.ones((query_length, key_length), dtype="bool")
+        )
+        mask = (
+            causal_mask if mask is None else jnp.logical_and(mask, causal_mask)
+        )
+    return mask
+
+
+def _group_heads(x, num_key_heads, num_groups):
+    """Reshapes a mask or bias broadcastable to `(B, N, T, S)` so that it is
+    broadcastable to `(B, K, G, T, S)`, with `N = K * G`."""
+    x = jnp.reshape(x, (1,) * (4 - x.ndim) + x.shape)
+    if x.shape[1] == 1:
+        return jnp.expand_dims(x, 2)
+    return jnp.reshape(x, (x.shape[0], num_key_heads, num_groups) + x.shape[2:])
+
+
+def _dot_product_attention_core(query, key, value, bias, mask, scale):
+    # The `N` query heads are split in `K` groups of `G` heads, each group
+    # attending to one of the `K` key/value heads, without repeating the keys
+    # and values `G` times.
+    batch_size, query_length, num_heads, head_dim = query.shape
+    num_key_heads = key.shape[2]
+    num_groups = num_heads // num_key_heads
+    query = jnp.reshape(
+        query * scale,
+        (batch_size, query_length, num_key_heads, num_groups, head_dim),
+    )
+    logits = jnp.einsum("BTKGH,BSKH->BKGTS", query, key)
+    logits = logits.astype("float32")
+    if bias is not None:
+        bias = _group_heads(bias, num_key_heads, num_groups)
+        logits = logits + bias.astype("float32")
+    if mask is not None:
+        mask = _group_heads(mask, num_key_heads, num_groups)
+        logits = jnp.where(mask, logits, large_negative_number(query.dtype))
+    probs = jnn.softmax(logits, axis=-1).astype(value.dtype)
+    outputs = jnp.einsum("BKGTS,BSKH->BTKGH", probs, value)
+    return jnp.reshape(
+        outputs, (batch_size, query_length, num_heads, value.shape[-1])
+    )
+
+
+def _dot_product_attention_blocked(
+    query, key, value, bias, mask, scale, is_causal, block_size
+):
+    """Attention over blocks of queries.
+
+    Only a `[B, N, block_size, S]` slice of the attention logits is
+    materialized at a time, and it is recomputed in the backward pass instead
+    of being stored, so that the memory grows linearly with the query length
+    for training too.
+    """
+    batch_size, query_length, num_heads, head_dim = query.shape
+    key_length = key.shape[1]
+    num_blocks = -(-query_length // block_size)
+    padding = num_blocks * block_size - query_length
+    if padding:
+        query = jnp.pad(query, [(0, 0), (0, padding), (0, 0), (0, 0)])
+
+    def slice_queries(x, start):
+        if x is None or x.ndim < 2 or x.shape[-2] == 1:
+            return x
+        if padding:
+            pad_width = [(0, 0)] * x.ndim
+            pad_width[-2] = (0, padding)
+            x = jnp.pad(x, pad_width)
+        return lax.dynamic_slice_in_dim(x, start, block_size, axis=-2)
+
+    @jax.checkpoint
+    def attend(inputs):
+        block_query, block_index = inputs
+        start = block_index * block_size
+        block_mask = slice_queries(mask, start)
+        if is_causal:
+            query_positions = start + jnp.arange(block_size)
+            causal_mask = query_positions[:, None] >= jnp.arange(key_length)
+            block_mask = (
+                causal_mask
+                if block_mask is None
+                else jnp.logical_and(block_mask, causal_mask)
+            )
+        return _dot_product_attention_core(
+            block_query,
+            key,
+            value,
+            slice_queries(bias, start),
+            block_mask,
+            scale,
+        )
+
+    blocks = jnp.reshape(
+        query, (batch_size, num_blocks, block_size, num_heads, head_dim)
+    )
+    outputs = lax.map(
+        attend, (jnp.moveaxis(blocks, 1, 0), jnp.arange(num_blocks))
+    )
+    outputs = jnp.reshape(
+        jnp.moveaxis(outputs, 0, 1),
+        (batch_size, num_blocks * block_size, num_heads, value.shape[-1]),
+    )
+    return outputs[:, :query_length]
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    if mask is not None:
+        mask = convert_to_tensor(mask, dtype="bool")
+    if scale is None:
+        scale = 1.0 / math.sqrt(query.shape[-1])
+
+    if (
+        hasattr(jnn, "dot_product_attention")
+        and value.shape[-1] == query.shape[-1]
+    ):
+        # Dispatches to cuDNN's flash attention where available. It requires
+        # the values to have the same head dimension as the queries.
+        if bias is not None:
+            bias = jnp.reshape(bias, (1,) * (4 - bias.ndim) + bias.shape)
+        if mask is not None:
+            mask = jnp.reshape(mask, (1,) * (4 - mask.ndim) + mask.shape)
+        return jnn.dot_product_attention(
+            query,
+            key,
+            value,
+            bias=bias,
+            mask=mask,
+            scale=scale,
+            is_causal=is_causal,
+        )
+    if query.shape[1] > _ATTENTION_BLOCK_SIZE:
+        return _dot_product_attention_blocked(
+            query,
+            key,
+            value,
+            bias,
+            mask,
+            scale,
+            is_causal,
+            block_size=_ATTENTION_BLOCK_SIZE,
+        )
+    mask = _attention_mask(mask, is_causal, query.shape[1], key.shape[1])
+    return _dot_product_attention_core(query, key, value, bias, mask, scale)
@@ -931,6 +931,7 @@ def split(x, indices_or_sections, axis=0):
 
 
 def stack(x, axis=0):
+    x = [convert_to_tensor(elem) for elem in x]
     return jnp.stack(x, axis=axis)
 
 
@@ -326,9 +326,8 @@ def scatter(indices, values, shape):
     indices = np.reshape(indices, [-1, index_length])
     values = np.reshape(values, [-1] + list(value_shape))
 
-    for i in range(indices.shape[0]):
-        index = indices[i]
-        zeros[tuple(index)] += values[i]
+    # Values at duplicate indices are summed.
+    np.add.at(zeros, tuple(indices.T), values)
     return zeros
 
 
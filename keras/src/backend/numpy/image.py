@@ -1,4 +1,3 @@
-import jax
 import numpy as np
 
 from keras.src import backend
@@ -298,6 +297,10 @@ def resize(
                 ] = images
         images = padded_img
 
+    # Imported lazily, so that the NumPy backend doesn't require JAX unless
+    # images are resized.
+    import jax
+
     return np.array(
         jax.image.resize(
             images, size, method=interpolation, antialias=antialias
@@ -2,8 +2,6 @@ import numpy as np
 
 from keras.src.backend import standardize_dtype
 from keras.src.backend.common import dtypes
-from keras.src.backend.jax.math import fft as jax_fft
-from keras.src.backend.jax.math import fft2 as jax_fft2
 from keras.src.backend.numpy.core import convert_to_tensor
 from keras.src.utils.module_utils import scipy
 
@@ -135,13 +133,23 @@ def _get_complex_tensor_from_tuple(x):
 
 
 def fft(x):
-    real, imag = jax_fft(x)
-    return np.array(real), np.array(imag)
+    complex_input = _get_complex_tensor_from_tuple(x)
+    complex_output = np.fft.fft(complex_input)
+    # numpy always outputs complex128, so we need to recast the dtype
+    return (
+        np.real(complex_output).astype(x[0].dtype),
+        np.imag(complex_output).astype(x[0].dtype),
+    )
 
 
 def fft2(x):
-    real, imag = jax_fft2(x)
-    return np.array(real), np.array(imag)
+    complex_input = _get_complex_tensor_from_tuple(x)
+    complex_output = np.fft.fft2(complex_input)
+    # numpy always outputs complex128, so we need to recast the dtype
+    return (
+        np.real(complex_output).astype(x[0].dtype),
+        np.imag(complex_output).astype(x[0].dtype),
+    )
 
 
 def rfft(x, fft_length=None):
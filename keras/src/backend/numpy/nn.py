@@ -1,11 +1,13 @@
-import jax
+import itertools
+import math
+
 import numpy as np
-from jax import lax
 
 from keras.src import backend
 from keras.src.backend.common.backend_utils import (
     compute_conv_transpose_padding_args_for_jax,
 )
+from keras.src.backend.common.backend_utils import large_negative_number
 from keras.src.backend.numpy.core import cast
 from keras.src.backend.numpy.core import convert_to_tensor
 from keras.src.backend.numpy.core import is_tensor
@@ -141,6 +143,80 @@ def _convert_to_spatial_operand(
     return x
 
 
+def _compute_same_padding(input_size, window_size, stride):
+    # Same padding as `lax.padtype_to_pads(..., "SAME")`.
+    output_size = -(-input_size // stride)
+    total = max((output_size - 1) * stride + window_size - input_size, 0)
+    return total // 2, total - total // 2
+
+
+def _sliding_windows(
+    x,
+    window_shape,
+    strides,
+    padding,
+    dilation_rate=None,
+    axes=None,
+    pad_value=0,
+):
+    """Extracts the (strided, dilated) windows of `x` along `axes`.
+
+    Args:
+        x: input array.
+        window_shape: a sequence of integers, the window size along each of
+            `axes`.
+        strides: a sequence of integers, the stride along each of `axes`.
+        padding: either the string `"same"` or `"valid"`, or a sequence of
+            `(low, high)` pairs of the padding along each of `axes`. Negative
+            padding crops the input.
+        dilation_rate: a sequence of integers, the dilation of the windows
+            along each of `axes` (default: `(1, ..., 1)`).
+        axes: the axes along which windows are extracted (default: all axes).
+        pad_value: the value used for padding.
+
+    Returns:
+        A read-only view of `x` where the window axes are appended at the
+        end, and the size of each of `axes` is the number of windows.
+    """
+    axes = tuple(range(x.ndim)) if axes is None else tuple(axes)
+    if dilation_rate is None:
+        dilation_rate = (1,) * len(axes)
+    window_shape = [
+        (size - 1) * rate + 1 for size, rate in zip(window_shape, dilation_rate)
+    ]
+    if isinstance(padding, str):
+        padding = padding.lower()
+        if padding == "valid":
+            padding = [(0, 0)] * len(axes)
+        elif padding == "same":
+            padding = [
+                _compute_same_padding(x.shape[axis], size, stride)
+                for axis, size, stride in zip(axes, window_shape, strides)
+            ]
+        else:
+            raise ValueError(
+                f"Invalid padding '{padding}', must be 'same' or 'valid'."
+            )
+
+    pad_width = [(0, 0)] * x.ndim
+    crop = [slice(None)] * x.ndim
+    for axis, (low, high) in zip(axes, padding):
+        pad_width[axis] = (max(low, 0), max(high, 0))
+        crop[axis] = slice(max(-low, 0), x.shape[axis] - max(-high, 0))
+    x = x[tuple(crop)]
+    if any(pad != (0, 0) for pad in pad_width):
+        x = np.pad(x, pad_width, constant_values=pad_value)
+
+    windows = np.lib.stride_tricks.sliding_window_view(
+        x, window_shape, axis=axes
+    )
+    index = [slice(None)] * x.ndim
+    for axis, stride in zip(axes, strides):
+        index[axis] = slice(None, None, stride)
+    index += [slice(None, None, rate) for rate in dilation_rate]
+    return windows[tuple(index)]
+
+
 def _pool(
     inputs,
     initial_value,
@@ -153,8 +229,8 @@ def _pool(
 
     Args:
         inputs: input data of shape `N+2`.
-        initial_value: the initial value for the reduction.
-        reduce_fn: a reduce function of the form `(T, T) -> T`.
+        initial_value: the initial value for the reduction, used for padding.
+        reduce_fn: a NumPy reduction function, e.g. `np.max`.
         pool_size: a sequence of `N` integers, representing the window size to
             reduce over.
         strides: a sequence of `N` integers, representing the inter-window
@@ -168,17 +244,14 @@ def _pool(
         raise ValueError(
             f"Invalid padding '{padding}', must be 'same' or 'valid'."
         )
-    padding = padding.upper()
-    return np.array(
-        lax.reduce_window(
-            inputs,
-            initial_value,
-            reduce_fn,
-            pool_size,
-            strides,
-            padding,
-        )
+    if strides is None:
+        strides = (1,) * inputs.ndim
+    if np.isinf(initial_value) and not backend.is_float_dtype(inputs.dtype):
+        initial_value = np.iinfo(inputs.dtype).min
+    windows = _sliding_windows(
+        inputs, pool_size, strides, padding, pad_value=initial_value
     )
+    return reduce_fn(windows, axis=tuple(range(inputs.ndim, windows.ndim)))
 
 
 def max_pool(
@@ -197,7 +270,7 @@ def max_pool(
     strides = _convert_to_spatial_operand(
         strides, num_spatial_dims, data_format
     )
-    return _pool(inputs, -np.inf, lax.max, pool_size, strides, padding)
+    return _pool(inputs, -np.inf, np.max, pool_size, strides, padding)
 
 
 def average_pool(
@@ -217,9 +290,9 @@ def average_pool(
         strides, num_spatial_dims, data_format
     )
 
-    pooled = _pool(inputs, 0.0, lax.add, pool_size, strides, padding)
+    pooled = _pool(inputs, 0.0, np.sum, pool_size, strides, padding)
     if padding == "valid":
-        # Avoid the extra reduce_window.
+        # Avoid the extra reduction.
         return pooled / np.prod(pool_size)
     else:
         # Count the number of valid entries at each input point, then use that
@@ -232,7 +305,7 @@ def average_pool(
         window_counts = _pool(
             np.ones(shape, inputs.dtype),
             0.0,
-            lax.add,
+            np.sum,
             pool_size,
             strides,
             padding,
@@ -240,29 +313,84 @@ def average_pool(
         return pooled / window_counts
 
 
-def _convert_to_lax_conv_dimension_numbers(
-    num_spatial_dims,
-    data_format="channels_last",
-    transpose=False,
+def _conv(
+    inputs,
+    kernel,
+    strides,
+    padding,
+    dilation_rate,
+    data_format,
+    feature_group_count=1,
 ):
-    """Create a `lax.ConvDimensionNumbers` for the given inputs."""
-    num_dims = num_spatial_dims + 2
+    """Grouped N-D convolution, as `lax.conv_general_dilated`.
 
-    if data_format == "channels_last":
-        spatial_dims = tuple(range(1, num_dims - 1))
-        inputs_dn = (0, num_dims - 1) + spatial_dims
-    else:
-        spatial_dims = tuple(range(2, num_dims))
-        inputs_dn = (0, 1) + spatial_dims
+    The patches of the inputs are gathered in a matrix (im2col), which is
+    multiplied with the kernel, one matrix product per group.
 
-    if transpose:
-        kernel_dn = (num_dims - 2, num_dims - 1) + tuple(range(num_dims - 2))
-    else:
-        kernel_dn = (num_dims - 1, num_dims - 2) + tuple(range(num_dims - 2))
+    Args:
+        inputs: input data of shape `N+2`, in `data_format`.
+        kernel: kernel of shape `kernel_size + (in_channels // groups,
+            out_channels)`.
+        strides: a sequence of `N` integers.
+        padding: either the string `"same"` or `"valid"`, or a sequence of
+            `N` `(low, high)` pairs.
+        dilation_rate: a sequence of `N` integers.
+        data_format: either `"channels_last"` or `"channels_first"`.
+        feature_group_count: the number of groups of channels.
+
+    Returns:
+        The output of the convolution, in `data_format`.
+    """
+    num_spatial_dims = inputs.ndim - 2
+    if data_format == "channels_first":
+        inputs = np.moveaxis(inputs, 1, -1)
+    dtype = np.result_type(inputs.dtype, kernel.dtype)
 
-    return lax.ConvDimensionNumbers(
-        lhs_spec=inputs_dn, rhs_spec=kernel_dn, out_spec=inputs_dn
+    # `(batch, *output_spatial_dims, *kernel_size, in_channels)`, with the
+    # channels last so that the patches are copied in contiguous blocks.
+    patches = _sliding_windows(
+        inputs,
+        kernel.shape[:num_spatial_dims],
+        strides,
+        padding,
+        dilation_rate,
+        axes=range(1, num_spatial_dims + 1),
     )
+    patches = np.moveaxis(patches, num_spatial_dims + 1, -1)
+    output_shape = patches.shape[: num_spatial_dims + 1]
+    groups = feature_group_count
+    group_in_channels = kernel.shape[-2]
+    kernel_size = math.prod(kernel.shape[:num_spatial_dims])
+    if groups == 1:
+        patches = np.reshape(patches, (-1, kernel_size * group_in_channels))
+        kernel = np.reshape(kernel, (kernel_size * group_in_channels, -1))
+        outputs = np.matmul(
+            patches.astype(dtype, copy=False), kernel.astype(dtype, copy=False)
+        )
+    else:
+        # `(groups, batch * output_spatial_size, kernel_size * group_channels)`
+        patches = np.reshape(
+            patches, (-1, kernel_size, groups, group_in_channels)
+        ).transpose(2, 0, 1, 3)
+        patches = np.reshape(
+            patches, (groups, -1, kernel_size * group_in_channels)
+        )
+        # `(groups, kernel_size * group_channels, group_out_channels)`
+        kernel = np.reshape(
+            kernel, (kernel_size, group_in_channels, groups, -1)
+        ).transpose(2, 0, 1, 3)
+        kernel = np.reshape(
+            kernel, (groups, kernel_size * group_in_channels, -1)
+        )
+        outputs = np.matmul(
+            patches.astype(dtype, copy=False), kernel.astype(dtype, copy=False)
+        )
+        outputs = outputs.swapaxes(0, 1)
+    outputs = np.reshape(outputs, output_shape + (-1,))
+
+    if data_format == "channels_first":
+        outputs = np.moveaxis(outputs, -1, 1)
+    return outputs
 
 
 def conv(
@@ -275,11 +403,6 @@ def conv(
 ):
     data_format = backend.standardize_data_format(data_format)
     num_spatial_dims = inputs.ndim - 2
-    dimension_numbers = _convert_to_lax_conv_dimension_numbers(
-        num_spatial_dims,
-        data_format,
-        transpose=False,
-    )
     strides = _convert_to_spatial_operand(
         strides,
         num_spatial_dims,
@@ -304,16 +427,14 @@ def conv(
             f"kernel in_channels {kernel_in_channels}. "
         )
     feature_group_count = channels // kernel_in_channels
-    return np.array(
-        jax.lax.conv_general_dilated(
-            inputs,
-            kernel if is_tensor(kernel) else kernel.numpy(),
-            strides,
-            padding,
-            rhs_dilation=dilation_rate,
-            dimension_numbers=dimension_numbers,
-            feature_group_count=feature_group_count,
-        )
+    return _conv(
+        inputs,
+        kernel if is_tensor(kernel) else kernel.numpy(),
+        strides,
+        padding,
+        dilation_rate,
+        data_format,
+        feature_group_count=feature_group_count,
     )
 
 
@@ -327,11 +448,6 @@ def depthwise_conv(
 ):
     data_format = backend.standardize_data_format(data_format)
     num_spatial_dims = inputs.ndim - 2
-    dimension_numbers = _convert_to_lax_conv_dimension_numbers(
-        num_spatial_dims,
-        data_format,
-        transpose=False,
-    )
     strides = _convert_to_spatial_operand(
         strides,
         num_spatial_dims,
@@ -351,16 +467,14 @@ def depthwise_conv(
         kernel if is_tensor(kernel) else kernel.numpy(),
         kernel.shape[:-2] + (1, feature_group_count * kernel.shape[-1]),
     )
-    return np.array(
-        jax.lax.conv_general_dilated(
-            inputs,
-            kernel,
-            strides,
-            padding,
-            rhs_dilation=dilation_rate,
-            dimension_numbers=dimension_numbers,
-            feature_group_count=feature_group_count,
-        )
+    return _conv(
+        inputs,
+        kernel,
+        strides,
+        padding,
+        dilation_rate,
+        data_format,
+        feature_group_count=feature_group_count,
     )
 
 
@@ -411,11 +525,6 @@ def conv_transpose(
         output_padding=output_padding,
         dilation_rate=dilation_rate,
     )
-    dimension_numbers = _convert_to_lax_conv_dimension_numbers(
-        num_spatial_dims,
-        data_format,
-        transpose=False,
-    )
     strides = _convert_to_spatial_operand(
         strides,
         num_spatial_dims,
@@ -428,18 +537,70 @@ def conv_transpose(
         data_format,
         include_batch_and_channels=False,
     )
-
-    return np.array(
-        jax.lax.conv_transpose(
-            inputs,
-            kernel if is_tensor(kernel) else kernel.numpy(),
-            strides,
-            padding=padding_values,
-            rhs_dilation=dilation_rate,
-            dimension_numbers=dimension_numbers,
-            transpose_kernel=True,
+    kernel = kernel if is_tensor(kernel) else kernel.numpy()
+    if data_format == "channels_first":
+        inputs = np.moveaxis(inputs, 1, -1)
+    dtype = np.result_type(inputs.dtype, kernel.dtype)
+    kernel_shape = kernel.shape[:num_spatial_dims]
+    input_shape = inputs.shape[1:-1]
+
+    # Each input pixel is multiplied by the kernel, and the products are
+    # added to the (unpadded) output at the strided and dilated positions of
+    # the kernel elements. This skips the zeros of the equivalent convolution
+    # of the inputs dilated by the strides.
+    # `(batch, *input_spatial_dims, *kernel_size, out_channels)`
+    products = np.matmul(
+        np.reshape(inputs, (-1, inputs.shape[-1])).astype(dtype, copy=False),
+        np.reshape(np.moveaxis(kernel, -1, 0), (kernel.shape[-1], -1)).astype(
+            dtype, copy=False
+        ),
+    )
+    products = np.reshape(products, inputs.shape[:-1] + kernel.shape[:-1])
+    full_shape = [
+        (size - 1) * stride + (kernel_size - 1) * rate + 1
+        for size, kernel_size, stride, rate in zip(
+            input_shape, kernel_shape, strides, dilation_rate
         )
+    ]
+    outputs = np.zeros(
+        inputs.shape[:1] + tuple(full_shape) + kernel.shape[-2:-1], dtype
     )
+    for offsets in itertools.product(*[range(k) for k in kernel_shape]):
+        index = tuple(
+            slice(
+                offset * rate, offset * rate + (size - 1) * stride + 1, stride
+            )
+            for offset, size, stride, rate in zip(
+                offsets, input_shape, strides, dilation_rate
+            )
+        )
+        outputs[(slice(None),) + index] += products[
+            (Ellipsis,) + offsets + (slice(None),)
+        ]
+
+    # Apply the padding of the equivalent convolution: the unpadded output
+    # corresponds to a padding of `(kernel_size - 1) * dilation_rate`.
+    pad_width = [(0, 0)]
+    crop = [slice(None)]
+    for (low, high), size, full_size, kernel_size, stride, rate in zip(
+        padding_values,
+        input_shape,
+        full_shape,
+        kernel_shape,
+        strides,
+        dilation_rate,
+    ):
+        start = (kernel_size - 1) * rate - low
+        end = full_size - (kernel_size - 1) * rate + high
+        pad_width.append((max(-start, 0), max(end - full_size, 0)))
+        crop.append(slice(max(start, 0), min(end, full_size)))
+    outputs = outputs[tuple(crop)]
+    if any(pad != (0, 0) for pad in pad_width):
+        outputs = np.pad(outputs, pad_width + [(0, 0)])
+
+    if data_format == "channels_first":
+        outputs = np.moveaxis(outputs, -1, 1)
+    return outputs
 
 
 def one_hot(x, num_classes, axis=-1, dtype="float32", sparse=False):
@@ -534,6 +695,34 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return -np.sum(target * log_prob, axis=axis)
 
 
+def chunked_sparse_categorical_crossentropy(
+    target, inputs, kernel, bias=None, chunk_size=4096
+):
+    target = convert_to_tensor(target, "int32")
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    dtype = backend.result_type(inputs.dtype, "float32")
+    batch_shape = inputs.shape[:-1]
+    target = np.reshape(target, (-1,))
+    inputs = np.reshape(inputs, (-1, inputs.shape[-1]))
+    log_sum_exp = np.full(target.shape, -np.inf, dtype=dtype)
+    target_logits = np.zeros(target.shape, dtype=dtype)
+    for start in range(0, kernel.shape[-1], chunk_size):
+        logits = np.matmul(inputs, kernel[:, start : start + chunk_size])
+        if bias is not None:
+            logits = logits + bias[start : start + chunk_size]
+        logits = logits.astype(dtype)
+        log_sum_exp = np.logaddexp(
+            log_sum_exp, scipy.special.logsumexp(logits, axis=-1)
+        )
+        index = target - start
+        in_chunk = (index >= 0) & (index < logits.shape[-1])
+        target_logits[in_chunk] += logits[in_chunk, index[in_chunk]]
+    return np.reshape(log_sum_exp - target_logits, batch_shape)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     target = np.array(target)
     output = np.array(output)
@@ -977,3 +1166,78 @@ def psnr(x1, x2, max_val):
     mse = np.mean(np.square(x1 - x2))
     psnr = 20 * np.log10(max_val) - 10 * np.log10(mse)
     return psnr
+
+
+# Queries are processed in blocks of this size, so that only a
+# `[B, N, block_size, S]` slice of the attention logits is materialized at a
+# time.
+_ATTENTION_BLOCK_SIZE = 512
+
+
+def _group_heads(x, num_key_heads, num_groups):
+    """Reshapes a mask or bias broadcastable to `(B, N, T, S)` so that it is
+    broadcastable to `(B, K, G, T, S)`, with `N = K * G`."""
+    x = np.reshape(x, (1,) * (4 - x.ndim) + x.shape)
+    if x.shape[1] == 1:
+        return np.expand_dims(x, 2)
+    return np.reshape(x, (x.shape[0], num_key_heads, num_groups) + x.shape[2:])
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    if mask is not None:
+        mask = convert_to_tensor(mask, dtype="bool")
+    if scale is None:
+        scale = 1.0 / np.sqrt(query.shape[-1])
+    batch_size, query_length, num_heads, head_dim = query.shape
+    key_length = key.shape[1]
+    # The `N` query heads are split in `K` groups of `G` heads, each group
+    # attending to one of the `K` key/value heads, without repeating the keys
+    # and values `G` times.
+    num_key_heads = key.shape[2]
+    num_groups = num_heads // num_key_heads
+    query = np.reshape(
+        query, (batch_size, query_length, num_key_heads, num_groups, head_dim)
+    )
+    if bias is not None:
+        bias = _group_heads(bias, num_key_heads, num_groups)
+    if mask is not None:
+        mask = _group_heads(mask, num_key_heads, num_groups)
+    compute_dtype = np.result_type(query.dtype, np.float32)
+    large_negative = large_negative_number(query.dtype)
+
+    def slice_queries(x, start, stop):
+        if x is None or x.shape[-2] == 1:
+            return x
+        return x[..., start:stop, :]
+
+    outputs = []
+    for start in range(0, max(query_length, 1), _ATTENTION_BLOCK_SIZE):
+        stop = min(start + _ATTENTION_BLOCK_SIZE, query_length)
+        logits = np.einsum(
+            "BTKGH,BSKH->BKGTS", query[:, start:stop] * scale, key
+        ).astype(compute_dtype)
+        if bias is not None:
+            logits += slice_queries(bias, start, stop)
+        block_mask = slice_queries(mask, start, stop)
+        if is_causal:
+            causal_mask = (
+                np.arange(start, stop)[:, None] >= np.arange(key_length)[None]
+            )
+            block_mask = (
+                causal_mask if block_mask is None else block_mask & causal_mask
+            )
+        if block_mask is not None:
+            logits = np.where(block_mask, logits, large_negative)
+        probs = softmax(logits, axis=-1).astype(value.dtype)
+        outputs.append(np.einsum("BKGTS,BSKH->BTKGH", probs, value))
+    outputs = outputs[0] if len(outputs) == 1 else np.concatenate(outputs, 1)
+    return np.reshape(
+        outputs, (batch_size, query_length, num_heads, value.shape[-1])
+    )
@@ -1,3 +1,5 @@
+import concurrent.futures
+
 import numpy as np
 
 from keras.src import backend
@@ -17,6 +19,31 @@ class NumpyTrainer(base_trainer.Trainer):
         super().__init__()
         self.test_function = None
         self.predict_function = None
+        self._predict_num_workers = None
+
+    @property
+    def predict_num_workers(self):
+        """Number of threads across which `predict()` splits each batch.
+
+        NumPy releases the GIL in most of its kernels, so the shards of a
+        batch are predicted in parallel. Defaults to `None`, which (like `1`)
+        predicts each batch in a single thread.
+
+        The shards are predicted without assigning any variable. Batches
+        that assign variables during inference (e.g. with stateful layers)
+        are predicted again in a single thread, and so are all the following
+        batches.
+        """
+        return self._predict_num_workers
+
+    @predict_num_workers.setter
+    def predict_num_workers(self, value):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError(
+                "`predict_num_workers` must be `None` or a positive "
+                f"integer. Received: predict_num_workers={value}"
+            )
+        self._predict_num_workers = value
 
     def test_step(self, data):
         (
@@ -210,18 +237,88 @@ class NumpyTrainer(base_trainer.Trainer):
 
         self.make_predict_function()
         self.stop_predicting = False
+        num_workers = self.predict_num_workers or 1
+        if any(
+            getattr(layer, "stateful", False)
+            for layer in self._flatten_layers()
+        ):
+            # The states carried over from one batch to the next can't be
+            # split across threads.
+            num_workers = 1
+        executor = None
+        if num_workers > 1:
+            executor = concurrent.futures.ThreadPoolExecutor(num_workers)
         callbacks.on_predict_begin()
         outputs = None
-        for step, data in epoch_iterator.enumerate_epoch():
-            callbacks.on_predict_batch_begin(step)
-            batch_outputs = self.predict_function(data)
-            outputs = append_to_outputs(batch_outputs, outputs)
-            callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
-            if self.stop_predicting:
-                break
+        try:
+            for step, data in epoch_iterator.enumerate_epoch():
+                callbacks.on_predict_batch_begin(step)
+                batch_outputs = None
+                # The first batch builds the model, in a single thread.
+                if executor is not None and all(
+                    layer.built for layer in self._flatten_layers()
+                ):
+                    batch_outputs = self._predict_in_shards(
+                        data, executor, num_workers
+                    )
+                    if batch_outputs is None:
+                        executor.shutdown()
+                        executor = None
+                if batch_outputs is None:
+                    batch_outputs = self.predict_function(data)
+                outputs = append_to_outputs(batch_outputs, outputs)
+                callbacks.on_predict_batch_end(step, {"outputs": batch_outputs})
+                if self.stop_predicting:
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown()
         callbacks.on_predict_end()
         return tree.map_structure_up_to(batch_outputs, np.concatenate, outputs)
 
+    def _predict_in_shards(self, data, executor, num_shards):
+        """Splits each batch in shards, and predicts them in parallel.
+
+        Returns `None` if predicting a shard assigned a variable, which would
+        race between the threads. The assignments are discarded.
+        """
+
+        def predict_shard(shard):
+            with backend.StatelessScope() as scope:
+                shard_outputs = self.predict_function([shard])
+            if scope.state_mapping:
+                return None
+            return shard_outputs
+
+        def get_shard(batch, start, end):
+            return tree.map_structure(
+                lambda x: x[start:end] if np.ndim(x) > 0 else x, batch
+            )
+
+        def concatenate(outputs):
+            return tree.map_structure(
+                lambda *outputs: np.concatenate(outputs), *outputs
+            )
+
+        # `data` contains `steps_per_execution` batches.
+        batch_outputs = []
+        for batch in data:
+            batch_size = min(
+                x.shape[0] for x in tree.flatten(batch) if np.ndim(x) > 0
+            )
+            bounds = np.linspace(
+                0, batch_size, min(num_shards, batch_size) + 1
+            ).astype("int64")
+            futures = [
+                executor.submit(predict_shard, get_shard(batch, start, end))
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+            shard_outputs = [future.result() for future in futures]
+            if any(outputs is None for outputs in shard_outputs):
+                return None
+            batch_outputs.append(concatenate(shard_outputs))
+        return concatenate(batch_outputs)
+
     @traceback_utils.filter_traceback
     def evaluate(
         self,
@@ -7,6 +7,7 @@ from keras.src import backend
 from keras.src.backend.common.backend_utils import (
     compute_conv_transpose_output_shape,
 )
+from keras.src.backend.common.backend_utils import large_negative_number
 from keras.src.backend.tensorflow.core import cast
 from keras.src.backend.tensorflow.core import convert_to_tensor
 
@@ -674,6 +675,140 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return result
 
 
+def _for_each_class_chunk(fn, carry, num_classes, chunk_size, output_dtypes=()):
+    """Calls `fn(carry, start, size)` for each chunk of classes.
+
+    `fn` returns the updated `carry`, and a tuple of per-chunk outputs with
+    dtypes `output_dtypes`, which are concatenated along their last axis. The
+    full chunks are processed one at a time by a `tf.while_loop`, then the
+    (static) remainder.
+    """
+    num_chunks, remainder = divmod(num_classes, chunk_size)
+    outputs = None
+    if num_chunks:
+        arrays = tuple(
+            tf.TensorArray(dtype, size=num_chunks) for dtype in output_dtypes
+        )
+
+        def body(i, carry, arrays):
+            carry, chunk_outputs = fn(carry, i * chunk_size, chunk_size)
+            arrays = tuple(
+                array.write(i, x) for array, x in zip(arrays, chunk_outputs)
+            )
+            return i + 1, carry, arrays
+
+        _, carry, arrays = tf.while_loop(
+            lambda i, *_: i < num_chunks,
+            body,
+            (tf.constant(0), carry, arrays),
+            parallel_iterations=1,
+        )
+        outputs = []
+        for array in arrays:
+            # `(num_chunks, ..., chunk_size)` to `(..., num_chunks * size)`.
+            x = array.stack()
+            rank = len(x.shape)
+            x = tf.transpose(x, list(range(1, rank - 1)) + [0, rank - 1])
+            outputs.append(
+                tf.reshape(x, tf.concat([tf.shape(x)[:-2], [-1]], axis=0))
+            )
+    if remainder:
+        carry, chunk_outputs = fn(carry, num_chunks * chunk_size, remainder)
+        if outputs is None:
+            outputs = chunk_outputs
+        else:
+            outputs = [
+                tf.concat([x, chunk_x], axis=-1)
+                for x, chunk_x in zip(outputs, chunk_outputs)
+            ]
+    return carry, tuple(outputs)
+
+
+def chunked_sparse_categorical_crossentropy(
+    target, inputs, kernel, bias=None, chunk_size=4096
+):
+    target = tf.cast(convert_to_tensor(target), "int32")
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    if bias is None:
+        bias = tf.zeros(kernel.shape[-1:], dtype=kernel.dtype)
+    else:
+        bias = convert_to_tensor(bias)
+    dtype = backend.result_type(inputs.dtype, "float32")
+    num_classes = kernel.shape[-1]
+    batch_shape = tf.shape(inputs)[:-1]
+    target = tf.reshape(target, [-1])
+
+    def chunk_logits(inputs, kernel, bias, start, size):
+        kernel = tf.slice(kernel, tf.stack([0, start]), [-1, size])
+        logits = tf.matmul(inputs, kernel) + tf.slice(bias, [start], [size])
+        return tf.cast(logits, dtype), kernel
+
+    @tf.custom_gradient
+    def crossentropy(inputs, kernel, bias):
+        def body(carry, start, size):
+            log_sum_exp, target_logits = carry
+            logits, _ = chunk_logits(inputs, kernel, bias, start, size)
+            log_sum_exp = tf.experimental.numpy.logaddexp(
+                log_sum_exp, tf.reduce_logsumexp(logits, axis=-1)
+            )
+            index = target - start
+            logit = tf.gather(
+                logits, tf.clip_by_value(index, 0, size - 1), batch_dims=1
+            )
+            in_chunk = (index >= 0) & (index < size)
+            target_logits += tf.where(in_chunk, logit, tf.zeros_like(logit))
+            return (log_sum_exp, target_logits), ()
+
+        (log_sum_exp, target_logits), _ = _for_each_class_chunk(
+            body,
+            (
+                tf.fill(tf.shape(target), tf.constant(float("-inf"), dtype)),
+                tf.zeros(tf.shape(target), dtype=dtype),
+            ),
+            num_classes,
+            chunk_size,
+        )
+
+        def grad(upstream):
+            def body(d_inputs, start, size):
+                logits, chunk_kernel = chunk_logits(
+                    inputs, kernel, bias, start, size
+                )
+                # The gradient of the loss w.r.t. the logits is
+                # `softmax(logits) - one_hot(target)`.
+                d_logits = tf.exp(logits - log_sum_exp[:, None])
+                d_logits -= tf.one_hot(target - start, size, dtype=dtype)
+                d_logits *= upstream[:, None]
+                d_inputs += tf.matmul(
+                    d_logits, tf.cast(chunk_kernel, dtype), transpose_b=True
+                )
+                d_kernel = tf.matmul(
+                    tf.cast(inputs, dtype), d_logits, transpose_a=True
+                )
+                return d_inputs, (d_kernel, tf.reduce_sum(d_logits, axis=0))
+
+            d_inputs, (d_kernel, d_bias) = _for_each_class_chunk(
+                body,
+                tf.zeros(tf.shape(inputs), dtype=dtype),
+                num_classes,
+                chunk_size,
+                output_dtypes=(dtype, dtype),
+            )
+            return (
+                tf.cast(d_inputs, inputs.dtype),
+                tf.cast(d_kernel, kernel.dtype),
+                tf.cast(d_bias, bias.dtype),
+            )
+
+        return log_sum_exp - target_logits, grad
+
+    loss = crossentropy(
+        tf.reshape(inputs, [-1, inputs.shape[-1]]), kernel, bias
+    )
+    return tf.reshape(loss, batch_shape)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     """Binary crossentropy between an output tensor and a target tensor.
 
@@ -852,7 +987,7 @@ def ctc_decode(
 
     sequence_lengths = convert_to_tensor(sequence_lengths, dtype="int32")
     if strategy == "greedy":
-        (decoded, scores) = tf.nn.ctc_greedy_decoder(
+        decoded, scores = tf.nn.ctc_greedy_decoder(
             inputs=inputs,
             sequence_length=sequence_lengths,
             merge_repeated=merge_repeated,
@@ -868,7 +1003,7 @@ def ctc_decode(
             inputs = tf.concat(
                 [inputs_before, inputs_after, inputs_mask], axis=-1
             )
-        (decoded, scores) = tf.nn.ctc_beam_search_decoder(
+        decoded, scores = tf.nn.ctc_beam_search_decoder(
             inputs=inputs,
             sequence_length=sequence_lengths,
             beam_width=beam_width,
@@ -911,3 +1046,196 @@ def psnr(x1, x2, max_val):
     mse = tf.reduce_mean(tf.square(x1 - x2))
     psnr = 20 * log10(max_val) - 10 * log10(mse)
     return psnr
+
+
+# Queries are processed in blocks of this size when the attention logits
+# would be too large to be materialized at once.
+_ATTENTION_BLOCK_SIZE = 512
+
+
+def _group_heads(x, num_key_heads, num_groups):
+    """Reshapes a mask or bias broadcastable to `(B, N, T, S)` so that it is
+    broadcastable to `(B, K, G, T, S)`, with `N = K * G`."""
+    for _ in range(4 - len(x.shape)):
+        x = tf.expand_dims(x, 0)
+    if x.shape[1] == 1:
+        return tf.expand_dims(x, 2)
+    shape = tf.shape(x)
+    return tf.reshape(
+        x,
+        tf.stack([shape[0], num_key_heads, num_groups, shape[2], shape[3]]),
+    )
+
+
+def _dot_product_attention_core(query, key, value, bias, mask, scale):
+    # The `N` query heads are split in `K` groups of `G` heads, each group
+    # attending to one of the `K` key/value heads, without repeating the keys
+    # and values `G` times.
+    num_heads, head_dim = query.shape[2], query.shape[3]
+    num_key_heads = key.shape[2]
+    num_groups = num_heads // num_key_heads
+    query_shape = tf.shape(query)
+    query = tf.reshape(
+        query * scale,
+        tf.stack(
+            [
+                query_shape[0],
+                query_shape[1],
+                num_key_heads,
+                num_groups,
+                head_dim,
+            ]
+        ),
+    )
+
+    # The logits stay in the compute dtype, and are only upcast in the
+    # softmax. With XLA (`jit_compile=True`), the scaling, masking and
+    # softmax are fused into the two matmuls.
+    logits = tf.einsum("BTKGH,BSKH->BKGTS", query, key)
+    if bias is not None:
+        bias = _group_heads(bias, num_key_heads, num_groups)
+        logits += tf.cast(bias, logits.dtype)
+    if mask is not None:
+        mask = _group_heads(mask, num_key_heads, num_groups)
+        logits = tf.where(
+            mask,
+            logits,
+            tf.cast(large_negative_number(logits.dtype), logits.dtype),
+        )
+    probs = tf.nn.softmax(tf.cast(logits, "float32"), axis=-1)
+    outputs = tf.einsum("BKGTS,BSKH->BTKGH", tf.cast(probs, value.dtype), value)
+    return tf.reshape(
+        outputs,
+        tf.stack([query_shape[0], query_shape[1], num_heads, value.shape[-1]]),
+    )
+
+
+def _causal_mask(query_positions, key_length, mask):
+    causal_mask = tf.expand_dims(query_positions, 1) >= tf.range(key_length)
+    if mask is None:
+        return causal_mask
+    return tf.logical_and(mask, causal_mask)
+
+
+def _dot_product_attention_blocked(
+    query, key, value, bias, mask, scale, is_causal, block_size
+):
+    """Attention over blocks of queries.
+
+    Only a `[B, N, block_size, S]` slice of the attention logits is
+    materialized at a time, and it is recomputed in the backward pass instead
+    of being stored, so that the memory grows linearly with the query length
+    for training too.
+    """
+    query_shape = tf.shape(query)
+    query_length = query_shape[1]
+    num_heads, head_dim = query.shape[2], query.shape[3]
+    key_length = tf.shape(key)[1]
+    num_blocks = (query_length + block_size - 1) // block_size
+    padding = num_blocks * block_size - query_length
+    query = tf.pad(query, [[0, 0], [0, padding], [0, 0], [0, 0]])
+
+    def pad_queries(x):
+        # Masks and biases with a query axis are sliced along with the
+        # queries, the others are broadcast to every block.
+        if x is None or len(x.shape) < 2 or x.shape[-2] == 1:
+            return x
+        paddings = [[0, 0]] * len(x.shape)
+        paddings[-2] = [0, padding]
+        return tf.pad(x, paddings)
+
+    def slice_queries(x, start):
+        if x is None or len(x.shape) < 2 or x.shape[-2] == 1:
+            return x
+        rank = len(x.shape)
+        return tf.slice(
+            x,
+            tf.stack([0] * (rank - 2) + [start, 0]),
+            [-1] * (rank - 2) + [block_size, -1],
+        )
+
+    bias = pad_queries(bias)
+    mask = pad_queries(mask)
+
+    def attend(inputs):
+        block_query, start = inputs
+        block_mask = slice_queries(mask, start)
+        if is_causal:
+            block_mask = _causal_mask(
+                start + tf.range(block_size), key_length, block_mask
+            )
+
+        # `tf.recompute_grad` only differentiates its arguments, so the
+        # tensors that need gradients are passed explicitly.
+        @tf.recompute_grad
+        def attend_block(block_query, key, value, *block_bias):
+            return _dot_product_attention_core(
+                block_query,
+                key,
+                value,
+                block_bias[0] if block_bias else None,
+                block_mask,
+                scale,
+            )
+
+        block_bias = [] if bias is None else [slice_queries(bias, start)]
+        return attend_block(block_query, key, value, *block_bias)
+
+    blocks = tf.reshape(
+        query,
+        tf.stack([query_shape[0], num_blocks, block_size, num_heads, head_dim]),
+    )
+    # A single iteration runs at a time, so that the logits of only one
+    # block are live.
+    outputs = tf.map_fn(
+        attend,
+        (
+            tf.transpose(blocks, (1, 0, 2, 3, 4)),
+            tf.range(num_blocks) * block_size,
+        ),
+        fn_output_signature=value.dtype,
+        parallel_iterations=1,
+    )
+    outputs = tf.reshape(
+        tf.transpose(outputs, (1, 0, 2, 3, 4)),
+        tf.stack(
+            [
+                query_shape[0],
+                num_blocks * block_size,
+                num_heads,
+                value.shape[-1],
+            ]
+        ),
+    )
+    return outputs[:, :query_length]
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    if mask is not None:
+        mask = convert_to_tensor(mask, dtype="bool")
+    if scale is None:
+        scale = 1.0 / math.sqrt(query.shape[-1])
+
+    if query.shape[1] is not None and query.shape[1] > _ATTENTION_BLOCK_SIZE:
+        return _dot_product_attention_blocked(
+            query,
+            key,
+            value,
+            bias,
+            mask,
+            scale,
+            is_causal,
+            block_size=_ATTENTION_BLOCK_SIZE,
+        )
+    if is_causal:
+        mask = _causal_mask(
+            tf.range(tf.shape(query)[1]), tf.shape(key)[1], mask
+        )
+    return _dot_product_attention_core(query, key, value, bias, mask, scale)
@@ -13,6 +13,7 @@ from tensorflow.python.ops.math_ops import is_nan
 from keras.src import tree
 from keras.src.backend import config
 from keras.src.backend import standardize_dtype
+from keras.src.backend.common import KerasVariable
 from keras.src.backend.common import dtypes
 from keras.src.backend.common.backend_utils import canonicalize_axis
 from keras.src.backend.common.backend_utils import to_tuple_or_list
@@ -1881,6 +1882,8 @@ def split(x, indices_or_sections, axis=0):
 
 
 def stack(x, axis=0):
+    # `tf.stack` can't convert Keras variables by itself.
+    x = [a.value if isinstance(a, KerasVariable) else a for a in x]
     dtype_set = set([getattr(a, "dtype", type(a)) for a in x])
     if len(dtype_set) > 1:
         dtype = dtypes.result_type(*dtype_set)
@@ -460,6 +460,7 @@ def gru(
     unroll=False,
     time_major=False,
     reset_after=True,
+    zero_output_for_mask=False,
 ):
     cudnn_supported = cudnn_ok(
         activation,
@@ -821,6 +822,7 @@ def lstm(
     go_backwards=False,
     unroll=False,
     time_major=False,
+    zero_output_for_mask=False,
 ):
     cudnn_supported = cudnn_ok(
         activation, recurrent_activation, unroll, use_bias=bias is not None
@@ -0,0 +1,55 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from keras.src import backend
+from keras.src import testing
+
+
+class NumpyBackendTest(testing.TestCase):
+    @pytest.mark.skipif(backend.backend() != "numpy", reason="numpy only")
+    def test_works_without_jax(self):
+        # Run in a new process in which JAX can't be imported.
+        script = textwrap.dedent("""
+            import sys
+
+            class BlockJax:
+                def find_spec(self, name, path=None, target=None):
+                    if name.split(".")[0] in ("jax", "jaxlib"):
+                        raise ImportError(f"No module named {name!r}")
+
+            sys.meta_path.insert(0, BlockJax())
+
+            import numpy as np
+
+            import keras
+
+            model = keras.Sequential(
+                [
+                    keras.Input((8, 8, 3)),
+                    keras.layers.Conv2D(4, 3),
+                    keras.layers.MaxPooling2D(),
+                    keras.layers.Flatten(),
+                    keras.layers.Dense(2),
+                ]
+            )
+            assert model.predict(np.ones((2, 8, 8, 3))).shape == (2, 2)
+            real, imag = keras.ops.fft((np.ones((4,)), np.zeros((4,))))
+            assert real[0] == 4.0
+            assert not any(name.startswith("jax") for name in sys.modules)
+            """)
+        env = dict(
+            os.environ,
+            KERAS_BACKEND="numpy",
+            PYTHONPATH=os.pathsep.join(sys.path),
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
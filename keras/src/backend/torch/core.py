@@ -561,9 +561,8 @@ def scatter(indices, values, shape):
     indices = torch.reshape(indices, [-1, index_length])
     values = torch.reshape(values, [-1] + list(value_shape))
 
-    for i in range(indices.shape[0]):
-        index = indices[i]
-        zeros[tuple(index)] += values[i]
+    # Values at duplicate indices are summed.
+    zeros.index_put_(tuple(indices.long().T), values, accumulate=True)
     return zeros
 
 
@@ -1,3 +1,5 @@
+import math
+
 import torch
 import torch.nn.functional as tnn
 
@@ -6,9 +8,11 @@ from keras.src import tree
 from keras.src.backend.common.backend_utils import (
     compute_conv_transpose_padding_args_for_torch,
 )
+from keras.src.backend.common.backend_utils import large_negative_number
 from keras.src.backend.torch.core import cast
 from keras.src.backend.torch.core import convert_to_tensor
 from keras.src.backend.torch.core import get_device
+from keras.src.backend.torch.core import to_torch_dtype
 from keras.src.backend.torch.numpy import expand_dims
 from keras.src.backend.torch.numpy import maximum
 from keras.src.backend.torch.numpy import where
@@ -635,6 +639,96 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     return -torch.sum(target * log_prob, dim=axis)
 
 
+class _ChunkedCrossentropy(torch.autograd.Function):
+    @staticmethod
+    def _chunk_logits(inputs, kernel, bias, start, size, dtype):
+        kernel = kernel[:, start : start + size]
+        logits = torch.matmul(inputs, kernel) + bias[start : start + size]
+        return logits.to(dtype), kernel
+
+    @staticmethod
+    def forward(ctx, target, inputs, kernel, bias, chunk_size, dtype):
+        log_sum_exp = torch.full(
+            target.shape, -math.inf, dtype=dtype, device=inputs.device
+        )
+        target_logits = torch.zeros_like(log_sum_exp)
+        for start in range(0, kernel.shape[-1], chunk_size):
+            size = min(chunk_size, kernel.shape[-1] - start)
+            logits, _ = _ChunkedCrossentropy._chunk_logits(
+                inputs, kernel, bias, start, size, dtype
+            )
+            log_sum_exp = torch.logaddexp(
+                log_sum_exp, torch.logsumexp(logits, dim=-1)
+            )
+            index = target - start
+            logit = torch.gather(
+                logits, -1, torch.clamp(index, 0, size - 1)[:, None]
+            )[:, 0]
+            in_chunk = (index >= 0) & (index < size)
+            target_logits += torch.where(in_chunk, logit, 0.0)
+        ctx.save_for_backward(target, inputs, kernel, bias, log_sum_exp)
+        ctx.chunk_size = chunk_size
+        return log_sum_exp - target_logits
+
+    @staticmethod
+    def backward(ctx, upstream):
+        target, inputs, kernel, bias, log_sum_exp = ctx.saved_tensors
+        dtype = log_sum_exp.dtype
+        d_inputs = torch.zeros(inputs.shape, dtype=dtype, device=inputs.device)
+        d_kernel = torch.zeros(kernel.shape, dtype=dtype, device=kernel.device)
+        d_bias = torch.zeros(bias.shape, dtype=dtype, device=bias.device)
+        for start in range(0, kernel.shape[-1], ctx.chunk_size):
+            size = min(ctx.chunk_size, kernel.shape[-1] - start)
+            logits, chunk_kernel = _ChunkedCrossentropy._chunk_logits(
+                inputs, kernel, bias, start, size, dtype
+            )
+            # The gradient of the loss w.r.t. the logits is
+            # `softmax(logits) - one_hot(target)`.
+            d_logits = torch.exp(logits - log_sum_exp[:, None])
+            index = target - start
+            in_chunk = (index >= 0) & (index < size)
+            d_logits[in_chunk, index[in_chunk]] -= 1.0
+            d_logits *= upstream[:, None]
+            d_inputs += torch.matmul(d_logits, chunk_kernel.to(dtype).T)
+            d_kernel[:, start : start + size] = torch.matmul(
+                inputs.to(dtype).T, d_logits
+            )
+            d_bias[start : start + size] = torch.sum(d_logits, dim=0)
+        return (
+            None,
+            d_inputs.to(inputs.dtype),
+            d_kernel.to(kernel.dtype),
+            d_bias.to(bias.dtype),
+            None,
+            None,
+        )
+
+
+def chunked_sparse_categorical_crossentropy(
+    target, inputs, kernel, bias=None, chunk_size=4096
+):
+    target = convert_to_tensor(target, "int64")
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    if bias is None:
+        bias = torch.zeros(
+            kernel.shape[-1:], dtype=kernel.dtype, device=kernel.device
+        )
+    else:
+        bias = convert_to_tensor(bias)
+    dtype = to_torch_dtype(backend.result_type(inputs.dtype, "float32"))
+    batch_shape = inputs.shape[:-1]
+    loss = _ChunkedCrossentropy.apply(
+        torch.reshape(target, (-1,)),
+        torch.reshape(inputs, (-1, inputs.shape[-1])),
+        kernel,
+        bias,
+        chunk_size,
+        dtype,
+    )
+    return torch.reshape(loss, batch_shape)
+
+
 def binary_crossentropy(target, output, from_logits=False):
     target = convert_to_tensor(target)
     output = convert_to_tensor(output)
@@ -853,3 +947,84 @@ def psnr(x1, x2, max_val):
     mse = torch.mean((x1 - x2) ** 2)
     psnr = 20 * torch.log10(max_val) - 10 * torch.log10(mse)
     return psnr
+
+
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    query = convert_to_tensor(query)
+    key = convert_to_tensor(key)
+    value = convert_to_tensor(value)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    if mask is not None:
+        mask = convert_to_tensor(mask, dtype="bool")
+    if scale is None:
+        scale = 1.0 / math.sqrt(query.shape[-1])
+    batch_size, query_length, num_heads, _ = query.shape
+    key_length, num_key_heads = key.shape[1], key.shape[2]
+    num_groups = num_heads // num_key_heads
+
+    # Inputs are `(B, T, N, H)`, `scaled_dot_product_attention` expects
+    # `(B, N, T, H)`.
+    query = torch.transpose(query, 1, 2)
+    key = torch.transpose(key, 1, 2)
+    value = torch.transpose(value, 1, 2)
+
+    if is_causal and (mask is not None or bias is not None or num_groups > 1):
+        causal_mask = torch.ones(
+            (query_length, key_length), dtype=torch.bool, device=query.device
+        ).tril()
+        mask = causal_mask if mask is None else mask & causal_mask
+        is_causal = False
+    attn_mask = None
+    if mask is not None:
+        # `scaled_dot_product_attention` only supports an additive mask
+        # together with a bias, and returns NaNs for fully masked rows with a
+        # boolean mask, so the mask is turned into a (finite) additive one.
+        attn_mask = torch.where(
+            mask, 0.0, large_negative_number(query.dtype)
+        ).to(query.dtype)
+    if bias is not None:
+        bias = bias.to(query.dtype)
+        attn_mask = bias if attn_mask is None else attn_mask + bias
+
+    if num_groups > 1:
+        # The `G` query heads attending to each of the `K` key/value heads are
+        # folded into the query length, `(B, N, T, H)` -> `(B, K, G * T, H)`,
+        # so that the keys and values are not repeated `G` times.
+        query = torch.reshape(
+            query, (batch_size, num_key_heads, num_groups * query_length, -1)
+        )
+        if attn_mask is not None:
+            attn_mask = attn_mask.reshape(
+                (1,) * (4 - attn_mask.ndim) + tuple(attn_mask.shape)
+            )
+            attn_mask = attn_mask.expand(
+                attn_mask.shape[0],
+                attn_mask.shape[1],
+                query_length,
+                attn_mask.shape[3],
+            )
+            if attn_mask.shape[1] == 1:
+                attn_mask = attn_mask.repeat(1, 1, num_groups, 1)
+            else:
+                attn_mask = attn_mask.reshape(
+                    attn_mask.shape[0],
+                    num_key_heads,
+                    num_groups * query_length,
+                    attn_mask.shape[3],
+                )
+
+    outputs = tnn.scaled_dot_product_attention(
+        query,
+        key,
+        value,
+        attn_mask=attn_mask,
+        is_causal=is_causal,
+        scale=scale,
+    )
+    outputs = torch.reshape(
+        outputs, (batch_size, num_heads, query_length, outputs.shape[-1])
+    )
+    return torch.transpose(outputs, 1, 2)
@@ -371,13 +371,273 @@ def rnn(
     return last_output, outputs, new_states
 
 
-def cudnn_ok(*args, **kwargs):
-    return False
+def cudnn_ok(
+    activation,
+    recurrent_activation,
+    unroll,
+    use_bias,
+    reset_after=None,
+):
+    # The fused kernels of `torch.lstm` and `torch.gru` run on any device,
+    # so only the layer configuration matters.
+    if reset_after is None:
+        return _do_lstm_arguments_support_fused_kernel(
+            activation=activation,
+            recurrent_activation=recurrent_activation,
+            unroll=unroll,
+        )
+    return _do_gru_arguments_support_fused_kernel(
+        activation=activation,
+        recurrent_activation=recurrent_activation,
+        unroll=unroll,
+        use_bias=use_bias,
+        reset_after=reset_after,
+    )
+
+
+def lstm(
+    inputs,
+    initial_state_h,
+    initial_state_c,
+    mask,
+    kernel,
+    recurrent_kernel,
+    bias,
+    activation,
+    recurrent_activation,
+    return_sequences=False,
+    go_backwards=False,
+    unroll=False,
+    time_major=False,
+    zero_output_for_mask=False,
+):
+    if not _do_lstm_arguments_support_fused_kernel(
+        activation, recurrent_activation, unroll
+    ):
+        raise NotImplementedError
+
+    kernel = convert_to_tensor(kernel)
+    recurrent_kernel = convert_to_tensor(recurrent_kernel)
+    inputs = convert_to_tensor(inputs).to(kernel.dtype)
+    # Keras and torch both order the LSTM gates as (i, f, c, o). Keras only
+    # has an input bias, so the recurrent bias is zero.
+    params = [kernel.T, recurrent_kernel.T]
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+        params += [bias, torch.zeros_like(bias)]
+
+    def step(inputs, batch_sizes, hx):
+        if batch_sizes is None:
+            return torch.lstm(
+                inputs, hx, params, bias is not None, 1, 0.0, False, False, True
+            )
+        return torch.lstm(
+            inputs,
+            batch_sizes,
+            hx,
+            params,
+            bias is not None,
+            1,
+            0.0,
+            False,
+            False,
+        )
+
+    last_output, outputs, (h, c) = _run_fused_rnn(
+        step,
+        inputs,
+        (initial_state_h, initial_state_c),
+        mask,
+        go_backwards=go_backwards,
+        time_major=time_major,
+        zero_output_for_mask=zero_output_for_mask,
+    )
+    if not return_sequences:
+        outputs = torch.unsqueeze(last_output, 0 if time_major else 1)
+    return last_output, outputs, [h, c]
+
+
+def gru(
+    inputs,
+    initial_state,
+    mask,
+    kernel,
+    recurrent_kernel,
+    bias,
+    activation,
+    recurrent_activation,
+    return_sequences=False,
+    go_backwards=False,
+    unroll=False,
+    time_major=False,
+    reset_after=True,
+    zero_output_for_mask=False,
+):
+    if not _do_gru_arguments_support_fused_kernel(
+        activation,
+        recurrent_activation,
+        unroll,
+        use_bias=bias is not None,
+        reset_after=reset_after,
+    ):
+        raise NotImplementedError
+
+    # Keras orders the GRU gates as (z, r, h) while torch expects (r, z, n).
+    def to_torch_gates(weights):
+        z, r, h = torch.chunk(weights, 3, dim=-1)
+        return torch.cat([r, z, h], dim=-1)
+
+    kernel = to_torch_gates(convert_to_tensor(kernel))
+    inputs = convert_to_tensor(inputs).to(kernel.dtype)
+    recurrent_kernel = to_torch_gates(convert_to_tensor(recurrent_kernel))
+    bias = to_torch_gates(convert_to_tensor(bias))
+    params = [kernel.T, recurrent_kernel.T, bias[0], bias[1]]
+
+    def step(inputs, batch_sizes, hx):
+        (hx,) = hx
+        if batch_sizes is None:
+            outputs, h = torch.gru(
+                inputs, hx, params, True, 1, 0.0, False, False, True
+            )
+        else:
+            outputs, h = torch.gru(
+                inputs, batch_sizes, hx, params, True, 1, 0.0, False, False
+            )
+        return outputs, h
+
+    last_output, outputs, (h,) = _run_fused_rnn(
+        step,
+        inputs,
+        (initial_state,),
+        mask,
+        go_backwards=go_backwards,
+        time_major=time_major,
+        zero_output_for_mask=zero_output_for_mask,
+    )
+    if not return_sequences:
+        outputs = torch.unsqueeze(last_output, 0 if time_major else 1)
+    return last_output, outputs, [h]
+
+
+def _do_lstm_arguments_support_fused_kernel(
+    activation,
+    recurrent_activation,
+    unroll,
+):
+    from keras.src import activations
+    from keras.src import ops
+
+    return (
+        activation in (activations.tanh, torch.tanh, ops.tanh)
+        and recurrent_activation
+        in (activations.sigmoid, torch.sigmoid, ops.sigmoid)
+        and not unroll
+    )
+
+
+def _do_gru_arguments_support_fused_kernel(
+    activation,
+    recurrent_activation,
+    unroll,
+    use_bias,
+    reset_after,
+):
+    return (
+        _do_lstm_arguments_support_fused_kernel(
+            activation, recurrent_activation, unroll
+        )
+        and use_bias
+        and reset_after
+    )
+
+
+def _run_fused_rnn(
+    step,
+    inputs,
+    initial_states,
+    mask,
+    go_backwards,
+    time_major,
+    zero_output_for_mask,
+):
+    """Runs a fused torch RNN kernel with the semantics of `rnn()`.
+
+    `step(inputs, batch_sizes, hx)` calls the kernel on batch-major inputs
+    when `batch_sizes` is `None`, and on the data of a packed sequence
+    otherwise. Masks are only supported when they are right-padded (i.e. all
+    the masked timesteps of a sequence come after its unmasked ones), in
+    which case the padding is skipped by packing the sequences.
+    """
+    inputs = convert_to_tensor(inputs)
+    if time_major:
+        inputs = torch.transpose(inputs, 0, 1)
+    # The kernels expect states with a leading `num_layers` axis.
+    hx = tuple(
+        torch.unsqueeze(convert_to_tensor(state), 0) for state in initial_states
+    )
+
+    if mask is None:
+        if go_backwards:
+            inputs = torch.flip(inputs, dims=(1,))
+        outputs, *states = step(inputs, None, hx)
+    else:
+        mask = convert_to_tensor(mask, dtype="bool")
+        if mask.ndim == 3:
+            mask = mask[..., 0]
+        if time_major:
+            mask = torch.transpose(mask, 0, 1)
+        lengths = torch.sum(mask, dim=1)
+        timesteps = torch.arange(mask.shape[1], device=mask.device)
+        if not torch.equal(mask, timesteps < lengths[:, None]):
+            raise NotImplementedError
+        if torch.any(lengths == 0):
+            # Packed sequences can't be empty.
+            raise NotImplementedError
+
+        if go_backwards:
+            # Reverse the unmasked part of each sequence in place. The same
+            # permutation maps the outputs back.
+            reverse_indices = torch.where(
+                timesteps < lengths[:, None],
+                lengths[:, None] - 1 - timesteps,
+                timesteps,
+            )
+            inputs = _gather_timesteps(inputs, reverse_indices)
 
+        packed = torch.nn.utils.rnn.pack_padded_sequence(
+            inputs, lengths.cpu(), batch_first=True, enforce_sorted=False
+        )
+        hx = tuple(
+            torch.index_select(state, 1, packed.sorted_indices) for state in hx
+        )
+        outputs, *states = step(packed.data, packed.batch_sizes, hx)
+        states = [
+            torch.index_select(state, 1, packed.unsorted_indices)
+            for state in states
+        ]
+        outputs, _ = torch.nn.utils.rnn.pad_packed_sequence(
+            packed._replace(data=outputs),
+            batch_first=True,
+            total_length=inputs.shape[1],
+        )
+
+        if go_backwards:
+            # `rnn()` processes the masked timesteps first, with zero outputs.
+            outputs = _gather_timesteps(outputs, reverse_indices)
+            outputs = torch.flip(outputs, dims=(1,))
+        elif not zero_output_for_mask:
+            # `rnn()` repeats the last unmasked output over masked timesteps.
+            outputs = torch.where(
+                mask[..., None], outputs, torch.unsqueeze(states[0][0], 1)
+            )
 
-def lstm(*args, **kwargs):
-    raise NotImplementedError
+    last_output = outputs[:, -1]
+    if time_major:
+        outputs = torch.transpose(outputs, 0, 1)
+    states = [torch.squeeze(state, 0) for state in states]
+    return last_output, outputs, states
 
 
-def gru(*args, **kwargs):
-    raise NotImplementedError
+def _gather_timesteps(inputs, indices):
+    indices = torch.unsqueeze(indices, -1).expand(-1, -1, inputs.shape[-1])
+    return torch.gather(inputs, 1, indices)
@@ -7,6 +7,7 @@ import numpy as np
 from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.datasets.cifar import load_batch
+from keras.src.datasets.decoded_cache import load_decoded_arrays
 from keras.src.utils.file_utils import get_file
 
 
@@ -62,38 +63,58 @@ def load_data():
     """
     dirname = "cifar-10-batches-py"
     origin = "https://www.cs.toronto.edu/~kriz/cifar-10-python.tar.gz"
+    file_hash = (  # noqa: E501
+        "6d958be074577803d12ecdefd02955f39262c83c16fe9348329d7fe0b5c001ce"
+    )
     path = get_file(
         fname=dirname,
         origin=origin,
         untar=True,
-        file_hash=(  # noqa: E501
-            "6d958be074577803d12ecdefd02955f39262c83c16fe9348329d7fe0b5c001ce"
-        ),
+        file_hash=file_hash,
     )
 
-    num_train_samples = 50000
-
-    x_train = np.empty((num_train_samples, 3, 32, 32), dtype="uint8")
-    y_train = np.empty((num_train_samples,), dtype="uint8")
-
-    for i in range(1, 6):
-        fpath = os.path.join(path, "data_batch_" + str(i))
-        (
-            x_train[(i - 1) * 10000 : i * 10000, :, :, :],
-            y_train[(i - 1) * 10000 : i * 10000],
-        ) = load_batch(fpath)
-
-    fpath = os.path.join(path, "test_batch")
-    x_test, y_test = load_batch(fpath)
-
-    y_train = np.reshape(y_train, (len(y_train), 1))
-    y_test = np.reshape(y_test, (len(y_test), 1))
+    train_paths = [
+        os.path.join(path, "data_batch_" + str(i)) for i in range(1, 6)
+    ]
+    test_path = os.path.join(path, "test_batch")
+
+    def decode():
+        num_train_samples = 50000
+
+        x_train = np.empty((num_train_samples, 3, 32, 32), dtype="uint8")
+        y_train = np.empty((num_train_samples,), dtype="uint8")
+
+        for i, fpath in enumerate(train_paths):
+            (
+                x_train[i * 10000 : (i + 1) * 10000, :, :, :],
+                y_train[i * 10000 : (i + 1) * 10000],
+            ) = load_batch(fpath)
+
+        x_test, y_test = load_batch(test_path)
+
+        y_train = np.reshape(y_train, (len(y_train), 1))
+        y_test = np.reshape(y_test, (len(y_test), 1))
+
+        x_test = x_test.astype(x_train.dtype)
+        y_test = y_test.astype(y_train.dtype)
+        return {
+            "x_train": x_train,
+            "y_train": y_train,
+            "x_test": x_test,
+            "y_test": y_test,
+        }
+
+    arrays = load_decoded_arrays(
+        os.path.join(path, "decoded"),
+        train_paths + [test_path],
+        decode,
+        file_hash=file_hash,
+    )
+    x_train, y_train = arrays["x_train"], arrays["y_train"]
+    x_test, y_test = arrays["x_test"], arrays["y_test"]
 
     if backend.image_data_format() == "channels_last":
         x_train = x_train.transpose(0, 2, 3, 1)
         x_test = x_test.transpose(0, 2, 3, 1)
 
-    x_test = x_test.astype(x_train.dtype)
-    y_test = y_test.astype(y_train.dtype)
-
     return (x_train, y_train), (x_test, y_test)
@@ -7,6 +7,7 @@ import numpy as np
 from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.datasets.cifar import load_batch
+from keras.src.datasets.decoded_cache import load_decoded_arrays
 from keras.src.utils.file_utils import get_file
 
 
@@ -60,23 +61,41 @@ def load_data(label_mode="fine"):
 
     dirname = "cifar-100-python"
     origin = "https://www.cs.toronto.edu/~kriz/cifar-100-python.tar.gz"
+    file_hash = (  # noqa: E501
+        "85cd44d02ba6437773c5bbd22e183051d648de2e7d6b014e1ef29b855ba677a7"
+    )
     path = get_file(
         fname=dirname,
         origin=origin,
         untar=True,
-        file_hash=(  # noqa: E501
-            "85cd44d02ba6437773c5bbd22e183051d648de2e7d6b014e1ef29b855ba677a7"
-        ),
+        file_hash=file_hash,
     )
 
-    fpath = os.path.join(path, "train")
-    x_train, y_train = load_batch(fpath, label_key=label_mode + "_labels")
-
-    fpath = os.path.join(path, "test")
-    x_test, y_test = load_batch(fpath, label_key=label_mode + "_labels")
-
-    y_train = np.reshape(y_train, (len(y_train), 1))
-    y_test = np.reshape(y_test, (len(y_test), 1))
+    train_path = os.path.join(path, "train")
+    test_path = os.path.join(path, "test")
+    label_key = label_mode + "_labels"
+
+    def decode():
+        x_train, y_train = load_batch(train_path, label_key=label_key)
+        x_test, y_test = load_batch(test_path, label_key=label_key)
+
+        y_train = np.reshape(y_train, (len(y_train), 1))
+        y_test = np.reshape(y_test, (len(y_test), 1))
+        return {
+            "x_train": x_train,
+            "y_train": y_train,
+            "x_test": x_test,
+            "y_test": y_test,
+        }
+
+    arrays = load_decoded_arrays(
+        os.path.join(path, "decoded_" + label_mode),
+        [train_path, test_path],
+        decode,
+        file_hash=file_hash,
+    )
+    x_train, y_train = arrays["x_train"], arrays["y_train"]
+    x_test, y_test = arrays["x_test"], arrays["y_test"]
 
     if backend.image_data_format() == "channels_last":
         x_train = x_train.transpose(0, 2, 3, 1)
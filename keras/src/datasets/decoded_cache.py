@@ -0,0 +1,103 @@
+"""Caching of decoded dataset arrays as memory-mappable `.npy` files."""
+
+import json
+import os
+
+import numpy as np
+
+_CACHE_FORMAT_VERSION = 1
+_METADATA_FILENAME = "metadata.json"
+
+
+def load_decoded_arrays(cache_dir, source_paths, decode_fn, file_hash=None):
+    """Returns decoded dataset arrays, caching them as `.npy` files.
+
+    On the first call, `decode_fn()` is run and each of the arrays it returns
+    is saved to `cache_dir` as a `.npy` file, along with metadata describing
+    the archive it was decoded from. Subsequent calls memory-map the cached
+    files instead of decoding the archive again.
+
+    The cache is only reused if it was built from the same archive: the
+    metadata records `file_hash` (the hash the archive was verified against
+    by `get_file()`) and the size and modification time of every file in
+    `source_paths`. If any of these changed, e.g. because the archive was
+    re-downloaded, the arrays are decoded again and the cache is rebuilt.
+
+    Arrays are memory-mapped in copy-on-write mode, so callers may modify
+    them in place without altering the cache.
+
+    Args:
+        cache_dir: Directory where the decoded arrays are stored.
+        source_paths: List of paths of the files read by `decode_fn`.
+        decode_fn: Callable with no arguments returning a dict mapping
+            array names to NumPy arrays. Arrays must not have `object`
+            dtype.
+        file_hash: Optional expected hash of the downloaded archive.
+
+    Returns:
+        A dict mapping array names to NumPy arrays.
+    """
+    metadata = {
+        "version": _CACHE_FORMAT_VERSION,
+        "file_hash": file_hash,
+        "sources": {
+            os.path.basename(path): _file_signature(path)
+            for path in source_paths
+        },
+    }
+    arrays = _load_cache(cache_dir, metadata)
+    if arrays is not None:
+        return arrays
+
+    arrays = decode_fn()
+    try:
+        _save_cache(cache_dir, metadata, arrays)
+    except OSError:
+        # The cache is an optimization only, e.g. the dataset directory may
+        # be read-only.
+        pass
+    return arrays
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _load_cache(cache_dir, metadata):
+    metadata_path = os.path.join(cache_dir, _METADATA_FILENAME)
+    try:
+        with open(metadata_path) as f:
+            cached_metadata = json.load(f)
+        names = cached_metadata.pop("arrays")
+        if cached_metadata != metadata:
+            return None
+        return {
+            name: np.load(
+                os.path.join(cache_dir, f"{name}.npy"),
+                mmap_mode="c",
+                allow_pickle=False,
+            )
+            for name in names
+        }
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _save_cache(cache_dir, metadata, arrays):
+    os.makedirs(cache_dir, exist_ok=True)
+    # Invalidate any previous cache before overwriting its arrays.
+    metadata_path = os.path.join(cache_dir, _METADATA_FILENAME)
+    if os.path.exists(metadata_path):
+        os.remove(metadata_path)
+    for name, array in arrays.items():
+        path = os.path.join(cache_dir, f"{name}.npy")
+        with open(path + ".tmp", "wb") as f:
+            np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+        os.replace(path + ".tmp", path)
+    # The metadata is written last so that an interrupted write never leaves
+    # behind a cache that looks valid.
+    metadata = dict(metadata, arrays=list(arrays))
+    with open(metadata_path + ".tmp", "w") as f:
+        json.dump(metadata, f)
+    os.replace(metadata_path + ".tmp", metadata_path)
@@ -0,0 +1,122 @@
+import json
+import os
+
+import numpy as np
+
+from keras.src import testing
+from keras.src.datasets import decoded_cache
+
+
+class LoadDecodedArraysTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = self.get_temp_dir()
+        self.cache_dir = os.path.join(self.temp_dir, "cache")
+        self.source_path = os.path.join(self.temp_dir, "archive.bin")
+        with open(self.source_path, "wb") as f:
+            f.write(b"archive content")
+        self.x = np.arange(24, dtype="uint8").reshape((2, 3, 4))
+        self.y = np.array([3, 7], dtype="int64")
+        self.num_decodes = 0
+
+    def decode_fn(self):
+        self.num_decodes += 1
+        return {"x": self.x.copy(), "y": self.y.copy()}
+
+    def load(self, file_hash="abc", cache_dir=None):
+        return decoded_cache.load_decoded_arrays(
+            cache_dir or self.cache_dir,
+            [self.source_path],
+            self.decode_fn,
+            file_hash=file_hash,
+        )
+
+    def assertArraysEqual(self, arrays):
+        self.assertEqual(sorted(arrays), ["x", "y"])
+        np.testing.assert_array_equal(arrays["x"], self.x)
+        self.assertEqual(arrays["x"].dtype, self.x.dtype)
+        np.testing.assert_array_equal(arrays["y"], self.y)
+
+    def test_cache_hit(self):
+        self.assertArraysEqual(self.load())
+        self.assertEqual(self.num_decodes, 1)
+
+        arrays = self.load()
+        self.assertArraysEqual(arrays)
+        self.assertEqual(self.num_decodes, 1)
+        self.assertIsInstance(arrays["x"], np.memmap)
+        # Arrays are copy-on-write: modifying them doesn't alter the cache.
+        arrays["x"][0] = 0
+        self.assertArraysEqual(self.load())
+        self.assertEqual(self.num_decodes, 1)
+
+    def test_rebuild_when_size_changes(self):
+        self.load()
+        stat = os.stat(self.source_path)
+        with open(self.source_path, "ab") as f:
+            f.write(b"more")
+        os.utime(self.source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertArraysEqual(self.load())
+        self.assertEqual(self.num_decodes, 2)
+
+    def test_rebuild_when_mtime_changes(self):
+        self.load()
+        stat = os.stat(self.source_path)
+        os.utime(
+            self.source_path,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+        self.assertArraysEqual(self.load())
+        self.assertEqual(self.num_decodes, 2)
+        # The rebuilt cache is reused.
+        self.load()
+        self.assertEqual(self.num_decodes, 2)
+
+    def test_rebuild_when_file_hash_changes(self):
+        self.load(file_hash="abc")
+        self.x = self.x + 1
+        self.assertArraysEqual(self.load(file_hash="def"))
+        self.assertEqual(self.num_decodes, 2)
+        self.load(file_hash=None)
+        self.assertEqual(self.num_decodes, 3)
+
+    def test_missing_metadata(self):
+        self.load()
+        os.remove(os.path.join(self.cache_dir, "metadata.json"))
+        self.assertArraysEqual(self.load())
+        self.assertEqual(self.num_decodes, 2)
+        self.assertTrue(
+            os.path.exists(os.path.join(self.cache_dir, "metadata.json"))
+        )
+
+    def test_corrupt_metadata(self):
+        self.load()
+        metadata_path = os.path.join(self.cache_dir, "metadata.json")
+        for content in ("{not json", json.dumps({"version": 1})):
+            with open(metadata_path, "w") as f:
+                f.write(content)
+            self.assertArraysEqual(self.load())
+        self.assertEqual(self.num_decodes, 3)
+
+    def test_missing_array_file(self):
+        self.load()
+        os.remove(os.path.join(self.cache_dir, "y.npy"))
+        self.assertArraysEqual(self.load())
+        self.assertEqual(self.num_decodes, 2)
+
+    def test_unwritable_cache_dir(self):
+        # The cache directory can't be created under a regular file, like
+        # in a read-only location: the decoded arrays are returned as is.
+        cache_dir = os.path.join(self.source_path, "cache")
+        self.assertArraysEqual(self.load(cache_dir=cache_dir))
+        self.assertArraysEqual(self.load(cache_dir=cache_dir))
+        self.assertEqual(self.num_decodes, 2)
+
+    def test_read_only_cache_dir(self):
+        os.makedirs(self.cache_dir)
+        os.chmod(self.cache_dir, 0o555)
+        self.addCleanup(os.chmod, self.cache_dir, 0o755)
+        if os.access(self.cache_dir, os.W_OK):
+            self.skipTest("Permissions are not enforced (e.g. root user).")
+        self.assertArraysEqual(self.load())
+        self.assertEqual(os.listdir(self.cache_dir), [])
@@ -6,6 +6,7 @@ import os
 import numpy as np
 
 from keras.src.api_export import keras_export
+from keras.src.datasets.decoded_cache import load_decoded_arrays
 from keras.src.utils.file_utils import get_file
 
 
@@ -77,20 +78,33 @@ def load_data():
     for fname in files:
         paths.append(get_file(fname, origin=base + fname, cache_subdir=dirname))
 
-    with gzip.open(paths[0], "rb") as lbpath:
-        y_train = np.frombuffer(lbpath.read(), np.uint8, offset=8)
-
-    with gzip.open(paths[1], "rb") as imgpath:
-        x_train = np.frombuffer(imgpath.read(), np.uint8, offset=16).reshape(
-            len(y_train), 28, 28
-        )
-
-    with gzip.open(paths[2], "rb") as lbpath:
-        y_test = np.frombuffer(lbpath.read(), np.uint8, offset=8)
-
-    with gzip.open(paths[3], "rb") as imgpath:
-        x_test = np.frombuffer(imgpath.read(), np.uint8, offset=16).reshape(
-            len(y_test), 28, 28
-        )
+    def decode():
+        with gzip.open(paths[0], "rb") as lbpath:
+            y_train = np.frombuffer(lbpath.read(), np.uint8, offset=8)
+
+        with gzip.open(paths[1], "rb") as imgpath:
+            x_train = np.frombuffer(
+                imgpath.read(), np.uint8, offset=16
+            ).reshape(len(y_train), 28, 28)
+
+        with gzip.open(paths[2], "rb") as lbpath:
+            y_test = np.frombuffer(lbpath.read(), np.uint8, offset=8)
+
+        with gzip.open(paths[3], "rb") as imgpath:
+            x_test = np.frombuffer(imgpath.read(), np.uint8, offset=16).reshape(
+                len(y_test), 28, 28
+            )
+        return {
+            "x_train": x_train,
+            "y_train": y_train,
+            "x_test": x_test,
+            "y_test": y_test,
+        }
+
+    arrays = load_decoded_arrays(
+        os.path.join(os.path.dirname(paths[0]), "decoded"), paths, decode
+    )
+    x_train, y_train = arrays["x_train"], arrays["y_train"]
+    x_test, y_test = arrays["x_test"], arrays["y_test"]
 
     return (x_train, y_train), (x_test, y_test)
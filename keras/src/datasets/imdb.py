@@ -5,6 +5,7 @@ import json
 import numpy as np
 
 from keras.src.api_export import keras_export
+from keras.src.datasets.decoded_cache import load_decoded_arrays
 from keras.src.utils.file_utils import get_file
 from keras.src.utils.python_utils import remove_long_seq
 
@@ -76,26 +77,50 @@ def load_data(
     origin_folder = (
         "https://storage.googleapis.com/tensorflow/tf-keras-datasets/"
     )
+    file_hash = (  # noqa: E501
+        "69664113be75683a8fe16e3ed0ab59fda8886cb3cd7ada244f7d9544e4676b9f"
+    )
     path = get_file(
         fname=path,
         origin=origin_folder + "imdb.npz",
-        file_hash=(  # noqa: E501
-            "69664113be75683a8fe16e3ed0ab59fda8886cb3cd7ada244f7d9544e4676b9f"
-        ),
+        file_hash=file_hash,
+    )
+
+    def decode():
+        # The sequences are stored as object arrays, which cannot be
+        # memory-mapped: cache them as flat token arrays with offsets.
+        with np.load(path, allow_pickle=True) as f:
+            x_train_tokens, x_train_offsets = _flatten_sequences(f["x_train"])
+            x_test_tokens, x_test_offsets = _flatten_sequences(f["x_test"])
+            return {
+                "x_train_tokens": x_train_tokens,
+                "x_train_offsets": x_train_offsets,
+                "y_train": f["y_train"],
+                "x_test_tokens": x_test_tokens,
+                "x_test_offsets": x_test_offsets,
+                "y_test": f["y_test"],
+            }
+
+    arrays = load_decoded_arrays(
+        path + ".decoded", [path], decode, file_hash=file_hash
+    )
+    x_train = _unflatten_sequences(
+        arrays["x_train_tokens"], arrays["x_train_offsets"]
+    )
+    x_test = _unflatten_sequences(
+        arrays["x_test_tokens"], arrays["x_test_offsets"]
     )
-    with np.load(path, allow_pickle=True) as f:
-        x_train, labels_train = f["x_train"], f["y_train"]
-        x_test, labels_test = f["x_test"], f["y_test"]
+    labels_train, labels_test = arrays["y_train"], arrays["y_test"]
 
     rng = np.random.RandomState(seed)
     indices = np.arange(len(x_train))
     rng.shuffle(indices)
-    x_train = x_train[indices]
+    x_train = [x_train[i] for i in indices]
     labels_train = labels_train[indices]
 
     indices = np.arange(len(x_test))
     rng.shuffle(indices)
-    x_test = x_test[indices]
+    x_test = [x_test[i] for i in indices]
     labels_test = labels_test[indices]
 
     if start_char is not None:
@@ -140,6 +165,22 @@ def load_data(
     return (x_train, y_train), (x_test, y_test)
 
 
+def _flatten_sequences(sequences):
+    lengths = [len(x) for x in sequences]
+    offsets = np.zeros((len(sequences) + 1,), dtype="int64")
+    np.cumsum(lengths, out=offsets[1:])
+    tokens = np.fromiter(
+        (w for x in sequences for w in x), dtype="int32", count=offsets[-1]
+    )
+    return tokens, offsets
+
+
+def _unflatten_sequences(tokens, offsets):
+    tokens = tokens.tolist()
+    offsets = offsets.tolist()
+    return [tokens[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
 @keras_export("keras.datasets.imdb.get_word_index")
 def get_word_index(path="imdb_word_index.json"):
     """Retrieves a dict mapping words to their index in the IMDB dataset.
@@ -3,6 +3,7 @@
 import numpy as np
 
 from keras.src.api_export import keras_export
+from keras.src.datasets.decoded_cache import load_decoded_arrays
 from keras.src.utils.file_utils import get_file
 
 
@@ -57,15 +58,27 @@ def load_data(path="mnist.npz"):
     origin_folder = (
         "https://storage.googleapis.com/tensorflow/tf-keras-datasets/"
     )
+    file_hash = (  # noqa: E501
+        "731c5ac602752760c8e48fbffcf8c3b850d9dc2a2aedcf2cc48468fc17b673d1"
+    )
     path = get_file(
         fname=path,
         origin=origin_folder + "mnist.npz",
-        file_hash=(  # noqa: E501
-            "731c5ac602752760c8e48fbffcf8c3b850d9dc2a2aedcf2cc48468fc17b673d1"
-        ),
+        file_hash=file_hash,
     )
-    with np.load(path, allow_pickle=True) as f:
-        x_train, y_train = f["x_train"], f["y_train"]
-        x_test, y_test = f["x_test"], f["y_test"]
 
-        return (x_train, y_train), (x_test, y_test)
+    def decode():
+        with np.load(path, allow_pickle=True) as f:
+            return {
+                "x_train": f["x_train"],
+                "y_train": f["y_train"],
+                "x_test": f["x_test"],
+                "y_test": f["y_test"],
+            }
+
+    arrays = load_decoded_arrays(
+        path + ".decoded", [path], decode, file_hash=file_hash
+    )
+    x_train, y_train = arrays["x_train"], arrays["y_train"]
+    x_test, y_test = arrays["x_test"], arrays["y_test"]
+    return (x_train, y_train), (x_test, y_test)
@@ -87,6 +87,7 @@ from keras.src.layers.preprocessing.hashing import Hashing
 from keras.src.layers.preprocessing.index_lookup import IndexLookup
 from keras.src.layers.preprocessing.integer_lookup import IntegerLookup
 from keras.src.layers.preprocessing.normalization import Normalization
+from keras.src.layers.preprocessing.random_affine import RandomAffine
 from keras.src.layers.preprocessing.random_brightness import RandomBrightness
 from keras.src.layers.preprocessing.random_contrast import RandomContrast
 from keras.src.layers.preprocessing.random_crop import RandomCrop
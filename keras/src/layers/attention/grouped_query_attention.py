@@ -1,3 +1,6 @@
+import math
+
+from keras.src import backend
 from keras.src import constraints
 from keras.src import initializers
 from keras.src import ops
@@ -68,6 +71,20 @@ class GroupedQueryAttention(Layer):
         use_causal_mask: A boolean to indicate whether to apply a causal mask to
             prevent tokens from attending to future tokens (e.g., used in a
             decoder Transformer).
+        cache: Optional tuple `(key_cache, value_cache)` of the projected keys
+            and values of previous steps, each of shape
+            `(batch_dim, max_seq_len, num_key_value_heads, head_dim)`. When
+            given, the layer attends to the cached keys and values instead of
+            projecting the whole `key` and `value`, which makes autoregressive
+            decoding linear in the number of steps. The Keras masks of `key`
+            and `value` are ignored, use `attention_mask` of shape
+            `(batch_dim, target_seq_len, max_seq_len)` to mask cached
+            positions.
+        cache_update_index: Optional integer or integer scalar tensor, the
+            position in the cache at which the projections of `key` and `value`
+            are written before attending. The causal mask is offset by this
+            index. If `None`, the `cache` is used as is, without projecting
+            `key` and `value`.
 
     Returns:
         attention_output: Result of the computation, of shape
@@ -76,6 +93,8 @@ class GroupedQueryAttention(Layer):
             last dim.
         attention_scores: (Optional) attention coefficients of shape
             `(batch_dim, num_query_heads, target_seq_len, source_seq_len)`.
+        cache: (Optional) the updated `(key_cache, value_cache)` tuple, only
+            returned when `cache` is given.
     """
 
     def __init__(
@@ -114,6 +133,7 @@ class GroupedQueryAttention(Layer):
         self.activity_regularizer = regularizers.get(activity_regularizer)
         self.kernel_constraint = constraints.get(kernel_constraint)
         self.bias_constraint = constraints.get(bias_constraint)
+        self._return_attention_scores = False
 
     def build(
         self,
@@ -163,8 +183,11 @@ class GroupedQueryAttention(Layer):
             rate=self.dropout, dtype=self.dtype_policy
         )
 
-        self._dot_product_equation = "bquh,bkuh->buqk"
-        self._combine_equation = "buqk,bkuh->bquh"
+        # The query heads are split in `num_key_value_heads` groups (`v`) of
+        # `num_repeats` heads (`g`), each group attending to one key/value
+        # head, so that the keys and values are not repeated.
+        self._dot_product_equation = "bqvgh,bkvh->bvgqk"
+        self._combine_equation = "bvgqk,bkvh->bqvgh"
 
         self._output_dense = EinsumDense(
             "bquh,uhm->bqm",
@@ -212,10 +235,34 @@ class GroupedQueryAttention(Layer):
         return_attention_scores=False,
         training=None,
         use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
     ):
         if key is None:
             key = value
 
+        self._return_attention_scores = return_attention_scores
+
+        query = self._query_dense(query)
+        if cache is not None:
+            key_cache, value_cache = cache
+            if cache_update_index is not None:
+                # Only project the new steps, and write them in the cache.
+                start = [0, cache_update_index, 0, 0]
+                key_cache = ops.slice_update(
+                    key_cache, start, self._key_dense(key)
+                )
+                value_cache = ops.slice_update(
+                    value_cache, start, self._value_dense(value)
+                )
+            cache = (key_cache, value_cache)
+            key, value = cache
+            # The Keras masks cover the new steps, not the whole cache.
+            value_mask = key_mask = None
+        else:
+            key = self._key_dense(key)
+            value = self._value_dense(value)
+
         attention_mask = self._compute_attention_mask(
             query,
             value,
@@ -224,19 +271,9 @@ class GroupedQueryAttention(Layer):
             key_mask=key_mask,
             attention_mask=attention_mask,
             use_causal_mask=use_causal_mask,
+            causal_mask_offset=cache_update_index,
         )
 
-        query = self._query_dense(query)
-        key = self._key_dense(key)
-        value = self._value_dense(value)
-
-        key = ops.repeat(
-            key, self.num_repeats, axis=2
-        )  # (batch_dim, source_seq_len, query_heads, head_dim)
-        value = ops.repeat(
-            value, self.num_repeats, axis=2
-        )  # (batch_dim, source_seq_len, query_heads, head_dim)
-
         output, scores = self._compute_attention(
             query,
             key,
@@ -249,9 +286,14 @@ class GroupedQueryAttention(Layer):
             output
         )  # (batch_dim, target_seq_len, feature_dim)
 
+        outputs = output
         if return_attention_scores:
-            return output, scores
-        return output
+            outputs = (output, scores)
+        if cache is not None:
+            if return_attention_scores:
+                return outputs + (cache,)
+            return outputs, cache
+        return outputs
 
     def _compute_attention_mask(
         self,
@@ -262,6 +304,7 @@ class GroupedQueryAttention(Layer):
         key_mask=None,
         attention_mask=None,
         use_causal_mask=False,
+        causal_mask_offset=None,
     ):
         """Computes the attention mask, using the Keras masks of the inputs.
 
@@ -286,6 +329,8 @@ class GroupedQueryAttention(Layer):
             use_causal_mask: A boolean to indicate whether to apply a causal
                 mask to prevent tokens from attending to future tokens (e.g.,
                 used in a decoder Transformer).
+            causal_mask_offset: Optional position of the first query step in
+                the key sequence, e.g. when decoding with a cache.
 
         Returns:
             attention_mask: a boolean mask of shape `(B, T, S)`, that prevents
@@ -310,7 +355,9 @@ class GroupedQueryAttention(Layer):
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if use_causal_mask:
             # the shape of the causal mask is [1, T, S]
-            mask = self._compute_causal_mask(query, value)
+            mask = self._compute_causal_mask(
+                query, value, offset=causal_mask_offset
+            )
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if auto_mask is not None:
             # merge attention_mask & automatic mask, to shape [B, T, S]
@@ -321,7 +368,7 @@ class GroupedQueryAttention(Layer):
             )
         return attention_mask
 
-    def _compute_causal_mask(self, query, value=None):
+    def _compute_causal_mask(self, query, value=None, offset=None):
         """Computes a causal mask (e.g., for masked self-attention layers).
 
         For example, if query and value both contain sequences of length 4,
@@ -338,6 +385,10 @@ class GroupedQueryAttention(Layer):
             query: query tensor of shape `(B, T, ...)`.
             value: value tensor of shape `(B, S, ...)` (optional, defaults to
                 query).
+            offset: Optional integer or integer scalar tensor, the position
+                of the first query step in the value sequence. The diagonal
+                of the mask is shifted right by `offset` (optional, defaults
+                to 0).
 
         Returns:
             mask: a boolean tensor of shape `(1, T, S)` containing a lower
@@ -348,25 +399,77 @@ class GroupedQueryAttention(Layer):
         ones_mask = ops.ones((1, q_seq_length, v_seq_length), dtype="int32")
         row_index = ops.cumsum(ones_mask, axis=-2)
         col_index = ops.cumsum(ones_mask, axis=-1)
+        if offset is not None:
+            row_index = row_index + ops.cast(offset, "int32")
         return ops.greater_equal(row_index, col_index)
 
     def _compute_attention(
         self, query, key, value, attention_mask=None, training=None
     ):
+        if not self._return_attention_scores and not (
+            self.dropout and training
+        ):
+            # The attention scores aren't needed, so the backend's fused (and
+            # memory-efficient) attention can be used. It takes the same
+            # `(B, T, N, H)` layout.
+            if attention_mask is not None:
+                # `(B, T, S)` -> `(B, 1, T, S)`, broadcast over the heads.
+                for _ in range(4 - len(attention_mask.shape)):
+                    attention_mask = ops.expand_dims(attention_mask, axis=-3)
+            output = ops.dot_product_attention(
+                query,
+                key,
+                value,
+                mask=attention_mask,
+                scale=1.0 / math.sqrt(self.head_dim),
+            )
+            return output, None
+
         query = ops.multiply(
             query,
             1.0 / ops.sqrt(ops.cast(self.head_dim, query.dtype)),
         )
+        # (batch_dim, target_seq_len, key_value_heads, num_repeats, head_dim)
+        query_shape = ops.shape(query)
+        query = ops.reshape(
+            query,
+            (
+                query_shape[0],
+                query_shape[1],
+                self.num_key_value_heads,
+                self.num_repeats,
+                self.head_dim,
+            ),
+        )
         # Take the dot product between "query" and "key" to get the raw
-        # attention scores.
-        scores = ops.einsum(
-            self._dot_product_equation, query, key
+        # attention scores, of shape (batch_dim, key_value_heads, num_repeats,
+        # target_seq_len, source_seq_len).
+        scores = ops.einsum(self._dot_product_equation, query, key)
+        scores_shape = ops.shape(scores)
+        scores = ops.reshape(
+            scores,
+            (
+                scores_shape[0],
+                self.num_query_heads,
+                scores_shape[3],
+                scores_shape[4],
+            ),
         )  # (batch_dim, query_heads, target_seq_len, source_seq_len)
         scores = self._masked_softmax(scores, attention_mask=attention_mask)
         # This is actually dropping out entire tokens to attend to, which might
         # seem a bit unusual, but is taken from the original Transformer paper.
         scores_dropout = self._dropout_layer(scores, training=training)
+        scores_dropout = ops.reshape(scores_dropout, scores_shape)
         output = ops.einsum(self._combine_equation, scores_dropout, value)
+        output = ops.reshape(
+            output,
+            (
+                query_shape[0],
+                query_shape[1],
+                self.num_query_heads,
+                self.head_dim,
+            ),
+        )  # (batch_dim, target_seq_len, query_heads, head_dim)
         return output, scores
 
     def _masked_softmax(self, scores, attention_mask=None):
@@ -408,6 +511,50 @@ class GroupedQueryAttention(Layer):
 
         return query_shape
 
+    def compute_output_spec(
+        self,
+        query,
+        value,
+        key=None,
+        query_mask=None,
+        value_mask=None,
+        key_mask=None,
+        attention_mask=None,
+        return_attention_scores=False,
+        training=None,
+        use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
+    ):
+        key_shape = None if key is None else key.shape
+        output_spec = backend.KerasTensor(
+            self.compute_output_shape(query.shape, value.shape, key_shape),
+            dtype=self.compute_dtype,
+        )
+        outputs = output_spec
+        if return_attention_scores:
+            source_length = (
+                value.shape[1] if cache is None else cache[0].shape[1]
+            )
+            scores_shape = (
+                query.shape[0],
+                self.num_query_heads,
+                query.shape[1],
+                source_length,
+            )
+            outputs = (
+                output_spec,
+                backend.KerasTensor(scores_shape, dtype=self.compute_dtype),
+            )
+        if cache is not None:
+            cache_spec = tuple(
+                backend.KerasTensor(x.shape, dtype=x.dtype) for x in cache
+            )
+            if return_attention_scores:
+                return outputs + (cache_spec,)
+            return outputs, cache_spec
+        return outputs
+
     def get_config(self):
         config = {
             "head_dim": self.head_dim,
@@ -84,6 +84,19 @@ class MultiHeadAttention(Layer):
         use_causal_mask: A boolean to indicate whether to apply a causal mask to
             prevent tokens from attending to future tokens (e.g., used in a
             decoder Transformer).
+        cache: Optional tuple `(key_cache, value_cache)` of the projected keys
+            and values of previous steps, of shapes `(B, max_length, N,
+            key_dim)` and `(B, max_length, N, value_dim)`, where `N` is the
+            number of heads. When given, the layer attends to the cached keys
+            and values instead of projecting the whole `key` and `value`, which
+            makes autoregressive decoding linear in the number of steps. The
+            Keras masks of `key` and `value` are ignored, use `attention_mask`
+            of shape `(B, T, max_length)` to mask cached positions.
+        cache_update_index: Optional integer or integer scalar tensor, the
+            position in the cache at which the projections of `key` and `value`
+            are written before attending. The causal mask is offset by this
+            index. If `None`, the `cache` is used as is, without projecting
+            `key` and `value`.
 
     Returns:
         attention_output: The result of the computation, of shape `(B, T, E)`,
@@ -93,6 +106,25 @@ class MultiHeadAttention(Layer):
             `output_shape`.
         attention_scores: (Optional) multi-head attention coefficients over
             attention axes.
+        cache: (Optional) the updated `(key_cache, value_cache)` tuple, only
+            returned when `cache` is given.
+
+    Example of incremental decoding with a cache:
+
+    >>> layer = keras.layers.MultiHeadAttention(num_heads=2, key_dim=8)
+    >>> cache = (
+    ...     np.zeros((1, 10, 2, 8), "float32"),
+    ...     np.zeros((1, 10, 2, 8), "float32"),
+    ... )
+    >>> for index in range(10):
+    ...     token = np.random.random((1, 1, 16)).astype("float32")
+    ...     output, cache = layer(
+    ...         token,
+    ...         token,
+    ...         use_causal_mask=True,
+    ...         cache=cache,
+    ...         cache_update_index=index,
+    ...     )
     """
 
     def __init__(
@@ -140,6 +172,7 @@ class MultiHeadAttention(Layer):
             )
         self._attention_axes = attention_axes
         self.seed = seed
+        self._return_attention_scores = False
 
     @property
     def num_heads(self):
@@ -420,8 +453,31 @@ class MultiHeadAttention(Layer):
 
         Returns:
           attention_output: Multi-headed outputs of attention computation.
-          attention_scores: Multi-headed attention weights.
+          attention_scores: Multi-headed attention weights, or `None` if they
+            were not requested and the fused `ops.dot_product_attention` was
+            used.
         """
+        if (
+            not self._return_attention_scores
+            and len(query.shape) == 4
+            and not (self.dropout and training)
+        ):
+            # The attention scores aren't needed, so the backend's fused (and
+            # memory-efficient) attention can be used. It takes the same
+            # `(B, T, N, H)` layout.
+            if attention_mask is not None:
+                # `(B, T, S)` -> `(B, 1, T, S)`, broadcast over the heads.
+                for _ in range(4 - len(attention_mask.shape)):
+                    attention_mask = ops.expand_dims(attention_mask, axis=-3)
+            attention_output = ops.dot_product_attention(
+                query,
+                key,
+                value,
+                mask=attention_mask,
+                scale=self._inverse_sqrt_key_dim,
+            )
+            return attention_output, None
+
         # Note: Applying scalar multiply at the smaller end of einsum improves
         # XLA performance, but may introduce slight numeric differences in
         # the Transformer attention head.
@@ -464,10 +520,44 @@ class MultiHeadAttention(Layer):
         return_attention_scores=False,
         training=None,
         use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
     ):
         if key is None:
             key = value
 
+        self._return_attention_scores = return_attention_scores
+
+        #   N = `num_attention_heads`
+        #   H = `size_per_head`
+        # `query` = [B, T, N ,H]
+        query = self._query_dense(query)
+
+        if cache is not None:
+            key_cache, value_cache = cache
+            if cache_update_index is not None:
+                # Only project the new steps, and write them in the cache.
+                start = [0, cache_update_index] + [0] * (
+                    len(key_cache.shape) - 2
+                )
+                key_cache = ops.slice_update(
+                    key_cache, start, self._key_dense(key)
+                )
+                value_cache = ops.slice_update(
+                    value_cache, start, self._value_dense(value)
+                )
+            cache = (key_cache, value_cache)
+            # `key` = [B, max_length, N, H], `value` = [B, max_length, N, H]
+            key, value = cache
+            # The Keras masks cover the new steps, not the whole cache.
+            value_mask = key_mask = None
+        else:
+            # `key` = [B, S, N, H]
+            key = self._key_dense(key)
+
+            # `value` = [B, S, N, H]
+            value = self._value_dense(value)
+
         attention_mask = self._compute_attention_mask(
             query,
             value,
@@ -476,27 +566,22 @@ class MultiHeadAttention(Layer):
             key_mask=key_mask,
             attention_mask=attention_mask,
             use_causal_mask=use_causal_mask,
+            causal_mask_offset=cache_update_index,
         )
 
-        #   N = `num_attention_heads`
-        #   H = `size_per_head`
-        # `query` = [B, T, N ,H]
-        query = self._query_dense(query)
-
-        # `key` = [B, S, N, H]
-        key = self._key_dense(key)
-
-        # `value` = [B, S, N, H]
-        value = self._value_dense(value)
-
         attention_output, attention_scores = self._compute_attention(
             query, key, value, attention_mask, training
         )
         attention_output = self._output_dense(attention_output)
 
+        outputs = attention_output
         if return_attention_scores:
-            return attention_output, attention_scores
-        return attention_output
+            outputs = (attention_output, attention_scores)
+        if cache is not None:
+            if return_attention_scores:
+                return outputs + (cache,)
+            return outputs, cache
+        return outputs
 
     def _compute_attention_mask(
         self,
@@ -507,6 +592,7 @@ class MultiHeadAttention(Layer):
         key_mask=None,
         attention_mask=None,
         use_causal_mask=False,
+        causal_mask_offset=None,
     ):
         """Computes the attention mask, using the Keras masks of the inputs.
 
@@ -531,6 +617,8 @@ class MultiHeadAttention(Layer):
             use_causal_mask: A boolean to indicate whether to apply a causal
                 mask to prevent tokens from attending to future tokens (e.g.,
                 used in a decoder Transformer).
+            causal_mask_offset: Optional position of the first query step in
+                the key sequence, e.g. when decoding with a cache.
 
         Returns:
             attention_mask: a boolean mask of shape `(B, T, S)`, that prevents
@@ -555,7 +643,9 @@ class MultiHeadAttention(Layer):
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if use_causal_mask:
             # the shape of the causal mask is [1, T, S]
-            mask = self._compute_causal_mask(query, value)
+            mask = self._compute_causal_mask(
+                query, value, offset=causal_mask_offset
+            )
             auto_mask = mask if auto_mask is None else auto_mask & mask
         if auto_mask is not None:
             # merge attention_mask & automatic mask, to shape [B, T, S]
@@ -566,7 +656,7 @@ class MultiHeadAttention(Layer):
             )
         return attention_mask
 
-    def _compute_causal_mask(self, query, value=None):
+    def _compute_causal_mask(self, query, value=None, offset=None):
         """Computes a causal mask (e.g., for masked self-attention layers).
 
         For example, if query and value both contain sequences of length 4,
@@ -583,6 +673,10 @@ class MultiHeadAttention(Layer):
             query: query tensor of shape `(B, T, ...)`.
             value: value tensor of shape `(B, S, ...)` (optional, defaults to
                 query).
+            offset: Optional integer or integer scalar tensor, the position
+                of the first query step in the value sequence. The diagonal
+                of the mask is shifted right by `offset` (optional, defaults
+                to 0).
 
         Returns:
             mask: a boolean tensor of shape `(1, T, S)` containing a lower
@@ -593,6 +687,8 @@ class MultiHeadAttention(Layer):
         ones_mask = ops.ones((1, q_seq_length, v_seq_length), dtype="int32")
         row_index = ops.cumsum(ones_mask, axis=-2)
         col_index = ops.cumsum(ones_mask, axis=-1)
+        if offset is not None:
+            row_index = row_index + ops.cast(offset, "int32")
         return ops.greater_equal(row_index, col_index)
 
     def compute_output_shape(
@@ -635,6 +731,8 @@ class MultiHeadAttention(Layer):
         return_attention_scores=False,
         training=None,
         use_causal_mask=False,
+        cache=None,
+        cache_update_index=None,
     ):
         if key is not None:
             key_shape = key.shape
@@ -646,13 +744,28 @@ class MultiHeadAttention(Layer):
         output_spec = backend.KerasTensor(
             output_shape, dtype=self.compute_dtype
         )
+        outputs = output_spec
         if return_attention_scores:
             length = query.shape[1]
-            attention_shape = (query.shape[0], self.num_heads, length, length)
-            return output_spec, backend.KerasTensor(
-                attention_shape, dtype=self.compute_dtype
+            source_length = length if cache is None else cache[0].shape[1]
+            attention_shape = (
+                query.shape[0],
+                self.num_heads,
+                length,
+                source_length,
+            )
+            outputs = (
+                output_spec,
+                backend.KerasTensor(attention_shape, dtype=self.compute_dtype),
+            )
+        if cache is not None:
+            cache_spec = tuple(
+                backend.KerasTensor(x.shape, dtype=x.dtype) for x in cache
             )
-        return output_spec
+            if return_attention_scores:
+                return outputs + (cache_spec,)
+            return outputs, cache_spec
+        return outputs
 
 
 def _index_to_einsum_variable(i):
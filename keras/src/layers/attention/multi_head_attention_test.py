@@ -10,6 +10,7 @@ from keras.src import dtype_policies
 from keras.src import initializers
 from keras.src import layers
 from keras.src import models
+from keras.src import ops
 from keras.src import saving
 from keras.src import testing
 
@@ -223,6 +224,129 @@ class MultiHeadAttentionTest(testing.TestCase, parameterized.TestCase):
         )
         self.assertAllClose(output, output_with_manual_mask)
 
+    @parameterized.named_parameters(("causal", True), ("not_causal", False))
+    def test_fused_attention(self, use_causal_mask):
+        """Test that the fused attention, used when the attention scores are
+        not returned, matches the explicit computation."""
+        layer = layers.MultiHeadAttention(num_heads=2, key_dim=4)
+        query = np.array([[1, 2, 3, 0, 0], [3, 3, 1, 1, 2], [1, 0, 0, 0, 0]])
+        masked_query = layers.Embedding(4, 8, mask_zero=True)(query)
+        value = np.array([[5, 4, 0], [3, 0, 0], [2, 1, 1]])
+        masked_value = layers.Embedding(6, 8, mask_zero=True)(value)
+        output = layer(
+            query=masked_query,
+            value=masked_value,
+            use_causal_mask=use_causal_mask,
+        )
+        output_with_scores, _ = layer(
+            query=masked_query,
+            value=masked_value,
+            use_causal_mask=use_causal_mask,
+            return_attention_scores=True,
+        )
+        self.assertAllClose(output, output_with_scores)
+
+    @parameterized.named_parameters(
+        ("with_scores", True), ("without_scores", False)
+    )
+    def test_cache(self, return_attention_scores):
+        """Test that decoding with a cache matches the full computation."""
+        layer = layers.MultiHeadAttention(num_heads=2, key_dim=4, value_dim=3)
+        inputs = np.random.normal(size=(2, 6, 5)).astype("float32")
+        expected_output = layer(inputs, inputs, use_causal_mask=True)
+
+        cache = (
+            np.zeros((2, 6, 2, 4), dtype="float32"),
+            np.zeros((2, 6, 2, 3), dtype="float32"),
+        )
+        # Process the first 3 steps at once, then the others one by one.
+        outputs = []
+        for start, end in [(0, 3), (3, 4), (4, 5), (5, 6)]:
+            step_outputs = layer(
+                inputs[:, start:end],
+                inputs[:, start:end],
+                use_causal_mask=True,
+                return_attention_scores=return_attention_scores,
+                cache=cache,
+                cache_update_index=start,
+            )
+            if return_attention_scores:
+                output, scores, cache = step_outputs
+                self.assertEqual(scores.shape[-2:], (end - start, 6))
+            else:
+                output, cache = step_outputs
+            outputs.append(backend.convert_to_numpy(output))
+        self.assertAllClose(
+            np.concatenate(outputs, axis=1), expected_output, atol=1e-5
+        )
+
+        # Without `cache_update_index`, the cache is used as is.
+        output, new_cache = layer(inputs[:, :1], inputs[:, :1], cache=cache)
+        self.assertAllClose(new_cache[0], cache[0])
+        self.assertAllClose(new_cache[1], cache[1])
+
+    def test_cache_with_traced_index(self):
+        layer = layers.MultiHeadAttention(num_heads=2, key_dim=4, value_dim=3)
+        inputs = np.random.normal(size=(2, 4, 5)).astype("float32")
+        expected_output = layer(inputs, inputs, use_causal_mask=True)
+
+        num_traces = []
+
+        def step(inputs, key_cache, value_cache, index):
+            num_traces.append(1)
+            output, cache = layer(
+                inputs,
+                inputs,
+                use_causal_mask=True,
+                cache=(key_cache, value_cache),
+                cache_update_index=index,
+            )
+            return output, cache[0], cache[1]
+
+        # The same compiled function decodes every step: the index is a
+        # traced tensor rather than a Python integer.
+        if backend.backend() == "jax":
+            import jax
+
+            step = jax.jit(step)
+        elif backend.backend() == "tensorflow":
+            import tensorflow as tf
+
+            step = tf.function(step, jit_compile=True)
+
+        key_cache = np.zeros((2, 4, 2, 4), dtype="float32")
+        value_cache = np.zeros((2, 4, 2, 3), dtype="float32")
+        outputs = []
+        for index in range(4):
+            output, key_cache, value_cache = step(
+                inputs[:, index : index + 1],
+                key_cache,
+                value_cache,
+                ops.convert_to_tensor(index, dtype="int32"),
+            )
+            outputs.append(backend.convert_to_numpy(output))
+        self.assertAllClose(
+            np.concatenate(outputs, axis=1), expected_output, atol=1e-5
+        )
+        if backend.backend() in ("jax", "tensorflow"):
+            self.assertLen(num_traces, 1)
+
+    def test_symbolic_cache(self):
+        layer = layers.MultiHeadAttention(num_heads=2, key_dim=4, value_dim=3)
+        inputs = layers.Input((1, 5))
+        cache = (layers.Input((6, 2, 4)), layers.Input((6, 2, 3)))
+        output, scores, new_cache = layer(
+            inputs,
+            inputs,
+            return_attention_scores=True,
+            cache=cache,
+            cache_update_index=2,
+        )
+        self.assertEqual(output.shape, (None, 1, 5))
+        self.assertEqual(scores.shape, (None, 2, 1, 6))
+        self.assertEqual(new_cache[0].shape, cache[0].shape)
+        self.assertEqual(new_cache[1].shape, cache[1].shape)
+
     def test_correctness(self):
         query = np.array([[[1.0, 0.0], [0.0, 1.0]]])
         key = np.array([[[0.0, 1.0], [1.0, 0.0]]])
@@ -1,3 +1,7 @@
+import math
+
+import numpy as np
+
 from keras.src.api_export import keras_export
 from keras.src.layers.preprocessing.tf_data_layer import TFDataLayer
 
@@ -112,6 +116,23 @@ class MelSpectrogram(TFDataLayer):
         self.ref_power = ref_power
         super().__init__(**kwargs)
 
+        # The window, the mel filterbank and the decibel reference only depend
+        # on the configuration, so they are computed once, on the host.
+        if isinstance(self.window, str):
+            self._window = _get_window(self.window, self.sequence_length)
+        else:
+            self._window = self.window
+        self._mel_weights = _linear_to_mel_weight_matrix(
+            num_mel_bins=self.num_mel_bins,
+            num_spectrogram_bins=self.fft_length // 2 + 1,
+            sampling_rate=self.sampling_rate,
+            lower_edge_hertz=self.min_freq,
+            upper_edge_hertz=self.max_freq,
+        )
+        self._ref_db = 10.0 * math.log10(
+            max(abs(self.ref_power), self.min_power)
+        )
+
     def call(self, inputs):
         dtype = (
             "float32"
@@ -134,25 +155,20 @@ class MelSpectrogram(TFDataLayer):
             sequence_length=self.sequence_length,
             sequence_stride=self.sequence_stride,
             fft_length=self.fft_length,
-            window=self.window,
+            window=self._window,
             center=True,
         )
-        # abs of complex  = sqrt(real^2 + imag^2)
-        spec = self.backend.numpy.sqrt(
-            self.backend.numpy.add(
-                self.backend.numpy.square(real), self.backend.numpy.square(imag)
-            )
+        # |stft|^mag_exp = (real^2 + imag^2)^(mag_exp / 2)
+        spec = self.backend.numpy.add(
+            self.backend.numpy.square(real), self.backend.numpy.square(imag)
         )
-        spec = self.backend.numpy.power(spec, self.mag_exp)
+        if self.mag_exp != 2:
+            spec = self.backend.numpy.power(spec, self.mag_exp / 2)
         return spec
 
     def _melscale(self, inputs):
-        matrix = self.linear_to_mel_weight_matrix(
-            num_mel_bins=self.num_mel_bins,
-            num_spectrogram_bins=self.backend.shape(inputs)[-1],
-            sampling_rate=self.sampling_rate,
-            lower_edge_hertz=self.min_freq,
-            upper_edge_hertz=self.max_freq,
+        matrix = self.backend.convert_to_tensor(
+            self._mel_weights, dtype=inputs.dtype
         )
         return self.backend.numpy.tensordot(inputs, matrix, axes=1)
 
@@ -162,33 +178,12 @@ class MelSpectrogram(TFDataLayer):
                 self.backend.numpy.maximum(inputs, self.min_power)
             )
         )
-        ref_value = self.backend.numpy.abs(
-            self.backend.convert_to_tensor(self.ref_power)
-        )
-        log_spec -= 10.0 * self.backend.numpy.log10(
-            self.backend.numpy.maximum(ref_value, self.min_power)
-        )
+        log_spec -= self._ref_db
         log_spec = self.backend.numpy.maximum(
             log_spec, self.backend.numpy.max(log_spec) - self.top_db
         )
         return log_spec
 
-    def _hertz_to_mel(self, frequencies_hertz):
-        """Converts frequencies in `frequencies_hertz` in Hertz to the
-            mel scale.
-
-        Args:
-            frequencies_hertz: A tensor of frequencies in Hertz.
-            name: An optional name for the operation.
-
-        Returns:
-            A tensor of the same shape and type of `frequencies_hertz`
-            containing frequencies in the mel scale.
-        """
-        return _MEL_HIGH_FREQUENCY_Q * self.backend.numpy.log(
-            1.0 + (frequencies_hertz / _MEL_BREAK_FREQUENCY_HERTZ)
-        )
-
     def linear_to_mel_weight_matrix(
         self,
         num_mel_bins=20,
@@ -261,67 +256,15 @@ class MelSpectrogram(TFDataLayer):
             A tensor of shape `[num_spectrogram_bins, num_mel_bins]`.
         """
 
-        # This function can be constant folded by graph optimization since
-        # there are no Tensor inputs.
-        sampling_rate = self.backend.cast(sampling_rate, dtype)
-        lower_edge_hertz = self.backend.convert_to_tensor(
-            lower_edge_hertz,
-            dtype,
-        )
-        upper_edge_hertz = self.backend.convert_to_tensor(
-            upper_edge_hertz,
-            dtype,
-        )
-        zero = self.backend.convert_to_tensor(0.0, dtype)
-
-        # HTK excludes the spectrogram DC bin.
-        bands_to_zero = 1
-        nyquist_hertz = sampling_rate / 2.0
-        linear_frequencies = self.backend.numpy.linspace(
-            zero, nyquist_hertz, num_spectrogram_bins
-        )[bands_to_zero:]
-        spectrogram_bins_mel = self.backend.numpy.expand_dims(
-            self._hertz_to_mel(linear_frequencies), 1
-        )
-
-        # Compute num_mel_bins triples of (lower_edge, center, upper_edge). The
-        # center of each band is the lower and upper edge of the adjacent bands.
-        # Accordingly, we divide [lower_edge_hertz, upper_edge_hertz] into
-        # num_mel_bins + 2 pieces.
-        band_edges_mel = self.backend.math.extract_sequences(
-            self.backend.numpy.linspace(
-                self._hertz_to_mel(lower_edge_hertz),
-                self._hertz_to_mel(upper_edge_hertz),
-                num_mel_bins + 2,
+        return self.backend.convert_to_tensor(
+            _linear_to_mel_weight_matrix(
+                num_mel_bins=num_mel_bins,
+                num_spectrogram_bins=num_spectrogram_bins,
+                sampling_rate=sampling_rate,
+                lower_edge_hertz=lower_edge_hertz,
+                upper_edge_hertz=upper_edge_hertz,
             ),
-            sequence_length=3,
-            sequence_stride=1,
-        )
-
-        # Split the triples up and reshape them into [1, num_mel_bins] tensors.
-        lower_edge_mel, center_mel, upper_edge_mel = tuple(
-            self.backend.numpy.reshape(t, [1, num_mel_bins])
-            for t in self.backend.numpy.split(band_edges_mel, 3, axis=1)
-        )
-
-        # Calculate lower and upper slopes for every spectrogram bin.
-        # Line segments are linear in the mel domain, not Hertz.
-        lower_slopes = (spectrogram_bins_mel - lower_edge_mel) / (
-            center_mel - lower_edge_mel
-        )
-        upper_slopes = (upper_edge_mel - spectrogram_bins_mel) / (
-            upper_edge_mel - center_mel
-        )
-
-        # Intersect the line segments with each other and zero.
-        mel_weights_matrix = self.backend.numpy.maximum(
-            zero, self.backend.numpy.minimum(lower_slopes, upper_slopes)
-        )
-
-        # Re-add the zeroed lower bins we sliced out above.
-        return self.backend.numpy.pad(
-            mel_weights_matrix,
-            [[bands_to_zero, 0], [0, 0]],
+            dtype=dtype,
         )
 
     def compute_output_shape(self, input_shape):
@@ -368,3 +311,81 @@ class MelSpectrogram(TFDataLayer):
             }
         )
         return config
+
+
+def _get_window(window, sequence_length):
+    """Returns a periodic `"hann"` or `"hamming"` window as a NumPy array."""
+    if window not in ("hann", "hamming"):
+        raise ValueError(
+            "Expected `window` to be one of `'hann'`, `'hamming'`, a tensor "
+            f"or `None`. Received: window={window}"
+        )
+    # Periodic windows, as used by all the backends' `stft`.
+    phase = 2.0 * np.pi * np.arange(sequence_length) / sequence_length
+    if window == "hann":
+        return 0.5 - 0.5 * np.cos(phase)
+    return 0.54 - 0.46 * np.cos(phase)
+
+
+def _hertz_to_mel(frequencies_hertz):
+    """Converts frequencies in `frequencies_hertz` in Hertz to the mel scale.
+
+    Args:
+        frequencies_hertz: A NumPy array of frequencies in Hertz.
+
+    Returns:
+        A NumPy array of the same shape containing frequencies in the mel
+        scale.
+    """
+    return _MEL_HIGH_FREQUENCY_Q * np.log(
+        1.0 + (frequencies_hertz / _MEL_BREAK_FREQUENCY_HERTZ)
+    )
+
+
+def _linear_to_mel_weight_matrix(
+    num_mel_bins,
+    num_spectrogram_bins,
+    sampling_rate,
+    lower_edge_hertz,
+    upper_edge_hertz,
+):
+    """NumPy implementation of `MelSpectrogram.linear_to_mel_weight_matrix`.
+
+    Returns a `float64` NumPy array of shape
+    `[num_spectrogram_bins, num_mel_bins]`.
+    """
+    # HTK excludes the spectrogram DC bin.
+    bands_to_zero = 1
+    nyquist_hertz = float(sampling_rate) / 2.0
+    linear_frequencies = np.linspace(
+        0.0, nyquist_hertz, int(num_spectrogram_bins)
+    )[bands_to_zero:]
+    spectrogram_bins_mel = _hertz_to_mel(linear_frequencies)[:, None]
+
+    # Compute num_mel_bins triples of (lower_edge, center, upper_edge). The
+    # center of each band is the lower and upper edge of the adjacent bands.
+    # Accordingly, we divide [lower_edge_hertz, upper_edge_hertz] into
+    # num_mel_bins + 2 pieces.
+    band_edges_mel = np.linspace(
+        _hertz_to_mel(float(lower_edge_hertz)),
+        _hertz_to_mel(float(upper_edge_hertz)),
+        num_mel_bins + 2,
+    )
+    lower_edge_mel = band_edges_mel[None, :-2]
+    center_mel = band_edges_mel[None, 1:-1]
+    upper_edge_mel = band_edges_mel[None, 2:]
+
+    # Calculate lower and upper slopes for every spectrogram bin.
+    # Line segments are linear in the mel domain, not Hertz.
+    lower_slopes = (spectrogram_bins_mel - lower_edge_mel) / (
+        center_mel - lower_edge_mel
+    )
+    upper_slopes = (upper_edge_mel - spectrogram_bins_mel) / (
+        upper_edge_mel - center_mel
+    )
+
+    # Intersect the line segments with each other and zero.
+    mel_weights_matrix = np.maximum(0.0, np.minimum(lower_slopes, upper_slopes))
+
+    # Re-add the zeroed lower bins we sliced out above.
+    return np.pad(mel_weights_matrix, [[bands_to_zero, 0], [0, 0]])
@@ -3,7 +3,9 @@ import pytest
 from absl.testing import parameterized
 from tensorflow import data as tf_data
 
+from keras.src import backend
 from keras.src import layers
+from keras.src import ops
 from keras.src import testing
 
 
@@ -101,3 +103,42 @@ class MelSpectrogramTest(testing.TestCase, parameterized.TestCase):
         for output in ds.take(1):
             output = output.numpy()
         self.assertEqual(tuple(output.shape), output_shape)
+
+    @parameterized.parameters(
+        [("hann", 2.0), ("hamming", 1.0), (None, 2.0), ("hann", 3.0)]
+    )
+    def test_correctness(self, window, mag_exp):
+        layer = layers.MelSpectrogram(
+            num_mel_bins=40,
+            sampling_rate=8000,
+            sequence_stride=128,
+            fft_length=512,
+            window=window,
+            power_to_db=False,
+            mag_exp=mag_exp,
+        )
+        input_data = np.random.uniform(-1, 1, (2, 4000)).astype("float32")
+        real, imag = ops.stft(
+            input_data,
+            sequence_length=512,
+            sequence_stride=128,
+            fft_length=512,
+            window=window,
+        )
+        spec = ops.power(ops.sqrt(real**2 + imag**2), mag_exp)
+        matrix = layer.linear_to_mel_weight_matrix(
+            num_mel_bins=40,
+            num_spectrogram_bins=257,
+            sampling_rate=8000,
+            lower_edge_hertz=20.0,
+            upper_edge_hertz=4000.0,
+        )
+        expected = ops.swapaxes(ops.tensordot(spec, matrix, axes=1), -1, -2)
+        expected = backend.convert_to_numpy(expected)
+        output = layer(input_data)
+        self.assertAllClose(
+            output, expected, rtol=1e-4, atol=1e-4 * np.max(expected)
+        )
+        self.assertEqual(
+            backend.standardize_dtype(output.dtype), layer.compute_dtype
+        )
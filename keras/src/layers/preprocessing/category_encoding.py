@@ -51,6 +51,29 @@ class CategoryEncoding(TFDataLayer):
              [0. , 0.2, 0.3, 0. ],
              [0. , 0.2, 0. , 0.4]]>
 
+    **Encoding as indices and weights**
+
+    With a large `num_tokens` (e.g. hashed features), the `(batch, num_tokens)`
+    encodings are very large. With `return_indices_and_weights=True`, the
+    layer instead returns the non-zero entries of each sample: the encoding
+    is the sum of the `weights` of the sample scattered at its `indices`.
+    This can be fed to an embedding-bag style reduction, which is equivalent
+    to a `Dense` layer applied to the encoding:
+
+    >>> layer = keras.layers.CategoryEncoding(
+    ...           num_tokens=4, output_mode="multi_hot",
+    ...           return_indices_and_weights=True)
+    >>> indices, weights = layer([[0, 1], [0, 0], [1, 2], [3, 1]])
+    >>> weights
+    array([[1., 1.],
+           [1., 0.],
+           [1., 1.],
+           [1., 1.]]>
+    >>> embeddings = np.random.random((4, 8))
+    >>> outputs = keras.ops.sum(
+    ...     keras.ops.take(embeddings, indices, axis=0) * weights[..., None],
+    ...     axis=1)
+
     Args:
         num_tokens: The total number of tokens the layer should support. All
             inputs to the layer must integers in the range `0 <= value <
@@ -77,6 +100,13 @@ class CategoryEncoding(TFDataLayer):
             Defaults to `"multi_hot"`.
         sparse: Whether to return a sparse tensor; for backends that support
             sparse tensors.
+        return_indices_and_weights: Whether to return the `"multi_hot"` or
+            `"count"` encoding as a tuple `(indices, weights)` of tensors
+            with the same shape as `inputs` rather than as a
+            `(..., num_tokens)` tensor. Out of range values, and repeated
+            values of a sample in `"multi_hot"` mode, get a weight of zero.
+            This is supported on all backends, for 1D and 2D dense inputs.
+            Defaults to `False`.
 
     Call arguments:
         inputs: A 1D or 2D tensor of integer inputs.
@@ -86,7 +116,12 @@ class CategoryEncoding(TFDataLayer):
     """
 
     def __init__(
-        self, num_tokens=None, output_mode="multi_hot", sparse=False, **kwargs
+        self,
+        num_tokens=None,
+        output_mode="multi_hot",
+        sparse=False,
+        return_indices_and_weights=False,
+        **kwargs,
     ):
         super().__init__(**kwargs)
 
@@ -108,14 +143,31 @@ class CategoryEncoding(TFDataLayer):
             raise ValueError(
                 f"`num_tokens` must be >= 1. Received: num_tokens={num_tokens}."
             )
+        if return_indices_and_weights and (output_mode == "one_hot" or sparse):
+            raise ValueError(
+                "`return_indices_and_weights=True` is only supported with "
+                "`output_mode='multi_hot'` or `output_mode='count'`, and "
+                f"`sparse=False`. Received: output_mode={output_mode}, "
+                f"sparse={sparse}"
+            )
         self.num_tokens = num_tokens
         self.output_mode = output_mode
         self.sparse = sparse
+        self.return_indices_and_weights = return_indices_and_weights
         self._allow_non_tensor_positional_args = True
         self._convert_input_args = False
 
     def _encode(self, inputs, count_weights=None):
         inputs = self.backend.core.convert_to_tensor(inputs)
+        if self.return_indices_and_weights:
+            return numerical_utils.encode_categorical_indices_and_weights(
+                inputs,
+                output_mode=self.output_mode,
+                depth=self.num_tokens,
+                dtype=self.dtype,
+                count_weights=count_weights,
+                backend_module=self.backend,
+            )
         return numerical_utils.encode_categorical_inputs(
             inputs,
             output_mode=self.output_mode,
@@ -127,6 +179,9 @@ class CategoryEncoding(TFDataLayer):
         )
 
     def compute_output_shape(self, input_shape):
+        if self.return_indices_and_weights:
+            output_shape = tuple(input_shape) or (1,)
+            return output_shape, output_shape
         if (input_shape is not None) & (len(input_shape) == 0):
             return (self.num_tokens,)
         if self.output_mode == "one_hot":
@@ -140,6 +195,11 @@ class CategoryEncoding(TFDataLayer):
 
     def compute_output_spec(self, inputs, count_weights=None):
         output_shape = self.compute_output_shape(inputs.shape)
+        if self.return_indices_and_weights:
+            return (
+                KerasTensor(output_shape[0], dtype="int32"),
+                KerasTensor(output_shape[1], dtype=self.compute_dtype),
+            )
         return KerasTensor(
             output_shape, dtype=self.compute_dtype, sparse=self.sparse
         )
@@ -148,6 +208,7 @@ class CategoryEncoding(TFDataLayer):
         config = {
             "num_tokens": self.num_tokens,
             "output_mode": self.output_mode,
+            "return_indices_and_weights": self.return_indices_and_weights,
         }
         base_config = super().get_config()
         return {**base_config, **config}
@@ -163,4 +224,8 @@ class CategoryEncoding(TFDataLayer):
                 count_weights, dtype=self.compute_dtype
             )
         outputs = self._encode(inputs, count_weights)
+        if self.return_indices_and_weights:
+            return tuple(
+                backend_utils.convert_tf_tensor(output) for output in outputs
+            )
         return backend_utils.convert_tf_tensor(outputs)
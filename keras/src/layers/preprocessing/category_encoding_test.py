@@ -4,6 +4,7 @@ from tensorflow import data as tf_data
 
 from keras.src import backend
 from keras.src import layers
+from keras.src import ops
 from keras.src import testing
 
 TEST_CASES = [{"testcase_name": "dense", "sparse": False}]
@@ -271,6 +272,75 @@ class CategoryEncodingTest(testing.TestCase, parameterized.TestCase):
             output = output.numpy()
         self.assertAllClose(output, expected_output)
 
+    @parameterized.parameters("multi_hot", "count")
+    def test_indices_and_weights(self, output_mode):
+        input_data = np.array([[1, 2, 2, 5], [0, 3, 0, 1]])
+        dense_layer = layers.CategoryEncoding(
+            num_tokens=4, output_mode=output_mode
+        )
+        layer = layers.CategoryEncoding(
+            num_tokens=4,
+            output_mode=output_mode,
+            return_indices_and_weights=True,
+        )
+        indices, weights = layer(input_data)
+        self.assertEqual(backend.standardize_dtype(indices.dtype), "int32")
+        self.assertEqual(backend.standardize_dtype(weights.dtype), "float32")
+        self.assertEqual(indices.shape, (2, 4))
+        self.assertEqual(weights.shape, (2, 4))
+
+        # The embedding-bag reduction matches a matmul with the encoding.
+        embeddings = np.random.random((4, 3)).astype("float32")
+        outputs = ops.sum(
+            ops.take(embeddings, indices, axis=0) * weights[..., None], axis=1
+        )
+        self.assertAllClose(
+            outputs, ops.matmul(dense_layer(input_data), embeddings)
+        )
+
+        # Symbolic call.
+        indices, weights = layer(layers.Input((4,), dtype="int32"))
+        self.assertEqual(indices.shape, (None, 4))
+        self.assertEqual(indices.dtype, "int32")
+        self.assertEqual(weights.shape, (None, 4))
+
+    def test_indices_and_weights_count_weights(self):
+        layer = layers.CategoryEncoding(
+            num_tokens=4, output_mode="count", return_indices_and_weights=True
+        )
+        indices, weights = layer(
+            np.array([[0, 1], [3, 3]]),
+            count_weights=np.array([[0.1, 0.2], [0.3, 0.4]]),
+        )
+        self.assertAllClose(indices, [[0, 1], [3, 3]])
+        self.assertAllClose(weights, [[0.1, 0.2], [0.3, 0.4]])
+
+    def test_indices_and_weights_tf_data_compatibility(self):
+        layer = layers.CategoryEncoding(
+            num_tokens=4,
+            output_mode="multi_hot",
+            return_indices_and_weights=True,
+        )
+        input_data = np.array([[3, 3], [0, 1]])
+        ds = tf_data.Dataset.from_tensor_slices(input_data).batch(2).map(layer)
+        for indices, weights in ds.take(1):
+            self.assertAllClose(indices.numpy(), [[3, 0], [0, 1]])
+            self.assertAllClose(weights.numpy(), [[1, 0], [1, 1]])
+
+    def test_indices_and_weights_config(self):
+        layer = layers.CategoryEncoding(
+            num_tokens=4, output_mode="count", return_indices_and_weights=True
+        )
+        self.run_class_serialization_test(layer)
+
+    def test_indices_and_weights_invalid_args(self):
+        with self.assertRaisesRegex(ValueError, "return_indices_and_weights"):
+            layers.CategoryEncoding(
+                num_tokens=4,
+                output_mode="one_hot",
+                return_indices_and_weights=True,
+            )
+
     def test_category_encoding_without_num_tokens(self):
         with self.assertRaisesRegex(
             ValueError, r"num_tokens must be set to use this layer"
@@ -1,8 +1,11 @@
+import math
+
 import numpy as np
 
 from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.layers.preprocessing.tf_data_layer import TFDataLayer
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.utils import argument_validation
 from keras.src.utils import numerical_utils
 from keras.src.utils.module_utils import tensorflow as tf
@@ -147,9 +150,9 @@ class Discretization(TFDataLayer):
         self.sparse = sparse
 
         if self.bin_boundaries:
-            self.summary = None
+            self.sketch = None
         else:
-            self.summary = np.array([[], []], dtype="float32")
+            self.sketch = QuantileSketch(self.epsilon)
 
     def build(self, input_shape=None):
         self.built = True
@@ -171,14 +174,21 @@ class Discretization(TFDataLayer):
         `num_bins` argument, and the error tolerance for quantile boundaries can
         be controlled via the `epsilon` argument.
 
+        The quantiles are estimated with a streaming sketch that uses a
+        bounded amount of memory, so `data` may be arbitrarily large. To adapt
+        on several shards of data in parallel, call `update_state()` on one
+        layer per shard and combine them with `merge_state()`.
+
         Arguments:
             data: The data to train on. It can be passed either as a
-                batched `tf.data.Dataset`,
-                or as a NumPy array.
+                batched `tf.data.Dataset`, as a NumPy array, as a
+                backend-native tensor, as a `keras.utils.PyDataset`, or as
+                any other iterable (e.g. a generator) of batches.
             steps: Integer or `None`.
                 Total number of steps (batches of samples) to process.
-                If `data` is a `tf.data.Dataset`, and `steps` is `None`,
-                `adapt()` will run until the input dataset is exhausted.
+                If `data` is a `tf.data.Dataset`, a `PyDataset` or an
+                iterable of batches, and `steps` is `None`, `adapt()` will
+                run until the input data is exhausted.
                 When passing an infinitely
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
@@ -194,34 +204,81 @@ class Discretization(TFDataLayer):
                 data = data.take(steps)
             for batch in data:
                 self.update_state(batch)
-        else:
+        elif isinstance(data, PyDataset):
+            num_batches = data.num_batches
+            if steps is not None:
+                num_batches = steps
+            elif num_batches is None:
+                raise ValueError(
+                    "When passing an infinite `PyDataset` to `adapt()`, you "
+                    "must specify the `steps` argument."
+                )
+            for index in range(num_batches):
+                self.update_state(data[index])
+        elif (
+            isinstance(data, (np.ndarray, list, tuple))
+            or backend.is_tensor(data)
+            or not hasattr(data, "__iter__")
+        ):
             self.update_state(data)
+        else:
+            for step, batch in enumerate(data):
+                if steps is not None and step >= steps:
+                    break
+                self.update_state(batch)
         self.finalize_state()
 
     def update_state(self, data):
-        data = np.array(data).astype("float32")
-        summary = summarize(data, self.epsilon)
-        self.summary = merge_summaries(summary, self.summary, self.epsilon)
+        if backend.is_tensor(data):
+            data = backend.convert_to_numpy(data)
+        self.sketch.update(np.asarray(data))
+
+    def merge_state(self, layers):
+        """Merges the state of other adapted `Discretization` layers.
+
+        This allows computing the bin boundaries of a dataset in parallel:
+        each layer is updated (with `update_state()`) on a shard of the data,
+        and the resulting states are merged into this layer, whose bin
+        boundaries are then computed over all shards.
+
+        Arguments:
+            layers: List of `Discretization` layers with the same `epsilon`
+                whose state should be merged into this layer.
+        """
+        if self.input_bin_boundaries is not None:
+            raise ValueError(
+                "Cannot merge the state of a Discretization layer that has "
+                "been initialized with `bin_boundaries`, use `num_bins` "
+                "instead."
+            )
+        for layer in layers:
+            if layer.sketch is None:
+                raise ValueError(
+                    "Cannot merge the state of a Discretization layer that "
+                    f"has not been adapted. Received: layer={layer.name}"
+                )
+            self.sketch.merge(layer.sketch)
+        self.finalize_state()
 
     def finalize_state(self):
         if self.input_bin_boundaries is not None:
             return
         self.bin_boundaries = get_bin_boundaries(
-            self.summary, self.num_bins
+            self.sketch, self.num_bins
         ).tolist()
 
     def reset_state(self):
         if self.input_bin_boundaries is not None:
             return
-        self.summary = np.array([[], []], dtype="float32")
+        self.sketch = QuantileSketch(self.epsilon)
 
     def compute_output_spec(self, inputs):
         return backend.KerasTensor(shape=inputs.shape, dtype=self.compute_dtype)
 
     def load_own_variables(self, store):
-        if len(store) == 1:
-            # Legacy format case
-            self.summary = store["0"]
+        # Legacy format case: the adapted summary used to be saved as a
+        # variable, but the bin boundaries are already restored from the
+        # config.
         return
 
     def call(self, inputs):
@@ -247,91 +304,113 @@ class Discretization(TFDataLayer):
         }
 
 
-def summarize(values, epsilon):
-    """Reduce a 1D sequence of values to a summary.
-
-    This algorithm is based on numpy.quantiles but modified to allow for
-    intermediate steps between multiple data sets. It first finds the target
-    number of bins as the reciprocal of epsilon and then takes the individual
-    values spaced at appropriate intervals to arrive at that target.
-    The final step is to return the corresponding counts between those values
-    If the target num_bins is larger than the size of values, the whole array is
-    returned (with weights of 1).
+class QuantileSketch:
+    """Mergeable streaming quantile sketch.
 
-    Args:
-        values: 1D `np.ndarray` to be summarized.
-        epsilon: A `'float32'` that determines the approximate desired
-        precision.
-
-    Returns:
-        A 2D `np.ndarray` that is a summary of the inputs. First column is the
-        interpolated partition values, the second is the weights (counts).
-    """
-    values = np.reshape(values, [-1])
-    values = np.sort(values)
-    elements = np.size(values)
-    num_buckets = 1.0 / epsilon
-    increment = elements / num_buckets
-    start = increment
-    step = max(increment, 1)
-    boundaries = values[int(start) :: int(step)]
-    weights = np.ones_like(boundaries)
-    weights = weights * step
-    return np.stack([boundaries, weights])
+    This is an implementation of the KLL sketch (Karnin, Lang and Liberty,
+    2016). Values are stored in a hierarchy of compactors, where each value
+    at level `h` stands for `2**h` values of the input. When a level grows
+    beyond its capacity, it is sorted and every other value (starting at a
+    random offset) is promoted to the next level. This keeps the memory
+    bounded by `O(1 / epsilon)` regardless of the number of values seen,
+    while the rank error of any quantile stays below `epsilon` with high
+    probability.
 
-
-def merge_summaries(prev_summary, next_summary, epsilon):
-    """Weighted merge sort of summaries.
-
-    Given two summaries of distinct data, this function merges (and compresses)
-    them to stay within `epsilon` error tolerance.
+    Sketches built over disjoint shards of data can be combined with
+    `merge()`, giving the same guarantees as a single sketch built over all
+    of the data.
 
     Args:
-        prev_summary: 2D `np.ndarray` summary to be merged with `next_summary`.
-        next_summary: 2D `np.ndarray` summary to be merged with `prev_summary`.
-        epsilon: A float that determines the approximate desired precision.
-
-    Returns:
-        A 2-D `np.ndarray` that is a merged summary. First column is the
-        interpolated partition values, the second is the weights (counts).
+        epsilon: The desired rank error, as a fraction of the number of
+            values seen.
+        seed: Seed for the random compaction offsets. Defaults to `0`, so
+            that the sketch is deterministic.
     """
-    merged = np.concatenate((prev_summary, next_summary), axis=1)
-    merged = np.take(merged, np.argsort(merged[0]), axis=1)
-    return compress_summary(merged, epsilon)
-
 
-def get_bin_boundaries(summary, num_bins):
-    return compress_summary(summary, 1.0 / num_bins)[0, :-1]
+    # Empirical constants relating the capacity `k` of the largest compactor
+    # to the normalized rank error of the sketch (at 99% confidence).
+    _ERROR_CONSTANT = 2.296
+    _ERROR_EXPONENT = 0.9723
 
+    def __init__(self, epsilon, seed=0):
+        self.k = max(
+            8,
+            math.ceil(
+                (self._ERROR_CONSTANT / epsilon) ** (1.0 / self._ERROR_EXPONENT)
+            ),
+        )
+        self.count = 0
+        self.levels = [np.empty((0,), dtype="float64")]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """Adds a batch of values (of any shape) to the sketch."""
+        values = np.asarray(values, dtype="float64").reshape(-1)
+        values = values[~np.isnan(values)]
+        self.count += values.size
+        self.levels[0] = np.concatenate((self.levels[0], values))
+        self._compress()
+
+    def merge(self, other):
+        """Merges the values summarized by `other` into this sketch."""
+        for level, values in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty((0,), dtype="float64"))
+            self.levels[level] = np.concatenate((self.levels[level], values))
+        self.count += other.count
+        self._compress()
+
+    def quantiles(self, fractions):
+        """Returns the approximate quantiles of the values seen so far.
+
+        Args:
+            fractions: 1D array of quantile fractions in `[0, 1]`.
+
+        Returns:
+            A 1D `np.ndarray` holding, for each fraction `q`, the smallest
+            value whose (approximate) rank is at least `q` times the number
+            of values seen.
+        """
+        values = np.concatenate(self.levels)
+        if values.size == 0:
+            return values
+        weights = np.concatenate(
+            [
+                np.full((level_values.size,), 2.0**level)
+                for level, level_values in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cum_weights = np.cumsum(weights[order])
+        ranks = np.asarray(fractions, dtype="float64") * cum_weights[-1]
+        indices = np.searchsorted(cum_weights, ranks, side="left")
+        return values[np.minimum(indices, values.size - 1)]
+
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2.0 / 3.0) ** depth))
+
+    def _compress(self):
+        while True:
+            for level, values in enumerate(self.levels):
+                if values.size > self._capacity(level):
+                    break
+            else:
+                return
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty((0,), dtype="float64"))
+            values = np.sort(values)
+            # With an odd number of values, one of them stays at this level.
+            num_kept = values.size % 2
+            offset = self._rng.integers(2)
+            promoted = values[num_kept + offset :: 2]
+            self.levels[level] = values[:num_kept]
+            self.levels[level + 1] = np.concatenate(
+                (self.levels[level + 1], promoted)
+            )
 
-def compress_summary(summary, epsilon):
-    """Compress a summary to within `epsilon` accuracy.
-
-    The compression step is needed to keep the summary sizes small after
-    merging, and also used to return the final target boundaries. It finds the
-    new bins based on interpolating cumulative weight percentages from the large
-    summary.  Taking the difference of the cumulative weights from the previous
-    bin's cumulative weight will give the new weight for that bin.
-
-    Args:
-        summary: 2D `np.ndarray` summary to be compressed.
-        epsilon: A `'float32'` that determines the approximate desired
-        precision.
 
-    Returns:
-        A 2D `np.ndarray` that is a compressed summary. First column is the
-        interpolated partition values, the second is the weights (counts).
-    """
-    if summary.shape[1] * epsilon < 1:
-        return summary
-
-    percents = epsilon + np.arange(0.0, 1.0, epsilon)
-    cum_weights = summary[1].cumsum()
-    cum_weight_percents = cum_weights / cum_weights[-1]
-    new_bins = np.interp(percents, cum_weight_percents, summary[0])
-    cum_weights = np.interp(percents, cum_weight_percents, cum_weights)
-    new_weights = cum_weights - np.concatenate(
-        (np.array([0]), cum_weights[:-1])
-    )
-    summary = np.stack((new_bins, new_weights))
-    return summary.astype("float32")
+def get_bin_boundaries(sketch, num_bins):
+    fractions = np.arange(1, num_bins) / num_bins
+    return sketch.quantiles(fractions)
@@ -38,6 +38,48 @@ class DiscretizationTest(testing.TestCase, parameterized.TestCase):
         output = layer(np.array([[0.0, 0.1, 0.3]]))
         self.assertTrue(output.dtype, "int32")
 
+    def test_adapt_iterable(self):
+        data = np.random.random((64, 3))
+        layer = layers.Discretization(num_bins=4)
+        layer.adapt(data)
+
+        def generator():
+            for i in range(0, 64, 16):
+                yield data[i : i + 16]
+
+        layer_from_generator = layers.Discretization(num_bins=4)
+        layer_from_generator.adapt(generator())
+        self.assertAllClose(
+            layer_from_generator.bin_boundaries, layer.bin_boundaries
+        )
+
+        layer_from_generator.adapt(generator(), steps=1)
+        self.assertAllClose(
+            layer_from_generator.bin_boundaries,
+            np.quantile(data[:16], [0.25, 0.5, 0.75], method="inverted_cdf"),
+        )
+
+    def test_merge_state(self):
+        data = np.random.random((64, 3))
+        layer = layers.Discretization(num_bins=4)
+        layer.adapt(data)
+
+        shard_layers = []
+        for i in range(0, 64, 16):
+            shard_layer = layers.Discretization(num_bins=4)
+            shard_layer.update_state(data[i : i + 16])
+            shard_layers.append(shard_layer)
+        merged_layer = layers.Discretization(num_bins=4)
+        merged_layer.merge_state(shard_layers)
+        self.assertAllClose(merged_layer.bin_boundaries, layer.bin_boundaries)
+
+    def test_adapt_rank_error(self):
+        data = np.random.normal(size=(200000,))
+        layer = layers.Discretization(num_bins=10, epsilon=0.01)
+        layer.adapt(data.reshape((-1, 1000)))
+        ranks = np.searchsorted(np.sort(data), layer.bin_boundaries)
+        self.assertAllClose(ranks / data.size, np.arange(1, 10) / 10, atol=0.01)
+
     @parameterized.named_parameters(
         named_product(
             [
@@ -1,3 +1,9 @@
+import contextlib
+import itertools
+import multiprocessing.pool
+
+import numpy as np
+
 from keras.src import backend
 from keras.src import layers
 from keras.src import tree
@@ -6,6 +12,7 @@ from keras.src.layers.layer import Layer
 from keras.src.layers.preprocessing.tf_data_layer import TFDataLayer
 from keras.src.saving import saving_lib
 from keras.src.saving import serialization_lib
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.utils import backend_utils
 from keras.src.utils.module_utils import tensorflow as tf
 from keras.src.utils.naming import auto_name
@@ -494,38 +501,120 @@ class FeatureSpace(Layer):
                 adaptable_preprocessors.append(name)
         return adaptable_preprocessors
 
-    def adapt(self, dataset):
-        if not isinstance(dataset, tf.data.Dataset):
+    def adapt(self, dataset, steps=None, workers=1):
+        """Computes the state of the preprocessors of the features.
+
+        The data is iterated over once: each batch is split into features,
+        and each feature is passed to the `update_state()` method of its
+        preprocessor. Preprocessors without `update_state()` are adapted
+        separately, on the values of their feature.
+
+        Arguments:
+            dataset: The data to adapt on, yielding dicts mapping feature
+                names to values. It can be passed either as a
+                `tf.data.Dataset` (batched or unbatched), as a dict of
+                arrays, or as a `keras.utils.PyDataset` of dicts of batches.
+            steps: Integer or `None`. Total number of steps (batches of
+                samples) to process. If `dataset` is a `tf.data.Dataset` or
+                a `PyDataset`, and `steps` is `None`, `adapt()` will run
+                until the input data is exhausted. This argument is not
+                supported with dict inputs.
+            workers: Integer. Number of threads used to update the
+                preprocessors of the features of each batch in parallel.
+                Defaults to `1`.
+        """
+        names = self._list_adaptable_preprocessors()
+        if isinstance(dataset, tf.data.Dataset):
+            if any(
+                dataset.element_spec[name].shape.rank == 0 for name in names
+            ):
+                # The dataset yields unbatched scalars; batch it.
+                dataset = dataset.batch(32)
+            if steps is not None:
+                dataset = dataset.take(steps)
+
+            def expand_dims(x):
+                if x.shape.rank in {0, 1}:
+                    # If the rank is 1, add a dimension
+                    # so we can reduce on axis=-1.
+                    return tf.expand_dims(x, -1)
+                return x
+
+            dataset = dataset.map(
+                lambda x: {name: expand_dims(x[name]) for name in names}
+            )
+
+            def get_batches():
+                return dataset
+
+        elif isinstance(dataset, PyDataset):
+            num_batches = dataset.num_batches
+            if steps is not None:
+                num_batches = steps
+            elif num_batches is None:
+                raise ValueError(
+                    "When passing an infinite `PyDataset` to `adapt()`, you "
+                    "must specify the `steps` argument."
+                )
+
+            def get_batches():
+                for index in range(num_batches):
+                    yield _expand_features(dataset[index], names)
+
+        elif isinstance(dataset, dict):
+
+            def get_batches():
+                return [_expand_features(dataset, names)]
+
+        else:
             raise ValueError(
-                "`adapt()` can only be called on a tf.data.Dataset. "
+                "`adapt()` can only be called on a tf.data.Dataset, a dict "
+                "of arrays or a `keras.utils.PyDataset`. "
                 f"Received instead: {dataset} (of type {type(dataset)})"
             )
 
-        for name in self._list_adaptable_preprocessors():
-            # Call adapt() on each individual adaptable layer.
-
-            # TODO: consider rewriting this to instead iterate on the
-            # dataset once, split each batch into individual features,
-            # and call the layer's `_adapt_function` on each batch
-            # to simulate the behavior of adapt() in a more performant fashion.
+        def get_feature(name):
+            if isinstance(dataset, tf.data.Dataset):
+                return dataset.map(lambda x: x[name])
+            if isinstance(dataset, dict):
+                return get_batches()[0][name]
+            return (batch[name] for batch in get_batches())
 
-            feature_dataset = dataset.map(lambda x: x[name])
+        incremental_names = []
+        for name in names:
             preprocessor = self.preprocessors[name]
-            # TODO: consider adding an adapt progress bar.
-            # Sample 1 element to check the rank
-            for x in feature_dataset.take(1):
-                pass
-            if len(x.shape) == 0:
-                # The dataset yields unbatched scalars; batch it.
-                feature_dataset = feature_dataset.batch(32)
-            if len(x.shape) in {0, 1}:
-                # If the rank is 1, add a dimension
-                # so we can reduce on axis=-1.
-                # Note: if rank was previously 0, it is now 1.
-                feature_dataset = feature_dataset.map(
-                    lambda x: tf.expand_dims(x, -1)
+            if all(
+                hasattr(preprocessor, method)
+                for method in ("reset_state", "update_state", "finalize_state")
+            ):
+                incremental_names.append(name)
+            else:
+                # Call adapt() on layers that can't be updated incrementally.
+                preprocessor.adapt(get_feature(name))
+
+        def update_state(name, data):
+            self.preprocessors[name].update_state(data)
+
+        for name in incremental_names:
+            self.preprocessors[name].reset_state()
+        with contextlib.ExitStack() as stack:
+            if workers > 1:
+                pool = stack.enter_context(
+                    multiprocessing.pool.ThreadPool(workers)
                 )
-            preprocessor.adapt(feature_dataset)
+                starmap = pool.starmap
+            else:
+                starmap = itertools.starmap
+            for batch in get_batches():
+                # Different features update different preprocessors, so they
+                # can be updated concurrently.
+                for _ in starmap(
+                    update_state,
+                    [(name, batch[name]) for name in incremental_names],
+                ):
+                    pass
+        for name in incremental_names:
+            self.preprocessors[name].finalize_state()
         self._is_adapted = True
         self.get_encoded_features()  # Finish building the layer
         self.built = True
@@ -810,3 +899,22 @@ class TFDConcat(TFDataLayer):
 class TFDIdentity(TFDataLayer):
     def call(self, x):
         return x
+
+
+def _expand_features(batch, names):
+    """Returns the features `names` of a batch as arrays of rank >= 2."""
+    if not isinstance(batch, dict):
+        raise ValueError(
+            "`FeatureSpace.adapt()` expects batches of data to be dicts "
+            f"mapping feature names to values. Received: {batch}"
+        )
+    features = {}
+    for name in names:
+        value = batch[name]
+        if backend.is_tensor(value) and not isinstance(value, np.ndarray):
+            value = backend.convert_to_numpy(value)
+        value = np.asarray(value)
+        if value.ndim in {0, 1}:
+            value = np.reshape(value, (-1, 1))
+        features[name] = value
+    return features
@@ -10,6 +10,7 @@ from keras.src import ops
 from keras.src import testing
 from keras.src.layers.preprocessing import feature_space
 from keras.src.saving import saving_api
+from keras.src.trainers.data_adapters import py_dataset_adapter
 
 
 class FeatureSpaceTest(testing.TestCase):
@@ -431,6 +432,50 @@ class FeatureSpaceTest(testing.TestCase):
         out = fs(data)
         self.assertEqual(out.shape, (148,))
 
+    def test_adapt_single_pass(self):
+        cls = feature_space.FeatureSpace
+        features = {
+            "float_2": cls.float_normalized(),
+            "float_3": cls.float_discretized(num_bins=3),
+            "string_1": cls.string_categorical(max_tokens=5),
+            "int_1": cls.integer_categorical(max_tokens=5),
+        }
+        data = self._get_train_data_dict()
+        ref_fs = feature_space.FeatureSpace(features, output_mode="dict")
+        ref_fs.adapt(self._get_train_data_dict(as_dataset=True))
+
+        num_batches_read = []
+
+        class DictDataset(py_dataset_adapter.PyDataset):
+            def __len__(self):
+                return 3
+
+            def __getitem__(self, index):
+                num_batches_read.append(index)
+                return {
+                    key: value[index * 4 : (index + 1) * 4]
+                    for key, value in data.items()
+                }
+
+        for dataset in (data, DictDataset()):
+            fs = feature_space.FeatureSpace(features, output_mode="dict")
+            fs.adapt(dataset, workers=2)
+            for name in ("string_1", "int_1"):
+                self.assertEqual(
+                    fs.preprocessors[name].get_vocabulary(),
+                    ref_fs.preprocessors[name].get_vocabulary(),
+                )
+            self.assertEqual(
+                fs.preprocessors["float_3"].bin_boundaries,
+                ref_fs.preprocessors["float_3"].bin_boundaries,
+            )
+            self.assertAllClose(
+                fs.preprocessors["float_2"].adapt_mean,
+                ref_fs.preprocessors["float_2"].adapt_mean,
+            )
+        # The `PyDataset` was iterated over once for all features.
+        self.assertEqual(num_batches_read, [0, 1, 2])
+
     def test_manual_kpl(self):
         data = {
             "text": ["1st string", "2nd string", "3rd string"],
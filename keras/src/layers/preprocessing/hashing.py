@@ -1,7 +1,13 @@
+import sys
+
+import numpy as np
+
 from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.layers.layer import Layer
+from keras.src.layers.preprocessing.index_lookup import strings_to_bytes
 from keras.src.utils import backend_utils
+from keras.src.utils import hash_utils
 from keras.src.utils import numerical_utils
 from keras.src.utils import tf_utils
 from keras.src.utils.module_utils import tensorflow as tf
@@ -26,13 +32,14 @@ class Hashing(Layer):
     [SipHash64](https://github.com/google/highwayhash) hash function, with
     the `salt` value serving as additional input to the hash function.
 
-    **Note:** This layer internally uses TensorFlow. It cannot
-    be used as part of the compiled computation graph of a model with
-    any backend other than TensorFlow.
-    It can however be used with any backend when running eagerly.
-    It can also always be used as part of an input preprocessing pipeline
-    with any backend (outside the model itself), which is how we recommend
-    to use this layer.
+    **Note:** With backends other than TensorFlow, this layer computes the
+    same hashes as TensorFlow with NumPy, or with backend ops for numeric
+    tensors, so TensorFlow is only needed to hash TensorFlow tensors. Numeric
+    inputs can be hashed as part of the compiled computation graph of a model
+    with the PyTorch backend, and with the JAX backend if 64-bit types are
+    enabled (`jax_enable_x64`). Other inputs can be hashed with any backend
+    when running eagerly, or as part of an input preprocessing pipeline (outside
+    the model itself), which is how we recommend to use this layer.
 
     **Note:** This layer is safe to use inside a `tf.data` pipeline
     (independently of which backend you're using).
@@ -143,12 +150,6 @@ class Hashing(Layer):
         sparse=False,
         **kwargs,
     ):
-        if not tf.available:
-            raise ImportError(
-                "Layer Hashing requires TensorFlow. "
-                "Install it via `pip install tensorflow`."
-            )
-
         # By default, output int32 when output_mode='int' and floats otherwise.
         if "dtype" not in kwargs or kwargs["dtype"] is None:
             kwargs["dtype"] = (
@@ -207,11 +208,17 @@ class Hashing(Layer):
                 )
         self._convert_input_args = False
         self._allow_non_tensor_positional_args = True
-        self.supports_jit = False
+        self.supports_jit = (
+            backend.backend() != "tensorflow"
+            and hash_utils.backend_supports_int64()
+        )
 
     def call(self, inputs):
         from keras.src.backend import tensorflow as tf_backend
 
+        if self._use_native_hashing(inputs):
+            return self._call_native(inputs)
+
         inputs = tf_utils.ensure_tensor(inputs)
         if self.output_mode == "one_hot" and inputs.shape[-1] == 1:
             # One hot only unpranks if the final dimension is not 1.
@@ -262,6 +269,67 @@ class Hashing(Layer):
             values = tf.where(mask, tf.zeros_like(values), values)
         return values
 
+    def _use_native_hashing(self, inputs):
+        """Whether `inputs` can be hashed without TensorFlow ops."""
+        if backend.backend() == "tensorflow" or self.sparse:
+            return False
+        if "tensorflow" not in sys.modules:
+            return True
+        return not backend_utils.in_tf_graph() and not isinstance(
+            inputs, (tf.Tensor, tf.RaggedTensor, tf.SparseTensor)
+        )
+
+    def _call_native(self, inputs):
+        if (
+            backend.is_tensor(inputs)
+            and backend.backend() != "numpy"
+            and backend.standardize_dtype(inputs.dtype) != "bool"
+            and hash_utils.backend_supports_int64()
+        ):
+            # Numeric tensors are hashed with backend ops, which also works
+            # inside of compiled functions.
+            xnp = backend.numpy
+        else:
+            inputs = strings_to_bytes(np.asarray(inputs))
+            xnp = np
+        if self.output_mode == "one_hot" and inputs.shape[-1] == 1:
+            # One hot only unpranks if the final dimension is not 1.
+            inputs = xnp.squeeze(inputs, axis=-1)
+        indices = self._hash_values_to_bins_native(inputs, xnp)
+        return numerical_utils.encode_categorical_inputs(
+            backend.convert_to_tensor(indices),
+            output_mode=self.output_mode,
+            depth=self.num_bins,
+            dtype=self.dtype,
+        )
+
+    def _hash_values_to_bins_native(self, values, xnp):
+        """Converts values to bin indices, like `_hash_values_to_bins`."""
+        hash_bins = self.num_bins
+        mask = None
+        # If mask_value is set, the zeroth bin is reserved for it.
+        if self.mask_value is not None and hash_bins > 1:
+            hash_bins -= 1
+            mask_value = self.mask_value
+            if xnp is np and values.dtype.kind == "S":
+                mask_value = strings_to_bytes(np.asarray(mask_value))
+            mask = values == mask_value
+        if xnp is np:
+            if values.dtype == bool:
+                # Booleans are hashed like `tf.as_string()` formats them.
+                values = np.where(values, b"true", b"false")
+            elif values.dtype.kind == "f":
+                values = values.astype("int64")
+        # Hash the strings, or the decimal representations of the integers.
+        if self.strong_hash:
+            hashes = hash_utils.siphash64(values, self.salt, xnp=xnp)
+        else:
+            hashes = hash_utils.fingerprint64(values, xnp=xnp)
+        values = hash_utils.unsigned_mod(hashes, hash_bins)
+        if mask is not None:
+            values = xnp.where(mask, 0, values + 1)
+        return values
+
     def compute_output_spec(self, inputs):
         if self.output_mode == "int":
             return backend.KerasTensor(shape=inputs.shape, dtype=self.dtype)
@@ -10,6 +10,7 @@ from keras.src import layers
 from keras.src import models
 from keras.src import testing
 from keras.src.saving import load_model
+from keras.src.utils import hash_utils
 
 
 class ArrayLike:
@@ -393,6 +394,31 @@ class HashingTest(testing.TestCase, parameterized.TestCase):
             expected, backend.convert_to_numpy(out_data).tolist()
         )
 
+    @parameterized.named_parameters(
+        ("strings_farmhash", ["A", "", "a longer string", "ünïcode"], None),
+        ("strings_siphash", ["A", "", "a longer string", "ünïcode"], [13, 7]),
+        ("ints_farmhash", [0, -1, 12345678901, -(2**63)], None),
+        ("ints_siphash", [0, -1, 12345678901, -(2**63)], [13, 7]),
+        ("floats_farmhash", [0.0, -1.5, 2.7, 1e10], None),
+        ("bools_farmhash", [True, False], None),
+    )
+    def test_native_hashing(self, values, salt):
+        input_data = np.array(values)
+        # Compare with the TensorFlow ops used on TensorFlow tensors.
+        for mask_value in (None, values[1]):
+            layer = layers.Hashing(num_bins=7, salt=salt, mask_value=mask_value)
+            output = layer(input_data)
+            expected = layer(tf.constant(input_data))
+            self.assertAllEqual(output, expected)
+        if (
+            input_data.dtype.kind in "if"
+            and hash_utils.backend_supports_int64()
+        ):
+            # Numeric tensors are hashed with backend ops.
+            output = layer(backend.convert_to_tensor(input_data))
+            self.assertTrue(backend.is_tensor(output))
+            self.assertAllEqual(output, expected)
+
     def test_hashing_invalid_num_bins(self):
         # Test with `num_bins` set to None
         with self.assertRaisesRegex(
@@ -1,14 +1,20 @@
 import collections
+import multiprocessing.pool
 
 import numpy as np
 
 from keras.src import backend
 from keras.src.layers.layer import Layer
 from keras.src.utils import argument_validation
+from keras.src.utils import backend_utils
+from keras.src.utils import hash_utils
 from keras.src.utils import numerical_utils
 from keras.src.utils import tf_utils
 from keras.src.utils.module_utils import tensorflow as tf
 
+# Multiplier of the polynomial hash of `hash_strings()` (the 64-bit FNV prime).
+_HASH_MULTIPLIER = 0x100000001B3
+
 
 class IndexLookup(Layer):
     """Maps values from a vocabulary to integer indices.
@@ -177,6 +183,11 @@ class IndexLookup(Layer):
         self.pad_to_max_tokens = pad_to_max_tokens
         self.vocabulary_dtype = tf.as_dtype(vocabulary_dtype).name
         self._frozen_vocab_size = kwargs.pop("vocabulary_size", None)
+        # Vocabulary compiled into arrays sorted by key, for lookups that
+        # don't go through TensorFlow. Built lazily from `lookup_table`.
+        self._lookup_keys = None
+        self._lookup_values = None
+        self._lookup_hashes = None
 
         self.input_vocabulary = vocabulary
         self.input_idf_weights = idf_weights
@@ -252,26 +263,12 @@ class IndexLookup(Layer):
             # This table needs to be uninitialized as a StaticHashTable cannot
             # be initialized twice.
             self.lookup_table = self._uninitialized_lookup_table()
+            self._lookup_keys = self._lookup_values = None
 
         # Only set up adapt state if we did not receive a vocab on construction.
         if not self._has_input_vocabulary:
             # Set adapt state.
-            self.token_counts = tf.lookup.experimental.MutableHashTable(
-                key_dtype=vocabulary_dtype,
-                value_dtype="int64",
-                default_value=0,
-            )
-            if self.output_mode == "tf_idf":
-                self.token_document_counts = (
-                    tf.lookup.experimental.MutableHashTable(
-                        key_dtype=vocabulary_dtype,
-                        value_dtype="int64",
-                        default_value=0,
-                    )
-                )
-                self.num_documents = tf.Variable(
-                    0, dtype="int64", trainable=False
-                )
+            self.token_counts = TokenCounts()
 
     def get_vocabulary(self, include_special_tokens=True):
         """Returns the current vocabulary of the layer.
@@ -392,6 +389,7 @@ class IndexLookup(Layer):
                     "vocabulary from file."
                 )
             self.lookup_table = self._lookup_table_from_file(vocabulary)
+            self._lookup_keys = self._lookup_values = None
             self._record_vocabulary_size()
             return
 
@@ -481,6 +479,7 @@ class IndexLookup(Layer):
                 f"`max_tokens` is {self.max_tokens}."
             )
         self.lookup_table = self._lookup_table_from_tokens(tokens)
+        self._lookup_keys = self._lookup_values = None
         self._record_vocabulary_size()
 
         if self.output_mode == "tf_idf" and idf_weights is not None:
@@ -565,23 +564,64 @@ class IndexLookup(Layer):
         output_shape = self.compute_output_shape(inputs.shape)
         return backend.KerasTensor(output_shape, dtype=output_dtype)
 
-    def adapt(self, data, steps=None):
+    def adapt(self, data, steps=None, workers=1):
         self.reset_state()
         if isinstance(data, tf.data.Dataset):
             if steps is not None:
                 data = data.take(steps)
-            for batch in data:
-                self.update_state(batch)
+            batches = data
         else:
             data = tf_utils.ensure_tensor(data, dtype=self.vocabulary_dtype)
             if data.shape.rank == 1:
                 # A plain list of strings
                 # is treated as as many documents
                 data = tf.expand_dims(data, -1)
-            self.update_state(data)
+            batches = shard_tensor(data, workers)
+        self._update_state_from_batches(batches, workers=workers)
         self.finalize_state()
 
     def update_state(self, data):
+        self.token_counts.add(*self._count_tokens(data))
+
+    def _update_state_from_batches(self, batches, workers=1, preprocess=None):
+        """Counts the tokens of `batches`, optionally in a thread pool.
+
+        Counting a batch (`_count_tokens()`, and `preprocess` if passed) only
+        runs NumPy and TensorFlow ops that release the GIL, so it is spread
+        over `workers` threads. The per-batch counts are merged in the
+        calling thread.
+        """
+
+        def count_tokens(batch):
+            if preprocess is not None:
+                batch = preprocess(batch)
+            return self._count_tokens(batch)
+
+        if workers <= 1:
+            for batch in batches:
+                self.token_counts.add(*count_tokens(batch))
+            return
+
+        with multiprocessing.pool.ThreadPool(workers) as pool:
+            # Bound the number of batches in flight, since `batches` may be
+            # much larger than memory.
+            pending = collections.deque()
+            for batch in batches:
+                pending.append(pool.apply_async(count_tokens, (batch,)))
+                if len(pending) > 2 * workers:
+                    self.token_counts.add(*pending.popleft().get())
+            while pending:
+                self.token_counts.add(*pending.popleft().get())
+
+    def _count_tokens(self, data):
+        """Counts the tokens (and documents) of a batch on host.
+
+        Returns:
+            A tuple `(groups, num_documents)`, where `groups` is a list of
+            `(tokens, counts, document_counts)` tuples, as accepted by
+            `TokenCounts.add()`. `tokens` are unique tokens of the batch and
+            `document_counts` is `None` unless `output_mode` is `"tf_idf"`.
+        """
         if self._has_input_vocabulary:
             raise ValueError(
                 f"Cannot adapt layer '{self.name}' after setting a static "
@@ -597,33 +637,54 @@ class IndexLookup(Layer):
             # is a single document.
             data = tf.expand_dims(data, 0)
 
-        tokens, counts = self._num_tokens(data)
-        self.token_counts.insert(
-            tokens, counts + self.token_counts.lookup(tokens)
-        )
-
-        if self.output_mode == "tf_idf":
-            # Dedupe each row of our dataset.
-            if isinstance(data, tf.RaggedTensor):
-                deduped_doc_data = tf.map_fn(lambda x: tf.unique(x)[0], data)
-            else:
-                deduped_doc_data = [tf.unique(x)[0] for x in data]
-                deduped_doc_data = tf.concat(deduped_doc_data, axis=0)
-            # Flatten and count tokens.
-            tokens, counts = self._num_tokens(deduped_doc_data)
-
-            self.token_document_counts.insert(
-                tokens, counts + self.token_document_counts.lookup(tokens)
+        # Flatten the tokens, and find the document (row) of each token.
+        if isinstance(data, tf.SparseTensor):
+            values = data.values.numpy()
+            row_ids = data.indices[:, 0].numpy()
+            num_documents = int(data.dense_shape[0])
+        elif isinstance(data, tf.RaggedTensor):
+            values = data.flat_values.numpy()
+            nested_row_ids = data.nested_value_rowids()
+            row_ids = nested_row_ids[-1]
+            for outer_row_ids in nested_row_ids[-2::-1]:
+                row_ids = tf.gather(outer_row_ids, row_ids)
+            row_ids = row_ids.numpy()
+            num_documents = int(data.nrows())
+        else:
+            values = tf.reshape(data, [-1]).numpy()
+            num_documents = int(data.shape[0])
+            row_ids = np.repeat(
+                np.arange(num_documents, dtype="int64"),
+                values.size // max(num_documents, 1),
             )
-            if isinstance(data, tf.RaggedTensor):
-                self.num_documents.assign_add(data.nrows())
-            else:
-                self.num_documents.assign_add(
-                    tf.shape(data, out_type="int64")[0]
-                )
+        if self.vocabulary_dtype == "string":
+            groups = split_strings_by_length(values)
+        else:
+            groups = [(None, values)]
+        return [
+            self._count_group(
+                group, row_ids if indices is None else row_ids[indices]
+            )
+            for indices, group in groups
+        ], num_documents
+
+    def _count_group(self, values, row_ids):
+        tokens, inverse, counts = np.unique(
+            values, return_inverse=True, return_counts=True
+        )
+        if self.output_mode != "tf_idf":
+            return tokens, counts, None
+
+        # Count each token once per document, by deduplicating
+        # (document, token) pairs.
+        pairs = np.unique(row_ids * len(tokens) + inverse.reshape(-1))
+        document_counts = np.bincount(
+            pairs % max(len(tokens), 1), minlength=len(tokens)
+        )
+        return tokens, counts, document_counts
 
     def finalize_state(self):
-        if self._has_input_vocabulary or tf.equal(self.token_counts.size(), 0):
+        if self._has_input_vocabulary or not self.token_counts:
             # Finalize idf_weights to a const for call even if we don't need to
             # compute a new vocabulary.
             if self.output_mode == "tf_idf":
@@ -631,32 +692,44 @@ class IndexLookup(Layer):
             self._record_vocabulary_size()
             return
 
+        tokens, counts, document_counts = self.token_counts.result()
+
         # Remove special tokens from our counts.
-        if self.mask_token is not None:
-            self.token_counts.remove(
-                tf.convert_to_tensor([self.mask_token], self.vocabulary_dtype)
-            )
-        if self.oov_token is not None:
-            self.token_counts.remove(
-                tf.convert_to_tensor([self.oov_token], self.vocabulary_dtype)
-            )
+        keep = np.ones(tokens.shape, dtype=bool)
+        for special_token in (self.mask_token, self.oov_token):
+            if special_token is not None:
+                keep &= tokens != self._special_token_to_numpy(special_token)
+        tokens, counts = tokens[keep], counts[keep]
+        if document_counts is not None:
+            document_counts = document_counts[keep]
 
-        tokens, counts = self.token_counts.export()
         # To keep vocabs deterministic, we sort our tokens by count and break
-        # ties by sorting the tokens themselves. Tensorflow has no ops for
-        # sorting strings, so we need to use numpy for the sort.
-        sorted_indices = np.lexsort((tokens.numpy(), counts.numpy()))[::-1]
+        # ties by sorting the tokens themselves. Only the tokens that can make
+        # the `max_tokens` cut (with a count at least equal to the count of
+        # the last token kept) need to be sorted.
+        candidates = np.arange(len(tokens))
         token_start = self._token_start_index()
+        max_learned_tokens = None
         if self.max_tokens:
-            max_learned_tokens = self.max_tokens - token_start
-            sorted_indices = sorted_indices[:max_learned_tokens]
-        tokens = tf.gather(tokens, sorted_indices)
+            max_learned_tokens = max(self.max_tokens - token_start, 0)
+            if 0 < max_learned_tokens < len(tokens):
+                kth = len(tokens) - max_learned_tokens
+                min_count = np.partition(counts, kth)[kth]
+                candidates = np.flatnonzero(counts >= min_count)
+        sorted_indices = np.lexsort((tokens[candidates], counts[candidates]))[
+            ::-1
+        ]
+        sorted_indices = candidates[sorted_indices][:max_learned_tokens]
+        tokens = tf.convert_to_tensor(
+            tokens[sorted_indices], dtype=self.vocabulary_dtype
+        )
         self.lookup_table = self._lookup_table_from_tokens(tokens)
+        self._lookup_keys = self._lookup_values = None
 
         if self.output_mode == "tf_idf":
-            token_document_counts = self.token_document_counts.lookup(tokens)
+            token_document_counts = document_counts[sorted_indices]
             idf_weights = self._inverse_document_frequency(
-                token_document_counts, self.num_documents
+                token_document_counts, self.token_counts.num_documents
             )
             idf_weights = tf.cast(idf_weights, backend.floatx())
             # Pad the front of idf_weights with the average idf weight for OOV
@@ -682,8 +755,7 @@ class IndexLookup(Layer):
             self.idf_weights_const = self.idf_weights.value()
 
         # We call this here to save memory, now that we've built our vocabulary,
-        # we don't want to keep every token we've seen in separate lookup
-        # tables.
+        # we don't want to keep every token we've seen in memory.
         self.reset_state()
         self._record_vocabulary_size()
 
@@ -691,18 +763,16 @@ class IndexLookup(Layer):
         if self._has_input_vocabulary:
             return
 
-        self.token_counts.remove(self.token_counts.export()[0])
-        if self.output_mode == "tf_idf":
-            self.token_document_counts.remove(
-                self.token_document_counts.export()[0]
-            )
-            self.num_documents.assign(0)
+        self.token_counts.reset()
 
     def call(self, inputs):
         from keras.src.backend import tensorflow as tf_backend
 
         self._ensure_known_vocab_size()
 
+        if self._use_native_lookup(inputs):
+            return self._call_native(inputs)
+
         inputs = tf_utils.ensure_tensor(inputs, dtype=self._key_dtype)
         original_shape = inputs.shape
         # Some ops will not handle scalar input, so uprank to rank 1.
@@ -755,6 +825,171 @@ class IndexLookup(Layer):
             )
         return output
 
+    def _use_native_lookup(self, inputs):
+        """Whether `inputs` can be looked up without TensorFlow ops.
+
+        On backends other than TensorFlow, dense inputs are looked up in the
+        vocabulary compiled into sorted arrays (see `_lookup_dense_native`),
+        so that calling the layer does not run TensorFlow eager ops. Sparse
+        outputs and string outputs are only supported through TensorFlow.
+        """
+        return (
+            backend.backend() != "tensorflow"
+            and not backend_utils.in_tf_graph()
+            and not self.sparse
+            and not (self.invert and self._value_dtype == "string")
+            and not isinstance(
+                inputs, (tf.Tensor, tf.RaggedTensor, tf.SparseTensor)
+            )
+        )
+
+    def _call_native(self, inputs):
+        if self._key_dtype == "string" or isinstance(
+            inputs, (np.ndarray, list, tuple)
+        ):
+            lookups = self._lookup_dense_native(inputs, np)
+        elif self.num_oov_indices == 0:
+            # Raising on OOV inputs requires concrete values.
+            lookups = self._lookup_dense_native(
+                backend.convert_to_numpy(inputs), np
+            )
+        else:
+            # Backend-native integer tensors are looked up with backend ops, so
+            # that this also works inside of compiled functions.
+            lookups = self._lookup_dense_native(inputs, backend)
+        lookups = backend.convert_to_tensor(lookups)
+
+        if self.output_mode == "int":
+            return lookups
+        return self._encode_native(lookups)
+
+    def _encode_native(self, lookups):
+        """Encodes vocabulary indices for non-`"int"` output modes."""
+        depth = (
+            self.max_tokens
+            if self.pad_to_max_tokens
+            else self._frozen_vocab_size
+        )
+        output = numerical_utils.encode_categorical_inputs(
+            lookups,
+            output_mode=(
+                "count" if self.output_mode == "tf_idf" else self.output_mode
+            ),
+            depth=depth,
+            dtype=self._value_dtype,
+        )
+        if self.output_mode == "tf_idf":
+            idf_weights = backend.convert_to_tensor(
+                self.idf_weights_const.numpy()
+            )
+            output = backend.numpy.multiply(
+                backend.cast(output, idf_weights.dtype), idf_weights
+            )
+        return output
+
+    def _lookup_arrays(self):
+        """Returns the vocabulary keys and values, sorted by key."""
+        if self._lookup_keys is None:
+            with tf.init_scope():
+                keys, values = self.lookup_table.export()
+                keys, values = keys.numpy(), values.numpy()
+            self._lookup_hashes = None
+            if self._key_dtype == "string":
+                keys = keys.astype(bytes)
+                # Binary search over byte strings is slow, so string keys are
+                # sorted and searched for by hash instead, unless two keys
+                # collide.
+                hashes = hash_strings(keys)
+                if len(np.unique(hashes)) == len(hashes):
+                    order = np.argsort(hashes)
+                    self._lookup_hashes = hashes[order]
+                else:
+                    order = np.argsort(keys, kind="stable")
+            else:
+                order = np.argsort(keys, kind="stable")
+            self._lookup_keys = keys[order]
+            self._lookup_values = values[order]
+        return self._lookup_keys, self._lookup_values
+
+    def _lookup_dense_native(self, inputs, module):
+        """Looks up dense `inputs` with binary search in sorted arrays.
+
+        This matches the masking and OOV semantics of `_lookup_dense`. When
+        `module` is `np`, the lookup runs on host with NumPy. Otherwise,
+        `module` is the Keras backend and `inputs` a backend-native integer
+        tensor.
+        """
+        keys, values = self._lookup_arrays()
+        if module is np:
+            inputs = np.asarray(inputs)
+            if self._key_dtype == "string":
+                inputs = strings_to_bytes(inputs)
+            else:
+                inputs = inputs.astype(self._key_dtype)
+            numpy_module = np
+        else:
+            inputs = backend.convert_to_tensor(inputs)
+            keys = backend.convert_to_tensor(keys, dtype=inputs.dtype)
+            values = backend.convert_to_tensor(values)
+            numpy_module = backend.numpy
+
+        if len(keys):
+            if self._lookup_hashes is not None:
+                indices = np.searchsorted(
+                    self._lookup_hashes, hash_strings(inputs)
+                )
+            else:
+                indices = numpy_module.searchsorted(keys, inputs)
+            indices = numpy_module.minimum(indices, len(keys) - 1)
+            found = numpy_module.equal(numpy_module.take(keys, indices), inputs)
+            lookups = numpy_module.where(
+                found, numpy_module.take(values, indices), self._default_value
+            )
+        else:
+            lookups = numpy_module.full_like(
+                inputs, self._default_value, dtype=values.dtype
+            )
+
+        if self.mask_token is not None:
+            mask_locations = numpy_module.equal(inputs, self._mask_key.numpy())
+            if self.invert:
+                return numpy_module.where(
+                    mask_locations, self._mask_value.numpy(), lookups
+                )
+        elif self.invert:
+            return lookups
+
+        if self.num_oov_indices == 0:
+            oov_locations = lookups == -1
+            if self.mask_token is not None:
+                oov_locations &= ~mask_locations
+            if np.any(oov_locations):
+                raise ValueError(
+                    "When `num_oov_indices=0` all inputs should be in "
+                    f"vocabulary, found OOV values {inputs[oov_locations]}, "
+                    "consider setting `num_oov_indices=1`."
+                )
+        elif self.num_oov_indices > 1:
+            oov_locations = numpy_module.equal(lookups, self._default_value)
+            if self._key_dtype == "string":
+                # Same buckets as `tf.strings.to_hash_bucket_fast()`.
+                oov_indices = np.zeros(inputs.shape, dtype=lookups.dtype)
+                oov_indices[oov_locations] = hash_utils.unsigned_mod(
+                    hash_utils.fingerprint64(inputs[oov_locations]),
+                    self.num_oov_indices,
+                )
+            else:
+                oov_indices = numpy_module.mod(inputs, self.num_oov_indices)
+            oov_indices = oov_indices + self._oov_start_index()
+            lookups = numpy_module.where(oov_locations, oov_indices, lookups)
+
+        if self.mask_token is not None:
+            # Masks map to 0 for int output. In other output modes, they are
+            # mapped to -1 so that they are dropped from the encoding.
+            mask_value = 0 if self.output_mode == "int" else -1
+            lookups = numpy_module.where(mask_locations, mask_value, lookups)
+        return lookups
+
     def _lookup_dense(self, inputs):
         """Lookup table values for a dense Tensor, handling masking and OOV."""
         # When executing eagerly and tracing keras.Input objects,
@@ -943,16 +1178,11 @@ class IndexLookup(Layer):
         else:
             return []
 
-    def _num_tokens(self, data):
-        """Count the number of tokens in a ragged, sparse or dense tensor."""
-        if isinstance(data, tf.SparseTensor):
-            flat_values = data.values
-        elif isinstance(data, tf.RaggedTensor):
-            flat_values = data.flat_values
-        else:
-            flat_values = tf.reshape(data, [-1])
-        tokens, _, counts = tf.unique_with_counts(flat_values, out_idx="int64")
-        return tokens, counts
+    def _special_token_to_numpy(self, token):
+        token = np.array(token)
+        if self.vocabulary_dtype == "string":
+            return strings_to_bytes(token)
+        return token.astype(self.vocabulary_dtype)
 
     def _inverse_document_frequency(self, token_document_counts, num_documents):
         """Computes the inverse-document-frequency (IDF) component of "tf_idf".
@@ -1003,6 +1233,191 @@ def get_null_initializer(key_dtype, value_dtype):
     return NullInitializer(key_dtype, value_dtype)
 
 
+class TokenCounts:
+    """Token and document counts of a dataset, accumulated with NumPy.
+
+    Counts are added per batch, as groups of unique tokens and their counts
+    (see `split_strings_by_length()`). Each group is buffered and
+    periodically merged with `np.unique`, so that adding a batch costs
+    amortized `O(n log n)` in the number of unique tokens of the batch,
+    without a Python loop over tokens.
+    """
+
+    # Minimum number of buffered (unmerged) tokens before merging.
+    _MIN_MERGE_SIZE = 2**20
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # Buffers of each group of tokens, by dtype.
+        self._groups = {}
+        self.num_documents = 0
+
+    def __len__(self):
+        return sum(
+            group["num_merged"] + group["num_buffered"]
+            for group in self._groups.values()
+        )
+
+    def add(self, groups, num_documents=0):
+        """Adds the counts of a batch.
+
+        Args:
+            groups: List of `(tokens, counts, document_counts)` tuples, where
+                `document_counts` may be `None`.
+            num_documents: Number of documents of the batch.
+        """
+        for tokens, counts, document_counts in groups:
+            group = self._groups.get(tokens.dtype)
+            if group is None:
+                group = self._groups[tokens.dtype] = {
+                    "tokens": [],
+                    "counts": [],
+                    "document_counts": [],
+                    "num_merged": 0,
+                    "num_buffered": 0,
+                }
+            group["tokens"].append(tokens)
+            group["counts"].append(counts)
+            if document_counts is not None:
+                group["document_counts"].append(document_counts)
+            group["num_buffered"] += len(tokens)
+            if group["num_buffered"] > max(
+                group["num_merged"], self._MIN_MERGE_SIZE
+            ):
+                self._merge(group)
+        self.num_documents += num_documents
+
+    def result(self):
+        """Returns the unique tokens with their (document) counts.
+
+        Tokens of all groups are concatenated. If long strings were added,
+        the tokens are an `object` array of bytes.
+        """
+        tokens, counts, document_counts = [], [], []
+        for group in self._groups.values():
+            self._merge(group)
+            tokens.extend(group["tokens"])
+            counts.extend(group["counts"])
+            document_counts.extend(group["document_counts"])
+        if any(x.dtype == object for x in tokens):
+            tokens = [x.astype(object) for x in tokens]
+        return (
+            np.concatenate(tokens),
+            np.concatenate(counts),
+            np.concatenate(document_counts) if document_counts else None,
+        )
+
+    def _merge(self, group):
+        if len(group["tokens"]) <= 1:
+            return
+        tokens, inverse = np.unique(
+            np.concatenate(group["tokens"]), return_inverse=True
+        )
+
+        def merge_counts(counts):
+            return np.bincount(
+                inverse, weights=np.concatenate(counts), minlength=len(tokens)
+            ).astype("int64")
+
+        group["counts"] = [merge_counts(group["counts"])]
+        if group["document_counts"]:
+            group["document_counts"] = [merge_counts(group["document_counts"])]
+        group["tokens"] = [tokens]
+        group["num_merged"] = len(tokens)
+        group["num_buffered"] = 0
+
+
+# Strings up to this length (in bytes) are counted as fixed-width bytes
+# arrays, longer strings as `object` arrays.
+_MAX_FIXED_WIDTH = 64
+
+
+def split_strings_by_length(values):
+    """Splits an array of strings into groups of similar lengths.
+
+    A fixed-width bytes array is as wide as its longest string, so a single
+    long token (e.g. a URL) would widen every other token of an array. Tokens
+    are instead grouped by their length rounded up to a power of two, each
+    group being at most twice as wide as its tokens, and tokens longer than
+    `_MAX_FIXED_WIDTH` bytes are kept as Python bytes.
+
+    Args:
+        values: 1D array of bytes, e.g. an `object` array.
+
+    Returns:
+        A list of `(indices, group)` tuples, where `group` is an array with
+        the `values` at `indices`.
+    """
+    if values.dtype.kind == "S" and values.dtype.itemsize <= _MAX_FIXED_WIDTH:
+        return [(None, values)]
+    lengths = np.frompyfunc(len, 1, 1)(values).astype("int64")
+    widths = np.where(
+        lengths > _MAX_FIXED_WIDTH,
+        0,
+        2 ** np.ceil(np.log2(np.maximum(lengths, 8))).astype("int64"),
+    )
+    groups = []
+    for width in np.unique(widths):
+        indices = np.flatnonzero(widths == width)
+        group = values[indices]
+        groups.append((indices, group.astype(f"S{width}" if width else object)))
+    return groups
+
+
+def shard_tensor(data, num_shards):
+    """Splits a dense or ragged tensor into `num_shards` along axis 0."""
+    if num_shards <= 1:
+        return [data]
+    num_rows = int(
+        data.nrows() if isinstance(data, tf.RaggedTensor) else data.shape[0]
+    )
+    shard_size = max(-(-num_rows // num_shards), 1)
+    return [data[i : i + shard_size] for i in range(0, num_rows, shard_size)]
+
+
+def strings_to_bytes(x):
+    """Converts a NumPy array of strings to an array of UTF-8 bytes."""
+    if x.dtype.kind == "U" and x.dtype.itemsize:
+        codes = np.ascontiguousarray(x).reshape(-1).view(np.uint32)
+        if not codes.size or codes.max() < 128:
+            # Fast path for ASCII strings, whose code points are their bytes.
+            width = x.dtype.itemsize // 4
+            return codes.astype(np.uint8).view(f"S{width}").reshape(x.shape)
+    if x.dtype.kind == "U":
+        return np.char.encode(x, "utf-8")
+    if x.dtype.kind == "O":
+        try:
+            # Fast path for arrays of bytes and ASCII strings.
+            return x.astype(bytes)
+        except UnicodeEncodeError:
+            pass
+        flat_values = [
+            v.encode("utf-8") if isinstance(v, str) else v for v in x.flat
+        ]
+        return np.array(flat_values, dtype=bytes).reshape(x.shape)
+    return x
+
+
+def hash_strings(x):
+    """Hashes a NumPy array of bytes to `uint64`, vectorized over bytes.
+
+    Trailing null bytes (which NumPy strips from bytes anyway) don't change
+    the hash, so arrays of different widths can be compared.
+    """
+    x = np.ascontiguousarray(x)
+    width = x.dtype.itemsize
+    codes = x.view(np.uint8).reshape(x.shape + (width,))
+    hashes = np.zeros(x.shape, dtype="uint64")
+    power = np.uint64(1)
+    with np.errstate(over="ignore"):
+        for i in range(width):
+            hashes += codes[..., i].astype("uint64") * power
+            power *= np.uint64(_HASH_MULTIPLIER)
+    return hashes
+
+
 def listify_tensors(x):
     """Convert any tensors or numpy arrays to lists for config serialization."""
     if tf.is_tensor(x):
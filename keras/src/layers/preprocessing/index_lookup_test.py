@@ -1,4 +1,5 @@
 import os
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -9,6 +10,7 @@ from keras.src import backend
 from keras.src import layers
 from keras.src import models
 from keras.src import testing
+from keras.src.layers.preprocessing import index_lookup
 from keras.src.saving import saving_api
 
 
@@ -210,6 +212,71 @@ class IndexLookupLayerTest(testing.TestCase, parameterized.TestCase):
         if backend.backend() != "torch":
             self.run_class_serialization_test(layer)
 
+    def test_adapt_with_workers(self):
+        adapt_data = np.random.randint(0, 50, size=(64, 8))
+        kwargs = {
+            "max_tokens": 20,
+            "num_oov_indices": 1,
+            "mask_token": 0,
+            "oov_token": -1,
+            "vocabulary_dtype": "int64",
+            "output_mode": "tf_idf",
+        }
+        layer = layers.IndexLookup(**kwargs)
+        layer.adapt(adapt_data)
+
+        ds = tf_data.Dataset.from_tensor_slices(adapt_data).batch(4)
+        for data in (adapt_data, ds):
+            parallel_layer = layers.IndexLookup(**kwargs)
+            # Also merges the counts of every batch as they are added.
+            with mock.patch.object(
+                index_lookup.TokenCounts, "_MIN_MERGE_SIZE", 1
+            ):
+                parallel_layer.adapt(data, workers=3)
+            self.assertEqual(
+                parallel_layer.get_vocabulary(), layer.get_vocabulary()
+            )
+            self.assertAllClose(
+                parallel_layer.idf_weights_const, layer.idf_weights_const
+            )
+
+    def test_adapt_long_tokens(self):
+        url = "https://example.com/" + "a" * 1000
+        adapt_data = np.array(
+            [
+                ["one", "two", url, "two"],
+                ["three", "x" * 40, url, "one"],
+                ["two", "four", "three", "x" * 40],
+            ]
+        )
+        kwargs = {
+            "max_tokens": None,
+            "num_oov_indices": 1,
+            "mask_token": "",
+            "oov_token": "[OOV]",
+            "vocabulary_dtype": "string",
+            "output_mode": "tf_idf",
+        }
+        layer = layers.IndexLookup(**kwargs)
+        # A long token doesn't widen the other tokens.
+        groups, num_documents = layer._count_tokens(adapt_data)
+        self.assertEqual(num_documents, 3)
+        self.assertEqual(
+            sorted(str(tokens.dtype) for tokens, _, _ in groups),
+            ["object", "|S64", "|S8"],
+        )
+
+        with mock.patch.object(index_lookup.TokenCounts, "_MIN_MERGE_SIZE", 1):
+            layer.adapt(tf_data.Dataset.from_tensor_slices(adapt_data).batch(1))
+        self.assertEqual(
+            layer.get_vocabulary(),
+            ["[OOV]", "two", "x" * 40, "three", "one", url, "four"],
+        )
+        self.assertAllClose(
+            layer.idf_weights_const[1:],
+            np.log(1 + 3 / (1 + np.array([2, 2, 2, 2, 2, 1]))),
+        )
+
     def test_pad_to_max_tokens(self):
         vocabulary = [1, 2]
         input_data = [1, 2]
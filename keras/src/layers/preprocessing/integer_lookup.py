@@ -40,13 +40,12 @@ class IntegerLookup(IndexLookup):
     `output_mode` is `"multi_hot"`, `"count"`, or `"tf_idf"` the vocabulary will
     begin with OOV indices and instances of the mask token will be dropped.
 
-    **Note:** This layer uses TensorFlow internally. It cannot
-    be used as part of the compiled computation graph of a model with
-    any backend other than TensorFlow.
-    It can however be used with any backend when running eagerly.
-    It can also always be used as part of an input preprocessing pipeline
-    with any backend (outside the model itself), which is how we recommend
-    to use this layer.
+    **Note:** This layer uses TensorFlow internally to build its vocabulary.
+    With backends other than TensorFlow, lookups on backend-native tensors
+    use a vocabulary compiled into sorted arrays, so that the layer can be
+    used as part of the compiled computation graph of a model (unless
+    `num_oov_indices=0`). It can also always be used as part of an input
+    preprocessing pipeline with any backend (outside the model itself).
 
     **Note:** This layer is safe to use inside a `tf.data` pipeline
     (independently of which backend you're using).
@@ -353,9 +352,14 @@ class IntegerLookup(IndexLookup):
         )
         self._convert_input_args = False
         self._allow_non_tensor_positional_args = True
-        self.supports_jit = False
+        # Outside of TensorFlow, backend-native inputs are looked up with
+        # backend ops, which can be compiled. Raising on OOV inputs when
+        # `num_oov_indices=0` requires concrete values.
+        self.supports_jit = (
+            backend.backend() != "tensorflow" and num_oov_indices > 0
+        )
 
-    def adapt(self, data, steps=None):
+    def adapt(self, data, steps=None, workers=1):
         """Computes a vocabulary of integer terms from tokens in a dataset.
 
         Calling `adapt()` on an `IntegerLookup` layer is an alternative to
@@ -383,8 +387,11 @@ class IntegerLookup(IndexLookup):
                 When passing an infinitely
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
+            workers: Integer. Number of threads used to count the tokens of
+                the batches of `data` (or of shards of array inputs) in
+                parallel. Defaults to `1`.
         """
-        super().adapt(data, steps=steps)
+        super().adapt(data, steps=steps, workers=workers)
 
     def get_config(self):
         config = super().get_config()
@@ -399,7 +406,7 @@ class IntegerLookup(IndexLookup):
     def call(self, inputs):
         if not isinstance(
             inputs, (tf.Tensor, tf.RaggedTensor, np.ndarray, list, tuple)
-        ):
+        ) and not self._use_native_lookup(inputs):
             inputs = tf.convert_to_tensor(backend.convert_to_numpy(inputs))
         outputs = super().call(inputs)
         return backend_utils.convert_tf_tensor(outputs)
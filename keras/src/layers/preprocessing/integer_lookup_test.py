@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+import tensorflow as tf
 from tensorflow import data as tf_data
 
 from keras.src import backend
@@ -85,6 +87,35 @@ class IntegerLookupTest(testing.TestCase):
         self.assertTrue(backend.is_tensor(output))
         self.assertAllClose(output, np.array([2, 3, 4, 0]))
 
+    def test_backend_tensor_inputs(self):
+        vocabulary = [12, 36, 1138, 42]
+        input_data = np.array([[12, 1138, 42, 0], [37, 1000, 36, 0]])
+        for kwargs in (
+            {"num_oov_indices": 2, "mask_token": 0},
+            {"output_mode": "count"},
+            {"invert": True},
+        ):
+            layer = layers.IntegerLookup(vocabulary=vocabulary, **kwargs)
+            data = input_data % 5 if kwargs.get("invert") else input_data
+            # Backend-native tensors don't go through TensorFlow lookups.
+            expected_output = layer(tf.constant(data))
+            output = layer(backend.convert_to_tensor(data))
+            self.assertTrue(backend.is_tensor(output))
+            self.assertAllClose(output, expected_output)
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax", reason="Tests jit compilation with JAX."
+    )
+    def test_jit_compile(self):
+        import jax
+
+        layer = layers.IntegerLookup(
+            vocabulary=[12, 36, 1138, 42], num_oov_indices=2
+        )
+        self.assertTrue(layer.supports_jit)
+        output = jax.jit(layer)(np.array([[12, 1138, 42], [37, 1000, 36]]))
+        self.assertAllClose(output, np.array([[2, 4, 5], [1, 0, 3]]))
+
     def test_set_vocabulary(self):
         layer = layers.IntegerLookup(
             output_mode="int",
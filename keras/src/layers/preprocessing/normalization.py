@@ -1,4 +1,7 @@
+import contextlib
+import itertools
 import math
+import multiprocessing.pool
 
 import numpy as np
 
@@ -6,8 +9,12 @@ from keras.src import backend
 from keras.src import ops
 from keras.src.api_export import keras_export
 from keras.src.layers.preprocessing.tf_data_layer import TFDataLayer
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.utils.module_utils import tensorflow as tf
 
+# Maximum number of array elements processed at once by `adapt()`.
+_ADAPT_CHUNK_SIZE = 2**22
+
 
 @keras_export("keras.layers.Normalization")
 class Normalization(TFDataLayer):
@@ -111,6 +118,7 @@ class Normalization(TFDataLayer):
         self.invert = invert
         self.supports_masking = True
         self._build_input_shape = None
+        self._adapt_moments = None
         self.mean = None
 
         # Set `mean` and `variance` if passed.
@@ -196,7 +204,7 @@ class Normalization(TFDataLayer):
             self.variance = ops.cast(variance, dtype=self.compute_dtype)
             self.built = True
 
-    def adapt(self, data):
+    def adapt(self, data, steps=None, workers=1):
         """Computes the mean and variance of values in a dataset.
 
         Calling `adapt()` on a `Normalization` layer is an alternative to
@@ -209,14 +217,33 @@ class Normalization(TFDataLayer):
         argument. To calculate a single `mean` and `variance` over the input
         data, simply pass `axis=None` to the layer.
 
+        Except for backend-native tensors, the data is processed in a single
+        pass over chunks of bounded size: the mean and variance of each chunk
+        are computed in float64 and merged exactly into the running totals.
+        NumPy arrays (including memory-mapped arrays) are split into chunks
+        along their first axis, so they are never copied as a whole.
+
         Arg:
             data: The data to train on. It can be passed either as a
-                `tf.data.Dataset`, as a NumPy array, or as a backend-native
-                eager tensor.
+                `tf.data.Dataset`, as a NumPy array, as a backend-native
+                eager tensor, as a `keras.utils.PyDataset`, or as any other
+                iterable (e.g. a generator) of batches.
                 If a dataset, *it must be batched*. Keras will assume that the
                 data is batched, and if that assumption doesn't hold, the mean
                 and variance may be incorrectly computed.
+            steps: Integer or `None`. Total number of steps (batches of
+                samples) to process. If `data` is a `tf.data.Dataset`, a
+                `PyDataset` or an iterable of batches, and `steps` is `None`,
+                `adapt()` will run until the input data is exhausted. This
+                argument is not supported with array inputs.
+            workers: Integer. Number of threads used to compute the moments
+                of NumPy array chunks or of `PyDataset` batches in parallel.
+                Defaults to `1`.
         """
+        if isinstance(data, (list, tuple)):
+            data = np.asarray(data)
+
+        batches = None
         if isinstance(data, np.ndarray) or backend.is_tensor(data):
             input_shape = data.shape
         elif isinstance(data, tf.data.Dataset):
@@ -225,67 +252,146 @@ class Normalization(TFDataLayer):
                 # Batch dataset if it isn't batched
                 data = data.batch(128)
             input_shape = tuple(data.element_spec.shape)
-
-        if not self.built:
-            self.build(input_shape)
+            if steps is not None:
+                data = data.take(steps)
+            batches = data
+        elif isinstance(data, PyDataset):
+            num_batches = data.num_batches
+            if steps is not None:
+                num_batches = steps
+            elif num_batches is None:
+                raise ValueError(
+                    "When passing an infinite `PyDataset` to `adapt()`, you "
+                    "must specify the `steps` argument."
+                )
+            input_shape = np.shape(data[0])
+            batches = range(num_batches)
         else:
-            for d in self._keep_axis:
-                if input_shape[d] != self._build_input_shape[d]:
-                    raise ValueError(
-                        "The layer was built with "
-                        f"input_shape={self._build_input_shape}, "
-                        "but adapt() is being called with data with "
-                        f"an incompatible shape, data.shape={input_shape}"
-                    )
+            iterator = iter(data)
+            if steps is not None:
+                iterator = itertools.islice(iterator, steps)
+            first_batch = next(iterator)
+            input_shape = np.shape(first_batch)
+            batches = itertools.chain([first_batch], iterator)
 
-        if isinstance(data, np.ndarray):
-            total_mean = np.mean(data, axis=self._reduce_axis)
-            total_var = np.var(data, axis=self._reduce_axis)
-        elif backend.is_tensor(data):
+        self._build_for_adapt(input_shape)
+        self.reset_state()
+
+        if not isinstance(data, np.ndarray) and backend.is_tensor(data):
             total_mean = ops.mean(data, axis=self._reduce_axis)
             total_var = ops.var(data, axis=self._reduce_axis)
-        elif isinstance(data, tf.data.Dataset):
-            total_mean = ops.zeros(self._mean_and_var_shape)
-            total_var = ops.zeros(self._mean_and_var_shape)
-            total_count = 0
-            for batch in data:
-                batch = backend.convert_to_tensor(
-                    batch, dtype=self.compute_dtype
-                )
-                batch_mean = ops.mean(batch, axis=self._reduce_axis)
-                batch_var = ops.var(batch, axis=self._reduce_axis)
-                if self._reduce_axis:
-                    batch_reduce_shape = (
-                        batch.shape[d] for d in self._reduce_axis
-                    )
-                    batch_count = math.prod(batch_reduce_shape)
-                else:
-                    batch_count = 1
-
-                total_count += batch_count
-                batch_weight = float(batch_count) / total_count
-                existing_weight = 1.0 - batch_weight
-                new_total_mean = (
-                    total_mean * existing_weight + batch_mean * batch_weight
+            self.adapt_mean.assign(total_mean)
+            self.adapt_variance.assign(total_var)
+            self.finalize_state()
+            return
+
+        if isinstance(data, np.ndarray):
+            if 0 in self._reduce_axis:
+                row_size = max(1, math.prod(data.shape[1:]))
+                chunk_rows = max(1, _ADAPT_CHUNK_SIZE // row_size)
+                batches = range(0, data.shape[0], chunk_rows)
+
+                def get_moments(start):
+                    return self._batch_moments(data[start : start + chunk_rows])
+
+            else:
+                batches = [data]
+                get_moments = self._batch_moments
+        elif isinstance(data, PyDataset):
+
+            def get_moments(index):
+                return self._batch_moments(data[index])
+
+        else:
+            # Batches of generic iterables are consumed in order from the
+            # calling thread.
+            workers = 1
+            get_moments = self._batch_moments
+
+        with contextlib.ExitStack() as stack:
+            if workers > 1:
+                pool = stack.enter_context(
+                    multiprocessing.pool.ThreadPool(workers)
                 )
-                # The variance is computed using the lack-of-fit sum of squares
-                # formula (see
-                # https://en.wikipedia.org/wiki/Lack-of-fit_sum_of_squares).
-                total_var = (
-                    total_var + (total_mean - new_total_mean) ** 2
-                ) * existing_weight + (
-                    batch_var + (batch_mean - new_total_mean) ** 2
-                ) * batch_weight
-                total_mean = new_total_mean
-
-        self.adapt_mean.assign(total_mean)
-        self.adapt_variance.assign(total_var)
+                moments = pool.imap(get_moments, batches)
+            else:
+                moments = map(get_moments, batches)
+            for count, mean, m2 in moments:
+                self._merge_moments(count, mean, m2)
         self.finalize_state()
 
+    def update_state(self, data):
+        """Accumulates the mean and variance of a batch of data.
+
+        This is the incremental counterpart of `adapt()`: after
+        `reset_state()`, call `update_state()` on each batch, then
+        `finalize_state()` to set the mean and variance of the layer.
+
+        Args:
+            data: A batch of data, as a NumPy array or a tensor.
+        """
+        if backend.is_tensor(data) and not isinstance(data, np.ndarray):
+            data = backend.convert_to_numpy(data)
+        data = np.asarray(data)
+        self._build_for_adapt(data.shape)
+        self._merge_moments(*self._batch_moments(data))
+
+    def reset_state(self):
+        self._adapt_moments = None
+
+    def _build_for_adapt(self, input_shape):
+        if not self.built:
+            self.build(input_shape)
+            return
+        for d in self._keep_axis:
+            if input_shape[d] != self._build_input_shape[d]:
+                raise ValueError(
+                    "The layer was built with "
+                    f"input_shape={self._build_input_shape}, "
+                    "but adapt() is being called with data with "
+                    f"an incompatible shape, data.shape={input_shape}"
+                )
+
+    def _merge_moments(self, count, mean, m2):
+        """Merges the moments of a batch into the moments seen so far."""
+        if count == 0:
+            return
+        if self._adapt_moments is None:
+            self._adapt_moments = (count, mean, m2)
+            return
+        # Merge the moments with the parallel algorithm of Chan et al.
+        total_count, total_mean, total_m2 = self._adapt_moments
+        new_count = total_count + count
+        delta = mean - total_mean
+        total_mean = total_mean + delta * (count / new_count)
+        total_m2 = (
+            total_m2 + m2 + np.square(delta) * (total_count * count / new_count)
+        )
+        self._adapt_moments = (new_count, total_mean, total_m2)
+
+    def _batch_moments(self, batch):
+        """Returns the count, mean and sum of squared deviations of a batch."""
+        if backend.is_tensor(batch) and not isinstance(batch, np.ndarray):
+            batch = backend.convert_to_numpy(batch)
+        batch = np.asarray(batch)
+        count = math.prod(batch.shape[d] for d in self._reduce_axis)
+        if count == 0:
+            return 0, None, None
+        mean = np.mean(
+            batch, axis=self._reduce_axis, dtype="float64", keepdims=True
+        )
+        m2 = np.sum(np.square(batch - mean), axis=self._reduce_axis)
+        return count, np.reshape(mean, self._mean_and_var_shape), m2
+
     def finalize_state(self):
         if self.input_mean is not None or not self.built:
             return
 
+        if self._adapt_moments is not None:
+            count, mean, m2 = self._adapt_moments
+            self.adapt_mean.assign(mean)
+            self.adapt_variance.assign(m2 / count)
+
         # In the adapt case, we make constant tensors for mean and variance with
         # proper broadcast shape and dtype each time `finalize_state` is called.
         self.mean = ops.reshape(self.adapt_mean, self._broadcast_shape)
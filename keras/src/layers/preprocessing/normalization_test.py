@@ -1,3 +1,6 @@
+import os
+from unittest import mock
+
 import numpy as np
 import pytest
 from absl.testing import parameterized
@@ -6,6 +9,8 @@ from tensorflow import data as tf_data
 from keras.src import backend
 from keras.src import layers
 from keras.src import testing
+from keras.src.layers.preprocessing import normalization
+from keras.src.trainers.data_adapters import py_dataset_adapter
 
 
 class NormalizationTest(testing.TestCase, parameterized.TestCase):
@@ -137,6 +142,57 @@ class NormalizationTest(testing.TestCase, parameterized.TestCase):
             layer = layers.Normalization(axis=1)
             layer.build((None, None))
 
+    @parameterized.parameters(
+        [("generator",), ("py_dataset",), ("memmap",), ("threads",)]
+    )
+    def test_normalization_adapt_streaming(self, input_type):
+        x = np.random.normal(loc=3.0, scale=2.0, size=(1000, 4, 3))
+        if input_type == "generator":
+            data = (x[i : i + 64] for i in range(0, 1000, 64))
+        elif input_type == "py_dataset":
+
+            class ChunkedDataset(py_dataset_adapter.PyDataset):
+                def __len__(self):
+                    return 16
+
+                def __getitem__(self, index):
+                    return x[index * 64 : (index + 1) * 64]
+
+            data = ChunkedDataset()
+        else:
+            fpath = os.path.join(self.get_temp_dir(), "data.npy")
+            np.save(fpath, x)
+            data = np.load(fpath, mmap_mode="r")
+
+        layer = layers.Normalization(axis=(1, 2))
+        if input_type == "threads":
+            with mock.patch.object(normalization, "_ADAPT_CHUNK_SIZE", 120):
+                layer.adapt(data, workers=4)
+        else:
+            layer.adapt(data)
+        self.assertAllClose(layer.adapt_mean, np.mean(x, axis=0))
+        self.assertAllClose(layer.adapt_variance, np.var(x, axis=0))
+
+    def test_normalization_adapt_steps(self):
+        x = np.random.random((64, 4))
+        layer = layers.Normalization()
+        layer.adapt((x[i : i + 16] for i in range(0, 64, 16)), steps=2)
+        self.assertAllClose(layer.adapt_mean, np.mean(x[:32], axis=0))
+        self.assertAllClose(layer.adapt_variance, np.var(x[:32], axis=0))
+
+    def test_normalization_update_state(self):
+        x = np.random.normal(loc=3.0, scale=2.0, size=(100, 4))
+        layer = layers.Normalization()
+        layer.adapt(np.ones((10, 4)))
+        layer.reset_state()
+        for i in range(0, 100, 16):
+            layer.update_state(x[i : i + 16])
+        layer.finalize_state()
+        self.assertAllClose(layer.adapt_mean, np.mean(x, axis=0))
+        self.assertAllClose(layer.adapt_variance, np.var(x, axis=0))
+        output = backend.convert_to_numpy(layer(x))
+        self.assertAllClose(np.mean(output, axis=0), 0.0, atol=1e-5)
+
     def test_normalization_adapt_with_incompatible_shape(self):
         layer = layers.Normalization(axis=-1)
         initial_shape = (10, 5)
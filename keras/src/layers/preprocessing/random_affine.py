@@ -0,0 +1,232 @@
+import copy
+
+from keras.src import backend
+from keras.src.api_export import keras_export
+from keras.src.layers.preprocessing.random_flip import RandomFlip
+from keras.src.layers.preprocessing.random_rotation import RandomRotation
+from keras.src.layers.preprocessing.random_translation import RandomTranslation
+from keras.src.layers.preprocessing.random_zoom import RandomZoom
+from keras.src.layers.preprocessing.tf_data_layer import TFDataLayer
+from keras.src.saving import serialization_lib
+
+
+@keras_export("keras.layers.RandomAffine")
+class RandomAffine(TFDataLayer):
+    """A preprocessing layer which applies several geometric augmentations
+    at once.
+
+    This layer composes the random transformations of a sequence of
+    `RandomFlip`, `RandomRotation`, `RandomTranslation` and `RandomZoom`
+    layers into a single affine transformation per image, and resamples each
+    image once. This is faster than applying the layers one after the other,
+    which resamples the images once per layer, and avoids the blur of
+    repeated interpolation.
+
+    The transformations are sampled by the given layers, in order, but their
+    `fill_mode`, `interpolation`, `fill_value` and `data_format` arguments are
+    ignored in favor of the ones of this layer.
+
+    By default, random transformations are only applied during training.
+    At inference time, the layer does nothing. If you need to apply random
+    transformations at inference time, pass `training=True` when calling the
+    layer.
+
+    Input pixel values can be of any range (e.g. `[0., 1.)` or `[0, 255]`) and
+    of integer or floating point dtype.
+    By default, the layer will output floats.
+
+    **Note:** This layer is safe to use inside a `tf.data` pipeline
+    (independently of which backend you're using).
+
+    Input shape:
+        3D (unbatched) or 4D (batched) tensor with shape:
+        `(..., height, width, channels)`, in `"channels_last"` format,
+        or `(..., channels, height, width)`, in `"channels_first"` format.
+
+    Output shape:
+        3D (unbatched) or 4D (batched) tensor with shape:
+        `(..., height, width, channels)`, in `"channels_last"` format,
+        or `(..., channels, height, width)`, in `"channels_first"` format.
+
+    Args:
+        layers: List of `RandomFlip`, `RandomRotation`, `RandomTranslation`
+            and `RandomZoom` layers, in the order in which their
+            transformations are applied.
+        fill_mode: Points outside the boundaries of the input are filled
+            according to the given mode. Available methods are `"constant"`,
+            `"nearest"`, `"wrap"` and `"reflect"`. Defaults to `"reflect"`.
+            - `"reflect"`: `(d c b a | a b c d | d c b a)`
+                The input is extended by reflecting about the edge of the last
+                pixel.
+            - `"constant"`: `(k k k k | a b c d | k k k k)`
+                The input is extended by filling all values beyond
+                the edge with the same constant value k specified by
+                `fill_value`.
+            - `"wrap"`: `(a b c d | a b c d | a b c d)`
+                The input is extended by wrapping around to the opposite edge.
+            - `"nearest"`: `(a a a a | a b c d | d d d d)`
+                The input is extended by the nearest pixel.
+        interpolation: Interpolation mode. Supported values: `"nearest"`,
+            `"bilinear"`.
+        fill_value: a float that represents the value to be filled outside
+            the boundaries when `fill_mode="constant"`.
+        data_format: string, either `"channels_last"` or `"channels_first"`.
+            The ordering of the dimensions in the inputs. `"channels_last"`
+            corresponds to inputs with shape `(batch, height, width, channels)`
+            while `"channels_first"` corresponds to inputs with shape
+            `(batch, channels, height, width)`. It defaults to the
+            `image_data_format` value found in your Keras config file at
+            `~/.keras/keras.json`. If you never set it, then it will be
+            `"channels_last"`.
+        **kwargs: Base layer keyword arguments, such as `name` and `dtype`.
+
+    Example:
+
+    >>> input_img = np.random.random((32, 224, 224, 3))
+    >>> layer = keras.layers.RandomAffine(
+    ...     [
+    ...         keras.layers.RandomFlip("horizontal"),
+    ...         keras.layers.RandomRotation(0.1),
+    ...         keras.layers.RandomZoom(0.2),
+    ...         keras.layers.RandomTranslation(0.1, 0.1),
+    ...     ]
+    ... )
+    >>> out_img = layer(input_img)
+    """
+
+    _SUPPORTED_LAYERS = (
+        RandomFlip,
+        RandomRotation,
+        RandomTranslation,
+        RandomZoom,
+    )
+    _SUPPORTED_FILL_MODE = ("reflect", "wrap", "constant", "nearest")
+    _SUPPORTED_INTERPOLATION = ("nearest", "bilinear")
+
+    def __init__(
+        self,
+        layers,
+        fill_mode="reflect",
+        interpolation="bilinear",
+        fill_value=0.0,
+        data_format=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        for layer in layers:
+            if not isinstance(layer, self._SUPPORTED_LAYERS):
+                raise ValueError(
+                    "Expected `layers` to be a list of `RandomFlip`, "
+                    "`RandomRotation`, `RandomTranslation` and `RandomZoom` "
+                    f"layers. Received: layer={layer} (of type {type(layer)})"
+                )
+        if fill_mode not in self._SUPPORTED_FILL_MODE:
+            raise NotImplementedError(
+                f"Unknown `fill_mode` {fill_mode}. Expected of one "
+                f"{self._SUPPORTED_FILL_MODE}."
+            )
+        if interpolation not in self._SUPPORTED_INTERPOLATION:
+            raise NotImplementedError(
+                f"Unknown `interpolation` {interpolation}. Expected of one "
+                f"{self._SUPPORTED_INTERPOLATION}."
+            )
+        self.layers = list(layers)
+        self.fill_mode = fill_mode
+        self.interpolation = interpolation
+        self.fill_value = fill_value
+        self.data_format = backend.standardize_data_format(data_format)
+
+        self.supports_jit = False
+
+    def call(self, inputs, training=True):
+        inputs = self.backend.cast(inputs, self.compute_dtype)
+        if training and self.layers:
+            return self._randomly_transform_inputs(inputs)
+        else:
+            return inputs
+
+    def _randomly_transform_inputs(self, inputs):
+        inputs_shape = self.backend.shape(inputs)
+        unbatched = len(inputs_shape) == 3
+        if unbatched:
+            inputs = self.backend.numpy.expand_dims(inputs, axis=0)
+            inputs_shape = self.backend.shape(inputs)
+
+        batch_size = inputs_shape[0]
+        if self.data_format == "channels_first":
+            height = inputs_shape[-2]
+            width = inputs_shape[-1]
+        else:
+            height = inputs_shape[-3]
+            width = inputs_shape[-2]
+
+        outputs = self.backend.image.affine_transform(
+            inputs,
+            transform=self._get_transform_matrix(batch_size, height, width),
+            interpolation=self.interpolation,
+            fill_mode=self.fill_mode,
+            fill_value=self.fill_value,
+            data_format=self.data_format,
+        )
+
+        if unbatched:
+            outputs = self.backend.numpy.squeeze(outputs, axis=0)
+        return outputs
+
+    def _get_transform_matrix(self, batch_size, image_height, image_width):
+        # Each matrix maps the coordinates of output pixels to coordinates of
+        # input pixels, so applying the transformations of the layers in
+        # order is equivalent to applying the product of their matrices.
+        transform = None
+        for layer in self.layers:
+            # Sample with the backend of this layer, which is TensorFlow in a
+            # tf.data pipeline.
+            layer.backend.set_backend(self.backend.name)
+            try:
+                matrix = layer._get_transform_matrix(
+                    batch_size, image_height, image_width
+                )
+            finally:
+                layer.backend.reset()
+            matrix = self.backend.numpy.concatenate(
+                [
+                    self.backend.cast(matrix, "float32"),
+                    self.backend.numpy.ones((batch_size, 1)),
+                ],
+                axis=1,
+            )
+            matrix = self.backend.numpy.reshape(matrix, (-1, 3, 3))
+            if transform is None:
+                transform = matrix
+            else:
+                transform = self.backend.numpy.matmul(transform, matrix)
+        transform = self.backend.numpy.reshape(transform, (-1, 9))
+        return transform[:, :8]
+
+    def compute_output_shape(self, input_shape):
+        return input_shape
+
+    def get_config(self):
+        base_config = super().get_config()
+        config = {
+            "layers": [
+                serialization_lib.serialize_keras_object(layer)
+                for layer in self.layers
+            ],
+            "fill_mode": self.fill_mode,
+            "interpolation": self.interpolation,
+            "fill_value": self.fill_value,
+            "data_format": self.data_format,
+        }
+        return {**base_config, **config}
+
+    @classmethod
+    def from_config(cls, config, custom_objects=None):
+        config = copy.deepcopy(config)
+        config["layers"] = [
+            serialization_lib.deserialize_keras_object(
+                layer_config, custom_objects=custom_objects
+            )
+            for layer_config in config["layers"]
+        ]
+        return cls(**config)
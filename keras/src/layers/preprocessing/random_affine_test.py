@@ -0,0 +1,107 @@
+import numpy as np
+from tensorflow import data as tf_data
+
+from keras.src import backend
+from keras.src import layers
+from keras.src import testing
+
+
+class RandomAffineTest(testing.TestCase):
+    def test_random_affine(self):
+        self.run_layer_test(
+            layers.RandomAffine,
+            init_kwargs={
+                "layers": [
+                    layers.RandomFlip(),
+                    layers.RandomRotation(0.2),
+                    layers.RandomZoom(0.2),
+                    layers.RandomTranslation(0.1, 0.1),
+                ],
+            },
+            input_shape=(2, 3, 4),
+            expected_output_shape=(2, 3, 4),
+            supports_masking=False,
+            run_training_check=False,
+        )
+
+    def test_config(self):
+        layer = layers.RandomAffine(
+            [layers.RandomFlip("horizontal", seed=1), layers.RandomZoom(0.3)],
+            fill_mode="constant",
+        )
+        self.run_class_serialization_test(layer)
+
+    def _get_input_image(self):
+        if backend.config.image_data_format() == "channels_last":
+            input_shape = (2, 5, 5, 1)
+        else:
+            input_shape = (2, 1, 5, 5)
+        return np.reshape(np.arange(0, 50, dtype="float32"), input_shape)
+
+    def test_matches_sequential_transformations(self):
+        input_image = self._get_input_image()
+        # A rotation by 90 degrees, and a translation by one pixel, which
+        # don't need interpolation.
+        transformations = [
+            (layers.RandomRotation, {"factor": (0.25, 0.25)}),
+            (
+                layers.RandomTranslation,
+                {"height_factor": (0.2, 0.2), "width_factor": (-0.2, -0.2)},
+            ),
+        ]
+        expected_output = input_image
+        for layer_class, kwargs in transformations:
+            layer = layer_class(fill_mode="constant", **kwargs)
+            expected_output = layer(expected_output)
+
+        layer = layers.RandomAffine(
+            [layer_class(**kwargs) for layer_class, kwargs in transformations],
+            fill_mode="constant",
+        )
+        self.assertAllClose(layer(input_image), expected_output, atol=1e-4)
+        self.assertAllClose(layer(input_image, training=False), input_image)
+
+    def test_random_flip(self):
+        input_image = self._get_input_image()
+        layer = layers.RandomAffine(
+            [layers.RandomFlip(seed=1337)], interpolation="nearest"
+        )
+        output = backend.convert_to_numpy(layer(input_image))
+        # Each image is flipped on each axis, or not.
+        if backend.config.image_data_format() == "channels_last":
+            height_axis, width_axis = 0, 1
+        else:
+            height_axis, width_axis = 1, 2
+        for image, output_image in zip(input_image, output):
+            candidates = [
+                image,
+                np.flip(image, height_axis),
+                np.flip(image, width_axis),
+                np.flip(image, (height_axis, width_axis)),
+            ]
+            self.assertTrue(
+                any(np.allclose(output_image, c) for c in candidates)
+            )
+
+    def test_tf_data_compatibility(self):
+        input_image = self._get_input_image()
+        layer = layers.RandomAffine(
+            [
+                layers.RandomRotation((0.25, 0.25)),
+                layers.RandomRotation((0.25, 0.25)),
+            ],
+            interpolation="nearest",
+        )
+        # Two rotations by 90 degrees are a rotation by 180 degrees.
+        if backend.config.image_data_format() == "channels_last":
+            expected_output = input_image[:, ::-1, ::-1]
+        else:
+            expected_output = input_image[:, :, ::-1, ::-1]
+        ds = tf_data.Dataset.from_tensor_slices(input_image).batch(2).map(layer)
+        for output in ds.take(1):
+            output = output.numpy()
+        self.assertAllClose(output, expected_output)
+
+    def test_unsupported_layer(self):
+        with self.assertRaisesRegex(ValueError, "Expected `layers`"):
+            layers.RandomAffine([layers.RandomContrast(0.2)])
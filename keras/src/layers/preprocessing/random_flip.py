@@ -81,6 +81,48 @@ class RandomFlip(TFDataLayer):
             )
         return flipped_outputs
 
+    def _get_transform_matrix(self, batch_size, image_height, image_width):
+        """Returns random flip matrices for a batch of images."""
+        seed_generator = self._get_seed_generator(self.backend._backend)
+        zeros = self.backend.numpy.zeros((batch_size, 1))
+        flip_x = flip_y = zeros
+        if self.mode == HORIZONTAL or self.mode == HORIZONTAL_AND_VERTICAL:
+            flip_x = self.backend.cast(
+                self.backend.random.uniform(
+                    shape=(batch_size, 1), seed=seed_generator
+                )
+                <= 0.5,
+                "float32",
+            )
+        if self.mode == VERTICAL or self.mode == HORIZONTAL_AND_VERTICAL:
+            flip_y = self.backend.cast(
+                self.backend.random.uniform(
+                    shape=(batch_size, 1), seed=seed_generator
+                )
+                <= 0.5,
+                "float32",
+            )
+        # The flip matrix looks like:
+        #     [[1 - 2fx  0        fx(width - 1)]
+        #      [0        1 - 2fy  fy(height - 1)]
+        #      [0        0        1]]
+        # where fx and fy are 1 for flipped images and 0 otherwise, and the
+        # last entry is implicit.
+        width = self.backend.cast(image_width, "float32")
+        height = self.backend.cast(image_height, "float32")
+        return self.backend.numpy.concatenate(
+            [
+                1.0 - 2.0 * flip_x,
+                zeros,
+                flip_x * (width - 1.0),
+                zeros,
+                1.0 - 2.0 * flip_y,
+                flip_y * (height - 1.0),
+                self.backend.numpy.zeros((batch_size, 2)),
+            ],
+            axis=1,
+        )
+
     def call(self, inputs, training=True):
         inputs = self.backend.cast(inputs, self.compute_dtype)
         if training:
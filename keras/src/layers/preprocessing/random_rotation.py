@@ -179,6 +179,15 @@ class RandomRotation(TFDataLayer):
                 image_height = shape[1]
                 image_width = shape[2]
 
+        outputs = self._get_transform_matrix(
+            batch_size, image_height, image_width
+        )
+        if len(shape) == 3:
+            outputs = self.backend.numpy.squeeze(outputs, axis=0)
+        return outputs
+
+    def _get_transform_matrix(self, batch_size, image_height, image_width):
+        """Returns random rotation matrices for a batch of images."""
         lower = self._factor[0] * 2.0 * self.backend.convert_to_tensor(np.pi)
         upper = self._factor[1] * 2.0 * self.backend.convert_to_tensor(np.pi)
 
@@ -205,7 +214,7 @@ class RandomRotation(TFDataLayer):
             - (sin_theta * (image_width - 1) + cos_theta * (image_height - 1))
         ) / 2.0
 
-        outputs = self.backend.numpy.concatenate(
+        return self.backend.numpy.concatenate(
             [
                 self.backend.numpy.cos(angle)[:, None],
                 -self.backend.numpy.sin(angle)[:, None],
@@ -217,9 +226,6 @@ class RandomRotation(TFDataLayer):
             ],
             axis=1,
         )
-        if len(shape) == 3:
-            outputs = self.backend.numpy.squeeze(outputs, axis=0)
-        return outputs
 
     def call(self, inputs, training=True):
         inputs = self.backend.cast(inputs, self.compute_dtype)
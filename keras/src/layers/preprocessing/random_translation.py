@@ -178,6 +178,21 @@ class RandomTranslation(TFDataLayer):
             height = inputs_shape[-3]
             width = inputs_shape[-2]
 
+        outputs = self.backend.image.affine_transform(
+            inputs,
+            transform=self._get_transform_matrix(batch_size, height, width),
+            interpolation=self.interpolation,
+            fill_mode=self.fill_mode,
+            fill_value=self.fill_value,
+            data_format=self.data_format,
+        )
+
+        if unbatched:
+            outputs = self.backend.numpy.squeeze(outputs, axis=0)
+        return outputs
+
+    def _get_transform_matrix(self, batch_size, image_height, image_width):
+        """Returns random translation matrices for a batch of images."""
         seed_generator = self._get_seed_generator(self.backend._backend)
         height_translate = self.backend.random.uniform(
             minval=self.height_lower,
@@ -185,14 +200,18 @@ class RandomTranslation(TFDataLayer):
             shape=[batch_size, 1],
             seed=seed_generator,
         )
-        height_translate = self.backend.numpy.multiply(height_translate, height)
+        height_translate = self.backend.numpy.multiply(
+            height_translate, image_height
+        )
         width_translate = self.backend.random.uniform(
             minval=self.width_lower,
             maxval=self.width_upper,
             shape=[batch_size, 1],
             seed=seed_generator,
         )
-        width_translate = self.backend.numpy.multiply(width_translate, width)
+        width_translate = self.backend.numpy.multiply(
+            width_translate, image_width
+        )
         translations = self.backend.cast(
             self.backend.numpy.concatenate(
                 [width_translate, height_translate], axis=1
@@ -200,18 +219,7 @@ class RandomTranslation(TFDataLayer):
             dtype="float32",
         )
 
-        outputs = self.backend.image.affine_transform(
-            inputs,
-            transform=self._get_translation_matrix(translations),
-            interpolation=self.interpolation,
-            fill_mode=self.fill_mode,
-            fill_value=self.fill_value,
-            data_format=self.data_format,
-        )
-
-        if unbatched:
-            outputs = self.backend.numpy.squeeze(outputs, axis=0)
-        return outputs
+        return self._get_translation_matrix(translations)
 
     def _get_translation_matrix(self, translations):
         num_translations = self.backend.shape(translations)[0]
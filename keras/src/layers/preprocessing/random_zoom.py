@@ -185,6 +185,21 @@ class RandomZoom(TFDataLayer):
             height = inputs_shape[-3]
             width = inputs_shape[-2]
 
+        outputs = self.backend.image.affine_transform(
+            inputs,
+            transform=self._get_transform_matrix(batch_size, height, width),
+            interpolation=self.interpolation,
+            fill_mode=self.fill_mode,
+            fill_value=self.fill_value,
+            data_format=self.data_format,
+        )
+
+        if unbatched:
+            outputs = self.backend.numpy.squeeze(outputs, axis=0)
+        return outputs
+
+    def _get_transform_matrix(self, batch_size, image_height, image_width):
+        """Returns random zoom matrices for a batch of images."""
         seed_generator = self._get_seed_generator(self.backend._backend)
         height_zoom = self.backend.random.uniform(
             minval=1.0 + self.height_lower,
@@ -206,18 +221,7 @@ class RandomZoom(TFDataLayer):
             dtype="float32",
         )
 
-        outputs = self.backend.image.affine_transform(
-            inputs,
-            transform=self._get_zoom_matrix(zooms, height, width),
-            interpolation=self.interpolation,
-            fill_mode=self.fill_mode,
-            fill_value=self.fill_value,
-            data_format=self.data_format,
-        )
-
-        if unbatched:
-            outputs = self.backend.numpy.squeeze(outputs, axis=0)
-        return outputs
+        return self._get_zoom_matrix(zooms, image_height, image_width)
 
     def _get_zoom_matrix(self, zooms, image_height, image_width):
         num_zooms = self.backend.shape(zooms)[0]
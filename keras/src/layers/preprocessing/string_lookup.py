@@ -336,7 +336,7 @@ class StringLookup(IndexLookup):
         self._allow_non_tensor_positional_args = True
         self.supports_jit = False
 
-    def adapt(self, data, steps=None):
+    def adapt(self, data, steps=None, workers=1):
         """Computes a vocabulary of integer terms from tokens in a dataset.
 
         Calling `adapt()` on a `StringLookup` layer is an alternative to passing
@@ -364,8 +364,11 @@ class StringLookup(IndexLookup):
                 When passing an infinitely
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
+            workers: Integer. Number of threads used to count the tokens of
+                the batches of `data` (or of shards of array inputs) in
+                parallel. Defaults to `1`.
         """
-        super().adapt(data, steps=steps)
+        super().adapt(data, steps=steps, workers=workers)
 
     # Overridden methods from IndexLookup.
     def _tensor_vocab_to_numpy(self, vocabulary):
@@ -1,5 +1,8 @@
+from unittest import mock
+
 import numpy as np
 import pytest
+import tensorflow as tf
 from tensorflow import data as tf_data
 
 from keras.src import backend
@@ -60,6 +63,32 @@ class StringLookupTest(testing.TestCase):
         self.assertAllClose(output, np.array([[2, 0, 0], [0, 3, 0], [0, 0, 0]]))
         self.assertAllClose(output.values, np.array([2, 3, 0]))
 
+    def test_multiple_oov_indices(self):
+        layer = layers.StringLookup(
+            vocabulary=["a", "b", "c"], num_oov_indices=3, mask_token=""
+        )
+        input_data = np.array([["a", "unknown", ""], ["xyz", "c", "b"]])
+        # OOV tokens are hashed like `tf.strings.to_hash_bucket_fast()`.
+        buckets = tf.strings.to_hash_bucket_fast(
+            ["unknown", "xyz"], num_buckets=3
+        ).numpy()
+        expected_output = np.array(
+            [[4, buckets[0] + 1, 0], [buckets[1] + 1, 6, 5]]
+        )
+        output = layer(tf.constant(input_data))
+        self.assertAllClose(output, expected_output)
+        if backend.backend() in ("tensorflow", "numpy"):
+            return
+
+        # Lookups of NumPy inputs don't use TensorFlow ops.
+        with mock.patch.object(
+            tf.strings,
+            "to_hash_bucket_fast",
+            side_effect=AssertionError("Unexpected TensorFlow op."),
+        ):
+            output = layer(input_data)
+        self.assertAllClose(output, expected_output)
+
     def test_set_vocabulary(self):
         layer = layers.StringLookup(
             output_mode="int",
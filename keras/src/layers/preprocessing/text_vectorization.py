@@ -1,9 +1,14 @@
+import itertools
+import re
+
 import numpy as np
 
 from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.layers.layer import Layer
 from keras.src.layers.preprocessing.index_lookup import listify_tensors
+from keras.src.layers.preprocessing.index_lookup import shard_tensor
+from keras.src.layers.preprocessing.index_lookup import strings_to_bytes
 from keras.src.layers.preprocessing.string_lookup import StringLookup
 from keras.src.saving import serialization_lib
 from keras.src.utils import argument_validation
@@ -11,6 +16,9 @@ from keras.src.utils import backend_utils
 from keras.src.utils import tf_utils
 from keras.src.utils.module_utils import tensorflow as tf
 
+_STRIP_PUNCTUATION_REGEX = r'[!"#$%&()\*\+,-\./:;<=>?@\[\\\]^_`{|}~\']'
+_STRIP_PUNCTUATION_PATTERN = re.compile(_STRIP_PUNCTUATION_REGEX.encode())
+
 
 @keras_export("keras.layers.TextVectorization")
 class TextVectorization(Layer):
@@ -384,7 +392,7 @@ class TextVectorization(Layer):
             output_dtype = backend.floatx()
         return backend.KerasTensor(output_shape, dtype=output_dtype)
 
-    def adapt(self, data, batch_size=None, steps=None):
+    def adapt(self, data, batch_size=None, steps=None, workers=1):
         """Computes a vocabulary of string terms from tokens in a dataset.
 
         Calling `adapt()` on a `TextVectorization` layer is an alternative to
@@ -412,20 +420,25 @@ class TextVectorization(Layer):
                 When passing an infinitely
                 repeating dataset, you must specify the `steps` argument. This
                 argument is not supported with array inputs or list inputs.
+            workers: Integer. Number of threads used to preprocess and count
+                the tokens of the batches of `data` (or of shards of array
+                inputs) in parallel. Defaults to `1`.
         """
         self.reset_state()
         if isinstance(data, tf.data.Dataset):
             if steps is not None:
                 data = data.take(steps)
-            for batch in data:
-                self.update_state(batch)
+            batches = data
         else:
             data = tf_utils.ensure_tensor(data, dtype="string")
             if data.shape.rank == 1:
                 # A plain list of strings
                 # is treated as as many documents
                 data = tf.expand_dims(data, -1)
-            self.update_state(data)
+            batches = shard_tensor(data, workers)
+        self._lookup_layer._update_state_from_batches(
+            batches, workers=workers, preprocess=self._preprocess
+        )
         self.finalize_state()
 
     def update_state(self, data):
@@ -527,7 +540,7 @@ class TextVectorization(Layer):
             "lower_and_strip_punctuation",
         ):
             inputs = tf.strings.regex_replace(
-                inputs, r'[!"#$%&()\*\+,-\./:;<=>?@\[\\\]^_`{|}~\']', ""
+                inputs, _STRIP_PUNCTUATION_REGEX, ""
             )
         if callable(self._standardize):
             inputs = self._standardize(inputs)
@@ -565,7 +578,107 @@ class TextVectorization(Layer):
             )
         return inputs
 
+    def _use_native_preprocessing(self, inputs):
+        """Whether `inputs` can be vectorized without TensorFlow ops.
+
+        On backends other than TensorFlow, array inputs are tokenized with
+        Python and NumPy (see `_preprocess_native`) when the built-in
+        standardization and splitting modes are used, and the tokens are
+        looked up without TensorFlow ops as well. This keeps the layer usable
+        in `PyDataset` workers at a low per-batch cost.
+        """
+        if not isinstance(inputs, (np.ndarray, list, tuple)):
+            return False
+        if callable(self._standardize) or callable(self._split):
+            return False
+        rank = np.ndim(inputs)
+        if rank == 0 or (self._split is not None and rank > 2):
+            return False
+        return self._lookup_layer._use_native_lookup(inputs)
+
+    def _preprocess_native(self, inputs):
+        """Standardizes, splits and n-grams `inputs` with Python and NumPy.
+
+        Returns:
+            A tuple `(tokens, row_splits)`. If the inputs are split,
+            `tokens` is a flat array of the tokens of all rows and the
+            tokens of row `i` are `tokens[row_splits[i]:row_splits[i + 1]]`.
+            Otherwise, `tokens` is a dense array and `row_splits` is `None`.
+        """
+        inputs = strings_to_bytes(np.asarray(inputs))
+        if inputs.dtype.kind != "S":
+            raise ValueError(
+                "`TextVectorization` inputs must be strings. "
+                f"Received: inputs.dtype={inputs.dtype}"
+            )
+        shape = inputs.shape
+        strings = inputs.reshape(-1).tolist()
+        if self._standardize in ("lower", "lower_and_strip_punctuation"):
+            # Like `tf.strings.lower()`, only ASCII characters are lowercased.
+            strings = [string.lower() for string in strings]
+        if self._standardize in (
+            "strip_punctuation",
+            "lower_and_strip_punctuation",
+        ):
+            sub = _STRIP_PUNCTUATION_PATTERN.sub
+            strings = [sub(b"", string) for string in strings]
+
+        if self._split is None:
+            tokens = np.array(strings, dtype=object).reshape(shape)
+            if self._ngrams is None:
+                return tokens, None
+            # N-grams are formed along the last axis.
+            row_length = shape[-1]
+            row_splits = np.arange(
+                0, tokens.size + 1, max(row_length, 1), dtype="int64"
+            )
+            tokens, row_splits = ngrams(
+                tokens.reshape(-1), row_splits, self._ngrams
+            )
+            return tokens.reshape(shape[:-1] + (-1,)), None
+
+        if len(shape) > 1 and shape[-1] != 1:
+            raise ValueError(
+                "When using `TextVectorization` to tokenize strings, "
+                "the input rank must be 1 or the last shape dimension "
+                f"must be 1. Received: inputs.shape={shape} "
+                f"with rank={len(shape)}"
+            )
+        tokens, row_splits = split_strings(strings, self._split)
+        if self._ngrams is not None:
+            tokens, row_splits = ngrams(tokens, row_splits, self._ngrams)
+        return tokens, row_splits
+
+    def _call_native(self, inputs):
+        tokens, row_splits = self._preprocess_native(inputs)
+        lookups = self._lookup_layer._lookup_dense_native(tokens, np)
+        if row_splits is not None:
+            # Padding maps to 0 for int output and is dropped from the
+            # encoding in other output modes.
+            lookups = pad_rows(
+                lookups,
+                row_splits,
+                length=self._output_sequence_length,
+                pad_value=0 if self._output_mode == "int" else -1,
+            )
+        if self._output_mode != "int":
+            return self._lookup_layer._encode_native(
+                backend.convert_to_tensor(lookups)
+            )
+
+        if self._output_sequence_length is not None:
+            lookups = lookups[..., : self._output_sequence_length]
+            padding = self._output_sequence_length - lookups.shape[-1]
+            if padding > 0:
+                lookups = np.pad(
+                    lookups, [(0, 0)] * (lookups.ndim - 1) + [(0, padding)]
+                )
+        return backend.convert_to_tensor(lookups)
+
     def call(self, inputs):
+        if self._use_native_preprocessing(inputs):
+            return self._call_native(inputs)
+
         if not isinstance(
             inputs, (tf.Tensor, tf.RaggedTensor, np.ndarray, list, tuple)
         ):
@@ -624,3 +737,88 @@ class TextVectorization(Layer):
 
     def load_assets(self, dir_path):
         self._lookup_layer.load_assets(dir_path)
+
+
+def split_strings(strings, split):
+    """Splits byte strings into a flat array of tokens with row splits.
+
+    `"whitespace"` splitting matches `tf.strings.split()`: runs of ASCII
+    whitespace are treated as a single separator, and leading and trailing
+    whitespace is dropped. `"character"` splitting matches
+    `tf.strings.unicode_split(..., "UTF-8")`.
+
+    Args:
+        strings: List of byte strings, one per row.
+        split: Either `"whitespace"` or `"character"`.
+
+    Returns:
+        A tuple `(tokens, row_splits)`, where `tokens` is an object array and
+        the tokens of row `i` are
+        `tokens[row_splits[i]:row_splits[i + 1]]`.
+    """
+    if split == "whitespace":
+        rows = [string.split() for string in strings]
+    else:
+        rows = [
+            [char.encode("utf-8") for char in string.decode("utf-8", "replace")]
+            for string in strings
+        ]
+    row_lengths = np.fromiter(map(len, rows), dtype="int64", count=len(rows))
+    row_splits = np.concatenate([[0], np.cumsum(row_lengths)])
+    tokens = np.array(list(itertools.chain.from_iterable(rows)), dtype=object)
+    return tokens, row_splits
+
+
+def ngrams(tokens, row_splits, widths, separator=b" "):
+    """Forms the n-grams of each row of `tokens` by array slicing.
+
+    This matches `tf.strings.ngrams()` without padding: the n-grams of a row
+    are all of its `widths[0]`-grams, followed by all of its
+    `widths[1]`-grams, and so on.
+
+    Args:
+        tokens: Flat object array of byte string tokens.
+        row_splits: Row splits of `tokens`, as returned by `split_strings()`.
+        widths: Tuple of n-gram widths.
+        separator: Byte string used to join the tokens of an n-gram.
+
+    Returns:
+        A tuple `(ngrams, row_splits)` in the same format as the inputs.
+    """
+    num_rows = len(row_splits) - 1
+    row_ids = np.repeat(np.arange(num_rows), np.diff(row_splits))
+    row_ends = row_splits[1:][row_ids]
+    positions = np.arange(len(tokens))
+    all_ngrams = [np.array([], dtype=object)]
+    all_row_ids = [np.array([], dtype=row_ids.dtype)]
+    for width in widths:
+        starts = positions[positions + width <= row_ends]
+        grams = tokens[starts]
+        for offset in range(1, width):
+            grams = grams + separator + tokens[starts + offset]
+        all_ngrams.append(grams)
+        all_row_ids.append(row_ids[starts])
+    row_ids = np.concatenate(all_row_ids)
+    # A stable sort groups the n-grams by row, keeping them ordered by width
+    # and then by position within each row.
+    order = np.argsort(row_ids, kind="stable")
+    row_lengths = np.bincount(row_ids, minlength=num_rows)
+    row_splits = np.concatenate([[0], np.cumsum(row_lengths)])
+    return np.concatenate(all_ngrams)[order], row_splits
+
+
+def pad_rows(values, row_splits, length=None, pad_value=0):
+    """Converts flat `values` with row splits to a padded dense array.
+
+    Rows are truncated to `length` if it is set, and otherwise padded to the
+    length of the longest row.
+    """
+    row_lengths = np.diff(row_splits)
+    if length is None:
+        length = int(row_lengths.max(initial=0))
+    row_ids = np.repeat(np.arange(len(row_lengths)), row_lengths)
+    positions = np.arange(len(values)) - row_splits[:-1][row_ids]
+    keep = positions < length
+    outputs = np.full((len(row_lengths), length), pad_value, values.dtype)
+    outputs[row_ids[keep], positions[keep]] = values[keep]
+    return outputs
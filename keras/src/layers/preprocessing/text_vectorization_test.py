@@ -1,8 +1,10 @@
 import os
+from unittest import mock
 
 import numpy as np
 import pytest
 import tensorflow as tf
+from absl.testing import parameterized
 from tensorflow import data as tf_data
 
 from keras.src import Sequential
@@ -13,7 +15,7 @@ from keras.src import saving
 from keras.src import testing
 
 
-class TextVectorizationTest(testing.TestCase):
+class TextVectorizationTest(testing.TestCase, parameterized.TestCase):
     # TODO: increase coverage. Most features aren't being tested.
 
     def test_config(self):
@@ -66,6 +68,43 @@ class TextVectorizationTest(testing.TestCase):
         self.assertTrue(backend.is_tensor(output))
         self.assertAllClose(output, np.array([[4, 1, 3, 0], [1, 2, 0, 0]]))
 
+    @parameterized.named_parameters(
+        ("whitespace_int", "whitespace", None, "int", 6),
+        ("whitespace_ngrams", "whitespace", (1, 3), "int", None),
+        ("character_count", "character", 2, "count", None),
+        ("no_split_ngrams", None, 2, "tf_idf", None),
+    )
+    def test_native_preprocessing(
+        self, split, ngrams, output_mode, output_sequence_length
+    ):
+        input_data = np.array(
+            [
+                ["The quick, brown FOX!", "jumped"],
+                ["  over\tthe  fox. ", "Ünïcode"],
+                ["foo bar", "baz"],
+            ]
+        )
+        if split is not None:
+            input_data = input_data[:, :1]
+        layer = layers.TextVectorization(
+            split=split,
+            ngrams=ngrams,
+            output_mode=output_mode,
+            output_sequence_length=output_sequence_length,
+        )
+        layer.adapt(input_data[:2])
+        output = layer(input_data.tolist())
+        self.assertTrue(backend.is_tensor(output))
+        # Compare with the TensorFlow ops used on TensorFlow tensors.
+        expected = layer(tf.constant(input_data))
+        self.assertAllClose(output, expected)
+
+        if backend.backend() != "tensorflow":
+            with mock.patch.object(
+                layer, "_preprocess", side_effect=AssertionError
+            ):
+                layer(input_data.tolist())
+
     @pytest.mark.skipif(
         backend.backend() != "tensorflow", reason="Requires string input dtype"
     )
@@ -1,9 +1,12 @@
 import copy
 
+from keras.src import backend
 from keras.src import ops
+from keras.src import tree
 from keras.src import utils
 from keras.src.api_export import keras_export
 from keras.src.layers.layer import Layer
+from keras.src.layers.rnn.rnn import RNN
 from keras.src.saving import serialization_lib
 
 
@@ -145,6 +148,7 @@ class Bidirectional(Layer):
         self.return_state = layer.return_state
         self.supports_masking = True
         self.input_spec = layer.input_spec
+        self._fuse_directions = self._can_fuse_directions()
 
     def _verify_layer_config(self):
         """Ensure the forward and backward layers have valid common property."""
@@ -170,6 +174,45 @@ class Bidirectional(Layer):
                     f'"{backward_value}" for backward layer'
                 )
 
+    def _can_fuse_directions(self):
+        """Whether both directions can run in a single loop.
+
+        This requires two instances of the same `RNN` class, configured
+        identically except for `go_backwards`, which use the generic loop over
+        a cell that supports projected inputs. Layers with an activity
+        regularizer are not fused either, since their losses are only added
+        when the layers are called.
+        """
+        forward, backward = self.forward_layer, self.backward_layer
+        if not isinstance(forward, RNN) or type(forward) is not type(backward):
+            return False
+        cell = forward.cell
+        if (
+            type(cell) is not type(backward.cell)
+            or not hasattr(cell, "_recurrent_step")
+            or "inputs_projected" not in cell._call_signature.parameters
+        ):
+            return False
+        if forward.stateful or getattr(cell, "recurrent_dropout", 0.0):
+            return False
+        if forward.activity_regularizer or backward.activity_regularizer:
+            return False
+        if forward._may_use_cudnn():
+            return False
+        if (
+            not hasattr(forward, "use_cudnn")
+            and type(forward).inner_loop is not RNN.inner_loop
+        ):
+            return False
+
+        def get_config(layer):
+            config = layer.get_config()
+            config.pop("name")
+            config.pop("go_backwards")
+            return config
+
+        return get_config(forward) == get_config(backward)
+
     def compute_output_shape(self, sequences_shape, initial_state_shape=None):
         output_shape = self.forward_layer.compute_output_shape(sequences_shape)
 
@@ -196,6 +239,48 @@ class Bidirectional(Layer):
         mask=None,
         training=None,
     ):
+        if (
+            self._fuse_directions
+            and not (self.forward_layer.unroll and sequences.shape[1] is None)
+            and self.forward_layer.activity_regularizer is None
+            and self.backward_layer.activity_regularizer is None
+        ):
+            y, y_rev, states = self._call_fused(
+                sequences, initial_state, mask, training
+            )
+        else:
+            y, y_rev, states = self._call_layers(
+                sequences, initial_state, mask, training
+            )
+
+        y = ops.cast(y, self.compute_dtype)
+        y_rev = ops.cast(y_rev, self.compute_dtype)
+
+        if self.return_sequences:
+            y_rev = ops.flip(y_rev, axis=1)
+        if self.merge_mode == "concat":
+            output = ops.concatenate([y, y_rev], axis=-1)
+        elif self.merge_mode == "sum":
+            output = y + y_rev
+        elif self.merge_mode == "ave":
+            output = (y + y_rev) / 2
+        elif self.merge_mode == "mul":
+            output = y * y_rev
+        elif self.merge_mode is None:
+            output = (y, y_rev)
+        else:
+            raise ValueError(
+                "Unrecognized value for `merge_mode`. "
+                f"Received: {self.merge_mode}"
+                'Expected one of {"concat", "sum", "ave", "mul"}.'
+            )
+        if self.return_state:
+            if self.merge_mode is None:
+                return output + states
+            return (output,) + states
+        return output
+
+    def _call_layers(self, sequences, initial_state, mask, training):
         kwargs = {}
         if self.forward_layer._call_has_training_arg:
             kwargs["training"] = training
@@ -222,37 +307,107 @@ class Bidirectional(Layer):
             backward_inputs, initial_state=backward_state, **kwargs
         )
 
+        states = None
         if self.return_state:
             states = tuple(y[1:] + y_rev[1:])
             y = y[0]
             y_rev = y_rev[0]
+        return y, y_rev, states
+
+    def _call_fused(self, sequences, initial_state, mask, training):
+        # Both directions run in a single loop: their (projected) sequences
+        # are stacked along the batch axis, so that masking still applies per
+        # sample, and their recurrent weights along a leading direction axis.
+        layers = (self.forward_layer, self.backward_layer)
+        cell = self.forward_layer.cell
+        batch_size = ops.shape(sequences)[0]
+        if tree.is_nested(mask):
+            mask = mask[0]
 
-        y = ops.cast(y, self.compute_dtype)
-        y_rev = ops.cast(y_rev, self.compute_dtype)
-
-        if self.return_sequences:
-            y_rev = ops.flip(y_rev, axis=1)
-        if self.merge_mode == "concat":
-            output = ops.concatenate([y, y_rev], axis=-1)
-        elif self.merge_mode == "sum":
-            output = y + y_rev
-        elif self.merge_mode == "ave":
-            output = (y + y_rev) / 2
-        elif self.merge_mode == "mul":
-            output = y * y_rev
-        elif self.merge_mode is None:
-            output = (y, y_rev)
+        if initial_state is None:
+            initial_state = [
+                layer.get_initial_state(batch_size) for layer in layers
+            ]
         else:
-            raise ValueError(
-                "Unrecognized value for `merge_mode`. "
-                f"Received: {self.merge_mode}"
-                'Expected one of {"concat", "sum", "ave", "mul"}.'
+            half = len(initial_state) // 2
+            initial_state = [initial_state[:half], initial_state[half:]]
+        states = [
+            ops.concatenate(
+                [
+                    backend.convert_to_tensor(s, dtype=cell.compute_dtype)
+                    for s in direction_states
+                ],
+                axis=0,
             )
-        if self.return_state:
-            if self.merge_mode is None:
-                return output + states
-            return (output,) + states
-        return output
+            for direction_states in zip(*initial_state)
+        ]
+
+        # Compute in the dtype of the wrapped layers, as their own `__call__`
+        # would.
+        sequences = ops.cast(sequences, cell.compute_dtype)
+        with backend.AutocastScope(cell.compute_dtype):
+            inputs = []
+            masks = []
+            for layer in layers:
+                projected_inputs = layer.cell.project_inputs(
+                    sequences, training=training
+                )
+                layer_mask = mask
+                if layer.go_backwards:
+                    projected_inputs = ops.flip(projected_inputs, axis=1)
+                    if mask is not None:
+                        layer_mask = ops.flip(mask, axis=1)
+                inputs.append(projected_inputs)
+                masks.append(layer_mask)
+            inputs = ops.concatenate(inputs, axis=0)
+            if mask is not None:
+                mask = ops.concatenate(masks, axis=0)
+
+            kernels, biases = zip(
+                *(layer.cell._recurrent_weights() for layer in layers)
+            )
+            recurrent_kernel = ops.stack(kernels)
+            recurrent_bias = None
+            if biases[0] is not None:
+                recurrent_bias = ops.repeat(
+                    ops.stack(biases), batch_size, axis=0
+                )
+
+            def matmul(x, kernel):
+                # `(2 * batch, n) x (2, n, m) -> (2 * batch, m)`
+                x = ops.reshape(x, (2, -1, x.shape[-1]))
+                return ops.reshape(
+                    ops.matmul(x, kernel), (-1, kernel.shape[-1])
+                )
+
+            def step(inputs, states):
+                return cell._recurrent_step(
+                    inputs,
+                    states,
+                    recurrent_kernel,
+                    recurrent_bias,
+                    matmul=matmul,
+                )
+
+            last_output, outputs, states = backend.rnn(
+                step,
+                inputs,
+                states,
+                mask=mask,
+                unroll=self.forward_layer.unroll,
+                input_length=sequences.shape[1],
+                zero_output_for_mask=self.forward_layer.zero_output_for_mask,
+                return_all_outputs=self.return_sequences,
+            )
+        for layer in layers:
+            layer._maybe_reset_dropout_masks(layer.cell)
+
+        output = outputs if self.return_sequences else last_output
+        y, y_rev = ops.split(output, 2, axis=0)
+        states = [ops.split(state, 2, axis=0) for state in states]
+        states = tuple(s[0] for s in states) + tuple(s[1] for s in states)
+        states = tuple(ops.cast(s, self.compute_dtype) for s in states)
+        return y, y_rev, states
 
     def reset_states(self):
         # Compatibility alias.
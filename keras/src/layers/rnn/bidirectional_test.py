@@ -1,12 +1,14 @@
 import numpy as np
 import pytest
+from absl.testing import parameterized
 
 from keras.src import initializers
 from keras.src import layers
+from keras.src import regularizers
 from keras.src import testing
 
 
-class SimpleRNNTest(testing.TestCase):
+class SimpleRNNTest(testing.TestCase, parameterized.TestCase):
     @pytest.mark.requires_trainable_backend
     def test_basics(self):
         self.run_layer_test(
@@ -198,6 +200,62 @@ class SimpleRNNTest(testing.TestCase):
             output,
         )
 
+    @parameterized.product(
+        layer_class=(layers.SimpleRNN, layers.LSTM, layers.GRU),
+        return_sequences=(True, False),
+        masked=(True, False),
+    )
+    def test_fused_directions(self, layer_class, return_sequences, masked):
+        sequence = np.random.random((3, 5, 4)).astype("float32")
+        mask = None
+        if masked:
+            mask = np.array(
+                [
+                    [True, True, True, True, True],
+                    [True, True, False, False, False],
+                    [False, True, True, False, True],
+                ]
+            )
+        kwargs = {"return_sequences": return_sequences, "return_state": True}
+        if layer_class is not layers.SimpleRNN:
+            # Rule out the cuDNN-like backend kernels.
+            kwargs["recurrent_activation"] = "hard_sigmoid"
+        layer = layers.Bidirectional(layer_class(2, **kwargs))
+        self.assertTrue(layer._fuse_directions)
+        outputs = layer(sequence, mask=mask)
+
+        layer._fuse_directions = False
+        expected_outputs = layer(sequence, mask=mask)
+        for output, expected_output in zip(outputs, expected_outputs):
+            self.assertAllClose(output, expected_output, atol=1e-6)
+
+    def test_fused_directions_requirements(self):
+        layer = layers.Bidirectional(
+            layers.SimpleRNN(2),
+            backward_layer=layers.SimpleRNN(3, go_backwards=True),
+        )
+        self.assertFalse(layer._fuse_directions)
+        layer = layers.Bidirectional(layers.SimpleRNN(2, stateful=True))
+        self.assertFalse(layer._fuse_directions)
+        layer = layers.Bidirectional(layers.RNN(layers.SimpleRNNCell(2)))
+        self.assertTrue(layer._fuse_directions)
+
+    @parameterized.parameters("SimpleRNN", "GRU", "LSTM")
+    def test_activity_regularizer(self, layer_class):
+        layer_class = getattr(layers, layer_class)
+        sequence = np.ones((2, 4, 3), dtype="float32")
+        layer = layers.Bidirectional(layer_class(4, activity_regularizer="l2"))
+        self.assertFalse(layer._fuse_directions)
+        layer(sequence)
+        self.assertLen(layer.losses, 2)
+
+        # A regularizer set after wrapping the layers is also applied.
+        layer = layers.Bidirectional(layer_class(4))
+        layer.forward_layer.activity_regularizer = regularizers.get("l2")
+        layer.backward_layer.activity_regularizer = regularizers.get("l2")
+        layer(sequence)
+        self.assertLen(layer.losses, 2)
+
     def test_return_state(self):
         sequence = np.arange(24).reshape((2, 4, 3)).astype("float32")
         forward_layer = layers.LSTM(
@@ -80,6 +80,9 @@ class ConvLSTMCell(Layer, DropoutRNNCell):
         training: Python boolean indicating whether the layer should behave in
             training mode or in inference mode. Only relevant when `dropout` or
             `recurrent_dropout` is used.
+        inputs_projected: Python boolean indicating whether `inputs` is a
+            timestep of the output of `project_inputs()` rather than a raw
+            input. Defaults to `False`.
     """
 
     def __init__(
@@ -171,10 +174,6 @@ class ConvLSTMCell(Layer, DropoutRNNCell):
                 "defined. Found None. Full input shape received: "
                 f"input_shape={inputs_shape}"
             )
-        self.input_spec = InputSpec(
-            ndim=self.rank + 3, shape=(None,) + inputs_shape[1:]
-        )
-
         input_dim = inputs_shape[channel_axis]
         self.input_dim = input_dim
         self.kernel_shape = self.kernel_size + (input_dim, self.filters * 4)
@@ -229,10 +228,43 @@ class ConvLSTMCell(Layer, DropoutRNNCell):
             self.bias = None
         self.built = True
 
-    def call(self, inputs, states, training=False):
+    def project_inputs(self, sequences, training=False):
+        """Computes the input convolutions of all timesteps at once.
+
+        The frames of all timesteps are convolved as a single batch, with the
+        kernels of the four gates at once.
+
+        Args:
+            sequences: A (3+ `rank`)D tensor, with shape
+                `(batch, timesteps, ...)`.
+            training: Python boolean indicating whether the layer should
+                behave in training mode or in inference mode. Unused, since
+                the cell does not apply dropout.
+
+        Returns:
+            A (3+ `rank`)D tensor with `4 * filters` channels, to be fed one
+            timestep at a time to `call()` with `inputs_projected=True`.
+        """
+        batch_size, timesteps = ops.shape(sequences)[:2]
+        frames = ops.reshape(sequences, (-1,) + tuple(sequences.shape[2:]))
+        x = self.input_conv(frames, self.kernel, self.bias, self.padding)
+        return ops.reshape(x, (batch_size, timesteps) + tuple(x.shape[1:]))
+
+    def call(self, inputs, states, training=False, inputs_projected=False):
         h_tm1 = states[0]  # previous memory state
         c_tm1 = states[1]  # previous carry state
 
+        if inputs_projected:
+            channel_axis = -1 if self.data_format == "channels_last" else 1
+            z = inputs + self.recurrent_conv(h_tm1, self.recurrent_kernel)
+            z_i, z_f, z_c, z_o = ops.split(z, 4, axis=channel_axis)
+            i = self.recurrent_activation(z_i)
+            f = self.recurrent_activation(z_f)
+            c = f * c_tm1 + i * self.activation(z_c)
+            o = self.recurrent_activation(z_o)
+            h = o * self.activation(c)
+            return h, [h, c]
+
         # dp_mask = self.get_dropout_mask(inputs)
         # rec_dp_mask = self.get_recurrent_dropout_mask(h_tm1)
 
@@ -317,9 +349,9 @@ class ConvLSTMCell(Layer, DropoutRNNCell):
         )
         if b is not None:
             if self.data_format == "channels_last":
-                bias_shape = (1,) * (self.rank + 1) + (self.filters,)
+                bias_shape = (1,) * (self.rank + 1) + (-1,)
             else:
-                bias_shape = (1, self.filters) + (1,) * self.rank
+                bias_shape = (1, -1) + (1,) * self.rank
             bias = ops.reshape(b, bias_shape)
             conv_out += bias
         return conv_out
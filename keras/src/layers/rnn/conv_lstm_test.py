@@ -55,3 +55,27 @@ class ConvLSTMTest(testing.TestCase):
         output = layer(x, initial_state=[s1, s2])
         output = backend.convert_to_numpy(output)
         self.assertAllClose(np.sum(output), 119.812454)
+
+    def test_projected_inputs(self):
+        x = np.random.random((2, 3, 6, 6, 3)).astype("float32")
+        if backend.config.image_data_format() == "channels_first":
+            x = x.transpose((0, 1, 4, 2, 3))
+        layer = ConvLSTM(
+            rank=2,
+            filters=4,
+            kernel_size=3,
+            strides=2,
+            return_sequences=True,
+            go_backwards=True,
+            bias_initializer="random_normal",
+        )
+        outputs = layer(x)
+
+        # Step through the cell with the raw inputs.
+        states = layer.get_initial_state(batch_size=2)
+        expected_outputs = []
+        for t in reversed(range(3)):
+            output, states = layer.cell(x[:, t], states)
+            expected_outputs.append(backend.convert_to_numpy(output))
+        expected_outputs = np.stack(expected_outputs, axis=1)
+        self.assertAllClose(outputs, expected_outputs, atol=1e-5)
@@ -64,6 +64,9 @@ class GRUCell(Layer, DropoutRNNCell):
         training: Python boolean indicating whether the layer should behave in
             training mode or in inference mode. Only relevant when `dropout` or
             `recurrent_dropout` is used.
+        inputs_projected: Python boolean indicating whether `inputs` is a
+            timestep of the output of `project_inputs()` rather than a raw
+            input. Defaults to `False`.
 
     Example:
 
@@ -176,12 +179,59 @@ class GRUCell(Layer, DropoutRNNCell):
             self.bias = None
         self.built = True
 
-    def call(self, inputs, states, training=False):
+    def project_inputs(self, sequences, training=False):
+        """Returns the `(batch, timesteps, 3 * units)` input projections."""
+        if training and 0.0 < self.dropout < 1.0:
+            dp_mask = self.get_dropout_mask(sequences[:, 0, :])
+            sequences = sequences * ops.expand_dims(dp_mask, axis=1)
+        matrix_x = ops.matmul(sequences, self.kernel)
+        if self.use_bias:
+            matrix_x += self.bias[0] if self.reset_after else self.bias
+        return matrix_x
+
+    def _recurrent_weights(self):
+        if self.use_bias and self.reset_after:
+            return self.recurrent_kernel, self.bias[1]
+        return self.recurrent_kernel, None
+
+    def _recurrent_step(
+        self, inputs, states, recurrent_kernel, recurrent_bias, matmul=None
+    ):
+        matmul = matmul or ops.matmul
+        h_tm1 = states[0]
+        x_z, x_r, x_h = ops.split(inputs, 3, axis=-1)
+        if self.reset_after:
+            matrix_inner = matmul(h_tm1, recurrent_kernel)
+            if recurrent_bias is not None:
+                matrix_inner += recurrent_bias
+        else:
+            matrix_inner = matmul(
+                h_tm1, recurrent_kernel[..., : 2 * self.units]
+            )
+        recurrent_z = matrix_inner[:, : self.units]
+        recurrent_r = matrix_inner[:, self.units : self.units * 2]
+
+        z = self.recurrent_activation(x_z + recurrent_z)
+        r = self.recurrent_activation(x_r + recurrent_r)
+
+        if self.reset_after:
+            recurrent_h = r * matrix_inner[:, self.units * 2 :]
+        else:
+            recurrent_h = matmul(
+                r * h_tm1, recurrent_kernel[..., 2 * self.units :]
+            )
+        hh = self.activation(x_h + recurrent_h)
+
+        h = z * h_tm1 + (1 - z) * hh
+        return h, [h]
+
+    def call(self, inputs, states, training=False, inputs_projected=False):
         h_tm1 = (
             states[0] if tree.is_nested(states) else states
         )  # previous state
 
-        dp_mask = self.get_dropout_mask(inputs)
+        if not inputs_projected:
+            dp_mask = self.get_dropout_mask(inputs)
         rec_dp_mask = self.get_recurrent_dropout_mask(h_tm1)
 
         if self.use_bias:
@@ -193,11 +243,17 @@ class GRUCell(Layer, DropoutRNNCell):
                     for e in ops.split(self.bias, self.bias.shape[0], axis=0)
                 )
 
-        if training and 0.0 < self.dropout < 1.0:
+        if not inputs_projected and training and 0.0 < self.dropout < 1.0:
             inputs = inputs * dp_mask
         if training and 0.0 < self.recurrent_dropout < 1.0:
             h_tm1 = h_tm1 * rec_dp_mask
 
+        if inputs_projected:
+            h, new_state = self._recurrent_step(
+                inputs, [h_tm1], *self._recurrent_weights()
+            )
+            return h, (new_state if tree.is_nested(states) else h)
+
         if self.implementation == 1:
             inputs_z = inputs
             inputs_r = inputs
@@ -566,6 +622,7 @@ class GRU(RNN):
                         return_sequences=self.return_sequences,
                         go_backwards=self.go_backwards,
                         unroll=self.unroll,
+                        zero_output_for_mask=self.zero_output_for_mask,
                         reset_after=self.cell.reset_after,
                     )
                     # We disable jit_compile for the model in this case,
@@ -195,6 +195,36 @@ class GRUTest(testing.TestCase, parameterized.TestCase):
             output,
         )
 
+    @parameterized.product(
+        return_sequences=(True, False),
+        go_backwards=(True, False),
+        zero_output_for_mask=(True, False),
+        mask=(None, "right_padded", "left_padded"),
+    )
+    def test_fused_kernel_matches_generic_loop(
+        self, return_sequences, go_backwards, zero_output_for_mask, mask
+    ):
+        sequence = np.random.random((4, 5, 3)).astype("float32")
+        if mask == "right_padded":
+            mask = np.arange(5)[None, :] < np.array([[5], [3], [1], [4]])
+        elif mask == "left_padded":
+            mask = np.arange(5)[None, :] >= np.array([[0], [2], [4], [1]])
+        kwargs = dict(
+            return_sequences=return_sequences,
+            return_state=True,
+            go_backwards=go_backwards,
+            zero_output_for_mask=zero_output_for_mask,
+        )
+        layer = layers.GRU(4, use_cudnn="auto", **kwargs)
+        reference_layer = layers.GRU(4, use_cudnn=False, **kwargs)
+        layer.build(sequence.shape)
+        reference_layer.build(sequence.shape)
+        reference_layer.set_weights(layer.get_weights())
+        outputs = layer(sequence, mask=mask)
+        expected_outputs = reference_layer(sequence, mask=mask)
+        for output, expected_output in zip(outputs, expected_outputs):
+            self.assertAllClose(output, expected_output, atol=1e-5)
+
     def test_masking(self):
         sequence = np.arange(24).reshape((2, 4, 3)).astype("float32")
         mask = np.array([[True, True, False, True], [True, False, False, True]])
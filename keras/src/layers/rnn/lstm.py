@@ -66,6 +66,9 @@ class LSTMCell(Layer, DropoutRNNCell):
         training: Python boolean indicating whether the layer should behave in
             training mode or in inference mode. Only relevant when `dropout` or
             `recurrent_dropout` is used.
+        inputs_projected: Python boolean indicating whether `inputs` is a
+            timestep of the output of `project_inputs()` rather than a raw
+            input. Defaults to `False`.
 
     Example:
 
@@ -224,18 +227,47 @@ class LSTMCell(Layer, DropoutRNNCell):
         o = self.recurrent_activation(z3)
         return c, o
 
-    def call(self, inputs, states, training=False):
+    def project_inputs(self, sequences, training=False):
+        """Returns the `(batch, timesteps, 4 * units)` input projections."""
+        if training and 0.0 < self.dropout < 1.0:
+            dp_mask = self.get_dropout_mask(sequences[:, 0, :])
+            sequences = sequences * ops.expand_dims(dp_mask, axis=1)
+        z = ops.matmul(sequences, self.kernel)
+        if self.use_bias:
+            z += self.bias
+        return z
+
+    def _recurrent_weights(self):
+        return self.recurrent_kernel, None
+
+    def _recurrent_step(
+        self, inputs, states, recurrent_kernel, recurrent_bias, matmul=None
+    ):
+        matmul = matmul or ops.matmul
+        h_tm1, c_tm1 = states
+        z = inputs + matmul(h_tm1, recurrent_kernel)
+        z = ops.split(z, 4, axis=-1)
+        c, o = self._compute_carry_and_output_fused(z, c_tm1)
+        h = o * self.activation(c)
+        return h, [h, c]
+
+    def call(self, inputs, states, training=False, inputs_projected=False):
         h_tm1 = states[0]  # previous memory state
         c_tm1 = states[1]  # previous carry state
 
-        dp_mask = self.get_dropout_mask(inputs)
+        if not inputs_projected:
+            dp_mask = self.get_dropout_mask(inputs)
+            if training and 0.0 < self.dropout < 1.0:
+                inputs = inputs * dp_mask
         rec_dp_mask = self.get_recurrent_dropout_mask(h_tm1)
-
-        if training and 0.0 < self.dropout < 1.0:
-            inputs = inputs * dp_mask
         if training and 0.0 < self.recurrent_dropout < 1.0:
             h_tm1 = h_tm1 * rec_dp_mask
 
+        if inputs_projected:
+            return self._recurrent_step(
+                inputs, [h_tm1, c_tm1], *self._recurrent_weights()
+            )
+
         if self.implementation == 1:
             inputs_i = inputs
             inputs_f = inputs
@@ -547,6 +579,7 @@ class LSTM(RNN):
                         return_sequences=self.return_sequences,
                         go_backwards=self.go_backwards,
                         unroll=self.unroll,
+                        zero_output_for_mask=self.zero_output_for_mask,
                     )
                     # We disable jit_compile for the model in this case,
                     # since cuDNN ops aren't XLA compatible.
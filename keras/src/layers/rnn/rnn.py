@@ -37,6 +37,19 @@ class RNN(Layer):
             If this method is not implemented
             by the cell, the RNN layer will create a zero filled tensor
             with shape `(batch_size, cell.state_size)`.
+            - An optional `project_inputs(sequences, training=False)` method
+            that computes the part of `call()` which only depends on the
+            inputs, for all timesteps at once. If the cell implements it and
+            its `call()` method accepts an `inputs_projected` argument, the
+            RNN layer projects the whole input sequence before the loop, and
+            calls the cell on the projected timesteps with
+            `inputs_projected=True`. This replaces one small matrix product
+            per timestep with a single large one. Built-in cells additionally
+            implement `_recurrent_step(inputs, states, recurrent_kernel,
+            recurrent_bias, matmul=None)`, which runs one timestep on
+            projected inputs with the recurrent weights passed in, so that
+            `Bidirectional` can run both directions in a single loop over
+            stacked weights through `matmul`.
             In the case that `cell` is a list of RNN cell instances, the cells
             will be stacked on top of each other in the RNN, resulting in an
             efficient stacked RNN.
@@ -329,11 +342,40 @@ class RNN(Layer):
             for v in self.states:
                 v.assign(ops.zeros_like(v))
 
+    def _may_use_cudnn(self):
+        # Whether `inner_loop` may run the backend's fused implementation,
+        # which only layers with a `use_cudnn` argument (LSTM, GRU) have.
+        use_cudnn = getattr(self, "use_cudnn", False)
+        if use_cudnn is True:
+            return True
+        return (
+            use_cudnn == "auto"
+            and not self.cell.recurrent_dropout
+            and backend.cudnn_ok(
+                self.cell.activation,
+                self.cell.recurrent_activation,
+                self.unroll,
+                self.cell.use_bias,
+                reset_after=getattr(self.cell, "reset_after", None),
+            )
+        )
+
     def inner_loop(self, sequences, initial_state, mask, training=False):
         cell_kwargs = {}
         if isinstance(self.cell, Layer) and self.cell._call_has_training_arg:
             cell_kwargs["training"] = training
 
+        project_inputs = getattr(self.cell, "project_inputs", None)
+        if (
+            project_inputs is not None
+            and isinstance(self.cell, Layer)
+            and "inputs_projected" in self.cell._call_signature.parameters
+        ):
+            # Project the inputs of all timesteps with a single large matmul,
+            # so that only the recurrent part of the cell runs in the loop.
+            sequences = project_inputs(sequences, training=training)
+            cell_kwargs["inputs_projected"] = True
+
         def step(inputs, states):
             output, new_states = self.cell(inputs, states, **cell_kwargs)
             if not tree.is_nested(new_states):
@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from absl.testing import parameterized
 
 from keras.src import layers
 from keras.src import ops
@@ -67,7 +68,7 @@ class TwoStatesRNNCell(layers.Layer):
         return output, [output_1, output_2]
 
 
-class RNNTest(testing.TestCase):
+class RNNTest(testing.TestCase, parameterized.TestCase):
     @pytest.mark.requires_trainable_backend
     def test_basics(self):
         self.run_layer_test(
@@ -376,6 +377,36 @@ class RNNTest(testing.TestCase):
         )
         self.assertAllClose(np.array([[954.0, 954.0], [3978.0, 3978.0]]), state)
 
+    @parameterized.named_parameters(
+        ("simple_rnn", layers.SimpleRNNCell, {}),
+        ("lstm", layers.LSTMCell, {}),
+        ("gru", layers.GRUCell, {}),
+        ("gru_reset_before", layers.GRUCell, {"reset_after": False}),
+    )
+    def test_projected_inputs(self, cell_class, cell_kwargs):
+        sequence = np.random.random((2, 5, 3)).astype("float32")
+        cell = cell_class(4, bias_initializer="random_normal", **cell_kwargs)
+        layer = layers.RNN(cell, return_sequences=True, go_backwards=True)
+        outputs = layer(sequence)
+
+        # Step through the cell with the raw inputs.
+        states = layer.get_initial_state(batch_size=2)
+        expected_outputs = []
+        for t in reversed(range(5)):
+            output, states = cell(sequence[:, t], states)
+            states = states if isinstance(states, list) else [states]
+            expected_outputs.append(output)
+        expected_outputs = ops.stack(expected_outputs, axis=1)
+        self.assertAllClose(outputs, expected_outputs, atol=1e-5)
+
+        states = layer.get_initial_state(batch_size=2)
+        projected = cell.project_inputs(sequence)
+        self.assertAllClose(
+            cell(projected[:, 0], states, inputs_projected=True)[0],
+            cell(sequence[:, 0], states)[0],
+            atol=1e-5,
+        )
+
     def test_serialization(self):
         layer = layers.RNN(TwoStatesRNNCell(2), return_sequences=False)
         self.run_class_serialization_test(layer)
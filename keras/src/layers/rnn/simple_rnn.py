@@ -58,6 +58,9 @@ class SimpleRNNCell(Layer, DropoutRNNCell):
         training: Python boolean indicating whether the layer should behave in
             training mode or in inference mode. Only relevant when `dropout` or
             `recurrent_dropout` is used.
+        inputs_projected: Python boolean indicating whether `sequence` is a
+            timestep of the output of `project_inputs()` rather than a raw
+            input. Defaults to `False`.
 
     Example:
 
@@ -152,19 +155,49 @@ class SimpleRNNCell(Layer, DropoutRNNCell):
             self.bias = None
         self.built = True
 
-    def call(self, sequence, states, training=False):
+    def project_inputs(self, sequences, training=False):
+        """Returns the `(batch, timesteps, units)` input projections."""
+        dp_mask = self.get_dropout_mask(sequences[:, 0, :])
+        if training and dp_mask is not None:
+            sequences = sequences * ops.expand_dims(dp_mask, axis=1)
+        h = ops.matmul(sequences, self.kernel)
+        if self.bias is not None:
+            h += self.bias
+        return h
+
+    def _recurrent_weights(self):
+        return self.recurrent_kernel, None
+
+    def _recurrent_step(
+        self, inputs, states, recurrent_kernel, recurrent_bias, matmul=None
+    ):
+        matmul = matmul or ops.matmul
+        output = inputs + matmul(states[0], recurrent_kernel)
+        if self.activation is not None:
+            output = self.activation(output)
+        return output, [output]
+
+    def call(self, sequence, states, training=False, inputs_projected=False):
         prev_output = states[0] if isinstance(states, (list, tuple)) else states
-        dp_mask = self.get_dropout_mask(sequence)
+        if not inputs_projected:
+            dp_mask = self.get_dropout_mask(sequence)
         rec_dp_mask = self.get_recurrent_dropout_mask(prev_output)
 
+        if training and rec_dp_mask is not None:
+            prev_output = prev_output * rec_dp_mask
+        if inputs_projected:
+            output, new_state = self._recurrent_step(
+                sequence, [prev_output], *self._recurrent_weights()
+            )
+            if not isinstance(states, (list, tuple)):
+                new_state = output
+            return output, new_state
+
         if training and dp_mask is not None:
             sequence = sequence * dp_mask
         h = ops.matmul(sequence, self.kernel)
         if self.bias is not None:
             h += self.bias
-
-        if training and rec_dp_mask is not None:
-            prev_output = prev_output * rec_dp_mask
         output = h + ops.matmul(prev_output, self.recurrent_kernel)
         if self.activation is not None:
             output = self.activation(output)
@@ -346,6 +379,7 @@ class SimpleRNN(RNN):
             go_backwards=go_backwards,
             stateful=stateful,
             unroll=unroll,
+            activity_regularizer=activity_regularizer,
             **kwargs,
         )
         self.input_spec = [InputSpec(ndim=3)]
@@ -309,24 +309,26 @@ class BatchFromFilesMixin:
         # build batch of image data
         # self.filepaths is dynamic, is better to call it once outside the loop
         filepaths = self.filepaths
-        for i, j in enumerate(index_array):
-            img = image_utils.load_img(
-                filepaths[j],
-                color_mode=self.color_mode,
-                target_size=self.target_size,
-                interpolation=self.interpolation,
-                keep_aspect_ratio=self.keep_aspect_ratio,
-            )
-            x = image_utils.img_to_array(img, data_format=self.data_format)
-            # Pillow images should be closed after `load_img`,
-            # but not PIL images.
-            if hasattr(img, "close"):
-                img.close()
-            if self.image_data_generator:
-                params = self.image_data_generator.get_random_transform(x.shape)
-                x = self.image_data_generator.apply_transform(x, params)
-                x = self.image_data_generator.standardize(x)
+        paths = [filepaths[j] for j in index_array]
+        if len(paths) > 1:
+            # Decoding releases the GIL, so files are loaded in threads.
+            if getattr(self, "_load_pool", None) is None:
+                self._load_pool = multiprocessing.pool.ThreadPool(
+                    min(self.batch_size, os.cpu_count() or 1)
+                )
+            images = self._load_pool.map(self._load_image_array, paths)
+        else:
+            images = [self._load_image_array(path) for path in paths]
+        for i, x in enumerate(images):
             batch_x[i] = x
+        if self.image_data_generator:
+            params = self.image_data_generator.get_random_transform_batch(
+                batch_x.shape
+            )
+            batch_x = self.image_data_generator.apply_transform_batch(
+                batch_x, params
+            )
+            batch_x = self.image_data_generator.standardize_batch(batch_x)
         # optionally save augmented images to disk for debugging purposes
         if self.save_to_dir:
             for i, j in enumerate(index_array):
@@ -364,6 +366,43 @@ class BatchFromFilesMixin:
         else:
             return batch_x, batch_y, self.sample_weight[index_array]
 
+    def _load_image_array(self, path):
+        img = image_utils.load_img(
+            path,
+            color_mode=self.color_mode,
+            target_size=self.target_size,
+            interpolation=self.interpolation,
+            keep_aspect_ratio=self.keep_aspect_ratio,
+        )
+        x = image_utils.img_to_array(img, data_format=self.data_format)
+        # Pillow images should be closed after `load_img`,
+        # but not PIL images.
+        if hasattr(img, "close"):
+            img.close()
+        return x
+
+    def on_epoch_end(self):
+        super().on_epoch_end()
+        self._close_pool()
+
+    def _close_pool(self):
+        pool = getattr(self, "_load_pool", None)
+        if pool is not None:
+            pool.close()
+            pool.join()
+            self._load_pool = None
+
+    def __del__(self):
+        pool = getattr(self, "_load_pool", None)
+        if pool is not None:
+            pool.terminate()
+
+    def __getstate__(self):
+        # The thread pool used to load files can't be pickled.
+        state = self.__dict__.copy()
+        state["_load_pool"] = None
+        return state
+
     @property
     def filepaths(self):
         """List of absolute paths to image files."""
@@ -645,17 +684,14 @@ class NumpyArrayIterator(Iterator):
         super().__init__(x.shape[0], batch_size, shuffle, seed)
 
     def _get_batches_of_transformed_samples(self, index_array):
-        batch_x = np.zeros(
-            tuple([len(index_array)] + list(self.x.shape)[1:]), dtype=self.dtype
+        batch_x = self.x[index_array].astype(self.dtype)
+        params = self.image_data_generator.get_random_transform_batch(
+            batch_x.shape
         )
-        for i, j in enumerate(index_array):
-            x = self.x[j]
-            params = self.image_data_generator.get_random_transform(x.shape)
-            x = self.image_data_generator.apply_transform(
-                x.astype(self.dtype), params
-            )
-            x = self.image_data_generator.standardize(x)
-            batch_x[i] = x
+        batch_x = self.image_data_generator.apply_transform_batch(
+            batch_x, params
+        )
+        batch_x = self.image_data_generator.standardize_batch(batch_x)
 
         if self.save_to_dir:
             for i, j in enumerate(index_array):
@@ -1249,12 +1285,34 @@ class ImageDataGenerator:
         """
         if self.preprocessing_function:
             x = self.preprocessing_function(x)
+        return self._standardize(x, samplewise_axes=None)
+
+    def standardize_batch(self, x):
+        """Applies the normalization configuration in-place to a batch of
+        images.
+
+        Unlike `standardize()`, samplewise statistics are computed
+        independently for every image of the batch, and
+        `preprocessing_function` is applied to each image separately.
+
+        Args:
+            x: Batch of images (rank 4).
+
+        Returns:
+            The images, normalized.
+        """
+        if self.preprocessing_function:
+            for i in range(len(x)):
+                x[i] = self.preprocessing_function(x[i])
+        return self._standardize(x, samplewise_axes=(1, 2, 3))
+
+    def _standardize(self, x, samplewise_axes):
         if self.rescale:
             x *= self.rescale
         if self.samplewise_center:
-            x -= np.mean(x, keepdims=True)
+            x -= np.mean(x, axis=samplewise_axes, keepdims=True)
         if self.samplewise_std_normalization:
-            x /= np.std(x, keepdims=True) + 1e-6
+            x /= np.std(x, axis=samplewise_axes, keepdims=True) + 1e-6
 
         if self.featurewise_center:
             if self.mean is not None:
@@ -1382,6 +1440,155 @@ class ImageDataGenerator:
 
         return transform_parameters
 
+    def get_random_transform_batch(self, batch_shape, seed=None):
+        """Generates random transformation parameters for a batch of images.
+
+        This draws the parameters of all images at once, from the same
+        distributions as `get_random_transform()`. The random numbers are
+        drawn in a different order than by calling `get_random_transform()`
+        once per image, so a given seed yields different (but equally
+        distributed) transformations.
+
+        Args:
+            batch_shape: Tuple of integers. Shape of the batch of images
+                that is transformed.
+            seed: Random seed.
+
+        Returns:
+            A dictionary with the same keys as `get_random_transform()`,
+            mapping to arrays of shape `(batch_size,)` (or `None` for
+            disabled `channel_shift_intensity` and `brightness`).
+        """
+        n = batch_shape[0]
+        img_row_axis = self.row_axis - 1
+        img_col_axis = self.col_axis - 1
+        img_shape = batch_shape[1:]
+
+        if seed is not None:
+            np.random.seed(seed)
+
+        if self.rotation_range:
+            theta = np.random.uniform(
+                -self.rotation_range, self.rotation_range, n
+            )
+        else:
+            theta = np.zeros((n,))
+
+        def sample_shift(shift_range, size):
+            if not shift_range:
+                return np.zeros((n,))
+            try:  # 1-D array-like or int
+                shift = np.random.choice(shift_range, n).astype("float64")
+                shift *= np.random.choice([-1, 1], n)
+            except ValueError:  # floating point
+                shift = np.random.uniform(-shift_range, shift_range, n)
+            if np.max(shift_range) < 1:
+                shift *= size
+            return shift
+
+        tx = sample_shift(self.height_shift_range, img_shape[img_row_axis])
+        ty = sample_shift(self.width_shift_range, img_shape[img_col_axis])
+
+        if self.shear_range:
+            shear = np.random.uniform(-self.shear_range, self.shear_range, n)
+        else:
+            shear = np.zeros((n,))
+
+        if self.zoom_range[0] == 1 and self.zoom_range[1] == 1:
+            zx, zy = np.ones((n,)), np.ones((n,))
+        else:
+            zx, zy = np.random.uniform(
+                self.zoom_range[0], self.zoom_range[1], (2, n)
+            )
+
+        flip_horizontal = (np.random.random(n) < 0.5) & bool(
+            self.horizontal_flip
+        )
+        flip_vertical = (np.random.random(n) < 0.5) & bool(self.vertical_flip)
+
+        channel_shift_intensity = None
+        if self.channel_shift_range != 0:
+            channel_shift_intensity = np.random.uniform(
+                -self.channel_shift_range, self.channel_shift_range, n
+            )
+
+        brightness = None
+        if self.brightness_range is not None:
+            brightness = np.random.uniform(
+                self.brightness_range[0], self.brightness_range[1], n
+            )
+
+        return {
+            "theta": theta,
+            "tx": tx,
+            "ty": ty,
+            "shear": shear,
+            "zx": zx,
+            "zy": zy,
+            "flip_horizontal": flip_horizontal,
+            "flip_vertical": flip_vertical,
+            "channel_shift_intensity": channel_shift_intensity,
+            "brightness": brightness,
+        }
+
+    def apply_transform_batch(self, x, transform_parameters):
+        """Applies per-image transformations to a batch of images.
+
+        All geometric transformations of the batch are applied with a single
+        vectorized resampling (see `apply_affine_transform_batch()`).
+
+        Args:
+            x: 4D tensor, batch of images.
+            transform_parameters: Dictionary of per-image parameters, as
+                returned by `get_random_transform_batch()`.
+
+        Returns:
+            A transformed version of the input (same shape).
+        """
+        inputs = x
+        x = apply_affine_transform_batch(
+            x,
+            transform_parameters.get("theta", 0),
+            transform_parameters.get("tx", 0),
+            transform_parameters.get("ty", 0),
+            transform_parameters.get("shear", 0),
+            transform_parameters.get("zx", 1),
+            transform_parameters.get("zy", 1),
+            row_axis=self.row_axis,
+            col_axis=self.col_axis,
+            channel_axis=self.channel_axis,
+            fill_mode=self.fill_mode,
+            cval=self.cval,
+            order=self.interpolation_order,
+        )
+
+        if transform_parameters.get("channel_shift_intensity") is not None:
+            intensity = np.reshape(
+                transform_parameters["channel_shift_intensity"], (-1, 1, 1, 1)
+            )
+            min_x = np.min(x, axis=(1, 2, 3), keepdims=True)
+            max_x = np.max(x, axis=(1, 2, 3), keepdims=True)
+            x = np.clip(x + intensity, min_x, max_x).astype(x.dtype)
+
+        # Flips and brightness shifts are applied in place, and mustn't
+        # modify the input batch.
+        if x is inputs:
+            x = x.copy()
+        for key, axis in (
+            ("flip_horizontal", self.col_axis),
+            ("flip_vertical", self.row_axis),
+        ):
+            flip = transform_parameters.get(key, False)
+            flip = np.broadcast_to(np.asarray(flip, dtype=bool), (len(x),))
+            if np.any(flip):
+                x[flip] = np.flip(x[flip], axis=axis)
+
+        if transform_parameters.get("brightness") is not None:
+            for i, brightness in enumerate(transform_parameters["brightness"]):
+                x[i] = apply_brightness_shift(x[i], brightness, False)
+
+        return x
+
     def apply_transform(self, x, transform_parameters):
         """Applies a transformation to an image according to given parameters.
 
@@ -1771,7 +1978,7 @@ def transform_matrix_offset_center(matrix, x, y):
     o_y = float(y) / 2 - 0.5
     offset_matrix = np.array([[1, 0, o_x], [0, 1, o_y], [0, 0, 1]])
     reset_matrix = np.array([[1, 0, -o_x], [0, 1, -o_y], [0, 0, 1]])
-    transform_matrix = np.dot(np.dot(offset_matrix, matrix), reset_matrix)
+    transform_matrix = offset_matrix @ matrix @ reset_matrix
     return transform_matrix
 
 
@@ -1890,3 +2097,116 @@ def apply_affine_transform(
         x = np.stack(channel_images, axis=0)
         x = np.rollaxis(x, 0, channel_axis + 1)
     return x
+
+
+def apply_affine_transform_batch(
+    x,
+    theta=0,
+    tx=0,
+    ty=0,
+    shear=0,
+    zx=1,
+    zy=1,
+    row_axis=1,
+    col_axis=2,
+    channel_axis=3,
+    fill_mode="nearest",
+    cval=0.0,
+    order=1,
+):
+    """Applies per-image affine transformations to a batch of images.
+
+    Batched counterpart of `apply_affine_transform()`: every parameter can
+    be a scalar or an array of shape `(batch_size,)`. The transform matrices
+    of all images are composed at once, and the whole batch is resampled with
+    a single `scipy.ndimage.map_coordinates` call per channel (the batch index
+    being an integer coordinate, each image is only sampled from itself).
+    """
+    if x.ndim != 4:
+        raise ValueError("Input arrays must be batches of 2D images.")
+    if sorted([row_axis, col_axis, channel_axis]) != [1, 2, 3]:
+        raise ValueError(
+            "'row_axis', 'col_axis', and 'channel_axis' must be a "
+            "permutation of 1, 2 and 3."
+        )
+    n = x.shape[0]
+
+    def per_image(value):
+        return np.broadcast_to(np.asarray(value, dtype="float64"), (n,))
+
+    theta = np.deg2rad(per_image(theta))
+    tx, ty = per_image(tx), per_image(ty)
+    shear = np.deg2rad(per_image(shear))
+    zx, zy = per_image(zx), per_image(zy)
+    needs_transform = ((theta != 0) | (tx != 0) | (ty != 0) | (shear != 0)) | (
+        (zx != 1) | (zy != 1)
+    )
+    if not np.any(needs_transform):
+        return x
+
+    zeros, ones = np.zeros((n,)), np.ones((n,))
+
+    def stack_matrices(rows):
+        return np.stack([np.stack(row, axis=-1) for row in rows], axis=-2)
+
+    rotation = stack_matrices(
+        [
+            [np.cos(theta), -np.sin(theta), zeros],
+            [np.sin(theta), np.cos(theta), zeros],
+            [zeros, zeros, ones],
+        ]
+    )
+    shift = stack_matrices(
+        [[ones, zeros, tx], [zeros, ones, ty], [zeros, zeros, ones]]
+    )
+    shear = stack_matrices(
+        [
+            [ones, -np.sin(shear), zeros],
+            [zeros, np.cos(shear), zeros],
+            [zeros, zeros, ones],
+        ]
+    )
+    zoom = stack_matrices(
+        [[zx, zeros, zeros], [zeros, zy, zeros], [zeros, zeros, ones]]
+    )
+    transform_matrix = rotation @ shift @ shear @ zoom
+
+    h, w = x.shape[row_axis], x.shape[col_axis]
+    transform_matrix = transform_matrix_offset_center(transform_matrix, h, w)
+    # See `apply_affine_transform()`: the matrices use (x, y) coordinates
+    # while arrays use (i, j) indexing.
+    if col_axis > row_axis:
+        transform_matrix[:, :, [0, 1]] = transform_matrix[:, :, [1, 0]]
+        transform_matrix[:, [0, 1]] = transform_matrix[:, [1, 0]]
+    transform_matrix = transform_matrix[needs_transform]
+
+    images = np.moveaxis(x[needs_transform], channel_axis, -1)
+    batch_size, dim_0, dim_1 = images.shape[:3]
+    # Input coordinates of every output pixel:
+    # `transform_matrix[:2, :2] @ output_coords + transform_matrix[:2, 2]`.
+    grid = np.indices((dim_0, dim_1)).reshape((2, -1))
+    coords = np.einsum("nij,jk->nik", transform_matrix[:, :2, :2], grid)
+    coords += transform_matrix[:, :2, 2:]
+    coords = np.moveaxis(coords, 1, 0).reshape((2, batch_size, dim_0, dim_1))
+    batch_coords = np.broadcast_to(
+        np.arange(batch_size, dtype=coords.dtype)[:, None, None],
+        (1, batch_size, dim_0, dim_1),
+    )
+    coords = np.concatenate([batch_coords, coords], axis=0)
+
+    transformed = np.stack(
+        [
+            scipy.ndimage.map_coordinates(
+                images[..., c],
+                coords,
+                order=order,
+                mode=fill_mode,
+                cval=cval,
+            )
+            for c in range(images.shape[-1])
+        ],
+        axis=-1,
+    )
+    x = x.copy()
+    x[needs_transform] = np.moveaxis(transformed, -1, channel_axis)
+    return x
@@ -0,0 +1,206 @@
+import gc
+import os
+
+import numpy as np
+from absl.testing import parameterized
+
+from keras.src import testing
+from keras.src.legacy.preprocessing import image
+from keras.src.utils import image_utils
+
+
+class ImageDataGeneratorTest(testing.TestCase, parameterized.TestCase):
+    def _get_images(self, data_format, count=4):
+        x = np.random.uniform(0, 255, (count, 12, 10, 3)).astype("float32")
+        if data_format == "channels_first":
+            x = x.transpose((0, 3, 1, 2))
+        return x
+
+    @parameterized.parameters(
+        ("channels_last", 1, "nearest"),
+        ("channels_first", 1, "reflect"),
+        ("channels_last", 0, "constant"),
+    )
+    def test_apply_transform_batch_matches_apply_transform(
+        self, data_format, interpolation_order, fill_mode
+    ):
+        generator = image.ImageDataGenerator(
+            rotation_range=30,
+            width_shift_range=0.2,
+            height_shift_range=[-2, 1, 3],
+            shear_range=10,
+            zoom_range=0.3,
+            channel_shift_range=20,
+            # Brightness shifts only support channels_last images.
+            brightness_range=(
+                (0.5, 1.5) if data_format == "channels_last" else None
+            ),
+            horizontal_flip=True,
+            vertical_flip=True,
+            fill_mode=fill_mode,
+            cval=7.0,
+            interpolation_order=interpolation_order,
+            data_format=data_format,
+        )
+        x = self._get_images(data_format, count=8)
+        params = generator.get_random_transform_batch(x.shape, seed=1337)
+        for value in params.values():
+            if value is not None:
+                self.assertEqual(np.shape(value), (8,))
+        outputs = generator.apply_transform_batch(x.copy(), params)
+        self.assertEqual(outputs.shape, x.shape)
+
+        for i in range(len(x)):
+            image_params = {
+                key: value[i]
+                for key, value in params.items()
+                if value is not None
+            }
+            expected = generator.apply_transform(x[i], image_params)
+            self.assertAllClose(outputs[i], expected, atol=1e-3, rtol=1e-4)
+
+    def test_apply_transform_batch_identity(self):
+        generator = image.ImageDataGenerator(horizontal_flip=True)
+        x = self._get_images("channels_last")
+        params = generator.get_random_transform_batch(x.shape)
+        params["flip_horizontal"] = np.zeros((4,), dtype=bool)
+        self.assertAllClose(generator.apply_transform_batch(x, params), x)
+
+    def test_apply_transform_batch_does_not_modify_inputs(self):
+        generator = image.ImageDataGenerator()
+        x = self._get_images("channels_last")
+        for params in (
+            {"flip_horizontal": np.array([True, False, True, False])},
+            {"flip_vertical": np.ones((4,), dtype=bool)},
+            {"brightness": np.full((4,), 0.5)},
+        ):
+            inputs = x.copy()
+            outputs = generator.apply_transform_batch(inputs, params)
+            self.assertIsNot(outputs, inputs)
+            self.assertAllClose(inputs, x)
+            for i in range(len(x)):
+                expected = generator.apply_transform(
+                    x[i], {key: value[i] for key, value in params.items()}
+                )
+                self.assertAllClose(outputs[i], expected, atol=1e-3)
+
+    def test_get_random_transform_batch(self):
+        generator = image.ImageDataGenerator(
+            rotation_range=20,
+            width_shift_range=3,
+            zoom_range=(0.5, 0.8),
+        )
+        params = generator.get_random_transform_batch((100, 10, 10, 3))
+        self.assertTrue(np.all(np.abs(params["theta"]) <= 20))
+        self.assertTrue(np.all(params["tx"] == 0))
+        self.assertTrue(np.all(np.isin(params["ty"], np.arange(-2, 3))))
+        self.assertTrue(np.all((params["zx"] >= 0.5) & (params["zx"] <= 0.8)))
+        self.assertFalse(np.any(params["flip_horizontal"]))
+        self.assertIsNone(params["channel_shift_intensity"])
+        self.assertIsNone(params["brightness"])
+
+        # Seeded parameters are reproducible.
+        params_1 = generator.get_random_transform_batch((4, 10, 10, 3), seed=1)
+        params_2 = generator.get_random_transform_batch((4, 10, 10, 3), seed=1)
+        for key in ("theta", "ty", "zx", "zy"):
+            self.assertAllClose(params_1[key], params_2[key])
+
+    @parameterized.parameters("channels_last", "channels_first")
+    def test_standardize_batch_matches_standardize(self, data_format):
+        x = self._get_images(data_format)
+        generator = image.ImageDataGenerator(
+            featurewise_center=True,
+            featurewise_std_normalization=True,
+            samplewise_center=True,
+            samplewise_std_normalization=True,
+            zca_whitening=False,
+            rescale=1.0 / 255,
+            preprocessing_function=lambda img: img + 1.0,
+            data_format=data_format,
+        )
+        generator.fit(x)
+        outputs = generator.standardize_batch(x.copy())
+        for i in range(len(x)):
+            expected = generator.standardize(x[i].copy())
+            self.assertAllClose(outputs[i], expected, atol=1e-5)
+
+    @parameterized.parameters("channels_last", "channels_first")
+    def test_flow_matches_per_image_path(self, data_format):
+        x = self._get_images(data_format, count=6)
+        generator = image.ImageDataGenerator(
+            rotation_range=20,
+            zoom_range=0.2,
+            horizontal_flip=True,
+            samplewise_center=True,
+            data_format=data_format,
+        )
+        iterator = generator.flow(x, batch_size=6, shuffle=False, seed=42)
+        outputs = iterator[0]
+
+        # The batch is transformed with the parameters that
+        # `get_random_transform_batch()` draws for the same seed.
+        np.random.seed(42)
+        params = generator.get_random_transform_batch(x.shape)
+        for i in range(len(x)):
+            image_params = {
+                key: value[i]
+                for key, value in params.items()
+                if value is not None
+            }
+            expected = generator.apply_transform(x[i], image_params)
+            expected = generator.standardize(expected)
+            self.assertAllClose(outputs[i], expected, atol=1e-3, rtol=1e-4)
+
+    def _prepare_directory(self):
+        directory = self.get_temp_dir()
+        for class_name in ("class_0", "class_1"):
+            os.mkdir(os.path.join(directory, class_name))
+            for i in range(3):
+                img = np.random.randint(0, 256, (14, 9, 3), dtype="uint8")
+                image_utils.save_img(
+                    os.path.join(directory, class_name, f"{i}.png"), img
+                )
+        return directory
+
+    def test_flow_from_directory_matches_load_img(self):
+        directory = self._prepare_directory()
+
+        generator = image.ImageDataGenerator(rescale=1.0 / 255)
+        iterator = generator.flow_from_directory(
+            directory,
+            target_size=(14, 9),
+            batch_size=4,
+            shuffle=False,
+            class_mode="sparse",
+        )
+        self.assertLen(iterator, 2)
+        batches = [iterator[i] for i in range(len(iterator))]
+        images = np.concatenate([batch[0] for batch in batches])
+        labels = np.concatenate([batch[1] for batch in batches])
+        self.assertEqual(images.shape, (6, 14, 9, 3))
+        for output, label, path in zip(images, labels, iterator.filepaths):
+            expected = image_utils.img_to_array(image_utils.load_img(path))
+            self.assertAllClose(output, expected / 255, atol=1e-6)
+            self.assertIn(f"class_{int(label)}", path)
+
+    def test_flow_from_directory_closes_pool(self):
+        directory = self._prepare_directory()
+        generator = image.ImageDataGenerator()
+        iterator = generator.flow_from_directory(
+            directory, target_size=(14, 9), batch_size=4, class_mode=None
+        )
+        iterator[0]
+        pool = iterator._load_pool
+        self.assertIsNotNone(pool)
+        iterator.on_epoch_end()
+        self.assertIsNone(iterator._load_pool)
+        with self.assertRaises(ValueError):
+            pool.apply(len, ([],))
+        # The pool is recreated for the next epoch.
+        self.assertEqual(iterator[0].shape[0], 4)
+
+        pool = iterator._load_pool
+        del iterator
+        gc.collect()
+        with self.assertRaises(ValueError):
+            pool.apply(len, ([],))
@@ -1561,6 +1561,107 @@ def sparse_categorical_crossentropy(target, output, from_logits=False, axis=-1):
     )
 
 
+class ChunkedSparseCategoricalCrossentropy(Operation):
+    def __init__(self, chunk_size=4096):
+        super().__init__()
+        self.chunk_size = chunk_size
+
+    def call(self, target, inputs, kernel, bias=None):
+        return backend.nn.chunked_sparse_categorical_crossentropy(
+            target, inputs, kernel, bias=bias, chunk_size=self.chunk_size
+        )
+
+    def compute_output_spec(self, target, inputs, kernel, bias=None):
+        _check_chunked_crossentropy_shapes(target, inputs, kernel, bias)
+        dtype = backend.result_type(inputs.dtype, "float32")
+        return KerasTensor(inputs.shape[:-1], dtype=dtype)
+
+
+def _check_chunked_crossentropy_shapes(target, inputs, kernel, bias):
+    if len(inputs.shape) < 1:
+        raise ValueError(
+            "Argument `inputs` must be at least rank 1. "
+            f"Received: inputs.shape={inputs.shape}"
+        )
+    if len(kernel.shape) != 2 or kernel.shape[0] != inputs.shape[-1]:
+        raise ValueError(
+            "Argument `kernel` must have shape `(input_dim, num_classes)`, "
+            "where `input_dim` is the last dimension of `inputs`. "
+            f"Received: inputs.shape={inputs.shape}, "
+            f"kernel.shape={kernel.shape}"
+        )
+    if bias is not None and tuple(bias.shape) != tuple(kernel.shape[-1:]):
+        raise ValueError(
+            "Argument `bias` must have shape `(num_classes,)`. "
+            f"Received: bias.shape={bias.shape}, kernel.shape={kernel.shape}"
+        )
+    if len(target.shape) != len(inputs.shape) - 1 or any(
+        e1 is not None and e2 is not None and e1 != e2
+        for e1, e2 in zip(target.shape, inputs.shape[:-1])
+    ):
+        raise ValueError(
+            "Arguments `target` and `inputs` must have the same shape "
+            "up until the last dimension: "
+            f"target.shape={target.shape}, inputs.shape={inputs.shape}"
+        )
+
+
+@keras_export(
+    [
+        "keras.ops.chunked_sparse_categorical_crossentropy",
+        "keras.ops.nn.chunked_sparse_categorical_crossentropy",
+    ]
+)
+def chunked_sparse_categorical_crossentropy(
+    target, inputs, kernel, bias=None, chunk_size=4096
+):
+    """Computes sparse categorical cross-entropy of a linear projection.
+
+    This is equivalent to
+    `sparse_categorical_crossentropy(target, inputs @ kernel + bias,
+    from_logits=True)`, but the logits are computed `chunk_size` classes at a
+    time, with a running log-sum-exp, and the gradients are computed by
+    recomputing the logits chunk by chunk. The full
+    `(..., num_classes)` logits tensor is never materialized, which saves a
+    lot of memory for language models with large vocabularies.
+
+    The logits are computed in at least `"float32"` precision, and so is the
+    returned loss.
+
+    Args:
+        target: Integer tensor of class labels, of shape `(...)`.
+        inputs: Tensor of shape `(..., input_dim)`, e.g. the final hidden
+            states of a language model.
+        kernel: Projection kernel, of shape `(input_dim, num_classes)`.
+        bias: Optional projection bias, of shape `(num_classes,)`.
+        chunk_size: Number of classes for which the logits are computed at
+            once. Larger chunks are faster but use more memory. Defaults to
+            `4096`.
+
+    Returns:
+        Tensor of shape `(...)`, the cross-entropy loss of each element.
+
+    Example:
+
+    >>> hidden_states = keras.random.normal((2, 16, 64))
+    >>> kernel = keras.random.normal((64, 32000))
+    >>> target = keras.random.randint((2, 16), 0, 32000)
+    >>> loss = keras.ops.chunked_sparse_categorical_crossentropy(
+    ...     target, hidden_states, kernel
+    ... )
+    >>> loss.shape
+    (2, 16)
+    """
+    if any_symbolic_tensors((target, inputs, kernel, bias)):
+        return ChunkedSparseCategoricalCrossentropy(
+            chunk_size=chunk_size
+        ).symbolic_call(target, inputs, kernel, bias=bias)
+    _check_chunked_crossentropy_shapes(target, inputs, kernel, bias)
+    return backend.nn.chunked_sparse_categorical_crossentropy(
+        target, inputs, kernel, bias=bias, chunk_size=chunk_size
+    )
+
+
 class MultiHot(Operation):
     def __init__(
         self, num_classes=None, axis=-1, dtype=None, sparse=False, **kwargs
@@ -2107,3 +2208,121 @@ def psnr(
         x2,
         max_val,
     )
+
+
+class DotProductAttention(Operation):
+    def __init__(self, is_causal=False):
+        super().__init__()
+        self.is_causal = is_causal
+
+    def call(self, query, key, value, bias=None, mask=None, scale=None):
+        return backend.nn.dot_product_attention(
+            query,
+            key,
+            value,
+            bias=bias,
+            mask=mask,
+            scale=scale,
+            is_causal=self.is_causal,
+        )
+
+    def compute_output_spec(
+        self, query, key, value, bias=None, mask=None, scale=None
+    ):
+        return KerasTensor(
+            query.shape[:-1] + value.shape[-1:], dtype=query.dtype
+        )
+
+
+@keras_export(
+    [
+        "keras.ops.dot_product_attention",
+        "keras.ops.nn.dot_product_attention",
+    ]
+)
+def dot_product_attention(
+    query, key, value, bias=None, mask=None, scale=None, is_causal=False
+):
+    """Scaled dot product attention function.
+
+    Computes the attention function on Q (`query`), K (`key`), and V (`value`):
+    `attention(Q, K, V) = softmax(Q * K / sqrt(d)) * V`.
+
+    Throughout this function, we utilize the following notation to represent
+    the shape of array:
+    - B: batch size
+    - S: length of the key/value
+    - T: length of the query
+    - N: number of attention heads
+    - K: number of key/value heads, which divides `N`
+    - H: dimensions of each attention head
+
+    When `K < N` (grouped-query attention), each group of `N // K`
+    consecutive query heads attends to the same key/value head, without
+    repeating the keys and values.
+
+    The `[B, N, T, S]` attention probabilities are not returned, which lets
+    each backend use its most memory-efficient implementation:
+    `torch.nn.functional.scaled_dot_product_attention` with PyTorch,
+    `jax.nn.dot_product_attention` with JAX when available and the head
+    dimensions of `query` and `value` match. Otherwise, long sequences are
+    processed over blocks of queries, which JAX and TensorFlow recompute
+    during the backward pass.
+
+    Args:
+        query: The query array with the shape of `(B, T, N, H)`.
+        key: The key array with the shape of `(B, S, K, H)`.
+        value: The value array with the same shape of `key`, except for the
+            last dimension.
+        bias: Optional bias array to be added to logits. The shape must be
+            broadcastable to `(B, N, T, S)`.
+        mask: Optional mask array used to filter out logits. It is a boolean
+            mask where `True` indicates the element should take part in
+            attention. The shape must be broadcastable to `(B, N, T, S)`.
+        scale: Optional scale for the logits. If `None`, the scale will be set
+            to `1.0 / sqrt(H)`.
+        is_causal: Whether to apply causal mask.
+
+    Returns:
+        An array of the attention output with the same shape of `query`,
+        except for the last dimension which is the one of `value`.
+
+    Example:
+
+    >>> query = keras.random.normal((2, 4, 8, 16))
+    >>> key = keras.random.normal((2, 6, 8, 16))
+    >>> value = keras.random.normal((2, 6, 8, 16))
+    >>> keras.ops.nn.dot_product_attention(query, key, value).shape
+    (2, 4, 8, 16)
+    """
+    for name, x in (("query", query), ("key", key), ("value", value)):
+        if len(x.shape) != 4:
+            raise ValueError(
+                f"`{name}` must be a 4D tensor of shape `(B, T, N, H)`. "
+                f"Received: {name}.shape={x.shape}"
+            )
+    num_heads, num_key_heads = query.shape[2], key.shape[2]
+    if (
+        num_heads is not None
+        and num_key_heads is not None
+        and (num_heads % num_key_heads or value.shape[2] != num_key_heads)
+    ):
+        raise ValueError(
+            "The number of heads of `query` must be a multiple of the number "
+            "of heads of `key` and `value`, which must be equal. Received: "
+            f"query.shape={query.shape}, key.shape={key.shape}, "
+            f"value.shape={value.shape}"
+        )
+    if any_symbolic_tensors((query, key, value, bias, mask)):
+        return DotProductAttention(is_causal=is_causal).symbolic_call(
+            query, key, value, bias=bias, mask=mask, scale=scale
+        )
+    return backend.nn.dot_product_attention(
+        query,
+        key,
+        value,
+        bias=bias,
+        mask=mask,
+        scale=scale,
+        is_causal=is_causal,
+    )
@@ -1,4 +1,5 @@
 from itertools import combinations
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -672,6 +673,22 @@ class NNOpsDynamicShapeTest(testing.TestCase, parameterized.TestCase):
         out = knn.psnr(x1, x2, max_val=224)
         self.assertEqual(out.shape, ())
 
+    def test_chunked_sparse_categorical_crossentropy(self):
+        target = KerasTensor([None, None], dtype="int32")
+        inputs = KerasTensor([None, None, 8])
+        kernel = KerasTensor([8, 100])
+        out = knn.chunked_sparse_categorical_crossentropy(
+            target, inputs, kernel
+        )
+        self.assertEqual(out.shape, (None, None))
+
+    def test_dot_product_attention(self):
+        query = KerasTensor([None, None, 8, 16])
+        key = KerasTensor([None, None, 8, 16])
+        value = KerasTensor([None, None, 8, 32])
+        out = knn.dot_product_attention(query, key, value)
+        self.assertEqual(out.shape, (None, None, 8, 32))
+
 
 class NNOpsStaticShapeTest(testing.TestCase):
     def test_relu(self):
@@ -1138,6 +1155,52 @@ class NNOpsStaticShapeTest(testing.TestCase):
         out = knn.psnr(x1, x2, max_val=224)
         self.assertEqual(out.shape, ())
 
+    def test_chunked_sparse_categorical_crossentropy(self):
+        target = KerasTensor([2, 3], dtype="int32")
+        inputs = KerasTensor([2, 3, 8])
+        kernel = KerasTensor([8, 100])
+        bias = KerasTensor([100])
+        out = knn.chunked_sparse_categorical_crossentropy(
+            target, inputs, kernel, bias
+        )
+        self.assertEqual(out.shape, (2, 3))
+
+        with self.assertRaisesRegex(ValueError, "`kernel` must have shape"):
+            knn.chunked_sparse_categorical_crossentropy(
+                target, inputs, KerasTensor([4, 100])
+            )
+        with self.assertRaisesRegex(ValueError, "`bias` must have shape"):
+            knn.chunked_sparse_categorical_crossentropy(
+                target, inputs, kernel, KerasTensor([10])
+            )
+        with self.assertRaisesRegex(ValueError, "must have the same shape"):
+            knn.chunked_sparse_categorical_crossentropy(
+                KerasTensor([2, 4], dtype="int32"), inputs, kernel
+            )
+
+    def test_dot_product_attention(self):
+        query = KerasTensor([2, 4, 8, 16])
+        key = KerasTensor([2, 6, 8, 16])
+        value = KerasTensor([2, 6, 8, 32])
+        mask = KerasTensor([2, 1, 4, 6], dtype="bool")
+        out = knn.dot_product_attention(query, key, value, mask=mask)
+        self.assertEqual(out.shape, (2, 4, 8, 32))
+
+        # Grouped-query attention.
+        key = KerasTensor([2, 6, 2, 16])
+        value = KerasTensor([2, 6, 2, 32])
+        out = knn.dot_product_attention(query, key, value)
+        self.assertEqual(out.shape, (2, 4, 8, 32))
+
+        with self.assertRaisesRegex(ValueError, "must be a 4D tensor"):
+            knn.dot_product_attention(
+                KerasTensor([4, 8, 16]), KerasTensor([6, 8, 16]), value
+            )
+        with self.assertRaisesRegex(ValueError, "must be a multiple"):
+            knn.dot_product_attention(
+                query, KerasTensor([2, 6, 3, 16]), KerasTensor([2, 6, 3, 32])
+            )
+
 
 class NNOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
     def test_relu(self):
@@ -1650,6 +1713,137 @@ class NNOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
         )
         self.assertAllClose(outputs, expected)
 
+    @parameterized.named_parameters(
+        ("with_bias", True), ("without_bias", False)
+    )
+    def test_chunked_sparse_categorical_crossentropy(self, use_bias):
+        rng = np.random.default_rng(0)
+        target = rng.integers(0, 37, size=(2, 3))
+        inputs = rng.normal(size=(2, 3, 8)).astype("float32")
+        kernel = rng.normal(size=(8, 37)).astype("float32")
+        bias = rng.normal(size=(37,)).astype("float32") if use_bias else None
+        # Weight the elements of the loss, to check the upstream gradient.
+        weights = np.arange(6, dtype="float32").reshape((2, 3))
+
+        def chunked_loss(inputs, kernel, bias):
+            loss = knn.chunked_sparse_categorical_crossentropy(
+                target, inputs, kernel, bias, chunk_size=10
+            )
+            return ops.sum(ops.multiply(loss, weights))
+
+        def reference_loss(inputs, kernel, bias):
+            logits = ops.matmul(inputs, kernel)
+            if bias is not None:
+                logits = logits + bias
+            loss = knn.sparse_categorical_crossentropy(
+                target, logits, from_logits=True
+            )
+            return ops.sum(ops.multiply(loss, weights))
+
+        self.assertAllClose(
+            knn.chunked_sparse_categorical_crossentropy(
+                target, inputs, kernel, bias, chunk_size=10
+            ),
+            knn.sparse_categorical_crossentropy(
+                target,
+                inputs @ kernel + (0.0 if bias is None else bias),
+                from_logits=True,
+            ),
+            atol=1e-5,
+        )
+
+        if backend.backend() == "numpy":
+            return
+        args = [inputs, kernel] + ([bias] if use_bias else [])
+        if backend.backend() == "tensorflow":
+            import tensorflow as tf
+
+            def gradients(fn):
+                args_ = [tf.convert_to_tensor(x) for x in args]
+                with tf.GradientTape() as tape:
+                    tape.watch(args_)
+                    loss = fn(*(args_ + [None] * (3 - len(args_))))
+                return tape.gradient(loss, args_)
+
+        elif backend.backend() == "jax":
+            import jax
+
+            def gradients(fn):
+                return jax.grad(
+                    lambda *a: fn(*(list(a) + [None] * (3 - len(a)))),
+                    argnums=tuple(range(len(args))),
+                )(*args)
+
+        elif backend.backend() == "torch":
+            import torch
+
+            def gradients(fn):
+                args_ = [torch.tensor(x, requires_grad=True) for x in args]
+                loss = fn(*(args_ + [None] * (3 - len(args_))))
+                return torch.autograd.grad(loss, args_)
+
+        for grad, expected_grad in zip(
+            gradients(chunked_loss), gradients(reference_loss)
+        ):
+            self.assertAllClose(grad, expected_grad, atol=1e-4)
+
+    @parameterized.named_parameters(
+        ("remainder", 37), ("full_chunks", 40), ("single_chunk", 7)
+    )
+    @pytest.mark.skipif(
+        backend.backend() != "tensorflow",
+        reason="Tests the TensorFlow implementation.",
+    )
+    def test_chunked_sparse_categorical_crossentropy_tf_loop(self, num_classes):
+        import tensorflow as tf
+
+        rng = np.random.default_rng(0)
+        target = rng.integers(0, num_classes, size=(6,))
+        inputs = tf.constant(rng.normal(size=(6, 8)), "float32")
+        kernel = tf.constant(rng.normal(size=(8, num_classes)), "float32")
+        bias = tf.constant(rng.normal(size=(num_classes,)), "float32")
+
+        def gradients(loss_fn):
+            def compute_gradients(inputs, kernel, bias):
+                with tf.GradientTape() as tape:
+                    tape.watch([inputs, kernel, bias])
+                    loss = tf.reduce_sum(loss_fn(inputs, kernel, bias))
+                return [loss] + tape.gradient(loss, [inputs, kernel, bias])
+
+            return compute_gradients
+
+        def chunked_loss(inputs, kernel, bias):
+            return knn.chunked_sparse_categorical_crossentropy(
+                target, inputs, kernel, bias, chunk_size=10
+            )
+
+        def reference_loss(inputs, kernel, bias):
+            return knn.sparse_categorical_crossentropy(
+                target, tf.matmul(inputs, kernel) + bias, from_logits=True
+            )
+
+        expected = gradients(reference_loss)(inputs, kernel, bias)
+        for compute_gradients in (
+            tf.function(gradients(chunked_loss)),
+            tf.function(gradients(chunked_loss), jit_compile=True),
+        ):
+            outputs = compute_gradients(inputs, kernel, bias)
+            for output, expected_output in zip(outputs, expected):
+                self.assertAllClose(output, expected_output, atol=1e-4)
+
+        # The chunks are processed by a loop rather than unrolled.
+        graph = (
+            tf.function(gradients(chunked_loss))
+            .get_concrete_function(inputs, kernel, bias)
+            .graph
+        )
+        num_loops = sum(
+            op.type in ("While", "StatelessWhile")
+            for op in graph.get_operations()
+        )
+        # One loop in the forward pass, and one in the backward pass.
+        self.assertEqual(num_loops, 2 if num_classes >= 10 else 0)
+
     @parameterized.named_parameters(
         [
             {"testcase_name": "dense", "sparse": False},
@@ -2123,6 +2317,149 @@ class NNOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
         psnr_2 = knn.psnr(x3, x4, max_val)
         self.assertAlmostEqual(psnr_2, expected_psnr_2)
 
+    @parameterized.product(
+        lengths=[(3, 5), (600, 300)],
+        num_key_heads=[4, 2],
+        use_bias=[False, True],
+        use_mask=[False, True],
+        is_causal=[False, True],
+    )
+    def test_dot_product_attention(
+        self, lengths, num_key_heads, use_bias, use_mask, is_causal
+    ):
+        query_length, key_length = lengths
+        rng = np.random.default_rng(0)
+        query = rng.normal(size=(2, query_length, 4, 8)).astype("float32")
+        key = rng.normal(size=(2, key_length, num_key_heads, 8))
+        key = key.astype("float32")
+        value = rng.normal(size=(2, key_length, num_key_heads, 4))
+        value = value.astype("float32")
+        bias = mask = None
+        if use_bias:
+            bias = rng.normal(size=(2, 4, query_length, key_length))
+            bias = bias.astype("float32")
+        if use_mask:
+            mask = rng.random((2, 1, query_length, key_length)) > 0.3
+            # A fully masked query, which attends to all the keys evenly.
+            mask[:, :, 0] = False
+
+        # Each key/value head is shared by consecutive query heads.
+        repeated_key = np.repeat(key, 4 // num_key_heads, axis=2)
+        repeated_value = np.repeat(value, 4 // num_key_heads, axis=2)
+        logits = np.einsum("BTNH,BSNH->BNTS", query / np.sqrt(8), repeated_key)
+        if use_bias:
+            logits += bias
+        full_mask = np.ones(logits.shape, dtype="bool")
+        if use_mask:
+            full_mask &= mask
+        if is_causal:
+            full_mask &= np.tri(query_length, key_length, dtype="bool")
+        logits = np.where(full_mask, logits, -1e9)
+        probs = np.exp(logits - np.max(logits, axis=-1, keepdims=True))
+        probs /= np.sum(probs, axis=-1, keepdims=True)
+        expected = np.einsum("BNTS,BSNH->BTNH", probs, repeated_value)
+
+        outputs = knn.dot_product_attention(
+            query, key, value, bias=bias, mask=mask, is_causal=is_causal
+        )
+        self.assertAllClose(outputs, expected, atol=1e-5, rtol=1e-5)
+
+    @pytest.mark.skipif(
+        backend.backend() != "tensorflow",
+        reason="Tests the TensorFlow implementation.",
+    )
+    def test_dot_product_attention_blocked_gradients(self):
+        import tensorflow as tf
+
+        rng = np.random.default_rng(0)
+        query = tf.constant(rng.normal(size=(2, 600, 4, 8)), "float32")
+        key = tf.constant(rng.normal(size=(2, 300, 2, 8)), "float32")
+        value = tf.constant(rng.normal(size=(2, 300, 2, 4)), "float32")
+        bias = tf.constant(rng.normal(size=(2, 4, 600, 300)), "float32")
+        mask = rng.random((2, 1, 600, 300)) > 0.3
+
+        def attention(query, key, value, bias):
+            key = tf.repeat(key, 2, axis=2)
+            value = tf.repeat(value, 2, axis=2)
+            logits = tf.einsum("BTNH,BSNH->BNTS", query / np.sqrt(8), key)
+            full_mask = mask & np.tri(600, 300, dtype="bool")
+            logits = tf.where(full_mask, logits + bias, -1e9)
+            probs = tf.nn.softmax(logits, axis=-1)
+            return tf.einsum("BNTS,BSNH->BTNH", probs, value)
+
+        def blocked_attention(query, key, value, bias):
+            return knn.dot_product_attention(
+                query, key, value, bias=bias, mask=mask, is_causal=True
+            )
+
+        def gradients(fn):
+            def compute_gradients(query, key, value, bias):
+                with tf.GradientTape() as tape:
+                    tape.watch([query, key, value, bias])
+                    outputs = fn(query, key, value, bias)
+                    loss = tf.reduce_sum(tf.square(outputs))
+                return tape.gradient(loss, [query, key, value, bias])
+
+            return compute_gradients
+
+        expected = gradients(attention)(query, key, value, bias)
+        for compute_gradients in (
+            gradients(blocked_attention),
+            tf.function(gradients(blocked_attention)),
+            tf.function(gradients(blocked_attention), jit_compile=True),
+        ):
+            grads = compute_gradients(query, key, value, bias)
+            for grad, expected_grad in zip(grads, expected):
+                self.assertAllClose(grad, expected_grad, atol=1e-4)
+
+        # Logits are computed in the compute dtype.
+        outputs = knn.dot_product_attention(
+            tf.cast(query, "float16"),
+            tf.cast(key, "float16"),
+            tf.cast(value, "float16"),
+            mask=mask,
+        )
+        self.assertEqual(backend.standardize_dtype(outputs.dtype), "float16")
+        self.assertAllClose(
+            outputs,
+            knn.dot_product_attention(query, key, value, mask=mask),
+            atol=1e-2,
+        )
+
+    @pytest.mark.skipif(
+        backend.backend() != "jax", reason="Tests the JAX implementation."
+    )
+    def test_dot_product_attention_jax_dispatch(self):
+        import jax
+
+        calls = []
+
+        def fused_attention(query, key, value, **kwargs):
+            # Like `jax.nn.dot_product_attention`, only supports values with
+            # the head dimension of the queries.
+            calls.append(value.shape)
+            if value.shape[-1] != query.shape[-1]:
+                raise ValueError("Incompatible head dimensions.")
+            return jax.numpy.zeros(query.shape)
+
+        query = np.ones((2, 3, 4, 8), dtype="float32")
+        key = np.ones((2, 5, 4, 8), dtype="float32")
+        with mock.patch.object(
+            jax.nn, "dot_product_attention", fused_attention, create=True
+        ):
+            outputs = knn.dot_product_attention(
+                query, key, np.ones((2, 5, 4, 3), dtype="float32")
+            )
+            self.assertEqual(outputs.shape, (2, 3, 4, 3))
+            self.assertAllClose(outputs, np.ones((2, 3, 4, 3)))
+            self.assertEqual(calls, [])
+
+            outputs = knn.dot_product_attention(
+                query, key, np.ones((2, 5, 4, 8), dtype="float32")
+            )
+            self.assertAllClose(outputs, np.zeros((2, 3, 4, 8)))
+            self.assertEqual(calls, [(2, 5, 4, 8)])
+
 
 class NNOpsDtypeTest(testing.TestCase, parameterized.TestCase):
     """Test the dtype to verify that the behavior matches JAX."""
@@ -4102,6 +4102,12 @@ class NumpyOneInputOpsCorrectnessTest(testing.TestCase, parameterized.TestCase):
         self.assertAllClose(knp.Stack()([x, y]), np.stack([x, y]))
         self.assertAllClose(knp.Stack(axis=1)([x, y]), np.stack([x, y], axis=1))
 
+        x = backend.Variable(np.ones((2, 3)))
+        y = backend.Variable(np.zeros((2, 3)))
+        self.assertAllClose(
+            knp.stack([x, y]), np.stack([np.ones((2, 3)), np.zeros((2, 3))])
+        )
+
     def test_std(self):
         x = np.array([[1, 2, 3], [3, 2, 1]])
         self.assertAllClose(knp.std(x), np.std(x))
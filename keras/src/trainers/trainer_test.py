@@ -1,3 +1,4 @@
+import threading
 from unittest import mock
 
 import numpy as np
@@ -528,6 +529,115 @@ class TestTrainer(testing.TestCase, parameterized.TestCase):
         self.assertAllClose(outputs["y_one"], 4 * np.ones((100, 3)))
         self.assertAllClose(outputs["y_two"], 4 * np.ones((100, 3)))
 
+    @parameterized.named_parameters([("one_step", 1), ("multiple_steps", 3)])
+    @pytest.mark.skipif(
+        backend.backend() != "numpy",
+        reason="`predict_num_workers` is specific to the NumPy backend.",
+    )
+    def test_predict_num_workers(self, steps_per_execution):
+        model = StructModel(units=3)
+        model.compile(steps_per_execution=steps_per_execution)
+        x = {
+            "x_one": np.random.normal(size=(100, 4)),
+            "x_two": np.random.normal(size=(100, 4)),
+        }
+        expected_outputs = model.predict(x, batch_size=16)
+
+        model.predict_num_workers = 4
+        outputs = model.predict(x, batch_size=16)
+        self.assertAllClose(outputs["y_one"], expected_outputs["y_one"])
+        self.assertAllClose(outputs["y_two"], expected_outputs["y_two"])
+
+        # The first batch builds the model.
+        model = StructModel(units=3)
+        model.predict_num_workers = 4
+        outputs = model.predict(x, batch_size=16)
+        self.assertEqual(outputs["y_one"].shape, (100, 3))
+
+    @pytest.mark.skipif(
+        backend.backend() != "numpy",
+        reason="`predict_num_workers` is specific to the NumPy backend.",
+    )
+    def test_predict_num_workers_stateful(self):
+        x = np.random.normal(size=(32, 3, 2))
+        model = models.Sequential(
+            [
+                layers.Input(batch_shape=(8, 3, 2)),
+                layers.SimpleRNN(4, stateful=True),
+            ]
+        )
+        expected_outputs = model.predict(x, batch_size=8)
+        model.layers[0].reset_states()
+
+        model.predict_num_workers = 4
+        outputs = model.predict(x, batch_size=8)
+        self.assertAllClose(outputs, expected_outputs)
+
+    @pytest.mark.skipif(
+        backend.backend() != "numpy",
+        reason="`predict_num_workers` is specific to the NumPy backend.",
+    )
+    def test_predict_num_workers_assigning_state(self):
+        class CountingLayer(layers.Layer):
+            def build(self, input_shape):
+                self.count = self.add_weight(
+                    shape=(), initializer="zeros", trainable=False
+                )
+
+            def call(self, inputs):
+                self.count.assign(self.count + 1)
+                return inputs + self.count
+
+        model = models.Sequential([layers.Input((2,)), CountingLayer()])
+        model.predict_num_workers = 4
+        outputs = model.predict(np.zeros((40, 2)), batch_size=8)
+        # Every batch was predicted once, in order.
+        self.assertAllClose(model.layers[0].count, 5)
+        self.assertAllClose(outputs[:, 0], np.repeat(np.arange(1, 6), 8))
+
+        # Variables assigned in later batches.
+        class LaterCountingLayer(CountingLayer):
+            def call(self, inputs):
+                if np.any(inputs):
+                    self.count.assign(self.count + 1)
+                return inputs + self.count
+
+        model = models.Sequential([layers.Input((2,)), LaterCountingLayer()])
+        model.predict_num_workers = 4
+        x = np.concatenate([np.zeros((24, 2)), np.ones((16, 2))])
+        outputs = model.predict(x, batch_size=8)
+        self.assertAllClose(model.layers[0].count, 2)
+        self.assertAllClose(outputs[:, 0], [0] * 24 + [2] * 8 + [3] * 8)
+
+        # Variables assigned their current value.
+        class ReassigningLayer(CountingLayer):
+            def call(self, inputs):
+                threads.append(threading.current_thread())
+                self.count.assign(self.count)
+                return inputs + self.count
+
+        threads = []
+        model = models.Sequential([layers.Input((2,)), ReassigningLayer()])
+        model.predict_num_workers = 4
+        model.predict(np.zeros((40, 2)), batch_size=8)
+        # Only the first batch after the build was split across threads.
+        worker_threads = [
+            thread
+            for thread in threads
+            if thread is not threading.main_thread()
+        ]
+        self.assertLen(worker_threads, 4)
+
+    @pytest.mark.skipif(
+        backend.backend() != "numpy",
+        reason="`predict_num_workers` is specific to the NumPy backend.",
+    )
+    def test_predict_num_workers_validation(self):
+        model = ExampleModel(units=3)
+        self.assertIsNone(model.predict_num_workers)
+        with self.assertRaisesRegex(ValueError, "positive integer"):
+            model.predict_num_workers = 0
+
     @parameterized.named_parameters(
         named_product(
             generator_type=["tf", "jax", "scipy"], mode=["eager", "graph"]
@@ -8,6 +8,7 @@ import numpy as np
 
 from keras.src import tree
 from keras.src.api_export import keras_export
+from keras.src.utils import file_utils
 from keras.src.utils import io_utils
 from keras.src.utils.module_utils import tensorflow as tf
 
@@ -527,8 +528,8 @@ def index_directory(
     """
     if labels == "inferred":
         subdirs = []
-        for subdir in sorted(tf.io.gfile.listdir(directory)):
-            if tf.io.gfile.isdir(tf.io.gfile.join(directory, subdir)):
+        for subdir in sorted(file_utils.listdir(directory)):
+            if file_utils.isdir(file_utils.join(directory, subdir)):
                 if not subdir.startswith("."):
                     if subdir.endswith("/"):
                         subdir = subdir[:-1]
@@ -566,7 +567,7 @@ def index_directory(
     results = []
     filenames = []
 
-    for dirpath in (tf.io.gfile.join(directory, subdir) for subdir in subdirs):
+    for dirpath in (file_utils.join(directory, subdir) for subdir in subdirs):
         results.append(
             pool.apply_async(
                 index_subdirectory,
@@ -608,7 +609,7 @@ def index_directory(
             )
     pool.close()
     pool.join()
-    file_paths = [tf.io.gfile.join(directory, fname) for fname in filenames]
+    file_paths = [file_utils.join(directory, fname) for fname in filenames]
 
     if shuffle:
         # Shuffle globally to erase macro-structure
@@ -623,10 +624,7 @@ def index_directory(
 
 
 def iter_valid_files(directory, follow_links, formats):
-    if not follow_links:
-        walk = tf.io.gfile.walk(directory)
-    else:
-        walk = os.walk(directory, followlinks=follow_links)
+    walk = file_utils.walk(directory, followlinks=follow_links)
     for root, _, files in sorted(walk, key=lambda x: x[0]):
         for fname in sorted(files):
             if fname.lower().endswith(formats):
@@ -654,8 +652,8 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
     filenames = []
     for root, fname in valid_files:
         labels.append(class_indices[dirname])
-        absolute_path = tf.io.gfile.join(root, fname)
-        relative_path = tf.io.gfile.join(
+        absolute_path = file_utils.join(root, fname)
+        relative_path = file_utils.join(
             dirname, os.path.relpath(absolute_path, directory)
         )
         filenames.append(relative_path)
@@ -730,6 +728,33 @@ def labels_to_dataset(labels, label_mode, num_classes):
     return label_ds
 
 
+def labels_to_numpy(labels, label_mode, num_classes):
+    """Encode the list/tuple of labels as a NumPy array.
+
+    This is the `tf.data`-free counterpart of `labels_to_dataset()`.
+
+    Args:
+        labels: list/tuple of integer labels.
+        label_mode: String describing the encoding of `labels`. Options are:
+        - `"int"` leaves the labels as `int32` integers.
+        - `"binary"` indicates that the labels (there can be only 2) are encoded
+            as `float32` scalars with values 0 or 1
+            (e.g. for `binary_crossentropy`).
+        - `"categorical"` means that the labels are mapped into a categorical
+            vector.  (e.g. for `categorical_crossentropy` loss).
+        num_classes: number of classes of labels.
+
+    Returns:
+        A NumPy array with one encoded label per row.
+    """
+    labels = np.asarray(labels, dtype="int32")
+    if label_mode == "binary":
+        return np.expand_dims(labels.astype("float32"), axis=-1)
+    elif label_mode == "categorical":
+        return np.eye(num_classes, dtype="float32")[labels]
+    return labels
+
+
 def check_validation_split_arg(validation_split, subset, shuffle, seed):
     """Raise errors in case of invalid argument values.
 
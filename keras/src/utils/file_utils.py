@@ -1,13 +1,15 @@
+import functools
 import hashlib
 import os
 import pathlib
 import re
 import shutil
 import tarfile
+import threading
 import urllib
+import urllib.request
 import warnings
 import zipfile
-from urllib.request import urlretrieve
 
 from keras.src.api_export import keras_export
 from keras.src.backend import config
@@ -15,6 +17,13 @@ from keras.src.utils import io_utils
 from keras.src.utils.module_utils import gfile
 from keras.src.utils.progbar import Progbar
 
+# Number of concurrent connections used by `get_file()` to download large
+# files from servers supporting HTTP range requests.
+DOWNLOAD_NUM_CONNECTIONS = 4
+# Files are only split in segments of at least this size.
+DOWNLOAD_MIN_SEGMENT_SIZE = 16 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def path_to_string(path):
     """Convert `PathLike` objects to their string representation.
@@ -99,7 +108,11 @@ def extract_archive(file_path, path=".", archive_format="auto"):
 
     for archive_type in archive_format:
         if archive_type == "tar":
-            open_fn = tarfile.open
+            # Stream the archive: members are extracted in a single
+            # sequential pass, without seeking or building an index first.
+            open_fn = functools.partial(
+                tarfile.open, mode="r|*", bufsize=DOWNLOAD_CHUNK_SIZE
+            )
             is_match_fn = tarfile.is_tarfile
         if archive_type == "zip":
             open_fn = zipfile.ZipFile
@@ -261,54 +274,34 @@ def get_file(
 
     if download:
         io_utils.print_msg(f"Downloading data from {origin}")
-
-        class DLProgbar:
-            """Manage progress bar state for use in urlretrieve."""
-
-            def __init__(self):
-                self.progbar = None
-                self.finished = False
-
-            def __call__(self, block_num, block_size, total_size):
-                if total_size == -1:
-                    total_size = None
-                if not self.progbar:
-                    self.progbar = Progbar(total_size)
-                current = block_num * block_size
-
-                if total_size is None:
-                    self.progbar.update(current)
-                else:
-                    if current < total_size:
-                        self.progbar.update(current)
-                    elif not self.finished:
-                        self.progbar.update(self.progbar.target)
-                        self.finished = True
+        partial_fpath = fpath + ".partial"
+        if force_download and os.path.exists(partial_fpath):
+            os.remove(partial_fpath)
+        hasher = None
+        if file_hash is not None:
+            hasher = resolve_hasher(hash_algorithm, file_hash)
 
         error_msg = "URL fetch failure on {}: {} -- {}"
         try:
-            try:
-                urlretrieve(origin, fpath, DLProgbar())
-            except urllib.error.HTTPError as e:
-                raise Exception(error_msg.format(origin, e.code, e.msg))
-            except urllib.error.URLError as e:
-                raise Exception(error_msg.format(origin, e.errno, e.reason))
-        except (Exception, KeyboardInterrupt):
-            if os.path.exists(fpath):
-                os.remove(fpath)
-            raise
+            download_file(origin, partial_fpath, hasher=hasher)
+        except urllib.error.HTTPError as e:
+            raise Exception(error_msg.format(origin, e.code, e.msg))
+        except urllib.error.URLError as e:
+            raise Exception(error_msg.format(origin, e.errno, e.reason))
 
         # Validate download if succeeded and user provided an expected hash
         # Security conscious users would get the hash of the file from a
-        # separate channel and pass it to this API to prevent MITM / corruption:
-        if os.path.exists(fpath) and file_hash is not None:
-            if not validate_file(fpath, file_hash, algorithm=hash_algorithm):
-                raise ValueError(
-                    "Incomplete or corrupted file detected. "
-                    f"The {hash_algorithm} "
-                    "file hash does not match the provided value "
-                    f"of {file_hash}."
-                )
+        # separate channel and pass it to this API to prevent MITM / corruption.
+        # The hash was computed while downloading, so the file isn't re-read.
+        if hasher is not None and hasher.hexdigest() != str(file_hash):
+            os.remove(partial_fpath)
+            raise ValueError(
+                "Incomplete or corrupted file detected. "
+                f"The {hash_algorithm} "
+                "file hash does not match the provided value "
+                f"of {file_hash}."
+            )
+        os.replace(partial_fpath, fpath)
 
     if untar:
         if not os.path.exists(untar_fpath):
@@ -327,6 +320,282 @@ def get_file(
     return fpath
 
 
+def _parse_content_length(response):
+    length = response.headers.get("Content-Length")
+    if length is None:
+        return None
+    try:
+        return int(length)
+    except ValueError:
+        return None
+
+
+def _get_validator(response):
+    """Returns the validator to send in `If-Range` to resume a download.
+
+    This is the entity tag of the response (weak tags can't be used in
+    `If-Range`), or else its last modification date.
+    """
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+
+def download_file(
+    origin,
+    fpath,
+    hasher=None,
+    num_connections=None,
+    chunk_size=DOWNLOAD_CHUNK_SIZE,
+):
+    """Downloads `origin` to `fpath`, resuming from a partial `fpath`.
+
+    If `fpath` already exists, it is considered to be the beginning of the
+    file and only the remaining bytes are requested (with an HTTP `Range`
+    header; the download restarts from scratch if the server doesn't honor
+    it). The validator of the original response (`ETag` or
+    `Last-Modified`), stored in `fpath + ".validator"`, is sent with an
+    `If-Range` header, so that the server sends the whole file again if it
+    has changed in the meantime. A partial file without validator is only
+    resumed if `hasher` is provided (the caller then checks the hash of the
+    result); otherwise the download restarts from scratch.
+    When the server supports ranges and the file is large enough, the
+    remaining bytes are split into `num_connections` segments downloaded
+    concurrently. If the download is interrupted, `fpath` is truncated to
+    the bytes that were received contiguously, so that the next call
+    resumes from there.
+
+    Args:
+        origin: URL of the file.
+        fpath: Path of the (partial) destination file.
+        hasher: Optional `hashlib` hasher. It is updated with the content of
+            the file while it is downloaded, in order, so that the file
+            doesn't need to be read again to be validated.
+        num_connections: Maximum number of concurrent connections. Defaults
+            to `DOWNLOAD_NUM_CONNECTIONS`.
+        chunk_size: Bytes to read at a time.
+    """
+    if num_connections is None:
+        num_connections = DOWNLOAD_NUM_CONNECTIONS
+    offset = os.path.getsize(fpath) if os.path.exists(fpath) else 0
+    validator_fpath = fpath + ".validator"
+    validator = None
+    if offset and os.path.exists(validator_fpath):
+        with open(validator_fpath, encoding="utf-8") as f:
+            validator = f.read() or None
+    if validator is None and hasher is None:
+        # Nothing can tell whether the partial file is still a prefix of
+        # the current file at `origin`.
+        offset = 0
+    request = urllib.request.Request(origin)
+    if offset:
+        request.add_header("Range", f"bytes={offset}-")
+        if validator is not None:
+            request.add_header("If-Range", validator)
+    try:
+        response = urllib.request.urlopen(request)
+    except urllib.error.HTTPError as e:
+        if not offset or e.code != 416:
+            raise
+        # The partial file can't be resumed (e.g. it is already complete but
+        # wasn't validated): start over.
+        offset = 0
+        response = urllib.request.urlopen(urllib.request.Request(origin))
+    try:
+        status = getattr(response, "status", None)
+        if offset and status != 206:
+            # The server ignored the `Range` header, or the file changed
+            # since the partial download: start over.
+            offset = 0
+        validator = _get_validator(response)
+        if validator is not None:
+            with open(validator_fpath, "w", encoding="utf-8") as f:
+                f.write(validator)
+        elif os.path.exists(validator_fpath):
+            os.remove(validator_fpath)
+        remaining = _parse_content_length(response)
+        total_size = None if remaining is None else offset + remaining
+        with open(fpath, "r+b" if offset else "wb") as f:
+            f.truncate(offset)
+        if hasher is not None and offset:
+            with open(fpath, "rb") as f:
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    hasher.update(chunk)
+
+        progbar = Progbar(total_size)
+        progbar.update(offset)
+        supports_ranges = status == 206 or (
+            response.headers.get("Accept-Ranges") == "bytes"
+        )
+        if (
+            num_connections > 1
+            and supports_ranges
+            and remaining is not None
+            and remaining >= 2 * DOWNLOAD_MIN_SEGMENT_SIZE
+        ):
+            response.close()
+            _download_segments(
+                origin,
+                fpath,
+                offset,
+                total_size,
+                hasher,
+                num_connections,
+                chunk_size,
+                progbar,
+                validator=validator,
+            )
+        else:
+            with open(fpath, "ab") as f:
+                current = offset
+                for chunk in iter(lambda: response.read(chunk_size), b""):
+                    f.write(chunk)
+                    if hasher is not None:
+                        hasher.update(chunk)
+                    current += len(chunk)
+                    progbar.update(current)
+            if total_size is not None and current < total_size:
+                raise IOError(
+                    f"Connection closed after {current} of {total_size} "
+                    f"bytes of {origin}."
+                )
+        if total_size is not None and progbar.target is not None:
+            progbar.update(progbar.target, finalize=True)
+    finally:
+        response.close()
+    if os.path.exists(validator_fpath):
+        os.remove(validator_fpath)
+
+
+def _download_segments(
+    origin,
+    fpath,
+    offset,
+    total_size,
+    hasher,
+    num_connections,
+    chunk_size,
+    progbar,
+    validator=None,
+):
+    """Downloads `[offset, total_size)` of `origin` with concurrent ranges.
+
+    Every worker thread streams one contiguous segment to its position in
+    `fpath`. Meanwhile, the calling thread updates `hasher` with each
+    segment as soon as all the bytes preceding it have been written.
+
+    If a segment fails, the segments after it are abandoned but the ones
+    before it are completed, so that the file is truncated to everything
+    preceding the failure.
+    """
+    num_segments = min(
+        num_connections,
+        max(1, (total_size - offset) // DOWNLOAD_MIN_SEGMENT_SIZE),
+    )
+    bounds = [
+        offset + (total_size - offset) * i // num_segments
+        for i in range(num_segments + 1)
+    ]
+    segments = list(zip(bounds[:-1], bounds[1:]))
+    written = [0] * len(segments)
+    errors = []
+    # Index of the first segment that failed: later segments are abandoned.
+    first_failed = [len(segments)]
+    stop = threading.Event()
+    condition = threading.Condition()
+
+    with open(fpath, "r+b") as f:
+        f.truncate(total_size)
+
+    def fetch(index):
+        start, end = segments[index]
+        try:
+            headers = {"Range": f"bytes={start}-{end - 1}"}
+            if validator is not None:
+                # Fail rather than mix the bytes of two versions of the file.
+                headers["If-Range"] = validator
+            request = urllib.request.Request(origin, headers=headers)
+            with urllib.request.urlopen(request) as response:
+                if getattr(response, "status", None) != 206:
+                    raise IOError(
+                        f"The server did not honor the range request for "
+                        f"bytes {start}-{end - 1} of {origin}."
+                    )
+                with open(fpath, "r+b") as f:
+                    f.seek(start)
+                    while (
+                        written[index] < end - start
+                        and index < first_failed[0]
+                        and not stop.is_set()
+                    ):
+                        chunk = response.read(
+                            min(chunk_size, end - start - written[index])
+                        )
+                        if not chunk:
+                            raise IOError(
+                                f"Connection closed after {written[index]} "
+                                f"of {end - start} bytes of a segment of "
+                                f"{origin}."
+                            )
+                        f.write(chunk)
+                        # Make the bytes visible to the hashing thread.
+                        f.flush()
+                        with condition:
+                            written[index] += len(chunk)
+                            condition.notify_all()
+        except BaseException as e:
+            with condition:
+                errors.append(e)
+                first_failed[0] = min(first_failed[0], index)
+                condition.notify_all()
+
+    threads = [
+        threading.Thread(target=fetch, args=(i,), daemon=True)
+        for i in range(len(segments))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        # Unbuffered, so that no stale (not yet written) bytes are cached.
+        with open(fpath, "rb", buffering=0) as reader:
+            for index, (start, end) in enumerate(segments):
+                hashed = 0
+                while hashed < end - start:
+                    with condition:
+                        while written[index] == hashed and not errors:
+                            condition.wait()
+                        available = written[index]
+                    if errors:
+                        raise errors[0]
+                    progbar.update(offset + sum(written))
+                    if hasher is not None:
+                        reader.seek(start + hashed)
+                        remaining = available - hashed
+                        while remaining:
+                            chunk = reader.read(min(chunk_size, remaining))
+                            hasher.update(chunk)
+                            remaining -= len(chunk)
+                    hashed = available
+    except BaseException as e:
+        if not any(e is error for error in errors):
+            # Interrupted by the caller (e.g. `KeyboardInterrupt`).
+            stop.set()
+        for thread in threads:
+            thread.join()
+        # Keep the contiguous prefix that was received, to resume from it.
+        valid_size = offset
+        for (start, end), size in zip(segments, written):
+            valid_size += size
+            if size < end - start:
+                break
+        with open(fpath, "r+b") as f:
+            f.truncate(valid_size)
+        raise
+    for thread in threads:
+        thread.join()
+
+
 def resolve_hasher(algorithm, file_hash=None):
     """Returns hash algorithm as hashlib function."""
     if algorithm == "sha256":
@@ -472,6 +741,15 @@ def listdir(path):
     return os.listdir(path)
 
 
+def walk(path, followlinks=False):
+    if is_remote_path(path):
+        if gfile.available:
+            return gfile.walk(path)
+        else:
+            _raise_if_no_gfile(path)
+    return os.walk(path, followlinks=followlinks)
+
+
 def copy(src, dst):
     if is_remote_path(src) or is_remote_path(dst):
         if gfile.available:
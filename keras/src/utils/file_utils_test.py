@@ -1,9 +1,11 @@
 import hashlib
+import http.server
 import os
 import pathlib
 import shutil
 import tarfile
 import tempfile
+import threading
 import urllib
 import zipfile
 from unittest.mock import patch
@@ -604,6 +606,218 @@ class GetFileTest(test_case.TestCase):
         self.assertFalse(os.path.exists(complex_dir))
 
 
+class _RangeRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Serves `content`, honoring `Range` headers if `support_ranges`."""
+
+    content = b""
+    support_ranges = True
+    # Byte position after which range responses are cut short.
+    fail_after = None
+    requested_ranges = []
+    # Entity tag of `content`, if any.
+    etag = None
+
+    def do_GET(self):
+        content = type(self).content
+        etag = type(self).etag
+        start, end = 0, len(content) - 1
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if if_range is not None and if_range != etag:
+            # The file changed: the whole file is sent.
+            range_header = None
+        if range_header and type(self).support_ranges:
+            start, _, end = range_header[len("bytes=") :].partition("-")
+            start = int(start)
+            end = int(end) if end else len(content) - 1
+            type(self).requested_ranges.append((start, end))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{end}/{len(content)}"
+            )
+        else:
+            type(self).requested_ranges.append(None)
+            self.send_response(200)
+        if type(self).support_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        body = content[start : end + 1]
+        fail_after = type(self).fail_after
+        if fail_after is not None and start <= fail_after < end:
+            body = body[: fail_after - start]
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class DownloadFileTest(test_case.TestCase):
+    def setUp(self):
+        self.content = os.urandom(10000)
+        handler = type(
+            "Handler",
+            (_RangeRequestHandler,),
+            {"content": self.content, "requested_ranges": []},
+        )
+        self.handler = handler
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.origin = f"http://127.0.0.1:{self.server.server_port}/file.bin"
+        self.file_hash = hashlib.sha256(self.content).hexdigest()
+        self.cache_dir = self.get_temp_dir()
+        self.fpath = os.path.join(self.cache_dir, "datasets", "file.bin")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_parallel_download(self):
+        with patch.object(file_utils, "DOWNLOAD_MIN_SEGMENT_SIZE", 1000):
+            path = file_utils.get_file(
+                "file.bin",
+                self.origin,
+                file_hash=self.file_hash,
+                cache_dir=self.cache_dir,
+            )
+        self.assertEqual(self._read(path), self.content)
+        self.assertFalse(os.path.exists(path + ".partial"))
+        # One probe request, then one ranged request per connection.
+        segments = sorted(self.handler.requested_ranges[1:])
+        self.assertLen(segments, file_utils.DOWNLOAD_NUM_CONNECTIONS)
+        self.assertEqual(segments[0][0], 0)
+        self.assertEqual(segments[-1][1], len(self.content) - 1)
+
+    def test_resume_from_partial_file(self):
+        os.makedirs(os.path.dirname(self.fpath))
+        with open(self.fpath + ".partial", "wb") as f:
+            f.write(self.content[:3000])
+        path = file_utils.get_file(
+            "file.bin",
+            self.origin,
+            file_hash=self.file_hash,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(
+            self.handler.requested_ranges, [(3000, len(self.content) - 1)]
+        )
+
+    def test_resume_without_range_support(self):
+        self.handler.support_ranges = False
+        os.makedirs(os.path.dirname(self.fpath))
+        with open(self.fpath + ".partial", "wb") as f:
+            f.write(b"garbage")
+        path = file_utils.get_file(
+            "file.bin",
+            self.origin,
+            file_hash=self.file_hash,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(self.handler.requested_ranges, [None])
+
+    def test_interrupted_parallel_download_is_resumed(self):
+        self.handler.fail_after = 6000
+        with patch.object(file_utils, "DOWNLOAD_MIN_SEGMENT_SIZE", 1000):
+            with self.assertRaises(Exception):
+                file_utils.get_file(
+                    "file.bin",
+                    self.origin,
+                    file_hash=self.file_hash,
+                    cache_dir=self.cache_dir,
+                )
+            # The segments preceding the failure are completed and kept.
+            partial = self._read(self.fpath + ".partial")
+            self.assertEqual(partial, self.content[:6000])
+            self.assertFalse(os.path.exists(self.fpath))
+
+            self.handler.fail_after = None
+            self.handler.requested_ranges = []
+            path = file_utils.get_file(
+                "file.bin",
+                self.origin,
+                file_hash=self.file_hash,
+                cache_dir=self.cache_dir,
+            )
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(self.handler.requested_ranges[0][0], 6000)
+
+    def _interrupt_download(self, fail_after):
+        self.handler.fail_after = fail_after
+        with self.assertRaises(Exception):
+            file_utils.get_file(
+                "file.bin", self.origin, cache_dir=self.cache_dir
+            )
+        self.handler.fail_after = None
+        self.handler.requested_ranges = []
+
+    def test_resume_with_validator(self):
+        self.handler.etag = '"v1"'
+        self._interrupt_download(3000)
+        self.assertEqual(self._read(self.fpath + ".partial.validator"), b'"v1"')
+        path = file_utils.get_file(
+            "file.bin", self.origin, cache_dir=self.cache_dir
+        )
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(
+            self.handler.requested_ranges, [(3000, len(self.content) - 1)]
+        )
+        self.assertFalse(os.path.exists(self.fpath + ".partial.validator"))
+
+    def test_resume_after_origin_changed(self):
+        self.handler.etag = '"v1"'
+        self._interrupt_download(3000)
+        new_content = os.urandom(10000)
+        self.handler.content = new_content
+        self.handler.etag = '"v2"'
+        path = file_utils.get_file(
+            "file.bin", self.origin, cache_dir=self.cache_dir
+        )
+        # The stale partial file is discarded.
+        self.assertEqual(self._read(path), new_content)
+        self.assertEqual(self.handler.requested_ranges, [None])
+
+    def test_resume_without_validator_or_hash(self):
+        os.makedirs(os.path.dirname(self.fpath))
+        with open(self.fpath + ".partial", "wb") as f:
+            f.write(b"stale content")
+        path = file_utils.get_file(
+            "file.bin", self.origin, cache_dir=self.cache_dir
+        )
+        self.assertEqual(self._read(path), self.content)
+        self.assertEqual(self.handler.requested_ranges, [None])
+
+    def test_corrupted_partial_file(self):
+        os.makedirs(os.path.dirname(self.fpath))
+        with open(self.fpath + ".partial", "wb") as f:
+            f.write(b"\0" * 3000)
+        with self.assertRaisesRegex(ValueError, "Incomplete or corrupted"):
+            file_utils.get_file(
+                "file.bin",
+                self.origin,
+                file_hash=self.file_hash,
+                cache_dir=self.cache_dir,
+            )
+        # The corrupted partial file is discarded.
+        self.assertFalse(os.path.exists(self.fpath + ".partial"))
+        path = file_utils.get_file(
+            "file.bin",
+            self.origin,
+            file_hash=self.file_hash,
+            cache_dir=self.cache_dir,
+        )
+        self.assertEqual(self._read(path), self.content)
+
+
 class HashFileTest(test_case.TestCase):
     def setUp(self):
         self.test_content = b"Hello, World!"
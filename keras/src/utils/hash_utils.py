@@ -0,0 +1,494 @@
+"""Vectorized implementations of the hash functions of TensorFlow.
+
+`fingerprint64()` computes FarmHash Fingerprint64, as used by
+`tf.fingerprint()` and `tf.strings.to_hash_bucket_fast()`, and `siphash64()`
+computes SipHash-2-4, as used by `tf.strings.to_hash_bucket_strong()`. Both
+return bit-identical results to TensorFlow.
+
+Strings are hashed with NumPy. Integers are hashed as their decimal string
+representation (which is what `tf.as_string()` produces), but the digits are
+computed arithmetically, so that integer tensors of any backend with 64-bit
+integer support can be hashed with backend ops, e.g. inside of compiled
+functions.
+
+All computations use wrapping signed 64-bit arithmetic, which is bit-for-bit
+equivalent to the unsigned arithmetic of the reference implementations.
+"""
+
+import numpy as np
+
+from keras.src import backend
+
+
+def _to_int64(value):
+    """Converts an unsigned 64-bit constant to its signed representation."""
+    value &= (1 << 64) - 1
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+# FarmHash constants.
+_K0 = _to_int64(0xC3A5C85C97CB3127)
+_K1 = _to_int64(0xB492B66FBE98F273)
+_K2 = _to_int64(0x9AE16A3B2F90404F)
+_SEED = 81
+
+# SipHash initialization constants.
+_SIP_V0 = 0x736F6D6570736575
+_SIP_V1 = 0x646F72616E646F6D
+_SIP_V2 = 0x6C7967656E657261
+_SIP_V3 = 0x7465646279746573
+
+# Number of decimal digits of the largest 64-bit magnitude, 2**63, and
+# maximum length of the decimal representation of 64-bit integers.
+_MAX_DIGITS = 19
+_MAX_LENGTH = _MAX_DIGITS + 1
+
+
+def backend_supports_int64():
+    """Whether integers can be hashed with ops of the current backend."""
+    if backend.backend() == "jax":
+        import jax
+
+        return bool(jax.config.jax_enable_x64)
+    return backend.backend() in ("torch", "numpy")
+
+
+def fingerprint64(values, xnp=np):
+    """Computes FarmHash Fingerprint64 of `values`.
+
+    Args:
+        values: Array of strings, bytes or integers. When `xnp` is a Keras
+            backend module, a backend tensor of integers.
+        xnp: Either `np` or `keras.src.backend.numpy`.
+
+    Returns:
+        An `int64` array with the bits of the unsigned 64-bit fingerprints.
+    """
+    if xnp is not np:
+        # Decimal representations have at most 20 bytes, and the branches
+        # for all lengths are computed, as compiled functions can't gather
+        # the rows of each branch.
+        reader = _TensorReader(values)
+        lengths = reader.lengths
+        hashes = xnp.where(
+            lengths > 0, _farmhash_len_1_to_3(reader), lengths * 0 + _K2
+        )
+        for hash_fn, start in (
+            (_farmhash_len_4_to_7, 4),
+            (_farmhash_len_8_to_16, 8),
+            (_farmhash_len_17_to_32, 17),
+        ):
+            hashes = xnp.where(lengths >= start, hash_fn(reader), hashes)
+        return xnp.reshape(hashes, values.shape)
+
+    values = np.asarray(values)
+    reader = _ArrayReader(values)
+    lengths = reader.lengths
+    hashes = np.full(lengths.shape, _K2, dtype="int64")
+    # Each branch is only computed for the rows with lengths in its range.
+    for hash_fn, start, stop in (
+        (_farmhash_len_1_to_3, 1, 3),
+        (_farmhash_len_4_to_7, 4, 7),
+        (_farmhash_len_8_to_16, 8, 16),
+        (_farmhash_len_17_to_32, 17, 32),
+        (_farmhash_len_33_to_64, 33, 64),
+        (_farmhash_long, 65, None),
+    ):
+        in_range = lengths >= start
+        if stop is not None:
+            in_range &= lengths <= stop
+        rows = np.nonzero(in_range)[0]
+        if rows.size:
+            hashes[rows] = hash_fn(reader.subset(rows))
+    return hashes.reshape(values.shape)
+
+
+def siphash64(values, key, xnp=np):
+    """Computes SipHash-2-4 of `values` with a 128-bit `key`.
+
+    Args:
+        values: Array of strings, bytes or integers. When `xnp` is a Keras
+            backend module, a backend tensor of integers.
+        key: List of two unsigned 64-bit integers.
+        xnp: Either `np` or `keras.src.backend.numpy`.
+
+    Returns:
+        An `int64` array with the bits of the unsigned 64-bit hashes.
+    """
+    if xnp is np:
+        values = np.asarray(values)
+        reader = _ArrayReader(values)
+        max_blocks = int(reader.lengths.max(initial=0)) // 8
+    else:
+        reader = _TensorReader(values)
+        max_blocks = _MAX_LENGTH // 8
+    lengths = reader.lengths
+    k0, k1 = _to_int64(key[0]), _to_int64(key[1])
+    zeros = lengths * 0
+    v0 = zeros + _to_int64(k0 ^ _SIP_V0)
+    v1 = zeros + _to_int64(k1 ^ _SIP_V1)
+    v2 = zeros + _to_int64(k0 ^ _SIP_V2)
+    v3 = zeros + _to_int64(k1 ^ _SIP_V3)
+    num_blocks = _shift_right(lengths, 3)
+    for i in range(max_blocks):
+        block = reader.fetch64(zeros + 8 * i)
+        updated = _sip_compress(v0, v1, v2, v3, block, 2)
+        active = num_blocks > i
+        v0, v1, v2, v3 = [
+            xnp.where(active, new, old)
+            for new, old in zip(updated, (v0, v1, v2, v3))
+        ]
+    # The last block holds the remaining bytes and the length.
+    block = reader.fetch64(num_blocks * 8) | (lengths << 56)
+    v0, v1, v2, v3 = _sip_compress(v0, v1, v2, v3, block, 2)
+    v2 = v2 ^ 0xFF
+    for _ in range(4):
+        v0, v1, v2, v3 = _sip_round(v0, v1, v2, v3)
+    hashes = v0 ^ v1 ^ v2 ^ v3
+    return xnp.reshape(hashes, values.shape)
+
+
+def unsigned_mod(hashes, num_bins):
+    """Computes `hashes % num_bins`, interpreting `hashes` as unsigned."""
+    # `hashes >> 1` is non-negative, so the signed remainder is correct.
+    return (_shift_right(hashes, 1) % num_bins * 2 + (hashes & 1)) % num_bins
+
+
+class _ArrayReader:
+    """Reads little-endian integers from the bytes of NumPy values.
+
+    The bytes of each value are stored in a row of a buffer with 8 bytes of
+    zero padding, and integers are read with a single gather from unaligned
+    views of the buffer with a stride of one byte. Bytes past the end of a
+    value read as zeros.
+    """
+
+    def __init__(self, values=None, views=None, starts=None, lengths=None):
+        if values is None:
+            self._views = views
+            self._starts = starts
+            self.lengths = lengths
+            return
+        values = values.reshape(-1)
+        if values.dtype.kind in "iu":
+            codes, lengths = _encode_integers(values.astype("int64"))
+        else:
+            codes, lengths = _encode_strings(values)
+        num_rows, width = codes.shape
+        buffer = np.zeros((num_rows, width + 8), dtype="uint8")
+        buffer[:, :width] = codes
+        buffer = buffer.reshape(-1)
+        self._views = {
+            num_bytes: np.ndarray(
+                shape=(max(buffer.size - 7, 0),),
+                dtype=f"<u{num_bytes}",
+                buffer=buffer,
+                strides=(1,),
+            )
+            for num_bytes in (1, 4, 8)
+        }
+        self._starts = np.arange(num_rows) * (width + 8)
+        self.lengths = lengths
+
+    def subset(self, rows):
+        """Returns a reader of the values in `rows`."""
+        return _ArrayReader(
+            views=self._views,
+            starts=self._starts[rows],
+            lengths=self.lengths[rows],
+        )
+
+    def _fetch(self, offsets, num_bytes):
+        # Offsets are only negative in branches of other lengths.
+        return self._views[num_bytes][self._starts + np.maximum(offsets, 0)]
+
+    def fetch8(self, offsets):
+        return self._fetch(offsets, 1).astype("int64")
+
+    def fetch32(self, offsets):
+        return self._fetch(offsets, 4).astype("int64")
+
+    def fetch64(self, offsets):
+        return self._fetch(offsets, 8).view("int64")
+
+
+class _TensorReader:
+    """Reads little-endian integers from the decimal digits of a tensor.
+
+    Only backend ops are used, so that this works in compiled functions.
+    Bytes past the end of a value read as zeros.
+    """
+
+    def __init__(self, values):
+        xnp = backend.numpy
+        values = xnp.reshape(backend.cast(values, "int64"), (-1,))
+        self._codes, self.lengths = _encode_integers(values, xnp)
+
+    def _fetch(self, offsets, num_bytes):
+        xnp = backend.numpy
+        positions = offsets[:, None] + xnp.arange(num_bytes, dtype="int64")
+        index = xnp.clip(positions, 0, _MAX_LENGTH - 1)
+        data = xnp.take_along_axis(self._codes, index, axis=1)
+        data = xnp.where(positions < self.lengths[:, None], data, 0)
+        result = data[:, 0]
+        for i in range(1, num_bytes):
+            result = result | (data[:, i] << (8 * i))
+        return result
+
+    def fetch8(self, offsets):
+        return self._fetch(offsets, 1)
+
+    def fetch32(self, offsets):
+        return self._fetch(offsets, 4)
+
+    def fetch64(self, offsets):
+        return self._fetch(offsets, 8)
+
+
+def _encode_strings(values):
+    """Returns a matrix of the bytes of strings, and their lengths."""
+    if values.dtype.kind in "UO":
+        try:
+            # Fast path for bytes and ASCII strings.
+            values = values.astype(bytes)
+        except UnicodeEncodeError:
+            values = np.array(
+                [
+                    v.encode("utf-8") if isinstance(v, str) else v
+                    for v in values
+                ],
+                dtype=bytes,
+            )
+    values = np.ascontiguousarray(values)
+    # NumPy pads the bytes with null bytes to a fixed width, and strips
+    # trailing null bytes from the values.
+    width = values.dtype.itemsize
+    codes = values.view(np.uint8).reshape(-1, width)
+    trailing_nulls = np.argmax(codes[:, ::-1] != 0, axis=1)
+    lengths = np.where(codes.any(axis=1), width - trailing_nulls, 0)
+    return codes, lengths.astype("int64")
+
+
+def _encode_integers(values, xnp=np):
+    """Returns the bytes of the decimal representation of integers."""
+    negative = values < 0
+    # The magnitude of the smallest integer wraps around to itself, which is
+    # its correct unsigned value.
+    magnitudes = xnp.where(negative, 0 - values, values)
+    digits = []
+    num_digits = values * 0 + 1
+    for _ in range(_MAX_DIGITS):
+        # Unsigned division by 10.
+        quotients = _shift_right(magnitudes, 1) // 5
+        digits.append(magnitudes - quotients * 10)
+        magnitudes = quotients
+        if xnp is np and not quotients.any():
+            break
+        num_digits = num_digits + _cast_int64(quotients != 0, xnp)
+    lengths = num_digits + _cast_int64(negative, xnp)
+
+    # Digits are stored from the least significant one.
+    if xnp is np:
+        codes = np.zeros((len(values), _MAX_LENGTH), dtype="uint8")
+        rows = np.arange(len(values))
+        codes[negative, 0] = 45
+        for i, digit in enumerate(digits):
+            valid = num_digits > i
+            codes[rows[valid], lengths[valid] - 1 - i] = digit[valid] + 48
+        return codes, lengths
+
+    digits = xnp.stack(digits, axis=1)
+    codes = []
+    for position in range(_MAX_LENGTH):
+        index = xnp.clip(lengths - 1 - position, 0, _MAX_DIGITS - 1)
+        code = xnp.take_along_axis(digits, index[:, None], axis=1)[:, 0] + 48
+        if position == 0:
+            code = xnp.where(negative, 45, code)
+        codes.append(xnp.where(position < lengths, code, 0))
+    return xnp.stack(codes, axis=1), lengths
+
+
+def _cast_int64(x, xnp):
+    if xnp is np:
+        return x.astype("int64")
+    return backend.cast(x, "int64")
+
+
+def _shift_right(x, shift):
+    """Logical right shift of signed 64-bit integers."""
+    return (x >> shift) & ((1 << (64 - shift)) - 1)
+
+
+def _rotate_right(x, shift):
+    return _shift_right(x, shift) | (x << (64 - shift))
+
+
+def _rotate_left(x, shift):
+    return (x << shift) | _shift_right(x, 64 - shift)
+
+
+def _shift_mix(x):
+    return x ^ _shift_right(x, 47)
+
+
+def _hash_len_16(u, v, mul):
+    a = (u ^ v) * mul
+    a = a ^ _shift_right(a, 47)
+    b = (v ^ a) * mul
+    b = b ^ _shift_right(b, 47)
+    return b * mul
+
+
+def _farmhash_len_1_to_3(reader):
+    lengths = reader.lengths
+    a = reader.fetch8(lengths * 0)
+    b = reader.fetch8(_shift_right(lengths, 1))
+    c = reader.fetch8(lengths - 1)
+    y = a + (b << 8)
+    z = lengths + (c << 2)
+    return _shift_mix(y * _K2 ^ z * _K0) * _K2
+
+
+def _farmhash_len_4_to_7(reader):
+    lengths = reader.lengths
+    mul = _K2 + lengths * 2
+    a = reader.fetch32(lengths * 0)
+    return _hash_len_16(lengths + (a << 3), reader.fetch32(lengths - 4), mul)
+
+
+def _farmhash_len_8_to_16(reader):
+    lengths = reader.lengths
+    mul = _K2 + lengths * 2
+    a = reader.fetch64(lengths * 0) + _K2
+    b = reader.fetch64(lengths - 8)
+    c = _rotate_right(b, 37) * mul + a
+    d = (_rotate_right(a, 25) + b) * mul
+    return _hash_len_16(c, d, mul)
+
+
+def _farmhash_len_17_to_32(reader):
+    lengths = reader.lengths
+    zeros = lengths * 0
+    mul = _K2 + lengths * 2
+    a = reader.fetch64(zeros) * _K1
+    b = reader.fetch64(zeros + 8)
+    c = reader.fetch64(lengths - 8) * mul
+    d = reader.fetch64(lengths - 16) * _K2
+    y = _rotate_right(a + b, 43) + _rotate_right(c, 30) + d
+    return _hash_len_16(y, a + _rotate_right(b + _K2, 18) + c, mul)
+
+
+def _farmhash_len_33_to_64(reader):
+    lengths = reader.lengths
+    zeros = lengths * 0
+    mul = _K2 + lengths * 2
+    a = reader.fetch64(zeros) * _K2
+    b = reader.fetch64(zeros + 8)
+    c = reader.fetch64(lengths - 8) * mul
+    d = reader.fetch64(lengths - 16) * _K2
+    y = _rotate_right(a + b, 43) + _rotate_right(c, 30) + d
+    z = _hash_len_16(y, a + _rotate_right(b + _K2, 18) + c, mul)
+    e = reader.fetch64(zeros + 16) * mul
+    f = reader.fetch64(zeros + 24)
+    g = (y + reader.fetch64(lengths - 32)) * mul
+    h = (z + reader.fetch64(lengths - 24)) * mul
+    return _hash_len_16(
+        _rotate_right(e + f, 43) + _rotate_right(g, 30) + h,
+        e + _rotate_right(f + a, 18) + g,
+        mul,
+    )
+
+
+def _farmhash_long(reader):
+    """FarmHash of strings of more than 64 bytes."""
+    lengths = reader.lengths
+    fetch64 = reader.fetch64
+
+    def weak_hash_len_32_with_seeds(offsets, a, b):
+        w = fetch64(offsets)
+        x = fetch64(offsets + 8)
+        y = fetch64(offsets + 16)
+        z = fetch64(offsets + 24)
+        a = a + w
+        b = _rotate_right(b + a + z, 21)
+        c = a
+        a = a + x + y
+        b = b + _rotate_right(a, 44)
+        return a + z, b + c
+
+    zeros = lengths * 0
+    x = zeros + _SEED
+    y = zeros + _to_int64(_SEED * _K1 + 113)
+    z = _shift_mix(y * _K2 + 113) * _K2
+    v0 = v1 = w0 = w1 = zeros
+    x = x * _K2 + fetch64(zeros)
+
+    # All rows run the loop over 64-byte chunks for the same number of
+    # iterations, and only update their state while they have chunks left.
+    num_chunks = (lengths - 1) // 64
+    for i in range(int(num_chunks.max())):
+        offsets = zeros + 64 * i
+        new_x = _rotate_right(x + y + v0 + fetch64(offsets + 8), 37) * _K1
+        new_y = _rotate_right(y + v1 + fetch64(offsets + 48), 42) * _K1
+        new_x = new_x ^ w1
+        new_y = new_y + v0 + fetch64(offsets + 40)
+        new_z = _rotate_right(z + w0, 33) * _K1
+        new_v0, new_v1 = weak_hash_len_32_with_seeds(
+            offsets, v1 * _K1, new_x + w0
+        )
+        new_w0, new_w1 = weak_hash_len_32_with_seeds(
+            offsets + 32, new_z + w1, new_y + fetch64(offsets + 16)
+        )
+        new_x, new_z = new_z, new_x
+        active = num_chunks > i
+        x, y, z, v0, v1, w0, w1 = [
+            np.where(active, new, old)
+            for new, old in zip(
+                (new_x, new_y, new_z, new_v0, new_v1, new_w0, new_w1),
+                (x, y, z, v0, v1, w0, w1),
+            )
+        ]
+
+    # The last 64 bytes.
+    offsets = lengths - 64
+    mul = _K1 + ((z & 0xFF) << 1)
+    w0 = w0 + ((lengths - 1) & 63)
+    v0 = v0 + w0
+    w0 = w0 + v0
+    x = _rotate_right(x + y + v0 + fetch64(offsets + 8), 37) * mul
+    y = _rotate_right(y + v1 + fetch64(offsets + 48), 42) * mul
+    x = x ^ (w1 * 9)
+    y = y + v0 * 9 + fetch64(offsets + 40)
+    z = _rotate_right(z + w0, 33) * mul
+    v0, v1 = weak_hash_len_32_with_seeds(offsets, v1 * mul, x + w0)
+    w0, w1 = weak_hash_len_32_with_seeds(
+        offsets + 32, z + w1, y + fetch64(offsets + 16)
+    )
+    x, z = z, x
+    return _hash_len_16(
+        _hash_len_16(v0, w0, mul) + _shift_mix(y) * _K0 + z,
+        _hash_len_16(v1, w1, mul) + x,
+        mul,
+    )
+
+
+def _sip_round(v0, v1, v2, v3):
+    v0 = v0 + v1
+    v1 = _rotate_left(v1, 13) ^ v0
+    v0 = _rotate_left(v0, 32)
+    v2 = v2 + v3
+    v3 = _rotate_left(v3, 16) ^ v2
+    v0 = v0 + v3
+    v3 = _rotate_left(v3, 21) ^ v0
+    v2 = v2 + v1
+    v1 = _rotate_left(v1, 17) ^ v2
+    v2 = _rotate_left(v2, 32)
+    return v0, v1, v2, v3
+
+
+def _sip_compress(v0, v1, v2, v3, block, num_rounds):
+    v3 = v3 ^ block
+    for _ in range(num_rounds):
+        v0, v1, v2, v3 = _sip_round(v0, v1, v2, v3)
+    v0 = v0 ^ block
+    return v0, v1, v2, v3
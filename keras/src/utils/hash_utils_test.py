@@ -0,0 +1,68 @@
+import numpy as np
+import tensorflow as tf
+
+from keras.src import backend
+from keras.src import testing
+from keras.src.utils import hash_utils
+
+
+class HashUtilsTest(testing.TestCase):
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(1337)
+        # Strings of all lengths exercise all the branches of FarmHash.
+        self.strings = [
+            rng.integers(1, 256, size=length, dtype="uint8").tobytes()
+            for length in list(range(150)) + [300, 1000]
+        ]
+        self.integers = np.concatenate(
+            [
+                [0, 1, -1, 9, 10, -10, 2**63 - 1, -(2**63)],
+                rng.integers(-(2**63), 2**63 - 1, size=100),
+            ]
+        ).astype("int64")
+
+    def test_fingerprint64(self):
+        expected = tf.fingerprint(self.strings).numpy().view("<u8")
+        hashes = hash_utils.fingerprint64(np.array(self.strings, "object"))
+        self.assertAllEqual(hashes.view("uint64"), expected.reshape(-1))
+
+    def test_hash_buckets(self):
+        strings = np.array(self.strings, "object")
+        for num_bins in (1, 3, 2**62 + 7):
+            expected = tf.strings.to_hash_bucket_fast(self.strings, num_bins)
+            hashes = hash_utils.fingerprint64(strings)
+            self.assertAllEqual(
+                hash_utils.unsigned_mod(hashes, num_bins), expected
+            )
+            expected = tf.strings.to_hash_bucket_strong(
+                self.strings, num_bins, key=[133, 2**63 - 1]
+            )
+            hashes = hash_utils.siphash64(strings, [133, 2**63 - 1])
+            self.assertAllEqual(
+                hash_utils.unsigned_mod(hashes, num_bins), expected
+            )
+
+    def test_integers(self):
+        strings = tf.as_string(self.integers)
+        expected = tf.strings.to_hash_bucket_fast(strings, 2**62 + 7)
+        hashes = hash_utils.fingerprint64(self.integers)
+        self.assertAllEqual(
+            hash_utils.unsigned_mod(hashes, 2**62 + 7), expected
+        )
+        expected = tf.strings.to_hash_bucket_strong(
+            strings, 2**62 + 7, key=[1, 2]
+        )
+        hashes = hash_utils.siphash64(self.integers, [1, 2])
+        self.assertAllEqual(
+            hash_utils.unsigned_mod(hashes, 2**62 + 7), expected
+        )
+
+        if hash_utils.backend_supports_int64():
+            integers = backend.convert_to_tensor(self.integers)
+            hashes = hash_utils.fingerprint64(integers, xnp=backend.numpy)
+            self.assertAllEqual(hashes, hash_utils.fingerprint64(self.integers))
+            hashes = hash_utils.siphash64(integers, [1, 2], xnp=backend.numpy)
+            self.assertAllEqual(
+                hashes, hash_utils.siphash64(self.integers, [1, 2])
+            )
@@ -1,5 +1,6 @@
 import numpy as np
 
+from keras.src import backend
 from keras.src.api_export import keras_export
 from keras.src.backend.config import standardize_data_format
 from keras.src.utils import dataset_utils
@@ -33,8 +34,9 @@ def image_dataset_from_directory(
     pad_to_aspect_ratio=False,
     data_format=None,
     verbose=True,
+    format="tf",
 ):
-    """Generates a `tf.data.Dataset` from image files in a directory.
+    """Generates a dataset from image files in a directory.
 
     If your directory structure is:
 
@@ -127,10 +129,20 @@ def image_dataset_from_directory(
             otherwise either 'channel_last' or 'channel_first'.
         verbose: Whether to display number information on classes and
             number of files found. Defaults to `True`.
+        format: The format of the return object. One of `"tf"` or
+            `"py_dataset"`. `"tf"` returns a `tf.data.Dataset`.
+            `"py_dataset"` returns a `keras.utils.PyDataset` that decodes
+            images with Pillow and resizes them with the current Keras
+            backend, so it does not require TensorFlow. Images within a
+            batch are decoded in a thread pool; batches can further be
+            loaded in parallel by setting the `workers` and
+            `use_multiprocessing` attributes of the returned dataset.
+            Defaults to `"tf"`.
 
     Returns:
 
-    A `tf.data.Dataset` object.
+    A `tf.data.Dataset` object, or a `keras.utils.PyDataset` if
+    `format="py_dataset"`.
 
     - If `label_mode` is `None`, it yields `float32` tensors of shape
         `(batch_size, image_size[0], image_size[1], num_channels)`,
@@ -182,6 +194,11 @@ def image_dataset_from_directory(
             '"categorical", "binary", '
             f"or None. Received: label_mode={label_mode}"
         )
+    if format not in ("tf", "py_dataset"):
+        raise ValueError(
+            '`format` should be either "tf" or "py_dataset". '
+            f"Received: format={format}"
+        )
     if labels is None or label_mode is None:
         labels = None
         label_mode = None
@@ -244,6 +261,23 @@ def image_dataset_from_directory(
     else:
         shuffle_buffer_size = 1024
 
+    if format == "tf":
+        to_dataset_fn = paths_and_labels_to_dataset
+    else:
+        to_dataset_fn = paths_and_labels_to_py_dataset
+    dataset_kwargs = dict(
+        image_size=image_size,
+        num_channels=num_channels,
+        label_mode=label_mode,
+        num_classes=len(class_names) if class_names else 0,
+        interpolation=interpolation,
+        crop_to_aspect_ratio=crop_to_aspect_ratio,
+        pad_to_aspect_ratio=pad_to_aspect_ratio,
+        data_format=data_format,
+    )
+    if format == "py_dataset":
+        dataset_kwargs["batch_size"] = batch_size
+
     if subset == "both":
         (
             image_paths_train,
@@ -267,42 +301,29 @@ def image_dataset_from_directory(
                 f"No validation images found in directory {directory}. "
                 f"Allowed formats: {ALLOWLIST_FORMATS}"
             )
-        train_dataset = paths_and_labels_to_dataset(
+        train_dataset = to_dataset_fn(
             image_paths=image_paths_train,
-            image_size=image_size,
-            num_channels=num_channels,
             labels=labels_train,
-            label_mode=label_mode,
-            num_classes=len(class_names) if class_names else 0,
-            interpolation=interpolation,
-            crop_to_aspect_ratio=crop_to_aspect_ratio,
-            pad_to_aspect_ratio=pad_to_aspect_ratio,
-            data_format=data_format,
             shuffle=shuffle,
             shuffle_buffer_size=shuffle_buffer_size,
             seed=seed,
+            **dataset_kwargs,
         )
 
-        val_dataset = paths_and_labels_to_dataset(
+        val_dataset = to_dataset_fn(
             image_paths=image_paths_val,
-            image_size=image_size,
-            num_channels=num_channels,
             labels=labels_val,
-            label_mode=label_mode,
-            num_classes=len(class_names) if class_names else 0,
-            interpolation=interpolation,
-            crop_to_aspect_ratio=crop_to_aspect_ratio,
-            pad_to_aspect_ratio=pad_to_aspect_ratio,
-            data_format=data_format,
             shuffle=False,
+            **dataset_kwargs,
         )
 
-        if batch_size is not None:
-            train_dataset = train_dataset.batch(batch_size)
-            val_dataset = val_dataset.batch(batch_size)
+        if format == "tf":
+            if batch_size is not None:
+                train_dataset = train_dataset.batch(batch_size)
+                val_dataset = val_dataset.batch(batch_size)
 
-        train_dataset = train_dataset.prefetch(tf.data.AUTOTUNE)
-        val_dataset = val_dataset.prefetch(tf.data.AUTOTUNE)
+            train_dataset = train_dataset.prefetch(tf.data.AUTOTUNE)
+            val_dataset = val_dataset.prefetch(tf.data.AUTOTUNE)
 
         # Users may need to reference `class_names`.
         train_dataset.class_names = class_names
@@ -323,26 +344,20 @@ def image_dataset_from_directory(
                 f"Allowed formats: {ALLOWLIST_FORMATS}"
             )
 
-        dataset = paths_and_labels_to_dataset(
+        dataset = to_dataset_fn(
             image_paths=image_paths,
-            image_size=image_size,
-            num_channels=num_channels,
             labels=labels,
-            label_mode=label_mode,
-            num_classes=len(class_names) if class_names else 0,
-            interpolation=interpolation,
-            crop_to_aspect_ratio=crop_to_aspect_ratio,
-            pad_to_aspect_ratio=pad_to_aspect_ratio,
-            data_format=data_format,
             shuffle=shuffle,
             shuffle_buffer_size=shuffle_buffer_size,
             seed=seed,
+            **dataset_kwargs,
         )
 
-        if batch_size is not None:
-            dataset = dataset.batch(batch_size)
+        if format == "tf":
+            if batch_size is not None:
+                dataset = dataset.batch(batch_size)
 
-        dataset = dataset.prefetch(tf.data.AUTOTUNE)
+            dataset = dataset.prefetch(tf.data.AUTOTUNE)
         # Users may need to reference `class_names`.
         dataset.class_names = class_names
 
@@ -449,3 +464,92 @@ def load_image(
     else:
         img.set_shape((num_channels, image_size[0], image_size[1]))
     return img
+
+
+def paths_and_labels_to_py_dataset(
+    image_paths,
+    image_size,
+    num_channels,
+    labels,
+    label_mode,
+    num_classes,
+    interpolation,
+    data_format,
+    batch_size=None,
+    crop_to_aspect_ratio=False,
+    pad_to_aspect_ratio=False,
+    shuffle=False,
+    shuffle_buffer_size=None,
+    seed=None,
+):
+    """Constructs a `PyDataset` of images and labels.
+
+    This is the TensorFlow-free counterpart of `paths_and_labels_to_dataset()`.
+    Since the `PyDataset` has random access to all samples, shuffling is
+    global (the whole index is reshuffled at the end of every epoch) and
+    `shuffle_buffer_size` is ignored.
+    """
+    from keras.src.utils.image_py_dataset import ImagePyDataset
+
+    if label_mode:
+        labels = dataset_utils.labels_to_numpy(labels, label_mode, num_classes)
+    else:
+        labels = None
+    return ImagePyDataset(
+        image_paths,
+        labels,
+        batch_size=batch_size,
+        image_size=image_size,
+        num_channels=num_channels,
+        interpolation=interpolation,
+        data_format=data_format,
+        crop_to_aspect_ratio=crop_to_aspect_ratio,
+        pad_to_aspect_ratio=pad_to_aspect_ratio,
+        shuffle=shuffle,
+        seed=seed,
+    )
+
+
+def load_image_numpy(
+    path,
+    image_size,
+    num_channels,
+    interpolation,
+    data_format,
+    crop_to_aspect_ratio=False,
+    pad_to_aspect_ratio=False,
+):
+    """Load an image from a path and resize it, without TensorFlow.
+
+    The image is decoded with Pillow and resized with the current backend.
+
+    Returns:
+        A `float32` NumPy array.
+    """
+    color_mode = {1: "grayscale", 3: "rgb", 4: "rgba"}[num_channels]
+    img = image_utils.load_img(path, color_mode=color_mode)
+    if color_mode == "grayscale" and img.mode != "L":
+        img = img.convert("L")
+    img = np.asarray(img, dtype="float32")
+    if img.ndim == 2:
+        img = np.expand_dims(img, axis=-1)
+
+    if crop_to_aspect_ratio:
+        img = image_utils.smart_resize(
+            img,
+            image_size,
+            interpolation=interpolation,
+            data_format="channels_last",
+        )
+    else:
+        img = backend.image.resize(
+            img,
+            image_size,
+            interpolation=interpolation,
+            pad_to_aspect_ratio=pad_to_aspect_ratio,
+            data_format="channels_last",
+        )
+        img = backend.convert_to_numpy(img)
+    if data_format == "channels_first":
+        img = np.transpose(img, (2, 0, 1))
+    return img.astype("float32", copy=False)
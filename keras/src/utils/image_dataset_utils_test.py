@@ -1,9 +1,11 @@
+import gc
 import os
 
 import numpy as np
 
 from keras.src import backend
 from keras.src import testing
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.utils import image_dataset_utils
 from keras.src.utils import image_utils
 from keras.src.utils.module_utils import tensorflow as tf
@@ -531,3 +533,144 @@ class ImageDatasetFromDirectoryTest(testing.TestCase):
             batches_1_alt.append(b)
         batches_1_alt = np.concatenate(batches_1_alt, axis=0)
         self.assertAllClose(batches_1, batches_1_alt, atol=1e-6)
+
+    def test_image_dataset_from_directory_py_dataset(self):
+        directory = self._prepare_directory(num_classes=2, count=10)
+        if backend.config.image_data_format() == "channels_last":
+            output_shape = (4, 18, 18, 3)
+        else:
+            output_shape = (4, 3, 18, 18)
+        for label_mode, label_shape, label_dtype in (
+            ("int", (4,), "int32"),
+            ("binary", (4, 1), "float32"),
+            ("categorical", (4, 2), "float32"),
+        ):
+            dataset = image_dataset_utils.image_dataset_from_directory(
+                directory,
+                batch_size=4,
+                image_size=(18, 18),
+                label_mode=label_mode,
+                format="py_dataset",
+            )
+            self.assertIsInstance(dataset, PyDataset)
+            self.assertEqual(dataset.class_names, ["class_0", "class_1"])
+            self.assertLen(dataset.file_paths, 10)
+            self.assertLen(dataset, 3)
+            batch = dataset[0]
+            self.assertLen(batch, 2)
+            self.assertEqual(batch[0].shape, output_shape)
+            self.assertEqual(batch[0].dtype.name, "float32")
+            self.assertEqual(batch[1].shape, label_shape)
+            self.assertEqual(batch[1].dtype.name, label_dtype)
+            # Last batch is partial.
+            self.assertEqual(dataset[2][0].shape[0], 2)
+
+        dataset = image_dataset_utils.image_dataset_from_directory(
+            directory,
+            batch_size=None,
+            image_size=(18, 18),
+            label_mode=None,
+            format="py_dataset",
+        )
+        self.assertLen(dataset, 10)
+        self.assertEqual(dataset[0].shape, output_shape[1:])
+
+    def test_image_dataset_from_directory_py_dataset_matches_files(self):
+        directory = self._prepare_directory(num_classes=2, count=6)
+        dataset = image_dataset_utils.image_dataset_from_directory(
+            directory,
+            batch_size=3,
+            image_size=(24, 24),
+            color_mode="rgb",
+            shuffle=False,
+            format="py_dataset",
+        )
+        images = np.concatenate([dataset[i][0] for i in range(len(dataset))])
+        labels = np.concatenate([dataset[i][1] for i in range(len(dataset))])
+        for image, label, path in zip(images, labels, dataset.file_paths):
+            expected = image_utils.img_to_array(image_utils.load_img(path))
+            self.assertAllClose(image, expected, atol=1e-4)
+            self.assertIn(f"class_{label}", path)
+
+    def test_image_dataset_from_directory_py_dataset_split_and_shuffle(self):
+        directory = self._prepare_directory(num_classes=2, count=10)
+        train_dataset, val_dataset = (
+            image_dataset_utils.image_dataset_from_directory(
+                directory,
+                batch_size=10,
+                image_size=(18, 18),
+                validation_split=0.2,
+                subset="both",
+                seed=1337,
+                format="py_dataset",
+            )
+        )
+        self.assertEqual(train_dataset[0][0].shape[0], 8)
+        self.assertEqual(val_dataset[0][0].shape[0], 2)
+        self.assertLen(
+            set(train_dataset.file_paths) & set(val_dataset.file_paths), 0
+        )
+
+        # Samples are reshuffled at the end of each epoch.
+        epoch_1 = train_dataset[0][0]
+        train_dataset.on_epoch_end()
+        epoch_2 = train_dataset[0][0]
+        self.assertNotAllClose(epoch_1, epoch_2)
+        self.assertAllClose(
+            np.sort(epoch_1.reshape(8, -1), axis=0),
+            np.sort(epoch_2.reshape(8, -1), axis=0),
+        )
+        # The validation set is never shuffled.
+        val_1 = val_dataset[0][0]
+        val_dataset.on_epoch_end()
+        self.assertAllClose(val_1, val_dataset[0][0])
+
+    def test_image_dataset_from_directory_py_dataset_closes_pool(self):
+        directory = self._prepare_directory(num_classes=2, count=4)
+        dataset = image_dataset_utils.image_dataset_from_directory(
+            directory,
+            batch_size=4,
+            image_size=(18, 18),
+            format="py_dataset",
+        )
+        dataset[0]
+        pool = dataset._pool
+        self.assertIsNotNone(pool)
+        dataset.on_epoch_end()
+        self.assertIsNone(dataset._pool)
+        with self.assertRaises(ValueError):
+            pool.apply(len, ([],))
+        # The pool is recreated for the next epoch.
+        self.assertEqual(dataset[0][0].shape[0], 4)
+
+        pool = dataset._pool
+        del dataset
+        gc.collect()
+        with self.assertRaises(ValueError):
+            pool.apply(len, ([],))
+
+    def test_image_dataset_from_directory_py_dataset_aspect_ratio(self):
+        directory = self._prepare_directory(num_classes=2, count=5)
+        if backend.config.image_data_format() == "channels_last":
+            output_shape = (5, 18, 12, 3)
+        else:
+            output_shape = (5, 3, 18, 12)
+        for kwargs in (
+            {"crop_to_aspect_ratio": True},
+            {"pad_to_aspect_ratio": True},
+        ):
+            dataset = image_dataset_utils.image_dataset_from_directory(
+                directory,
+                batch_size=5,
+                image_size=(18, 12),
+                format="py_dataset",
+                **kwargs,
+            )
+            self.assertEqual(dataset[0][0].shape, output_shape)
+
+    def test_image_dataset_from_directory_invalid_format(self):
+        directory = self._prepare_directory(num_classes=2, count=2)
+        with self.assertRaisesRegex(ValueError, "`format` should be"):
+            image_dataset_utils.image_dataset_from_directory(
+                directory, format="grain"
+            )
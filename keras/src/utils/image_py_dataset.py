@@ -0,0 +1,140 @@
+"""TensorFlow-free `PyDataset` used by `image_dataset_from_directory`.
+
+This lives in its own module (rather than in `image_dataset_utils`) because
+`keras.src.utils` is imported while the backend is initialized, before
+`PyDataset` can be imported.
+"""
+
+import os
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
+
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
+from keras.src.utils import image_dataset_utils
+
+
+class ImagePyDataset(PyDataset):
+    """`PyDataset` decoding and resizing image files with Pillow and NumPy.
+
+    Images of a batch are decoded in a thread pool (Pillow releases the GIL
+    while decoding) and resized with the current Keras backend.
+
+    Args:
+        image_paths: List of image file paths.
+        labels: NumPy array of encoded labels (one row per path), or `None`.
+        batch_size: Number of samples per batch. If `None`, every item of
+            the dataset is a single (unbatched) sample.
+        image_size, num_channels, interpolation, data_format,
+        crop_to_aspect_ratio, pad_to_aspect_ratio: See
+            `image_dataset_utils.load_image_numpy()`.
+        shuffle: Whether to reshuffle the samples at the end of each epoch.
+        seed: Optional random seed for shuffling.
+        **kwargs: Base `PyDataset` arguments (`workers`,
+            `use_multiprocessing`, `max_queue_size`).
+    """
+
+    def __init__(
+        self,
+        image_paths,
+        labels,
+        batch_size,
+        image_size,
+        num_channels,
+        interpolation,
+        data_format,
+        crop_to_aspect_ratio=False,
+        pad_to_aspect_ratio=False,
+        shuffle=False,
+        seed=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if pad_to_aspect_ratio and crop_to_aspect_ratio:
+            raise ValueError(
+                "Only one of `pad_to_aspect_ratio`, `crop_to_aspect_ratio`"
+                " can be set to `True`."
+            )
+        self.image_paths = list(image_paths)
+        self.labels = labels
+        self.batch_size = batch_size
+        self.image_size = tuple(image_size)
+        self.num_channels = num_channels
+        self.interpolation = interpolation
+        self.data_format = data_format
+        self.crop_to_aspect_ratio = crop_to_aspect_ratio
+        self.pad_to_aspect_ratio = pad_to_aspect_ratio
+        self.shuffle = shuffle
+        self._rng = np.random.default_rng(seed)
+        self._indices = np.arange(len(self.image_paths))
+        self._pool = None
+
+    def __len__(self):
+        if self.batch_size is None:
+            return len(self.image_paths)
+        return -(-len(self.image_paths) // self.batch_size)
+
+    def __getitem__(self, index):
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Index {index} out of range.")
+        if self.batch_size is None:
+            indices = self._indices[index : index + 1]
+        else:
+            start = index * self.batch_size
+            indices = self._indices[start : start + self.batch_size]
+
+        paths = [self.image_paths[i] for i in indices]
+        if len(paths) > 1:
+            if self._pool is None:
+                self._pool = ThreadPool(
+                    min(self.batch_size, os.cpu_count() or 1)
+                )
+            images = self._pool.map(self._load_image, paths)
+        else:
+            images = [self._load_image(path) for path in paths]
+        images = np.stack(images)
+
+        if self.batch_size is None:
+            images = images[0]
+            if self.labels is None:
+                return images
+            return images, self.labels[indices[0]]
+        if self.labels is None:
+            return images
+        return images, self.labels[indices]
+
+    def _load_image(self, path):
+        return image_dataset_utils.load_image_numpy(
+            path,
+            self.image_size,
+            self.num_channels,
+            self.interpolation,
+            self.data_format,
+            crop_to_aspect_ratio=self.crop_to_aspect_ratio,
+            pad_to_aspect_ratio=self.pad_to_aspect_ratio,
+        )
+
+    def on_epoch_end(self):
+        # Release the worker threads between epochs; the pool is recreated
+        # lazily by the next `__getitem__()` call.
+        self._close_pool()
+        if self.shuffle:
+            self._rng.shuffle(self._indices)
+
+    def _close_pool(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __del__(self):
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.terminate()
+
+    def __getstate__(self):
+        # Thread pools can't be pickled (e.g. with
+        # `use_multiprocessing=True`); they are recreated lazily.
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
@@ -134,6 +134,23 @@ def encode_categorical_inputs(
         # We need to update `rank_of_inputs` if necessary.
         inputs = backend_module.numpy.expand_dims(inputs, -1)
 
+    if output_mode in ("multi_hot", "count") and _supports_dense_counts(
+        inputs, sparse
+    ):
+        # Accumulate the counts directly into a `(..., depth)` tensor instead
+        # of reducing a `(..., length, depth)` one-hot encoding, which is
+        # prohibitively large for large `depth` (e.g. hashed features).
+        if output_mode == "multi_hot":
+            counts = _dense_counts(inputs, depth, None, "int32", backend_module)
+            return backend_module.cast(
+                backend_module.numpy.greater(counts, 0), dtype
+            )
+        if count_weights is not None:
+            dtype = count_weights.dtype
+        return _dense_counts(
+            inputs, depth, count_weights, dtype, backend_module
+        )
+
     if output_mode == "multi_hot":
         return backend_module.nn.multi_hot(
             inputs, depth, dtype=dtype, sparse=sparse
@@ -173,3 +190,135 @@ def encode_categorical_inputs(
             axis=reduction_axis,
         )
         return outputs
+
+
+def _supports_dense_counts(inputs, sparse):
+    """Whether `_dense_counts` can encode `inputs`."""
+    from keras.src.trainers.data_adapters import data_adapter_utils
+
+    return (
+        not sparse
+        and len(inputs.shape) in (1, 2)
+        and not data_adapter_utils.is_tensorflow_sparse(inputs)
+        and not data_adapter_utils.is_tensorflow_ragged(inputs)
+        and not data_adapter_utils.is_jax_sparse(inputs)
+    )
+
+
+def encode_categorical_indices_and_weights(
+    inputs,
+    output_mode,
+    depth,
+    dtype,
+    count_weights=None,
+    backend_module=None,
+):
+    """Encodes categorical inputs as indices and weights.
+
+    This returns the `"multi_hot"` or `"count"` encoding of `inputs` as a
+    pair `(indices, weights)` of tensors with the same shape as `inputs`,
+    instead of a `(..., depth)` tensor: the encoding of a sample is the sum of
+    its `weights` scattered at its `indices`. This is the input of an
+    embedding-bag style reduction,
+    `sum(weights[..., None] * take(embeddings, indices, axis=0), axis=-2)`,
+    which is equivalent to multiplying the dense encoding by `embeddings`
+    without materializing it.
+
+    In `"multi_hot"` mode, the values of each sample are sorted, and their
+    repetitions get an index and a weight of zero. So do values outside of
+    `[0, depth)`.
+
+    Args:
+        inputs: the 1D or 2D dense inputs to encode.
+        output_mode: one of `"multi_hot"` or `"count"`.
+        depth: number of classes.
+        dtype: the dtype of the weights, unless `count_weights` is not
+            `None`.
+        count_weights: weights to apply if `output_mode` is `"count"`.
+        backend_module: the backend to use instead of the current one.
+    Returns: a tuple `(indices, weights)`, where `indices` has dtype
+        `"int32"`.
+    """
+    backend_module = backend_module or backend
+    if output_mode not in ("multi_hot", "count"):
+        raise ValueError(
+            "Indices and weights are only supported for `output_mode` "
+            f"`'multi_hot'` or `'count'`. Received: output_mode={output_mode}"
+        )
+    if len(backend_module.shape(inputs)) == 0:
+        inputs = backend_module.numpy.expand_dims(inputs, -1)
+    if not _supports_dense_counts(inputs, sparse=False):
+        raise ValueError(
+            "Indices and weights are only supported for dense 1D or 2D "
+            f"inputs. Received: inputs={inputs}"
+        )
+
+    xnp = backend_module.numpy
+    if output_mode == "multi_hot":
+        # Only the first occurrence of a value in a sorted sample is kept.
+        inputs = xnp.sort(inputs, axis=-1)
+        first = xnp.concatenate(
+            [
+                xnp.ones_like(inputs[..., :1], dtype="bool"),
+                xnp.not_equal(inputs[..., 1:], inputs[..., :-1]),
+            ],
+            axis=-1,
+        )
+        count_weights = None
+    elif count_weights is not None:
+        dtype = count_weights.dtype
+    # The range is checked before casting, since the cast would wrap large
+    # int64 values into `[0, depth)`.
+    valid = xnp.logical_and(
+        xnp.greater_equal(inputs, 0), xnp.less(inputs, depth)
+    )
+    if output_mode == "multi_hot":
+        valid = xnp.logical_and(valid, first)
+
+    if count_weights is None:
+        weights = backend_module.cast(valid, dtype)
+    else:
+        weights = xnp.where(valid, backend_module.cast(count_weights, dtype), 0)
+    indices = backend_module.cast(xnp.where(valid, inputs, 0), "int32")
+    return indices, weights
+
+
+def _dense_counts(inputs, depth, weights, dtype, backend_module):
+    """Counts the values of a 1D or 2D `inputs` tensor along its last axis.
+
+    Values outside of `[0, depth)` are ignored, like in a one-hot encoding.
+
+    Args:
+        inputs: 1D or 2D integer tensor.
+        depth: number of classes, the last dimension of the output.
+        weights: optional tensor of the same shape as `inputs`, the values
+            to sum instead of counts.
+        dtype: the dtype of the output.
+        backend_module: the backend to use.
+
+    Returns: a tensor of shape `inputs.shape[:-1] + (depth,)`.
+    """
+    xnp = backend_module.numpy
+    indices, values = encode_categorical_indices_and_weights(
+        inputs,
+        "count",
+        depth,
+        dtype,
+        count_weights=weights,
+        backend_module=backend_module,
+    )
+
+    if len(inputs.shape) == 1:
+        return backend_module.core.scatter(
+            xnp.expand_dims(indices, -1), values, (depth,)
+        )
+    input_shape = backend_module.core.shape(inputs)
+    batch_indices = xnp.broadcast_to(
+        xnp.expand_dims(xnp.arange(input_shape[0], dtype="int32"), -1),
+        input_shape,
+    )
+    return backend_module.core.scatter(
+        xnp.stack([batch_indices, indices], axis=-1),
+        values,
+        (input_shape[0], depth),
+    )
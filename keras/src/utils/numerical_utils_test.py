@@ -72,3 +72,131 @@ class TestNumericalUtils(testing.TestCase, parameterized.TestCase):
         out = numerical_utils.normalize(xb, axis=-1, order=order)
         self.assertTrue(backend.is_tensor(out))
         self.assertAllClose(backend.convert_to_numpy(out), expected)
+
+    @parameterized.named_parameters(
+        ("multi_hot", "multi_hot", None, [[0, 1, 1, 0], [1, 0, 0, 1]]),
+        ("count", "count", None, [[0, 1, 2, 0], [2, 0, 0, 1]]),
+        (
+            "weighted_count",
+            "count",
+            [[0.5, 1.0, 2.0, 3.0], [1.0, 2.0, 3.0, 4.0]],
+            [[0, 0.5, 3.0, 0], [4.0, 0, 0, 2.0]],
+        ),
+    )
+    def test_encode_categorical_inputs(self, output_mode, weights, expected):
+        # Values outside of `[0, depth)` are ignored.
+        inputs = backend.convert_to_tensor([[1, 2, 2, 4], [0, 3, 0, -1]])
+        if weights is not None:
+            weights = backend.convert_to_tensor(weights)
+        outputs = numerical_utils.encode_categorical_inputs(
+            inputs,
+            output_mode=output_mode,
+            depth=4,
+            dtype="float32",
+            count_weights=weights,
+        )
+        self.assertEqual(backend.standardize_dtype(outputs.dtype), "float32")
+        self.assertAllClose(outputs, expected)
+
+        # Unbatched inputs.
+        outputs = numerical_utils.encode_categorical_inputs(
+            inputs[0],
+            output_mode=output_mode,
+            depth=4,
+            dtype="float32",
+            count_weights=None if weights is None else weights[0],
+        )
+        self.assertAllClose(outputs, expected[0])
+
+    @parameterized.named_parameters(
+        ("multi_hot", "multi_hot", None, [[0, 1, 1, 0], [1, 0, 0, 1]]),
+        ("count", "count", None, [[0, 1, 2, 0], [2, 0, 0, 1]]),
+        (
+            "weighted_count",
+            "count",
+            [[0.5, 1.0, 2.0, 3.0], [1.0, 2.0, 3.0, 4.0]],
+            [[0, 0.5, 3.0, 0], [4.0, 0, 0, 2.0]],
+        ),
+    )
+    def test_encode_categorical_indices_and_weights(
+        self, output_mode, weights, expected
+    ):
+        inputs = backend.convert_to_tensor([[1, 2, 2, 4], [0, 3, 0, -1]])
+        if weights is not None:
+            weights = backend.convert_to_tensor(weights)
+        indices, outputs = (
+            numerical_utils.encode_categorical_indices_and_weights(
+                inputs,
+                output_mode=output_mode,
+                depth=4,
+                dtype="float32",
+                count_weights=weights,
+            )
+        )
+        self.assertEqual(backend.standardize_dtype(indices.dtype), "int32")
+        self.assertEqual(backend.standardize_dtype(outputs.dtype), "float32")
+        indices = backend.convert_to_numpy(indices)
+        outputs = backend.convert_to_numpy(outputs)
+        self.assertEqual(indices.shape, (2, 4))
+        # Scattering the weights at the indices gives the dense encoding.
+        dense = np.zeros((2, 4))
+        np.add.at(dense, (np.arange(2)[:, None], indices), outputs)
+        self.assertAllClose(dense, expected)
+        # Out of range and repeated values get a zero weight.
+        if output_mode == "multi_hot":
+            # The values of each sample are sorted.
+            self.assertAllClose(outputs, [[1, 1, 0, 0], [0, 1, 0, 1]])
+        else:
+            self.assertAllClose(outputs[:, -1] == 0, [True, True])
+
+        indices, outputs = (
+            numerical_utils.encode_categorical_indices_and_weights(
+                inputs[0],
+                output_mode=output_mode,
+                depth=4,
+                dtype="float32",
+                count_weights=None if weights is None else weights[0],
+            )
+        )
+        dense = np.zeros((4,))
+        np.add.at(
+            dense,
+            backend.convert_to_numpy(indices),
+            backend.convert_to_numpy(outputs),
+        )
+        self.assertAllClose(dense, expected[0])
+
+    @parameterized.named_parameters(
+        ("multi_hot", "multi_hot", [[0, 1, 0, 1], [1, 0, 1, 0]]),
+        ("count", "count", [[0, 2, 0, 1], [3, 0, 1, 0]]),
+    )
+    def test_encode_categorical_indices_and_weights_large_values(
+        self, output_mode, expected
+    ):
+        # Values wrapping into `[0, depth)` when cast to int32 are ignored.
+        inputs = backend.convert_to_tensor(
+            np.array(
+                [[2**32 + 1, 1, 3, 1, 2**32 + 1], [0, 2, 0, -(2**32), 0]],
+                dtype="int64",
+            )
+        )
+        if backend.standardize_dtype(inputs.dtype) != "int64":
+            self.skipTest("The backend doesn't support int64 tensors.")
+        indices, outputs = (
+            numerical_utils.encode_categorical_indices_and_weights(
+                inputs, output_mode=output_mode, depth=4, dtype="float32"
+            )
+        )
+        dense = np.zeros((2, 4))
+        np.add.at(
+            dense,
+            (np.arange(2)[:, None], backend.convert_to_numpy(indices)),
+            backend.convert_to_numpy(outputs),
+        )
+        self.assertAllClose(dense, expected)
+
+    def test_encode_categorical_indices_and_weights_invalid_mode(self):
+        with self.assertRaisesRegex(ValueError, "output_mode=one_hot"):
+            numerical_utils.encode_categorical_indices_and_weights(
+                np.array([0, 1]), "one_hot", depth=4, dtype="float32"
+            )
@@ -21,6 +21,7 @@ def timeseries_dataset_from_array(
     seed=None,
     start_index=None,
     end_index=None,
+    format="tf",
 ):
     """Creates a dataset of sliding windows over a timeseries provided as array.
 
@@ -61,10 +62,19 @@ def timeseries_dataset_from_array(
         end_index: Optional int; data points later (exclusive) than `end_index`
             will not be used in the output sequences.
             This is useful to reserve part of the data for test or validation.
+        format: The format of the return object. One of `"tf"` or
+            `"py_dataset"`. `"tf"` returns a `tf.data.Dataset`.
+            `"py_dataset"` returns a `keras.utils.PyDataset` that does not
+            require TensorFlow: windows are strided views over `data`
+            (no per-window copy), and only the samples of the requested batch
+            are materialized. With `shuffle=True`, the window start positions
+            are reshuffled at the end of every epoch.
+            Defaults to `"tf"`.
 
     Returns:
 
-    A `tf.data.Dataset` instance. If `targets` was passed, the dataset yields
+    A `tf.data.Dataset` instance, or a `keras.utils.PyDataset` if
+    `format="py_dataset"`. If `targets` was passed, the dataset yields
     tuple `(batch_of_sequences, batch_of_targets)`. If not, the dataset yields
     only `batch_of_sequences`.
 
@@ -133,6 +143,11 @@ def timeseries_dataset_from_array(
         break
     ```
     """
+    if format not in ("tf", "py_dataset"):
+        raise ValueError(
+            '`format` should be either "tf" or "py_dataset". '
+            f"Received: format={format}"
+        )
     if start_index:
         if start_index < 0:
             raise ValueError(
@@ -211,6 +226,22 @@ def timeseries_dataset_from_array(
         rng = np.random.RandomState(seed)
         rng.shuffle(start_positions)
 
+    if format == "py_dataset":
+        from keras.src.utils.timeseries_py_dataset import TimeseriesPyDataset
+
+        return TimeseriesPyDataset(
+            data,
+            targets,
+            start_positions,
+            sequence_length=sequence_length,
+            sampling_rate=sampling_rate,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            seed=seed,
+            start_index=start_index,
+            end_index=end_index,
+        )
+
     sequence_length = tf.cast(sequence_length, dtype=index_dtype)
     sampling_rate = tf.cast(sampling_rate, dtype=index_dtype)
 
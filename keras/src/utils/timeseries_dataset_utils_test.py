@@ -1,6 +1,7 @@
 import numpy as np
 
 from keras.src import testing
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
 from keras.src.utils import timeseries_dataset_utils
 
 
@@ -202,3 +203,82 @@ class TimeseriesDatasetTest(testing.TestCase):
         )
         sample = next(iter(dataset))
         self.assertEqual(len(sample.shape), 1)
+
+    def test_py_dataset_matches_tf(self):
+        data = np.random.random((120, 3)).astype("float32")
+        targets = np.arange(120)
+        for kwargs in (
+            dict(sequence_length=9, batch_size=5),
+            dict(sequence_length=4, sampling_rate=3, sequence_stride=2),
+            dict(sequence_length=5, batch_size=7, start_index=10, end_index=90),
+        ):
+            tf_dataset = timeseries_dataset_utils.timeseries_dataset_from_array(
+                data, targets, **kwargs
+            )
+            py_dataset = timeseries_dataset_utils.timeseries_dataset_from_array(
+                data, targets, format="py_dataset", **kwargs
+            )
+            self.assertIsInstance(py_dataset, PyDataset)
+            tf_batches = list(tf_dataset)
+            self.assertLen(py_dataset, len(tf_batches))
+            for i, (x, y) in enumerate(tf_batches):
+                py_x, py_y = py_dataset[i]
+                self.assertAllClose(py_x, x)
+                self.assertAllClose(py_y, y)
+
+    def test_py_dataset_windows_are_views(self):
+        data = np.arange(200, dtype="float32").reshape((100, 2))
+        dataset = timeseries_dataset_utils.timeseries_dataset_from_array(
+            data,
+            None,
+            sequence_length=10,
+            sampling_rate=2,
+            batch_size=8,
+            format="py_dataset",
+        )
+        self.assertTrue(np.shares_memory(dataset.windows, data))
+        batch = dataset[1]
+        self.assertEqual(batch.shape, (8, 10, 2))
+        self.assertFalse(np.shares_memory(batch, data))
+        self.assertAllClose(batch[0], data[8:27:2])
+
+    def test_py_dataset_shuffle(self):
+        data = np.arange(50)
+        targets = data * 2
+        dataset = timeseries_dataset_utils.timeseries_dataset_from_array(
+            data,
+            targets,
+            sequence_length=5,
+            batch_size=46,
+            shuffle=True,
+            seed=123,
+            format="py_dataset",
+        )
+        x, y = dataset[0]
+        self.assertNotAllClose(x[:, 0], np.arange(46))
+        self.assertAllClose(x[:, 0] * 2, y)
+        dataset.on_epoch_end()
+        x_2, y_2 = dataset[0]
+        self.assertNotAllClose(x_2, x)
+        self.assertAllClose(np.sort(x_2[:, 0]), np.arange(46))
+        self.assertAllClose(x_2[:, 0] * 2, y_2)
+
+        # Check determism with same seed
+        dataset = timeseries_dataset_utils.timeseries_dataset_from_array(
+            data,
+            targets,
+            sequence_length=5,
+            batch_size=46,
+            shuffle=True,
+            seed=123,
+            format="py_dataset",
+        )
+        self.assertAllClose(dataset[0][0], x)
+
+    def test_py_dataset_not_batched(self):
+        data = np.arange(100)
+        dataset = timeseries_dataset_utils.timeseries_dataset_from_array(
+            data, None, sequence_length=9, batch_size=None, format="py_dataset"
+        )
+        self.assertLen(dataset, 92)
+        self.assertAllClose(dataset[3], np.arange(3, 12))
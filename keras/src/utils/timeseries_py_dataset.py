@@ -0,0 +1,98 @@
+"""TensorFlow-free `PyDataset` used by `timeseries_dataset_from_array`.
+
+This lives in its own module (rather than in `timeseries_dataset_utils`)
+because `keras.src.utils` is imported while the backend is initialized,
+before `PyDataset` can be imported.
+"""
+
+import numpy as np
+
+from keras.src.trainers.data_adapters.py_dataset_adapter import PyDataset
+
+
+class TimeseriesPyDataset(PyDataset):
+    """`PyDataset` of sliding windows over a timeseries array.
+
+    All windows are exposed as a single strided view over `data` (built with
+    `np.lib.stride_tricks.sliding_window_view`), so no window is copied
+    until it is gathered into a batch.
+
+    Args:
+        data: Array-like of consecutive data points. Axis 0 is the time
+            dimension.
+        targets: Array-like of targets, or `None`. `targets[i]` is the target
+            of the window starting at index `i` (relative to `start_index`).
+        start_positions: 1D integer array of window start positions
+            (relative to `start_index`), in the order of the first epoch.
+        sequence_length: Length of the output sequences.
+        sampling_rate: Period between successive timesteps within sequences.
+        batch_size: Number of windows per batch. If `None`, every item of
+            the dataset is a single (unbatched) window.
+        shuffle: Whether to reshuffle the start positions at the end of each
+            epoch.
+        seed: Optional random seed for shuffling.
+        start_index: Index of the first data point used.
+        end_index: Index (exclusive) of the last data point used.
+        **kwargs: Base `PyDataset` arguments (`workers`,
+            `use_multiprocessing`, `max_queue_size`).
+    """
+
+    def __init__(
+        self,
+        data,
+        targets,
+        start_positions,
+        sequence_length,
+        sampling_rate=1,
+        batch_size=128,
+        shuffle=False,
+        seed=None,
+        start_index=0,
+        end_index=None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        # `np.asarray` does not copy NumPy arrays (including memmaps).
+        data = np.asarray(data)[start_index:end_index]
+        span = (sequence_length - 1) * sampling_rate + 1
+        if len(data) >= span:
+            windows = np.lib.stride_tricks.sliding_window_view(
+                data, span, axis=0
+            )
+            # Move the window axis next to the sample axis, and subsample it.
+            windows = np.moveaxis(windows, -1, 1)[:, ::sampling_rate]
+        else:
+            windows = np.empty(
+                (0, sequence_length) + data.shape[1:], dtype=data.dtype
+            )
+        self.windows = windows
+        if targets is not None:
+            targets = np.asarray(targets)[start_index:end_index]
+        self.targets = targets
+        self.start_positions = np.array(start_positions)
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        if self.batch_size is None:
+            return len(self.start_positions)
+        return -(-len(self.start_positions) // self.batch_size)
+
+    def __getitem__(self, index):
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Index {index} out of range.")
+        if self.batch_size is None:
+            positions = self.start_positions[index]
+        else:
+            start = index * self.batch_size
+            positions = self.start_positions[start : start + self.batch_size]
+        # Fancy indexing only copies the windows of this batch.
+        sequences = self.windows[positions]
+        if self.targets is None:
+            return sequences
+        return sequences, self.targets[positions]
+
+    def on_epoch_end(self):
+        if self.shuffle:
+            self._rng.shuffle(self.start_positions)